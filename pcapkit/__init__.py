@@ -65,6 +65,7 @@ import warnings
 
 import tbtrim
 
+from pcapkit.utilities.compat import lazy_import
 from pcapkit.utilities.exceptions import DEVMODE, BaseError
 from pcapkit.utilities.warnings import DevModeWarning
 
@@ -78,43 +79,9 @@ else:
     tbtrim.set_trim_rule(lambda filename: ROOT in os.path.realpath(filename),
                          exception=BaseError, strict=False)
 
-# All Reference
-import pcapkit.all
-
-# Interface
-from pcapkit.interface import *
-
-# ToolKit
-from pcapkit.toolkit import *
-
-# Protocols
-from pcapkit.protocols.null import NoPayload
-from pcapkit.protocols.raw import Raw
-from pcapkit.protocols.link.arp import ARP
-from pcapkit.protocols.link.ethernet import Ethernet
-from pcapkit.protocols.application.ftp import FTP
-from pcapkit.protocols.link.l2tp import L2TP
-from pcapkit.protocols.link.ospf import OSPF
-from pcapkit.protocols.link.rarp import RARP
-from pcapkit.protocols.link.vlan import VLAN
-from pcapkit.protocols.internet.ah import AH
-from pcapkit.protocols.internet.hip import HIP
-from pcapkit.protocols.internet.hopopt import HOPOPT
-from pcapkit.protocols.internet.ip import IP
-from pcapkit.protocols.internet.ipsec import IPsec
-from pcapkit.protocols.internet.ipv4 import IPv4
-from pcapkit.protocols.internet.ipv6 import IPv6
-from pcapkit.protocols.internet.ipv6_frag import IPv6_Frag
-from pcapkit.protocols.internet.ipv6_opts import IPv6_Opts
-from pcapkit.protocols.internet.ipv6_route import IPv6_Route
-from pcapkit.protocols.internet.ipx import IPX
-from pcapkit.protocols.internet.mh import MH
-from pcapkit.protocols.transport.tcp import TCP
-from pcapkit.protocols.transport.udp import UDP
-from pcapkit.protocols.application.http import HTTP
-
 __all__ = [
-    'extract', 'analyse', 'reassemble', 'trace',            # Interface Functions
+    'extract', 'aextract', 'analyse', 'reassemble', 'trace',
+                                                            # Interface Functions
     'TREE', 'JSON', 'PLIST', 'PCAP',                        # Format Macros
     'LINK', 'INET', 'TRANS', 'APP', 'RAW',                  # Layer Macros
     'DPKT', 'Scapy', 'PyShark', 'MPServer', 'MPPipeline', 'PCAPKit',
@@ -128,3 +95,88 @@ __all__ = [
     'TCP', 'UDP',                                           # Transport Layer
     'FTP', 'HTTP',                                          # Application Layer
 ]
+
+__getattr__, __dir__ = lazy_import(__name__, {
+    # All Reference
+    'all': ('pcapkit.all', None),
+
+    # Interface
+    'extract': ('pcapkit.interface', 'extract'),
+    'aextract': ('pcapkit.interface', 'aextract'),
+    'analyse': ('pcapkit.interface', 'analyse'),
+    'reassemble': ('pcapkit.interface', 'reassemble'),
+    'trace': ('pcapkit.interface', 'trace'),
+    'TREE': ('pcapkit.interface', 'TREE'),
+    'JSON': ('pcapkit.interface', 'JSON'),
+    'PLIST': ('pcapkit.interface', 'PLIST'),
+    'PCAP': ('pcapkit.interface', 'PCAP'),
+    'LINK': ('pcapkit.interface', 'LINK'),
+    'INET': ('pcapkit.interface', 'INET'),
+    'TRANS': ('pcapkit.interface', 'TRANS'),
+    'APP': ('pcapkit.interface', 'APP'),
+    'RAW': ('pcapkit.interface', 'RAW'),
+    'DPKT': ('pcapkit.interface', 'DPKT'),
+    'Scapy': ('pcapkit.interface', 'Scapy'),
+    'PyShark': ('pcapkit.interface', 'PyShark'),
+    'MPServer': ('pcapkit.interface', 'MPServer'),
+    'MPPipeline': ('pcapkit.interface', 'MPPipeline'),
+    'PCAPKit': ('pcapkit.interface', 'PCAPKit'),
+
+    # ToolKit
+    'ipv4_reassembly': ('pcapkit.toolkit', 'ipv4_reassembly'),
+    'ipv6_reassembly': ('pcapkit.toolkit', 'ipv6_reassembly'),
+    'tcp_reassembly': ('pcapkit.toolkit', 'tcp_reassembly'),
+    'tcp_traceflow': ('pcapkit.toolkit', 'tcp_traceflow'),
+    'dpkt_ipv6_hdr_len': ('pcapkit.toolkit', 'dpkt_ipv6_hdr_len'),
+    'dpkt_packet2chain': ('pcapkit.toolkit', 'dpkt_packet2chain'),
+    'dpkt_packet2dict': ('pcapkit.toolkit', 'dpkt_packet2dict'),
+    'dpkt_ipv4_reassembly': ('pcapkit.toolkit', 'dpkt_ipv4_reassembly'),
+    'dpkt_ipv6_reassembly': ('pcapkit.toolkit', 'dpkt_ipv6_reassembly'),
+    'dpkt_tcp_reassembly': ('pcapkit.toolkit', 'dpkt_tcp_reassembly'),
+    'dpkt_tcp_traceflow': ('pcapkit.toolkit', 'dpkt_tcp_traceflow'),
+    'pyshark_packet2dict': ('pcapkit.toolkit', 'pyshark_packet2dict'),
+    'pyshark_tcp_traceflow': ('pcapkit.toolkit', 'pyshark_tcp_traceflow'),
+    'scapy_packet2chain': ('pcapkit.toolkit', 'scapy_packet2chain'),
+    'scapy_packet2dict': ('pcapkit.toolkit', 'scapy_packet2dict'),
+    'scapy_ipv4_reassembly': ('pcapkit.toolkit', 'scapy_ipv4_reassembly'),
+    'scapy_ipv6_reassembly': ('pcapkit.toolkit', 'scapy_ipv6_reassembly'),
+    'scapy_tcp_reassembly': ('pcapkit.toolkit', 'scapy_tcp_reassembly'),
+    'scapy_tcp_traceflow': ('pcapkit.toolkit', 'scapy_tcp_traceflow'),
+
+    # Protocols
+    'NoPayload': ('pcapkit.protocols.null', 'NoPayload'),
+    'Raw': ('pcapkit.protocols.raw', 'Raw'),
+    'ARP': ('pcapkit.protocols.link.arp', 'ARP'),
+    'Ethernet': ('pcapkit.protocols.link.ethernet', 'Ethernet'),
+    'FTP': ('pcapkit.protocols.application.ftp', 'FTP'),
+    'L2TP': ('pcapkit.protocols.link.l2tp', 'L2TP'),
+    'OSPF': ('pcapkit.protocols.link.ospf', 'OSPF'),
+    'RARP': ('pcapkit.protocols.link.rarp', 'RARP'),
+    'VLAN': ('pcapkit.protocols.link.vlan', 'VLAN'),
+    'AH': ('pcapkit.protocols.internet.ah', 'AH'),
+    'HIP': ('pcapkit.protocols.internet.hip', 'HIP'),
+    'HOPOPT': ('pcapkit.protocols.internet.hopopt', 'HOPOPT'),
+    'IP': ('pcapkit.protocols.internet.ip', 'IP'),
+    'IPsec': ('pcapkit.protocols.internet.ipsec', 'IPsec'),
+    'IPv4': ('pcapkit.protocols.internet.ipv4', 'IPv4'),
+    'IPv6': ('pcapkit.protocols.internet.ipv6', 'IPv6'),
+    'IPv6_Frag': ('pcapkit.protocols.internet.ipv6_frag', 'IPv6_Frag'),
+    'IPv6_Opts': ('pcapkit.protocols.internet.ipv6_opts', 'IPv6_Opts'),
+    'IPv6_Route': ('pcapkit.protocols.internet.ipv6_route', 'IPv6_Route'),
+    'IPX': ('pcapkit.protocols.internet.ipx', 'IPX'),
+    'MH': ('pcapkit.protocols.internet.mh', 'MH'),
+    'TCP': ('pcapkit.protocols.transport.tcp', 'TCP'),
+    'UDP': ('pcapkit.protocols.transport.udp', 'UDP'),
+    'HTTP': ('pcapkit.protocols.application.http', 'HTTP'),
+
+    # Submodules
+    'const': ('pcapkit.const', None),
+    'corekit': ('pcapkit.corekit', None),
+    'dumpkit': ('pcapkit.dumpkit', None),
+    'foundation': ('pcapkit.foundation', None),
+    'interface': ('pcapkit.interface', None),
+    'protocols': ('pcapkit.protocols', None),
+    'reassembly': ('pcapkit.reassembly', None),
+    'toolkit': ('pcapkit.toolkit', None),
+    'utilities': ('pcapkit.utilities', None),
+})
@@ -29,8 +29,9 @@ def get_parser():
                                      description='PCAP file extractor and formatted dumper')
     parser.add_argument('-V', '--version', action='version', version=__version__)
     parser.add_argument('fin', metavar='input-file-name',
-                        help=('The name of input pcap file. If ".pcap" omits, '
-                              'it will be automatically appended.'))
+                        help=('The name of input pcap file, or "-" to read from '
+                              'standard input. If ".pcap" omits, it will be '
+                              'automatically appended.'))
     parser.add_argument('-o', '--output', action='store', metavar='file-name', dest='fout',
                         help=('The name of input pcap file. If format extension '
                               'omits, it will be automatically appended.'))
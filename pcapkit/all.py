@@ -39,9 +39,12 @@ __all__ = [
     'Extractor',                                            # Extraction
     'analyse2',                                             # Analysis
     'TraceFlow',                                            # Trace Flow
+    'ProtoHierarchy',                                       # Protocol Hierarchy
+    'Instrument',                                           # Instrumentation
 
     # pcapkit.interface
-    'extract', 'analyse', 'reassemble', 'trace',            # Interface Functions
+    'extract', 'aextract', 'analyse', 'reassemble', 'trace',
+                                                            # Interface Functions
     'TREE', 'JSON', 'PLIST', 'PCAP',                        # Format Macros
     'LINK', 'INET', 'TRANS', 'APP', 'RAW',                  # Layer Macros
     'DPKT', 'Scapy', 'PyShark', 'MPServer', 'MPPipeline', 'PCAPKit',
@@ -2,27 +2,15 @@
 # pylint: disable=unused-import, unused-wildcard-import
 """Constant enumerations."""
 
-# IANA registration
-from pcapkit.const.reg import *
-
-# per protocol
-from pcapkit.const.arp import *
-from pcapkit.const.ftp import *
-from pcapkit.const.hip import *
-from pcapkit.const.http import *
-from pcapkit.const.ipv4 import *
-from pcapkit.const.ipv6 import *
-from pcapkit.const.ipx import *
-from pcapkit.const.mh import *
-from pcapkit.const.ospf import *
-from pcapkit.const.tcp import *
-from pcapkit.const.vlan import *
+from pcapkit.utilities.compat import lazy_import
 
 __all__ = [
     # Protocol Registration
     'EtherType', 'LinkType', 'TransType',
     # ARP
     'ARP_Hardware', 'ARP_Operation',
+    # DNS
+    'DNS_Opcode', 'DNS_RCode', 'DNS_RRClass', 'DNS_RRType',
     # FTP
     'FTP_Command', 'FTP_ReturnCode',
     # HIP
@@ -47,6 +35,97 @@ __all__ = [
     'OSPF_Authentication', 'OSPF_Packet',
     # TCP
     'TCP_Checksum', 'TCP_Option',
+    # TLS
+    'TLS_ContentType', 'TLS_HandshakeType',
     # VLAN
     'VLAN_PriorityLevel',
 ]
+
+__getattr__, __dir__ = lazy_import(__name__, {
+    # Protocol registration enumerations
+    'EtherType': ('pcapkit.const.reg.ethertype', 'EtherType'),
+    'LinkType': ('pcapkit.const.reg.linktype', 'LinkType'),
+    'TransType': ('pcapkit.const.reg.transtype', 'TransType'),
+
+    # ARP constant enumerations
+    'ARP_Hardware': ('pcapkit.const.arp.hardware', 'Hardware'),
+    'ARP_Operation': ('pcapkit.const.arp.operation', 'Operation'),
+
+    # DNS constant enumerations
+    'DNS_Opcode': ('pcapkit.const.dns.opcode', 'Opcode'),
+    'DNS_RCode': ('pcapkit.const.dns.rcode', 'RCode'),
+    'DNS_RRClass': ('pcapkit.const.dns.rr_class', 'RRClass'),
+    'DNS_RRType': ('pcapkit.const.dns.rr_type', 'RRType'),
+
+    # FTP constant enumerations
+    'FTP_Command': ('pcapkit.const.ftp.command', 'Command'),
+    'FTP_ReturnCode': ('pcapkit.const.ftp.return_code', 'ReturnCode'),
+
+    # HIP constant enumerations
+    'HIP_Certificate': ('pcapkit.const.hip.certificate', 'Certificate'),
+    'HIP_Cipher': ('pcapkit.const.hip.cipher', 'Cipher'),
+    'HIP_DITypes': ('pcapkit.const.hip.di', 'DITypes'),
+    'HIP_ECDSACurve': ('pcapkit.const.hip.ecdsa_curve', 'ECDSACurve'),
+    'HIP_ECDSALowCurve': ('pcapkit.const.hip.ecdsa_low_curve', 'ECDSALowCurve'),
+    'HIP_ESPTransformSuite': ('pcapkit.const.hip.esp_transform_suite', 'ESPTransformSuite'),
+    'HIP_Group': ('pcapkit.const.hip.group', 'Group'),
+    'HIP_HIAlgorithm': ('pcapkit.const.hip.hi_algorithm', 'HIAlgorithm'),
+    'HIP_HITSuite': ('pcapkit.const.hip.hit_suite', 'HITSuite'),
+    'HIP_NATTraversal': ('pcapkit.const.hip.nat_traversal', 'NATTraversal'),
+    'HIP_NotifyMessage': ('pcapkit.const.hip.notify_message', 'NotifyMessage'),
+    'HIP_Packet': ('pcapkit.const.hip.packet', 'Packet'),
+    'HIP_Parameter': ('pcapkit.const.hip.parameter', 'Parameter'),
+    'HIP_Registration': ('pcapkit.const.hip.registration', 'Registration'),
+    'HIP_RegistrationFailure': ('pcapkit.const.hip.registration_failure', 'RegistrationFailure'),
+    'HIP_Suite': ('pcapkit.const.hip.suite', 'Suite'),
+    'HIP_Transport': ('pcapkit.const.hip.transport', 'Transport'),
+
+    # HTTP constant enumerations
+    'HTTP_ErrorCode': ('pcapkit.const.http.error_code', 'ErrorCode'),
+    'HTTP_Frame': ('pcapkit.const.http.frame', 'Frame'),
+    'HTTP_Setting': ('pcapkit.const.http.setting', 'Setting'),
+
+    # IPv4 constant enumerations
+    'IPv4_ClassificationLevel': ('pcapkit.const.ipv4.classification_level', 'ClassificationLevel'),
+    'IPv4_OptionClass': ('pcapkit.const.ipv4.option_class', 'OptionClass'),
+    'IPv4_OptionNumber': ('pcapkit.const.ipv4.option_number', 'OptionNumber'),
+    'IPv4_ProtectionAuthority': ('pcapkit.const.ipv4.protection_authority', 'ProtectionAuthority'),
+    'IPv4_QSFunction': ('pcapkit.const.ipv4.qs_function', 'QSFunction'),
+    'IPv4_RouterAlert': ('pcapkit.const.ipv4.router_alert', 'RouterAlert'),
+    'IPv4_ToSDelay': ('pcapkit.const.ipv4.tos_del', 'ToSDelay'),
+    'IPv4_ToSECN': ('pcapkit.const.ipv4.tos_ecn', 'ToSECN'),
+    'IPv4_ToSPrecedence': ('pcapkit.const.ipv4.tos_pre', 'ToSPrecedence'),
+    'IPv4_ToSReliability': ('pcapkit.const.ipv4.tos_rel', 'ToSReliability'),
+    'IPv4_ToSThroughput': ('pcapkit.const.ipv4.tos_thr', 'ToSThroughput'),
+
+    # IPv6 constant enumerations
+    'IPv6_ExtensionHeader': ('pcapkit.const.ipv6.extension_header', 'ExtensionHeader'),
+    'IPv6_Option': ('pcapkit.const.ipv6.option', 'Option'),
+    'IPv6_QSFunction': ('pcapkit.const.ipv6.qs_function', 'QSFunction'),
+    'IPv6_RouterAlert': ('pcapkit.const.ipv6.router_alert', 'RouterAlert'),
+    'IPv6_Routing': ('pcapkit.const.ipv6.routing', 'Routing'),
+    'IPv6_SeedID': ('pcapkit.const.ipv6.seed_id', 'SeedID'),
+    'IPv6_TaggerID': ('pcapkit.const.ipv6.tagger_id', 'TaggerID'),
+
+    # IPX constant enumerations
+    'IPX_Packet': ('pcapkit.const.ipx.packet', 'Packet'),
+    'IPX_Socket': ('pcapkit.const.ipx.socket', 'Socket'),
+
+    # MH constant enumerations
+    'MH_Packet': ('pcapkit.const.mh.packet', 'Packet'),
+
+    # OSPF constant enumerations
+    'OSPF_Authentication': ('pcapkit.const.ospf.authentication', 'Authentication'),
+    'OSPF_Packet': ('pcapkit.const.ospf.packet', 'Packet'),
+
+    # TCP constant enumerations
+    'TCP_Checksum': ('pcapkit.const.tcp.checksum', 'Checksum'),
+    'TCP_Option': ('pcapkit.const.tcp.option', 'Option'),
+
+    # TLS constant enumerations
+    'TLS_ContentType': ('pcapkit.const.tls.content_type', 'ContentType'),
+    'TLS_HandshakeType': ('pcapkit.const.tls.handshake_type', 'HandshakeType'),
+
+    # VLAN constant enumerations
+    'VLAN_PriorityLevel': ('pcapkit.const.vlan.priority_level', 'PriorityLevel'),
+})
@@ -4,9 +4,20 @@
 
 from aenum import IntEnum, extend_enum
 
+from pcapkit.corekit.registry import RangeTable
+
 __all__ = ['Hardware']
 
 
+#: Range table of values not assigned in :class:`Hardware`.
+_MISSING = RangeTable(
+    #: Unassigned
+    (38, 255, 'Unassigned_{:d}'),
+    #: Unassigned
+    (258, 65534, 'Unassigned_{:d}'),
+)
+
+
 class Hardware(IntEnum):
     """[Hardware] Hardware Types [:rfc:`826`][:rfc:`5494`]"""
 
@@ -149,12 +160,7 @@ class Hardware(IntEnum):
         """Lookup function used when value is not found."""
         if not (isinstance(value, int) and 0 <= value <= 65535):
             raise ValueError('%r is not a valid %s' % (value, cls.__name__))
-        if 38 <= value <= 255:
-            #: Unassigned
-            extend_enum(cls, 'Unassigned_%d' % value, value)
-            return cls(value)
-        if 258 <= value <= 65534:
-            #: Unassigned
-            extend_enum(cls, 'Unassigned_%d' % value, value)
-            return cls(value)
-        return super()._missing_(value)
+        member = _MISSING.lookup(cls, value)
+        if member is None:
+            return super()._missing_(value)
+        return member
@@ -4,9 +4,18 @@
 
 from aenum import IntEnum, extend_enum
 
+from pcapkit.corekit.registry import RangeTable
+
 __all__ = ['Operation']
 
 
+#: Range table of values not assigned in :class:`Operation`.
+_MISSING = RangeTable(
+    #: Unassigned
+    (26, 65534, 'Unassigned_{:d}'),
+)
+
+
 class Operation(IntEnum):
     """[Operation] Operation Codes [:rfc:`826`][:rfc:`5494`]"""
 
@@ -105,8 +114,7 @@ class Operation(IntEnum):
         """Lookup function used when value is not found."""
         if not (isinstance(value, int) and 0 <= value <= 65535):
             raise ValueError('%r is not a valid %s' % (value, cls.__name__))
-        if 26 <= value <= 65534:
-            #: Unassigned
-            extend_enum(cls, 'Unassigned_%d' % value, value)
-            return cls(value)
-        return super()._missing_(value)
+        member = _MISSING.lookup(cls, value)
+        if member is None:
+            return super()._missing_(value)
+        return member
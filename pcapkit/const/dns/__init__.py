@@ -0,0 +1,10 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=unused-import
+"""DNS constant enumerations."""
+
+from pcapkit.const.dns.opcode import Opcode as DNS_Opcode
+from pcapkit.const.dns.rcode import RCode as DNS_RCode
+from pcapkit.const.dns.rr_class import RRClass as DNS_RRClass
+from pcapkit.const.dns.rr_type import RRType as DNS_RRType
+
+__all__ = ['DNS_Opcode', 'DNS_RCode', 'DNS_RRClass', 'DNS_RRType']
@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=line-too-long
+"""DNS OpCodes"""
+
+from aenum import IntEnum, extend_enum
+
+from pcapkit.corekit.registry import RangeTable
+
+__all__ = ['Opcode']
+
+
+#: Range table of values not assigned in :class:`Opcode`.
+_MISSING = RangeTable(
+    #: Unassigned
+    (7, 15, 'Unassigned_{:d}'),
+)
+
+
+class Opcode(IntEnum):
+    """[Opcode] DNS OpCodes"""
+
+    #: Query [:rfc:`1035`]
+    Query = 0
+
+    #: IQuery (Inverse Query - OBSOLETE) [:rfc:`3425`]
+    IQuery = 1
+
+    #: Status [:rfc:`1035`]
+    Status = 2
+
+    #: Unassigned
+    Unassigned = 3
+
+    #: Notify [:rfc:`1996`]
+    Notify = 4
+
+    #: Update [:rfc:`2136`]
+    Update = 5
+
+    #: DNS Stateful Operations (DSO) [:rfc:`8490`]
+    DNS_Stateful_Operations = 6
+
+    @staticmethod
+    def get(key, default=-1):
+        """Backport support for original codes."""
+        if isinstance(key, int):
+            return Opcode(key)
+        if key not in Opcode._member_map_:  # pylint: disable=no-member
+            extend_enum(Opcode, key, default)
+        return Opcode[key]
+
+    @classmethod
+    def _missing_(cls, value):
+        """Lookup function used when value is not found."""
+        if not (isinstance(value, int) and 0 <= value <= 15):
+            raise ValueError('%r is not a valid %s' % (value, cls.__name__))
+        member = _MISSING.lookup(cls, value)
+        if member is None:
+            return super()._missing_(value)
+        return member
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=line-too-long
+"""DNS RCODEs"""
+
+from aenum import IntEnum, extend_enum
+
+from pcapkit.corekit.registry import RangeTable
+
+__all__ = ['RCode']
+
+
+#: Range table of values not assigned in :class:`RCode`.
+_MISSING = RangeTable(
+    #: Unassigned
+    (12, 15, 'Unassigned_{:d}'),
+    #: Unassigned
+    (24, 3840, 'Unassigned_{:d}'),
+    #: Reserved for Private Use [:rfc:`6895`]
+    (3841, 4095, 'Reserved_for_Private_Use_{:d}'),
+    #: Unassigned
+    (4096, 65534, 'Unassigned_{:d}'),
+)
+
+
+class RCode(IntEnum):
+    """[RCode] DNS RCODEs"""
+
+    #: NoError - No Error [:rfc:`1035`]
+    NoError = 0
+
+    #: FormErr - Format Error [:rfc:`1035`]
+    FormErr = 1
+
+    #: ServFail - Server Failure [:rfc:`1035`]
+    ServFail = 2
+
+    #: NXDomain - Non-Existent Domain [:rfc:`1035`]
+    NXDomain = 3
+
+    #: NotImp - Not Implemented [:rfc:`1035`]
+    NotImp = 4
+
+    #: Refused - Query Refused [:rfc:`1035`]
+    Refused = 5
+
+    #: YXDomain - Name Exists when it should not [:rfc:`2136`][:rfc:`6672`]
+    YXDomain = 6
+
+    #: YXRRSet - RR Set Exists when it should not [:rfc:`2136`]
+    YXRRSet = 7
+
+    #: NXRRSet - RR Set that should exist does not [:rfc:`2136`]
+    NXRRSet = 8
+
+    #: NotAuth - Server Not Authoritative for zone [:rfc:`2136`]
+    NotAuth = 9
+
+    #: NotZone - Name not contained in zone [:rfc:`2136`]
+    NotZone = 10
+
+    #: DSOTYPENI - DSO-TYPE Not Implemented [:rfc:`8490`]
+    DSOTYPENI = 11
+
+    #: BADVERS - Bad OPT Version [:rfc:`6891`]
+    BADVERS = 16
+
+    #: BADSIG - TSIG Signature Failure [:rfc:`8945`]
+    BADSIG = 16
+
+    #: BADKEY - Key not recognized [:rfc:`8945`]
+    BADKEY = 17
+
+    #: BADTIME - Signature out of time window [:rfc:`8945`]
+    BADTIME = 18
+
+    #: BADMODE - Bad TKEY Mode [:rfc:`2930`]
+    BADMODE = 19
+
+    #: BADNAME - Duplicate key name [:rfc:`2930`]
+    BADNAME = 20
+
+    #: BADALG - Algorithm not supported [:rfc:`2930`]
+    BADALG = 21
+
+    #: BADTRUNC - Bad Truncation [:rfc:`8945`]
+    BADTRUNC = 22
+
+    #: BADCOOKIE - Bad/missing Server Cookie [:rfc:`7873`]
+    BADCOOKIE = 23
+
+    #: Reserved, can be allocated by Standards Action [:rfc:`6895`]
+    Reserved_can_be_allocated_by_Standards_Action = 65535
+
+    @staticmethod
+    def get(key, default=-1):
+        """Backport support for original codes."""
+        if isinstance(key, int):
+            return RCode(key)
+        if key not in RCode._member_map_:  # pylint: disable=no-member
+            extend_enum(RCode, key, default)
+        return RCode[key]
+
+    @classmethod
+    def _missing_(cls, value):
+        """Lookup function used when value is not found."""
+        if not (isinstance(value, int) and 0 <= value <= 65535):
+            raise ValueError('%r is not a valid %s' % (value, cls.__name__))
+        member = _MISSING.lookup(cls, value)
+        if member is None:
+            return super()._missing_(value)
+        return member
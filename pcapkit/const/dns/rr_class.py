@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=line-too-long
+"""DNS CLASSes"""
+
+from aenum import IntEnum, extend_enum
+
+from pcapkit.corekit.registry import RangeTable
+
+__all__ = ['RRClass']
+
+
+#: Range table of values not assigned in :class:`RRClass`.
+_MISSING = RangeTable(
+    #: Unassigned
+    (5, 253, 'Unassigned_{:d}'),
+    #: Unassigned
+    (256, 65279, 'Unassigned_{:d}'),
+    #: Reserved for Private Use [:rfc:`6895`]
+    (65280, 65534, 'Reserved_for_Private_Use_{:d}'),
+)
+
+
+class RRClass(IntEnum):
+    """[RRClass] DNS CLASSes"""
+
+    #: Reserved [:rfc:`6895`]
+    Reserved_0 = 0
+
+    #: Internet (IN) [:rfc:`1035`]
+    IN = 1
+
+    #: Unassigned
+    Unassigned = 2
+
+    #: Chaos (CH) [D. Moon, "Chaosnet", A.I. Memo 628, Massachusetts Institute of
+    #: Technology Artificial Intelligence Laboratory, June 1981.]
+    CH = 3
+
+    #: Hesiod (HS) [Dyer, S., and F. Hsu, "Hesiod", Project Athena Technical Plan -
+    #: Name Service, April 1987.]
+    HS = 4
+
+    #: QCLASS NONE [:rfc:`2136`]
+    NONE = 254
+
+    #: QCLASS * (ANY) [:rfc:`1035`]
+    ANY = 255
+
+    #: Reserved [:rfc:`6895`]
+    Reserved_65535 = 65535
+
+    @staticmethod
+    def get(key, default=-1):
+        """Backport support for original codes."""
+        if isinstance(key, int):
+            return RRClass(key)
+        if key not in RRClass._member_map_:  # pylint: disable=no-member
+            extend_enum(RRClass, key, default)
+        return RRClass[key]
+
+    @classmethod
+    def _missing_(cls, value):
+        """Lookup function used when value is not found."""
+        if not (isinstance(value, int) and 0 <= value <= 65535):
+            raise ValueError('%r is not a valid %s' % (value, cls.__name__))
+        member = _MISSING.lookup(cls, value)
+        if member is None:
+            return super()._missing_(value)
+        return member
@@ -4,9 +4,18 @@
 
 from aenum import IntEnum, extend_enum
 
+from pcapkit.corekit.registry import RangeTable
+
 __all__ = ['Certificate']
 
 
+#: Range table of values not assigned in :class:`Certificate`.
+_MISSING = RangeTable(
+    #: Unassigned
+    (9, 255, 'Unassigned_{:d}'),
+)
+
+
 class Certificate(IntEnum):
     """[Certificate] HIP Certificate Types"""
 
@@ -51,8 +60,7 @@ class Certificate(IntEnum):
         """Lookup function used when value is not found."""
         if not (isinstance(value, int) and 0 <= value <= 255):
             raise ValueError('%r is not a valid %s' % (value, cls.__name__))
-        if 9 <= value <= 255:
-            #: Unassigned
-            extend_enum(cls, 'Unassigned_%d' % value, value)
-            return cls(value)
-        return super()._missing_(value)
+        member = _MISSING.lookup(cls, value)
+        if member is None:
+            return super()._missing_(value)
+        return member
@@ -4,9 +4,18 @@
 
 from aenum import IntEnum, extend_enum
 
+from pcapkit.corekit.registry import RangeTable
+
 __all__ = ['ECDSALowCurve']
 
 
+#: Range table of values not assigned in :class:`ECDSALowCurve`.
+_MISSING = RangeTable(
+    #: Unassigned
+    (2, 65535, 'Unassigned_{:d}'),
+)
+
+
 class ECDSALowCurve(IntEnum):
     """[ECDSALowCurve] ECDSA_LOW Curve Label"""
 
@@ -30,8 +39,7 @@ class ECDSALowCurve(IntEnum):
         """Lookup function used when value is not found."""
         if not (isinstance(value, int) and 0 <= value <= 65535):
             raise ValueError('%r is not a valid %s' % (value, cls.__name__))
-        if 2 <= value <= 65535:
-            #: Unassigned
-            extend_enum(cls, 'Unassigned_%d' % value, value)
-            return cls(value)
-        return super()._missing_(value)
+        member = _MISSING.lookup(cls, value)
+        if member is None:
+            return super()._missing_(value)
+        return member
@@ -4,9 +4,18 @@
 
 from aenum import IntEnum, extend_enum
 
+from pcapkit.corekit.registry import RangeTable
+
 __all__ = ['ESPTransformSuite']
 
 
+#: Range table of values not assigned in :class:`ESPTransformSuite`.
+_MISSING = RangeTable(
+    #: Unassigned
+    (16, 65535, 'Unassigned_{:d}'),
+)
+
+
 class ESPTransformSuite(IntEnum):
     """[ESPTransformSuite] ESP Transform Suite IDs"""
 
@@ -72,8 +81,7 @@ class ESPTransformSuite(IntEnum):
         """Lookup function used when value is not found."""
         if not (isinstance(value, int) and 0 <= value <= 65535):
             raise ValueError('%r is not a valid %s' % (value, cls.__name__))
-        if 16 <= value <= 65535:
-            #: Unassigned
-            extend_enum(cls, 'Unassigned_%d' % value, value)
-            return cls(value)
-        return super()._missing_(value)
+        member = _MISSING.lookup(cls, value)
+        if member is None:
+            return super()._missing_(value)
+        return member
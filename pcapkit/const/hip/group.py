@@ -4,9 +4,18 @@
 
 from aenum import IntEnum, extend_enum
 
+from pcapkit.corekit.registry import RangeTable
+
 __all__ = ['Group']
 
 
+#: Range table of values not assigned in :class:`Group`.
+_MISSING = RangeTable(
+    #: Unassigned
+    (12, 255, 'Unassigned_{:d}'),
+)
+
+
 class Group(IntEnum):
     """[Group] Group IDs"""
 
@@ -60,8 +69,7 @@ class Group(IntEnum):
         """Lookup function used when value is not found."""
         if not (isinstance(value, int) and 0 <= value <= 255):
             raise ValueError('%r is not a valid %s' % (value, cls.__name__))
-        if 12 <= value <= 255:
-            #: Unassigned
-            extend_enum(cls, 'Unassigned_%d' % value, value)
-            return cls(value)
-        return super()._missing_(value)
+        member = _MISSING.lookup(cls, value)
+        if member is None:
+            return super()._missing_(value)
+        return member
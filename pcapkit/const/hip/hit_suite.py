@@ -4,9 +4,18 @@
 
 from aenum import IntEnum, extend_enum
 
+from pcapkit.corekit.registry import RangeTable
+
 __all__ = ['HITSuite']
 
 
+#: Range table of values not assigned in :class:`HITSuite`.
+_MISSING = RangeTable(
+    #: Unassigned
+    (4, 15, 'Unassigned_{:d}'),
+)
+
+
 class HITSuite(IntEnum):
     """[HITSuite] HIT Suite ID"""
 
@@ -36,8 +45,7 @@ class HITSuite(IntEnum):
         """Lookup function used when value is not found."""
         if not (isinstance(value, int) and 0 <= value <= 15):
             raise ValueError('%r is not a valid %s' % (value, cls.__name__))
-        if 4 <= value <= 15:
-            #: Unassigned
-            extend_enum(cls, 'Unassigned_%d' % value, value)
-            return cls(value)
-        return super()._missing_(value)
+        member = _MISSING.lookup(cls, value)
+        if member is None:
+            return super()._missing_(value)
+        return member
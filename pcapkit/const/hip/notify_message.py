@@ -4,9 +4,42 @@
 
 from aenum import IntEnum, extend_enum
 
+from pcapkit.corekit.registry import RangeTable
+
 __all__ = ['NotifyMessage']
 
 
+#: Range table of values not assigned in :class:`NotifyMessage`.
+_MISSING = RangeTable(
+    #: Unassigned
+    (2, 6, 'Unassigned_{:d}'),
+    #: Unassigned
+    (8, 13, 'Unassigned_{:d}'),
+    #: Unassigned
+    (21, 23, 'Unassigned_{:d}'),
+    #: Unassigned
+    (29, 31, 'Unassigned_{:d}'),
+    #: Unassigned
+    (33, 39, 'Unassigned_{:d}'),
+    #: Unassigned
+    (52, 59, 'Unassigned_{:d}'),
+    #: Unassigned
+    (63, 69, 'Unassigned_{:d}'),
+    #: Unassigned
+    (71, 89, 'Unassigned_{:d}'),
+    #: Unassigned
+    (91, 99, 'Unassigned_{:d}'),
+    #: Unassigned
+    (101, 8191, 'Unassigned_{:d}'),
+    #: Reserved for Private Use [:rfc:`7401`]
+    (8192, 16383, 'Reserved_for_Private_Use_{:d}'),
+    #: Unassigned
+    (16385, 40959, 'Unassigned_{:d}'),
+    #: Reserved for Private Use [:rfc:`7401`]
+    (40960, 65535, 'Reserved_for_Private_Use_{:d}'),
+)
+
+
 class NotifyMessage(IntEnum):
     """[NotifyMessage] Notify Message Types"""
 
@@ -129,56 +162,7 @@ class NotifyMessage(IntEnum):
         """Lookup function used when value is not found."""
         if not (isinstance(value, int) and 0 <= value <= 65535):
             raise ValueError('%r is not a valid %s' % (value, cls.__name__))
-        if 2 <= value <= 6:
-            #: Unassigned
-            extend_enum(cls, 'Unassigned_%d' % value, value)
-            return cls(value)
-        if 8 <= value <= 13:
-            #: Unassigned
-            extend_enum(cls, 'Unassigned_%d' % value, value)
-            return cls(value)
-        if 21 <= value <= 23:
-            #: Unassigned
-            extend_enum(cls, 'Unassigned_%d' % value, value)
-            return cls(value)
-        if 29 <= value <= 31:
-            #: Unassigned
-            extend_enum(cls, 'Unassigned_%d' % value, value)
-            return cls(value)
-        if 33 <= value <= 39:
-            #: Unassigned
-            extend_enum(cls, 'Unassigned_%d' % value, value)
-            return cls(value)
-        if 52 <= value <= 59:
-            #: Unassigned
-            extend_enum(cls, 'Unassigned_%d' % value, value)
-            return cls(value)
-        if 63 <= value <= 69:
-            #: Unassigned
-            extend_enum(cls, 'Unassigned_%d' % value, value)
-            return cls(value)
-        if 71 <= value <= 89:
-            #: Unassigned
-            extend_enum(cls, 'Unassigned_%d' % value, value)
-            return cls(value)
-        if 91 <= value <= 99:
-            #: Unassigned
-            extend_enum(cls, 'Unassigned_%d' % value, value)
-            return cls(value)
-        if 101 <= value <= 8191:
-            #: Unassigned
-            extend_enum(cls, 'Unassigned_%d' % value, value)
-            return cls(value)
-        if 8192 <= value <= 16383:
-            #: Reserved for Private Use [:rfc:`7401`]
-            extend_enum(cls, 'Reserved_for_Private_Use_%d' % value, value)
-            return cls(value)
-        if 16385 <= value <= 40959:
-            #: Unassigned
-            extend_enum(cls, 'Unassigned_%d' % value, value)
-            return cls(value)
-        if 40960 <= value <= 65535:
-            #: Reserved for Private Use [:rfc:`7401`]
-            extend_enum(cls, 'Reserved_for_Private_Use_%d' % value, value)
-            return cls(value)
-        return super()._missing_(value)
+        member = _MISSING.lookup(cls, value)
+        if member is None:
+            return super()._missing_(value)
+        return member
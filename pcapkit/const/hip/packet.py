@@ -4,9 +4,22 @@
 
 from aenum import IntEnum, extend_enum
 
+from pcapkit.corekit.registry import RangeTable
+
 __all__ = ['Packet']
 
 
+#: Range table of values not assigned in :class:`Packet`.
+_MISSING = RangeTable(
+    # Unassigned
+    (5, 15, 'Unassigned_{:d}'),
+    # Unassigned
+    (21, 31, 'Unassigned_{:d}'),
+    # Unassigned
+    (33, 127, 'Unassigned_{:d}'),
+)
+
+
 class Packet(IntEnum):
     """[Packet] HIP Packet Types"""
 
@@ -57,16 +70,7 @@ class Packet(IntEnum):
         """Lookup function used when value is not found."""
         if not (isinstance(value, int) and 0 <= value <= 127):
             raise ValueError('%r is not a valid %s' % (value, cls.__name__))
-        if 5 <= value <= 15:
-            # Unassigned
-            extend_enum(cls, 'Unassigned_%d' % value, value)
-            return cls(value)
-        if 21 <= value <= 31:
-            # Unassigned
-            extend_enum(cls, 'Unassigned_%d' % value, value)
-            return cls(value)
-        if 33 <= value <= 127:
-            # Unassigned
-            extend_enum(cls, 'Unassigned_%d' % value, value)
-            return cls(value)
-        return super()._missing_(value)
+        member = _MISSING.lookup(cls, value)
+        if member is None:
+            return super()._missing_(value)
+        return member
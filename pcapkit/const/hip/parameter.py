@@ -4,9 +4,102 @@
 
 from aenum import IntEnum, extend_enum
 
+from pcapkit.corekit.registry import RangeTable
+
 __all__ = ['Parameter']
 
 
+#: Range table of values not assigned in :class:`Parameter`.
+_MISSING = RangeTable(
+    #: Unassigned
+    (0, 64, 'Unassigned_{:d}'),
+    #: Unassigned
+    (66, 127, 'Unassigned_{:d}'),
+    #: Unassigned
+    (130, 192, 'Unassigned_{:d}'),
+    #: Unassigned
+    (194, 256, 'Unassigned_{:d}'),
+    #: Unassigned
+    (258, 320, 'Unassigned_{:d}'),
+    #: Unassigned
+    (322, 384, 'Unassigned_{:d}'),
+    #: Unassigned
+    (386, 448, 'Unassigned_{:d}'),
+    #: Unassigned
+    (450, 510, 'Unassigned_{:d}'),
+    #: Unassigned
+    (514, 576, 'Unassigned_{:d}'),
+    #: Unassigned
+    (580, 607, 'Unassigned_{:d}'),
+    #: Unassigned
+    (611, 640, 'Unassigned_{:d}'),
+    #: Unassigned
+    (642, 704, 'Unassigned_{:d}'),
+    #: Unassigned
+    (706, 714, 'Unassigned_{:d}'),
+    #: Unassigned
+    (716, 767, 'Unassigned_{:d}'),
+    #: Unassigned
+    (769, 831, 'Unassigned_{:d}'),
+    #: Unassigned
+    (833, 896, 'Unassigned_{:d}'),
+    #: Unassigned
+    (898, 929, 'Unassigned_{:d}'),
+    #: Unassigned
+    (937, 949, 'Unassigned_{:d}'),
+    #: Unassigned
+    (951, 960, 'Unassigned_{:d}'),
+    #: Unassigned
+    (962, 2048, 'Unassigned_{:d}'),
+    #: Unassigned
+    (2050, 4094, 'Unassigned_{:d}'),
+    #: Unassigned
+    (4096, 4480, 'Unassigned_{:d}'),
+    #: Unassigned
+    (4482, 4544, 'Unassigned_{:d}'),
+    #: Unassigned
+    (4546, 4576, 'Unassigned_{:d}'),
+    #: Unassigned
+    (4578, 4579, 'Unassigned_{:d}'),
+    #: Unassigned
+    (4581, 4591, 'Unassigned_{:d}'),
+    #: Unassigned
+    (4593, 4600, 'Unassigned_{:d}'),
+    #: Unassigned
+    (4602, 7679, 'Unassigned_{:d}'),
+    #: Unassigned
+    (7681, 32767, 'Unassigned_{:d}'),
+    #: Reserved [:rfc:`7401`]
+    (32768, 49151, 'Reserved_{:d}'),
+    #: Unassigned
+    (49152, 61504, 'Unassigned_{:d}'),
+    #: Unassigned
+    (61506, 61568, 'Unassigned_{:d}'),
+    #: Unassigned
+    (61570, 61632, 'Unassigned_{:d}'),
+    #: Unassigned
+    (61634, 61696, 'Unassigned_{:d}'),
+    #: Unassigned
+    (61698, 63660, 'Unassigned_{:d}'),
+    #: Unassigned
+    (63662, 63424, 'Unassigned_{:d}'),
+    #: Unassigned
+    (63426, 63997, 'Unassigned_{:d}'),
+    #: Unassigned
+    (63999, 64001, 'Unassigned_{:d}'),
+    #: Unassigned
+    (64003, 64010, 'Unassigned_{:d}'),
+    #: Unassigned
+    (64012, 64016, 'Unassigned_{:d}'),
+    #: Unassigned
+    (64018, 65497, 'Unassigned_{:d}'),
+    #: Unassigned
+    (65503, 65519, 'Unassigned_{:d}'),
+    #: Unassigned
+    (65521, 65535, 'Unassigned_{:d}'),
+)
+
+
 class Parameter(IntEnum):
     """[Parameter] HIP Parameter Types"""
 
@@ -195,176 +288,7 @@ class Parameter(IntEnum):
         """Lookup function used when value is not found."""
         if not (isinstance(value, int) and 0 <= value <= 65535):
             raise ValueError('%r is not a valid %s' % (value, cls.__name__))
-        if 0 <= value <= 64:
-            #: Unassigned
-            extend_enum(cls, 'Unassigned_%d' % value, value)
-            return cls(value)
-        if 66 <= value <= 127:
-            #: Unassigned
-            extend_enum(cls, 'Unassigned_%d' % value, value)
-            return cls(value)
-        if 130 <= value <= 192:
-            #: Unassigned
-            extend_enum(cls, 'Unassigned_%d' % value, value)
-            return cls(value)
-        if 194 <= value <= 256:
-            #: Unassigned
-            extend_enum(cls, 'Unassigned_%d' % value, value)
-            return cls(value)
-        if 258 <= value <= 320:
-            #: Unassigned
-            extend_enum(cls, 'Unassigned_%d' % value, value)
-            return cls(value)
-        if 322 <= value <= 384:
-            #: Unassigned
-            extend_enum(cls, 'Unassigned_%d' % value, value)
-            return cls(value)
-        if 386 <= value <= 448:
-            #: Unassigned
-            extend_enum(cls, 'Unassigned_%d' % value, value)
-            return cls(value)
-        if 450 <= value <= 510:
-            #: Unassigned
-            extend_enum(cls, 'Unassigned_%d' % value, value)
-            return cls(value)
-        if 514 <= value <= 576:
-            #: Unassigned
-            extend_enum(cls, 'Unassigned_%d' % value, value)
-            return cls(value)
-        if 580 <= value <= 607:
-            #: Unassigned
-            extend_enum(cls, 'Unassigned_%d' % value, value)
-            return cls(value)
-        if 611 <= value <= 640:
-            #: Unassigned
-            extend_enum(cls, 'Unassigned_%d' % value, value)
-            return cls(value)
-        if 642 <= value <= 704:
-            #: Unassigned
-            extend_enum(cls, 'Unassigned_%d' % value, value)
-            return cls(value)
-        if 706 <= value <= 714:
-            #: Unassigned
-            extend_enum(cls, 'Unassigned_%d' % value, value)
-            return cls(value)
-        if 716 <= value <= 767:
-            #: Unassigned
-            extend_enum(cls, 'Unassigned_%d' % value, value)
-            return cls(value)
-        if 769 <= value <= 831:
-            #: Unassigned
-            extend_enum(cls, 'Unassigned_%d' % value, value)
-            return cls(value)
-        if 833 <= value <= 896:
-            #: Unassigned
-            extend_enum(cls, 'Unassigned_%d' % value, value)
-            return cls(value)
-        if 898 <= value <= 929:
-            #: Unassigned
-            extend_enum(cls, 'Unassigned_%d' % value, value)
-            return cls(value)
-        if 937 <= value <= 949:
-            #: Unassigned
-            extend_enum(cls, 'Unassigned_%d' % value, value)
-            return cls(value)
-        if 951 <= value <= 960:
-            #: Unassigned
-            extend_enum(cls, 'Unassigned_%d' % value, value)
-            return cls(value)
-        if 962 <= value <= 2048:
-            #: Unassigned
-            extend_enum(cls, 'Unassigned_%d' % value, value)
-            return cls(value)
-        if 2050 <= value <= 4094:
-            #: Unassigned
-            extend_enum(cls, 'Unassigned_%d' % value, value)
-            return cls(value)
-        if 4096 <= value <= 4480:
-            #: Unassigned
-            extend_enum(cls, 'Unassigned_%d' % value, value)
-            return cls(value)
-        if 4482 <= value <= 4544:
-            #: Unassigned
-            extend_enum(cls, 'Unassigned_%d' % value, value)
-            return cls(value)
-        if 4546 <= value <= 4576:
-            #: Unassigned
-            extend_enum(cls, 'Unassigned_%d' % value, value)
-            return cls(value)
-        if 4578 <= value <= 4579:
-            #: Unassigned
-            extend_enum(cls, 'Unassigned_%d' % value, value)
-            return cls(value)
-        if 4581 <= value <= 4591:
-            #: Unassigned
-            extend_enum(cls, 'Unassigned_%d' % value, value)
-            return cls(value)
-        if 4593 <= value <= 4600:
-            #: Unassigned
-            extend_enum(cls, 'Unassigned_%d' % value, value)
-            return cls(value)
-        if 4602 <= value <= 7679:
-            #: Unassigned
-            extend_enum(cls, 'Unassigned_%d' % value, value)
-            return cls(value)
-        if 7681 <= value <= 32767:
-            #: Unassigned
-            extend_enum(cls, 'Unassigned_%d' % value, value)
-            return cls(value)
-        if 32768 <= value <= 49151:
-            #: Reserved [:rfc:`7401`]
-            extend_enum(cls, 'Reserved_%d' % value, value)
-            return cls(value)
-        if 49152 <= value <= 61504:
-            #: Unassigned
-            extend_enum(cls, 'Unassigned_%d' % value, value)
-            return cls(value)
-        if 61506 <= value <= 61568:
-            #: Unassigned
-            extend_enum(cls, 'Unassigned_%d' % value, value)
-            return cls(value)
-        if 61570 <= value <= 61632:
-            #: Unassigned
-            extend_enum(cls, 'Unassigned_%d' % value, value)
-            return cls(value)
-        if 61634 <= value <= 61696:
-            #: Unassigned
-            extend_enum(cls, 'Unassigned_%d' % value, value)
-            return cls(value)
-        if 61698 <= value <= 63660:
-            #: Unassigned
-            extend_enum(cls, 'Unassigned_%d' % value, value)
-            return cls(value)
-        if 63662 <= value <= 63424:
-            #: Unassigned
-            extend_enum(cls, 'Unassigned_%d' % value, value)
-            return cls(value)
-        if 63426 <= value <= 63997:
-            #: Unassigned
-            extend_enum(cls, 'Unassigned_%d' % value, value)
-            return cls(value)
-        if 63999 <= value <= 64001:
-            #: Unassigned
-            extend_enum(cls, 'Unassigned_%d' % value, value)
-            return cls(value)
-        if 64003 <= value <= 64010:
-            #: Unassigned
-            extend_enum(cls, 'Unassigned_%d' % value, value)
-            return cls(value)
-        if 64012 <= value <= 64016:
-            #: Unassigned
-            extend_enum(cls, 'Unassigned_%d' % value, value)
-            return cls(value)
-        if 64018 <= value <= 65497:
-            #: Unassigned
-            extend_enum(cls, 'Unassigned_%d' % value, value)
-            return cls(value)
-        if 65503 <= value <= 65519:
-            #: Unassigned
-            extend_enum(cls, 'Unassigned_%d' % value, value)
-            return cls(value)
-        if 65521 <= value <= 65535:
-            #: Unassigned
-            extend_enum(cls, 'Unassigned_%d' % value, value)
-            return cls(value)
-        return super()._missing_(value)
+        member = _MISSING.lookup(cls, value)
+        if member is None:
+            return super()._missing_(value)
+        return member
@@ -4,9 +4,20 @@
 
 from aenum import IntEnum, extend_enum
 
+from pcapkit.corekit.registry import RangeTable
+
 __all__ = ['Registration']
 
 
+#: Range table of values not assigned in :class:`Registration`.
+_MISSING = RangeTable(
+    #: Unassigned
+    (3, 200, 'Unassigned_{:d}'),
+    #: Reserved for Private Use [:rfc:`8003`]
+    (201, 255, 'Reserved_for_Private_Use_{:d}'),
+)
+
+
 class Registration(IntEnum):
     """[Registration] Registration Types"""
 
@@ -33,12 +44,7 @@ class Registration(IntEnum):
         """Lookup function used when value is not found."""
         if not (isinstance(value, int) and 0 <= value <= 255):
             raise ValueError('%r is not a valid %s' % (value, cls.__name__))
-        if 3 <= value <= 200:
-            #: Unassigned
-            extend_enum(cls, 'Unassigned_%d' % value, value)
-            return cls(value)
-        if 201 <= value <= 255:
-            #: Reserved for Private Use [:rfc:`8003`]
-            extend_enum(cls, 'Reserved_for_Private_Use_%d' % value, value)
-            return cls(value)
-        return super()._missing_(value)
+        member = _MISSING.lookup(cls, value)
+        if member is None:
+            return super()._missing_(value)
+        return member
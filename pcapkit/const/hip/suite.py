@@ -4,9 +4,18 @@
 
 from aenum import IntEnum, extend_enum
 
+from pcapkit.corekit.registry import RangeTable
+
 __all__ = ['Suite']
 
 
+#: Range table of values not assigned in :class:`Suite`.
+_MISSING = RangeTable(
+    #: Unassigned
+    (7, 65535, 'Unassigned_{:d}'),
+)
+
+
 class Suite(IntEnum):
     """[Suite] Suite IDs"""
 
@@ -45,8 +54,7 @@ class Suite(IntEnum):
         """Lookup function used when value is not found."""
         if not (isinstance(value, int) and 0 <= value <= 65535):
             raise ValueError('%r is not a valid %s' % (value, cls.__name__))
-        if 7 <= value <= 65535:
-            #: Unassigned
-            extend_enum(cls, 'Unassigned_%d' % value, value)
-            return cls(value)
-        return super()._missing_(value)
+        member = _MISSING.lookup(cls, value)
+        if member is None:
+            return super()._missing_(value)
+        return member
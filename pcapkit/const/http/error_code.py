@@ -4,9 +4,18 @@
 
 from aenum import IntEnum, extend_enum
 
+from pcapkit.corekit.registry import RangeTable
+
 __all__ = ['ErrorCode']
 
 
+#: Range table of values not assigned in :class:`ErrorCode`.
+_MISSING = RangeTable(
+    #: Unassigned
+    (0x0000000E, 0xFFFFFFFF, 'Unassigned_0x{:09_X}'),
+)
+
+
 class ErrorCode(IntEnum):
     """[ErrorCode] HTTP/2 Error Code"""
 
@@ -66,9 +75,7 @@ class ErrorCode(IntEnum):
         """Lookup function used when value is not found."""
         if not (isinstance(value, int) and 0x00000000 <= value <= 0xFFFFFFFF):
             raise ValueError('%r is not a valid %s' % (value, cls.__name__))
-        if 0x0000000E <= value <= 0xFFFFFFFF:
-            #: Unassigned
-            temp = hex(value)[2:].upper().zfill(8)
-            extend_enum(cls, 'Unassigned_0x%s' % (temp[:4]+'_'+temp[4:]), value)
-            return cls(value)
-        return super()._missing_(value)
+        member = _MISSING.lookup(cls, value)
+        if member is None:
+            return super()._missing_(value)
+        return member
@@ -4,9 +4,20 @@
 
 from aenum import IntEnum, extend_enum
 
+from pcapkit.corekit.registry import RangeTable
+
 __all__ = ['Frame']
 
 
+#: Range table of values not assigned in :class:`Frame`.
+_MISSING = RangeTable(
+    #: Unassigned
+    (0x0D, 0xEF, 'Unassigned_0x{:02X}'),
+    #: Reserved for Experimental Use [:rfc:`7540`]
+    (0xF0, 0xFF, 'Reserved for Experimental Use_0x{:02X}'),
+)
+
+
 class Frame(IntEnum):
     """[Frame] HTTP/2 Frame Type"""
 
@@ -63,12 +74,7 @@ class Frame(IntEnum):
         """Lookup function used when value is not found."""
         if not (isinstance(value, int) and 0x00 <= value <= 0xFF):
             raise ValueError('%r is not a valid %s' % (value, cls.__name__))
-        if 0x0D <= value <= 0xEF:
-            #: Unassigned
-            extend_enum(cls, 'Unassigned_0x%s' % hex(value)[2:].upper().zfill(2), value)
-            return cls(value)
-        if 0xF0 <= value <= 0xFF:
-            #: Reserved for Experimental Use [:rfc:`7540`]
-            extend_enum(cls, 'Reserved for Experimental Use_0x%s' % hex(value)[2:].upper().zfill(2), value)
-            return cls(value)
-        return super()._missing_(value)
+        member = _MISSING.lookup(cls, value)
+        if member is None:
+            return super()._missing_(value)
+        return member
@@ -4,9 +4,22 @@
 
 from aenum import IntEnum, extend_enum
 
+from pcapkit.corekit.registry import RangeTable
+
 __all__ = ['Setting']
 
 
+#: Range table of values not assigned in :class:`Setting`.
+_MISSING = RangeTable(
+    #: Unassigned
+    (0x0009, 0x000F, 'Unassigned_0x{:04X}'),
+    #: Unassigned
+    (0x0011, 0xEFFF, 'Unassigned_0x{:04X}'),
+    #: Reserved for Experimental Use [:rfc:`7540`]
+    (0xF000, 0xFFFF, 'Reserved_for_Experimental_Use_0x{:04X}'),
+)
+
+
 class Setting(IntEnum):
     """[Setting] HTTP/2 Settings"""
 
@@ -54,16 +67,7 @@ class Setting(IntEnum):
         """Lookup function used when value is not found."""
         if not (isinstance(value, int) and 0x0000 <= value <= 0xFFFF):
             raise ValueError('%r is not a valid %s' % (value, cls.__name__))
-        if 0x0009 <= value <= 0x000F:
-            #: Unassigned
-            extend_enum(cls, 'Unassigned_0x%s' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
-        if 0x0011 <= value <= 0xEFFF:
-            #: Unassigned
-            extend_enum(cls, 'Unassigned_0x%s' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
-        if 0xF000 <= value <= 0xFFFF:
-            #: Reserved for Experimental Use [:rfc:`7540`]
-            extend_enum(cls, 'Reserved_for_Experimental_Use_0x%s' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
-        return super()._missing_(value)
+        member = _MISSING.lookup(cls, value)
+        if member is None:
+            return super()._missing_(value)
+        return member
@@ -4,9 +4,17 @@
 
 from aenum import IntEnum, extend_enum
 
+from pcapkit.corekit.registry import RangeTable
+
 __all__ = ['ClassificationLevel']
 
 
+#: Range table of values not assigned in :class:`ClassificationLevel`.
+_MISSING = RangeTable(
+    default='Unassigned_0b{:09_b}',
+)
+
+
 class ClassificationLevel(IntEnum):
     """[ClassificationLevel] Classification Level Encodings"""
 
@@ -40,6 +48,7 @@ class ClassificationLevel(IntEnum):
         """Lookup function used when value is not found."""
         if not (isinstance(value, int) and 0b00000000 <= value <= 0b11111111):
             raise ValueError('%r is not a valid %s' % (value, cls.__name__))
-        temp = bin(value)[2:].upper().zfill(8)
-        extend_enum(cls, 'Unassigned_0b%s' % (temp[:4]+'_'+temp[4:]), value)
-        return cls(value)
+        member = _MISSING.lookup(cls, value)
+        if member is None:
+            return super()._missing_(value)
+        return member
@@ -4,9 +4,17 @@
 
 from aenum import IntEnum, extend_enum
 
+from pcapkit.corekit.registry import RangeTable
+
 __all__ = ['ProtectionAuthority']
 
 
+#: Range table of values not assigned in :class:`ProtectionAuthority`.
+_MISSING = RangeTable(
+    default='Unassigned_{:d}',
+)
+
+
 class ProtectionAuthority(IntEnum):
     """[ProtectionAuthority] Protection Authority Bit Assignments"""
 
@@ -40,5 +48,7 @@ class ProtectionAuthority(IntEnum):
         """Lookup function used when value is not found."""
         if not (isinstance(value, int) and 0 <= value <= 7):
             raise ValueError('%r is not a valid %s' % (value, cls.__name__))
-        extend_enum(cls, 'Unassigned_%d' % value, value)
-        return cls(value)
+        member = _MISSING.lookup(cls, value)
+        if member is None:
+            return super()._missing_(value)
+        return member
@@ -4,9 +4,20 @@
 
 from aenum import IntEnum, extend_enum
 
+from pcapkit.corekit.registry import RangeTable
+
 __all__ = ['RouterAlert']
 
 
+#: Range table of values not assigned in :class:`RouterAlert`.
+_MISSING = RangeTable(
+    #: Unassigned
+    (66, 65502, 'Unassigned_{:d}'),
+    #: Reserved for experimental use [:rfc:`5350`]
+    (65503, 65534, 'Reserved for experimental use_{:d}'),
+)
+
+
 class RouterAlert(IntEnum):
     """[RouterAlert] IPv4 Router Alert Option Values"""
 
@@ -222,12 +233,7 @@ class RouterAlert(IntEnum):
         """Lookup function used when value is not found."""
         if not (isinstance(value, int) and 0 <= value <= 65535):
             raise ValueError('%r is not a valid %s' % (value, cls.__name__))
-        if 66 <= value <= 65502:
-            #: Unassigned
-            extend_enum(cls, 'Unassigned_%d' % value, value)
-            return cls(value)
-        if 65503 <= value <= 65534:
-            #: Reserved for experimental use [:rfc:`5350`]
-            extend_enum(cls, 'Reserved for experimental use_%d' % value, value)
-            return cls(value)
-        return super()._missing_(value)
+        member = _MISSING.lookup(cls, value)
+        if member is None:
+            return super()._missing_(value)
+        return member
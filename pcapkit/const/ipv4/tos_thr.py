@@ -4,9 +4,17 @@
 
 from aenum import IntEnum, extend_enum
 
+from pcapkit.corekit.registry import RangeTable
+
 __all__ = ['ToSThroughput']
 
 
+#: Range table of values not assigned in :class:`ToSThroughput`.
+_MISSING = RangeTable(
+    default='Unassigned_{:d}',
+)
+
+
 class ToSThroughput(IntEnum):
     """[ToSThroughput] ToS (DS Field) Throughput"""
 
@@ -28,5 +36,7 @@ class ToSThroughput(IntEnum):
         """Lookup function used when value is not found."""
         if not (isinstance(value, int) and 0 <= value <= 1):
             raise ValueError('%r is not a valid %s' % (value, cls.__name__))
-        extend_enum(cls, 'Unassigned_%d' % value, value)
-        return cls(value)
+        member = _MISSING.lookup(cls, value)
+        if member is None:
+            return super()._missing_(value)
+        return member
@@ -4,9 +4,17 @@
 
 from aenum import IntEnum, extend_enum
 
+from pcapkit.corekit.registry import RangeTable
+
 __all__ = ['Option']
 
 
+#: Range table of values not assigned in :class:`Option`.
+_MISSING = RangeTable(
+    default='Unassigned_0x{:02X}',
+)
+
+
 class Option(IntEnum):
     """[Option] Destination Options and Hop-by-Hop Options"""
 
@@ -114,5 +122,7 @@ class Option(IntEnum):
         """Lookup function used when value is not found."""
         if not (isinstance(value, int) and 0x00 <= value <= 0xFF):
             raise ValueError('%r is not a valid %s' % (value, cls.__name__))
-        extend_enum(cls, 'Unassigned_0x%s' % hex(value)[2:].upper().zfill(2), value)
-        return cls(value)
+        member = _MISSING.lookup(cls, value)
+        if member is None:
+            return super()._missing_(value)
+        return member
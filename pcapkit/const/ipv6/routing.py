@@ -4,9 +4,18 @@
 
 from aenum import IntEnum, extend_enum
 
+from pcapkit.corekit.registry import RangeTable
+
 __all__ = ['Routing']
 
 
+#: Range table of values not assigned in :class:`Routing`.
+_MISSING = RangeTable(
+    #: Unassigned
+    (5, 252, 'Unassigned_{:d}'),
+)
+
+
 class Routing(IntEnum):
     """[Routing] IPv6 Routing Types"""
 
@@ -48,8 +57,7 @@ class Routing(IntEnum):
         """Lookup function used when value is not found."""
         if not (isinstance(value, int) and 0 <= value <= 255):
             raise ValueError('%r is not a valid %s' % (value, cls.__name__))
-        if 5 <= value <= 252:
-            #: Unassigned
-            extend_enum(cls, 'Unassigned_%d' % value, value)
-            return cls(value)
-        return super()._missing_(value)
+        member = _MISSING.lookup(cls, value)
+        if member is None:
+            return super()._missing_(value)
+        return member
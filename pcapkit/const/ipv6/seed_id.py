@@ -4,9 +4,17 @@
 
 from aenum import IntEnum, extend_enum
 
+from pcapkit.corekit.registry import RangeTable
+
 __all__ = ['SeedID']
 
 
+#: Range table of values not assigned in :class:`SeedID`.
+_MISSING = RangeTable(
+    default='Unassigned_0b{:02b}',
+)
+
+
 class SeedID(IntEnum):
     """[SeedID] Seed-ID Types"""
 
@@ -32,5 +40,7 @@ class SeedID(IntEnum):
         """Lookup function used when value is not found."""
         if not (isinstance(value, int) and 0b00 <= value <= 0b11):
             raise ValueError('%r is not a valid %s' % (value, cls.__name__))
-        extend_enum(cls, 'Unassigned_0b%s' % bin(value)[2:].zfill(2), value)
-        return cls(value)
+        member = _MISSING.lookup(cls, value)
+        if member is None:
+            return super()._missing_(value)
+        return member
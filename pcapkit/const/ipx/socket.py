@@ -4,9 +4,26 @@
 
 from aenum import IntEnum, extend_enum
 
+from pcapkit.corekit.registry import RangeTable
+
 __all__ = ['Socket']
 
 
+#: Range table of values not assigned in :class:`Socket`.
+_MISSING = RangeTable(
+    #: Registered by Xerox
+    (0x0001, 0x0BB8, 'Registered by Xerox_0x{:04X}'),
+    #: Experimental
+    (0x0020, 0x003F, 'Experimental_0x{:04X}'),
+    #: Dynamically Assigned
+    (0x0BB9, 0xFFFF, 'Dynamically Assigned_0x{:04X}'),
+    #: Dynamically Assigned Socket Numbers
+    (0x4000, 0x4FFF, 'Dynamically Assigned Socket Numbers_0x{:04X}'),
+    #: Statically Assigned Socket Numbers
+    (0x8000, 0xFFFF, 'Statically Assigned Socket Numbers_0x{:04X}'),
+)
+
+
 class Socket(IntEnum):
     """[Socket] Socket Types"""
 
@@ -66,24 +83,7 @@ class Socket(IntEnum):
         """Lookup function used when value is not found."""
         if not (isinstance(value, int) and 0x0000 <= value <= 0xFFFF):
             raise ValueError('%r is not a valid %s' % (value, cls.__name__))
-        if 0x0001 <= value <= 0x0BB8:
-            #: Registered by Xerox
-            extend_enum(cls, 'Registered by Xerox_0x%s' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
-        if 0x0020 <= value <= 0x003F:
-            #: Experimental
-            extend_enum(cls, 'Experimental_0x%s' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
-        if 0x0BB9 <= value <= 0xFFFF:
-            #: Dynamically Assigned
-            extend_enum(cls, 'Dynamically Assigned_0x%s' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
-        if 0x4000 <= value <= 0x4FFF:
-            #: Dynamically Assigned Socket Numbers
-            extend_enum(cls, 'Dynamically Assigned Socket Numbers_0x%s' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
-        if 0x8000 <= value <= 0xFFFF:
-            #: Statically Assigned Socket Numbers
-            extend_enum(cls, 'Statically Assigned Socket Numbers_0x%s' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
-        return super()._missing_(value)
+        member = _MISSING.lookup(cls, value)
+        if member is None:
+            return super()._missing_(value)
+        return member
@@ -4,9 +4,20 @@
 
 from aenum import IntEnum, extend_enum
 
+from pcapkit.corekit.registry import RangeTable
+
 __all__ = ['Authentication']
 
 
+#: Range table of values not assigned in :class:`Authentication`.
+_MISSING = RangeTable(
+    #: Unassigned
+    (4, 255, 'Unassigned_{:d}'),
+    #: Deprecated [:rfc:`6549`]
+    (256, 65535, 'Deprecated_{:d}'),
+)
+
+
 class Authentication(IntEnum):
     """[Authentication] Authentication Types"""
 
@@ -36,12 +47,7 @@ class Authentication(IntEnum):
         """Lookup function used when value is not found."""
         if not (isinstance(value, int) and 0 <= value <= 65535):
             raise ValueError('%r is not a valid %s' % (value, cls.__name__))
-        if 4 <= value <= 255:
-            #: Unassigned
-            extend_enum(cls, 'Unassigned_%d' % value, value)
-            return cls(value)
-        if 256 <= value <= 65535:
-            #: Deprecated [:rfc:`6549`]
-            extend_enum(cls, 'Deprecated_%d' % value, value)
-            return cls(value)
-        return super()._missing_(value)
+        member = _MISSING.lookup(cls, value)
+        if member is None:
+            return super()._missing_(value)
+        return member
@@ -4,9 +4,20 @@
 
 from aenum import IntEnum, extend_enum
 
+from pcapkit.corekit.registry import RangeTable
+
 __all__ = ['Packet']
 
 
+#: Range table of values not assigned in :class:`Packet`.
+_MISSING = RangeTable(
+    #: Unassigned
+    (6, 127, 'Unassigned_{:d}'),
+    #: Reserved
+    (128, 255, 'Reserved_{:d}'),
+)
+
+
 class Packet(IntEnum):
     """[Packet] OSPF Packet Types"""
 
@@ -42,12 +53,7 @@ class Packet(IntEnum):
         """Lookup function used when value is not found."""
         if not (isinstance(value, int) and 0 <= value <= 65535):
             raise ValueError('%r is not a valid %s' % (value, cls.__name__))
-        if 6 <= value <= 127:
-            #: Unassigned
-            extend_enum(cls, 'Unassigned_%d' % value, value)
-            return cls(value)
-        if 128 <= value <= 255:
-            #: Reserved
-            extend_enum(cls, 'Reserved_%d' % value, value)
-            return cls(value)
-        return super()._missing_(value)
+        member = _MISSING.lookup(cls, value)
+        if member is None:
+            return super()._missing_(value)
+        return member
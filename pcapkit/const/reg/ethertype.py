@@ -4,9 +4,128 @@
 
 from aenum import IntEnum, extend_enum
 
+from pcapkit.corekit.registry import RangeTable
+
 __all__ = ['EtherType']
 
 
+#: Range table of values not assigned in :class:`EtherType`.
+_MISSING = RangeTable(
+    #: IEEE802.3 Length Field [Neil Sembower]
+    (0x0000, 0x05DC, 'IEEE802_3_Length_Field_0x{:04X}'),
+    #: Experimental [Neil Sembower]
+    (0x0101, 0x01FF, 'Experimental_0x{:04X}'),
+    #: Xyplex [Neil Sembower]
+    (0x0888, 0x088A, 'Xyplex_0x{:04X}'),
+    #: Berkeley Trailer encap/IP [Neil Sembower]
+    (0x1001, 0x100F, 'Berkeley_Trailer_encap_IP_0x{:04X}'),
+    #: DEC Unassigned [Neil Sembower]
+    (0x6008, 0x6009, 'DEC_Unassigned_0x{:04X}'),
+    #: 3Com Corporation [Neil Sembower]
+    (0x6010, 0x6014, 'EtherType_3Com_Corporation_0x{:04X}'),
+    #: LRT [Neil Sembower]
+    (0x7020, 0x7029, 'LRT_0x{:04X}'),
+    #: DEC Unassigned [Neil Sembower]
+    (0x8039, 0x803C, 'DEC_Unassigned_0x{:04X}'),
+    #: DEC Unassigned [Neil Sembower]
+    (0x8040, 0x8042, 'DEC_Unassigned_0x{:04X}'),
+    #: Landmark Graphics Corp. [Neil Sembower]
+    (0x806E, 0x8077, 'Landmark_Graphics_Corp_0x{:04X}'),
+    #: Vitalink Communications [Neil Sembower]
+    (0x807D, 0x807F, 'Vitalink_Communications_0x{:04X}'),
+    #: Counterpoint Computers [Neil Sembower]
+    (0x8081, 0x8083, 'Counterpoint_Computers_0x{:04X}'),
+    #: Datability [Neil Sembower]
+    (0x809C, 0x809E, 'Datability_0x{:04X}'),
+    #: Siemens Gammasonics Inc. [Neil Sembower]
+    (0x80A4, 0x80B3, 'Siemens_Gammasonics_Inc_0x{:04X}'),
+    #: DCA Data Exchange Cluster [Neil Sembower]
+    (0x80C0, 0x80C3, 'DCA_Data_Exchange_Cluster_0x{:04X}'),
+    #: Intergraph Corporation [Neil Sembower]
+    (0x80C8, 0x80CC, 'Intergraph_Corporation_0x{:04X}'),
+    #: Harris Corporation [Neil Sembower]
+    (0x80CD, 0x80CE, 'Harris_Corporation_0x{:04X}'),
+    #: Taylor Instrument [Neil Sembower]
+    (0x80CF, 0x80D2, 'Taylor_Instrument_0x{:04X}'),
+    #: Rosemount Corporation [Neil Sembower]
+    (0x80D3, 0x80D4, 'Rosemount_Corporation_0x{:04X}'),
+    #: Integrated Solutions TRFS [Neil Sembower]
+    (0x80DE, 0x80DF, 'Integrated_Solutions_TRFS_0x{:04X}'),
+    #: Allen-Bradley [Neil Sembower]
+    (0x80E0, 0x80E3, 'Allen_Bradley_0x{:04X}'),
+    #: Datability [Neil Sembower]
+    (0x80E4, 0x80F0, 'Datability_0x{:04X}'),
+    #: Kinetics [Neil Sembower]
+    (0x80F4, 0x80F5, 'Kinetics_0x{:04X}'),
+    #: Wellfleet Communications [Neil Sembower]
+    (0x8101, 0x8103, 'Wellfleet_Communications_0x{:04X}'),
+    #: Symbolics Private [Neil Sembower]
+    (0x8107, 0x8109, 'Symbolics_Private_0x{:04X}'),
+    #: Bridge Communications [Neil Sembower]
+    (0x8132, 0x8136, 'Bridge_Communications_0x{:04X}'),
+    #: Novell, Inc. [Neil Sembower]
+    (0x8137, 0x8138, 'Novell_Inc_0x{:04X}'),
+    #: KTI [Neil Sembower]
+    (0x8139, 0x813D, 'KTI_0x{:04X}'),
+    #: Qualcomm [Neil Sembower]
+    (0x8151, 0x8153, 'Qualcomm_0x{:04X}'),
+    #: Computer Protocol Pty Ltd [Neil Sembower]
+    (0x815C, 0x815E, 'Computer_Protocol_Pty_Ltd_0x{:04X}'),
+    #: Charles River Data System [Neil Sembower]
+    (0x8164, 0x8166, 'Charles_River_Data_System_0x{:04X}'),
+    #: Silicon Graphics prop. [Neil Sembower]
+    (0x8184, 0x818C, 'Silicon_Graphics_prop_0x{:04X}'),
+    #: Qualcomm [Neil Sembower]
+    (0x819A, 0x81A3, 'Qualcomm_0x{:04X}'),
+    #: RAD Network Devices [Neil Sembower]
+    (0x81A5, 0x81AE, 'RAD_Network_Devices_0x{:04X}'),
+    #: Xyplex [Neil Sembower]
+    (0x81B7, 0x81B9, 'Xyplex_0x{:04X}'),
+    #: Apricot Computers [Neil Sembower]
+    (0x81CC, 0x81D5, 'Apricot_Computers_0x{:04X}'),
+    #: Artisoft [Neil Sembower]
+    (0x81D6, 0x81DD, 'Artisoft_0x{:04X}'),
+    #: Polygon [Neil Sembower]
+    (0x81E6, 0x81EF, 'Polygon_0x{:04X}'),
+    #: Comsat Labs [Neil Sembower]
+    (0x81F0, 0x81F2, 'Comsat_Labs_0x{:04X}'),
+    #: SAIC [Neil Sembower]
+    (0x81F3, 0x81F5, 'SAIC_0x{:04X}'),
+    #: VG Analytical [Neil Sembower]
+    (0x81F6, 0x81F8, 'VG_Analytical_0x{:04X}'),
+    #: Quantum Software [Neil Sembower]
+    (0x8203, 0x8205, 'Quantum_Software_0x{:04X}'),
+    #: Ascom Banking Systems [Neil Sembower]
+    (0x8221, 0x8222, 'Ascom_Banking_Systems_0x{:04X}'),
+    #: Advanced Encryption Syste [Neil Sembower]
+    (0x823E, 0x8240, 'Advanced_Encryption_Syste_0x{:04X}'),
+    #: Athena Programming [Neil Sembower]
+    (0x827F, 0x8282, 'Athena_Programming_0x{:04X}'),
+    #: Charles River Data System [Neil Sembower]
+    (0x8263, 0x826A, 'Charles_River_Data_System_0x{:04X}'),
+    #: Inst Ind Info Tech [Neil Sembower]
+    (0x829A, 0x829B, 'Inst_Ind_Info_Tech_0x{:04X}'),
+    #: Taurus Controls [Neil Sembower]
+    (0x829C, 0x82AB, 'Taurus_Controls_0x{:04X}'),
+    #: Walker Richer & Quinn [Neil Sembower]
+    (0x82AC, 0x8693, 'Walker_Richer_Quinn_0x{:04X}'),
+    #: Idea Courier [Neil Sembower]
+    (0x8694, 0x869D, 'Idea_Courier_0x{:04X}'),
+    #: Computer Network Tech [Neil Sembower]
+    (0x869E, 0x86A1, 'Computer_Network_Tech_0x{:04X}'),
+    #: Gateway Communications [Neil Sembower]
+    (0x86A3, 0x86AC, 'Gateway_Communications_0x{:04X}'),
+    #: Landis & Gyr Powers [Neil Sembower]
+    (0x86E0, 0x86EF, 'Landis_Gyr_Powers_0x{:04X}'),
+    #: Motorola [Neil Sembower]
+    (0x8700, 0x8710, 'Motorola_0x{:04X}'),
+    #: Invisible Software [Neil Sembower]
+    (0x8A96, 0x8A97, 'Invisible_Software_0x{:04X}'),
+    #: ISC Bunker Ramo [Neil Sembower]
+    (0xFF00, 0xFF0F, 'ISC_Bunker_Ramo_0x{:04X}'),
+)
+
+
 class EtherType(IntEnum):
     """[EtherType] Ethertype IEEE 802 Numbers"""
 
@@ -510,228 +629,7 @@ class EtherType(IntEnum):
         """Lookup function used when value is not found."""
         if not (isinstance(value, int) and 0x0000 <= value <= 0xFFFF):
             raise ValueError('%r is not a valid %s' % (value, cls.__name__))
-        if 0x0000 <= value <= 0x05DC:
-            #: IEEE802.3 Length Field [Neil Sembower]
-            extend_enum(cls, 'IEEE802_3_Length_Field_0x%s' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
-        if 0x0101 <= value <= 0x01FF:
-            #: Experimental [Neil Sembower]
-            extend_enum(cls, 'Experimental_0x%s' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
-        if 0x0888 <= value <= 0x088A:
-            #: Xyplex [Neil Sembower]
-            extend_enum(cls, 'Xyplex_0x%s' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
-        if 0x1001 <= value <= 0x100F:
-            #: Berkeley Trailer encap/IP [Neil Sembower]
-            extend_enum(cls, 'Berkeley_Trailer_encap_IP_0x%s' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
-        if 0x6008 <= value <= 0x6009:
-            #: DEC Unassigned [Neil Sembower]
-            extend_enum(cls, 'DEC_Unassigned_0x%s' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
-        if 0x6010 <= value <= 0x6014:
-            #: 3Com Corporation [Neil Sembower]
-            extend_enum(cls, 'EtherType_3Com_Corporation_0x%s' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
-        if 0x7020 <= value <= 0x7029:
-            #: LRT [Neil Sembower]
-            extend_enum(cls, 'LRT_0x%s' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
-        if 0x8039 <= value <= 0x803C:
-            #: DEC Unassigned [Neil Sembower]
-            extend_enum(cls, 'DEC_Unassigned_0x%s' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
-        if 0x8040 <= value <= 0x8042:
-            #: DEC Unassigned [Neil Sembower]
-            extend_enum(cls, 'DEC_Unassigned_0x%s' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
-        if 0x806E <= value <= 0x8077:
-            #: Landmark Graphics Corp. [Neil Sembower]
-            extend_enum(cls, 'Landmark_Graphics_Corp_0x%s' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
-        if 0x807D <= value <= 0x807F:
-            #: Vitalink Communications [Neil Sembower]
-            extend_enum(cls, 'Vitalink_Communications_0x%s' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
-        if 0x8081 <= value <= 0x8083:
-            #: Counterpoint Computers [Neil Sembower]
-            extend_enum(cls, 'Counterpoint_Computers_0x%s' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
-        if 0x809C <= value <= 0x809E:
-            #: Datability [Neil Sembower]
-            extend_enum(cls, 'Datability_0x%s' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
-        if 0x80A4 <= value <= 0x80B3:
-            #: Siemens Gammasonics Inc. [Neil Sembower]
-            extend_enum(cls, 'Siemens_Gammasonics_Inc_0x%s' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
-        if 0x80C0 <= value <= 0x80C3:
-            #: DCA Data Exchange Cluster [Neil Sembower]
-            extend_enum(cls, 'DCA_Data_Exchange_Cluster_0x%s' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
-        if 0x80C8 <= value <= 0x80CC:
-            #: Intergraph Corporation [Neil Sembower]
-            extend_enum(cls, 'Intergraph_Corporation_0x%s' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
-        if 0x80CD <= value <= 0x80CE:
-            #: Harris Corporation [Neil Sembower]
-            extend_enum(cls, 'Harris_Corporation_0x%s' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
-        if 0x80CF <= value <= 0x80D2:
-            #: Taylor Instrument [Neil Sembower]
-            extend_enum(cls, 'Taylor_Instrument_0x%s' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
-        if 0x80D3 <= value <= 0x80D4:
-            #: Rosemount Corporation [Neil Sembower]
-            extend_enum(cls, 'Rosemount_Corporation_0x%s' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
-        if 0x80DE <= value <= 0x80DF:
-            #: Integrated Solutions TRFS [Neil Sembower]
-            extend_enum(cls, 'Integrated_Solutions_TRFS_0x%s' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
-        if 0x80E0 <= value <= 0x80E3:
-            #: Allen-Bradley [Neil Sembower]
-            extend_enum(cls, 'Allen_Bradley_0x%s' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
-        if 0x80E4 <= value <= 0x80F0:
-            #: Datability [Neil Sembower]
-            extend_enum(cls, 'Datability_0x%s' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
-        if 0x80F4 <= value <= 0x80F5:
-            #: Kinetics [Neil Sembower]
-            extend_enum(cls, 'Kinetics_0x%s' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
-        if 0x8101 <= value <= 0x8103:
-            #: Wellfleet Communications [Neil Sembower]
-            extend_enum(cls, 'Wellfleet_Communications_0x%s' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
-        if 0x8107 <= value <= 0x8109:
-            #: Symbolics Private [Neil Sembower]
-            extend_enum(cls, 'Symbolics_Private_0x%s' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
-        if 0x8132 <= value <= 0x8136:
-            #: Bridge Communications [Neil Sembower]
-            extend_enum(cls, 'Bridge_Communications_0x%s' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
-        if 0x8137 <= value <= 0x8138:
-            #: Novell, Inc. [Neil Sembower]
-            extend_enum(cls, 'Novell_Inc_0x%s' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
-        if 0x8139 <= value <= 0x813D:
-            #: KTI [Neil Sembower]
-            extend_enum(cls, 'KTI_0x%s' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
-        if 0x8151 <= value <= 0x8153:
-            #: Qualcomm [Neil Sembower]
-            extend_enum(cls, 'Qualcomm_0x%s' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
-        if 0x815C <= value <= 0x815E:
-            #: Computer Protocol Pty Ltd [Neil Sembower]
-            extend_enum(cls, 'Computer_Protocol_Pty_Ltd_0x%s' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
-        if 0x8164 <= value <= 0x8166:
-            #: Charles River Data System [Neil Sembower]
-            extend_enum(cls, 'Charles_River_Data_System_0x%s' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
-        if 0x8184 <= value <= 0x818C:
-            #: Silicon Graphics prop. [Neil Sembower]
-            extend_enum(cls, 'Silicon_Graphics_prop_0x%s' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
-        if 0x819A <= value <= 0x81A3:
-            #: Qualcomm [Neil Sembower]
-            extend_enum(cls, 'Qualcomm_0x%s' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
-        if 0x81A5 <= value <= 0x81AE:
-            #: RAD Network Devices [Neil Sembower]
-            extend_enum(cls, 'RAD_Network_Devices_0x%s' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
-        if 0x81B7 <= value <= 0x81B9:
-            #: Xyplex [Neil Sembower]
-            extend_enum(cls, 'Xyplex_0x%s' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
-        if 0x81CC <= value <= 0x81D5:
-            #: Apricot Computers [Neil Sembower]
-            extend_enum(cls, 'Apricot_Computers_0x%s' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
-        if 0x81D6 <= value <= 0x81DD:
-            #: Artisoft [Neil Sembower]
-            extend_enum(cls, 'Artisoft_0x%s' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
-        if 0x81E6 <= value <= 0x81EF:
-            #: Polygon [Neil Sembower]
-            extend_enum(cls, 'Polygon_0x%s' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
-        if 0x81F0 <= value <= 0x81F2:
-            #: Comsat Labs [Neil Sembower]
-            extend_enum(cls, 'Comsat_Labs_0x%s' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
-        if 0x81F3 <= value <= 0x81F5:
-            #: SAIC [Neil Sembower]
-            extend_enum(cls, 'SAIC_0x%s' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
-        if 0x81F6 <= value <= 0x81F8:
-            #: VG Analytical [Neil Sembower]
-            extend_enum(cls, 'VG_Analytical_0x%s' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
-        if 0x8203 <= value <= 0x8205:
-            #: Quantum Software [Neil Sembower]
-            extend_enum(cls, 'Quantum_Software_0x%s' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
-        if 0x8221 <= value <= 0x8222:
-            #: Ascom Banking Systems [Neil Sembower]
-            extend_enum(cls, 'Ascom_Banking_Systems_0x%s' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
-        if 0x823E <= value <= 0x8240:
-            #: Advanced Encryption Syste [Neil Sembower]
-            extend_enum(cls, 'Advanced_Encryption_Syste_0x%s' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
-        if 0x827F <= value <= 0x8282:
-            #: Athena Programming [Neil Sembower]
-            extend_enum(cls, 'Athena_Programming_0x%s' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
-        if 0x8263 <= value <= 0x826A:
-            #: Charles River Data System [Neil Sembower]
-            extend_enum(cls, 'Charles_River_Data_System_0x%s' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
-        if 0x829A <= value <= 0x829B:
-            #: Inst Ind Info Tech [Neil Sembower]
-            extend_enum(cls, 'Inst_Ind_Info_Tech_0x%s' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
-        if 0x829C <= value <= 0x82AB:
-            #: Taurus Controls [Neil Sembower]
-            extend_enum(cls, 'Taurus_Controls_0x%s' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
-        if 0x82AC <= value <= 0x8693:
-            #: Walker Richer & Quinn [Neil Sembower]
-            extend_enum(cls, 'Walker_Richer_Quinn_0x%s' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
-        if 0x8694 <= value <= 0x869D:
-            #: Idea Courier [Neil Sembower]
-            extend_enum(cls, 'Idea_Courier_0x%s' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
-        if 0x869E <= value <= 0x86A1:
-            #: Computer Network Tech [Neil Sembower]
-            extend_enum(cls, 'Computer_Network_Tech_0x%s' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
-        if 0x86A3 <= value <= 0x86AC:
-            #: Gateway Communications [Neil Sembower]
-            extend_enum(cls, 'Gateway_Communications_0x%s' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
-        if 0x86E0 <= value <= 0x86EF:
-            #: Landis & Gyr Powers [Neil Sembower]
-            extend_enum(cls, 'Landis_Gyr_Powers_0x%s' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
-        if 0x8700 <= value <= 0x8710:
-            #: Motorola [Neil Sembower]
-            extend_enum(cls, 'Motorola_0x%s' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
-        if 0x8A96 <= value <= 0x8A97:
-            #: Invisible Software [Neil Sembower]
-            extend_enum(cls, 'Invisible_Software_0x%s' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
-        if 0xFF00 <= value <= 0xFF0F:
-            #: ISC Bunker Ramo [Neil Sembower]
-            extend_enum(cls, 'ISC_Bunker_Ramo_0x%s' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
-        return super()._missing_(value)
+        member = _MISSING.lookup(cls, value)
+        if member is None:
+            return super()._missing_(value)
+        return member
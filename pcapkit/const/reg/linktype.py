@@ -4,9 +4,17 @@
 
 from aenum import IntEnum, extend_enum
 
+from pcapkit.corekit.registry import RangeTable
+
 __all__ = ['LinkType']
 
 
+#: Range table of values not assigned in :class:`LinkType`.
+_MISSING = RangeTable(
+    default='Unassigned_{:d}',
+)
+
+
 class LinkType(IntEnum):
     """[LinkType] Link-Layer Header Type Values"""
 
@@ -408,5 +416,7 @@ class LinkType(IntEnum):
         """Lookup function used when value is not found."""
         if not (isinstance(value, int) and 0x00000000 <= value <= 0xFFFFFFFF):
             raise ValueError('%r is not a valid %s' % (value, cls.__name__))
-        extend_enum(cls, 'Unassigned_%d' % value, value)
-        return cls(value)
+        member = _MISSING.lookup(cls, value)
+        if member is None:
+            return super()._missing_(value)
+        return member
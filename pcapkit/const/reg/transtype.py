@@ -4,9 +4,18 @@
 
 from aenum import IntEnum, extend_enum
 
+from pcapkit.corekit.registry import RangeTable
+
 __all__ = ['TransType']
 
 
+#: Range table of values not assigned in :class:`TransType`.
+_MISSING = RangeTable(
+    #: [Internet Assigned Numbers Authority] Unassigned
+    (144, 252, 'Unassigned_{:d}'),
+)
+
+
 class TransType(IntEnum):
     """[TransType] Transport Layer Protocol Numbers"""
 
@@ -492,8 +501,7 @@ class TransType(IntEnum):
         """Lookup function used when value is not found."""
         if not (isinstance(value, int) and 0 <= value <= 255):
             raise ValueError('%r is not a valid %s' % (value, cls.__name__))
-        if 144 <= value <= 252:
-            #: [Internet Assigned Numbers Authority] Unassigned
-            extend_enum(cls, 'Unassigned_%d' % value, value)
-            return cls(value)
-        return super()._missing_(value)
+        member = _MISSING.lookup(cls, value)
+        if member is None:
+            return super()._missing_(value)
+        return member
@@ -4,9 +4,22 @@
 
 from aenum import IntEnum, extend_enum
 
+from pcapkit.corekit.registry import RangeTable
+
 __all__ = ['Option']
 
 
+#: Range table of values not assigned in :class:`Option`.
+_MISSING = RangeTable(
+    #: Reserved
+    (35, 68, 'Reserved_{:d}'),
+    #: Reserved
+    (71, 75, 'Reserved_{:d}'),
+    #: Reserved
+    (79, 252, 'Reserved_{:d}'),
+)
+
+
 class Option(IntEnum):
     """[Option] TCP Option Kind Numbers"""
 
@@ -153,16 +166,7 @@ class Option(IntEnum):
         """Lookup function used when value is not found."""
         if not (isinstance(value, int) and 0 <= value <= 255):
             raise ValueError('%r is not a valid %s' % (value, cls.__name__))
-        if 35 <= value <= 68:
-            #: Reserved
-            extend_enum(cls, 'Reserved_%d' % value, value)
-            return cls(value)
-        if 71 <= value <= 75:
-            #: Reserved
-            extend_enum(cls, 'Reserved_%d' % value, value)
-            return cls(value)
-        if 79 <= value <= 252:
-            #: Reserved
-            extend_enum(cls, 'Reserved_%d' % value, value)
-            return cls(value)
-        return super()._missing_(value)
+        member = _MISSING.lookup(cls, value)
+        if member is None:
+            return super()._missing_(value)
+        return member
@@ -0,0 +1,8 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=unused-import
+"""TLS constant enumerations."""
+
+from pcapkit.const.tls.content_type import ContentType as TLS_ContentType
+from pcapkit.const.tls.handshake_type import HandshakeType as TLS_HandshakeType
+
+__all__ = ['TLS_ContentType', 'TLS_HandshakeType']
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=line-too-long
+"""TLS ContentType"""
+
+from aenum import IntEnum, extend_enum
+
+from pcapkit.corekit.registry import RangeTable
+
+__all__ = ['ContentType']
+
+
+#: Range table of values not assigned in :class:`ContentType`.
+_MISSING = RangeTable(
+    #: Unassigned
+    (0, 19, 'Unassigned_{:d}'),
+    #: Unassigned
+    (27, 255, 'Unassigned_{:d}'),
+)
+
+
+class ContentType(IntEnum):
+    """[ContentType] TLS ContentType"""
+
+    #: change_cipher_spec [:rfc:`8446`]
+    change_cipher_spec = 20
+
+    #: alert [:rfc:`8446`]
+    alert = 21
+
+    #: handshake [:rfc:`8446`]
+    handshake = 22
+
+    #: application_data [:rfc:`8446`]
+    application_data = 23
+
+    #: heartbeat [:rfc:`6520`]
+    heartbeat = 24
+
+    #: tls12_cid [:rfc:`9146`]
+    tls12_cid = 25
+
+    #: ACK [:rfc:`9147`]
+    ACK = 26
+
+    @staticmethod
+    def get(key, default=-1):
+        """Backport support for original codes."""
+        if isinstance(key, int):
+            return ContentType(key)
+        if key not in ContentType._member_map_:  # pylint: disable=no-member
+            extend_enum(ContentType, key, default)
+        return ContentType[key]
+
+    @classmethod
+    def _missing_(cls, value):
+        """Lookup function used when value is not found."""
+        if not (isinstance(value, int) and 0 <= value <= 255):
+            raise ValueError('%r is not a valid %s' % (value, cls.__name__))
+        member = _MISSING.lookup(cls, value)
+        if member is None:
+            return super()._missing_(value)
+        return member
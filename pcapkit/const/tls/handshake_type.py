@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=line-too-long
+"""TLS HandshakeType"""
+
+from aenum import IntEnum, extend_enum
+
+from pcapkit.corekit.registry import RangeTable
+
+__all__ = ['HandshakeType']
+
+
+#: Range table of values not assigned in :class:`HandshakeType`.
+_MISSING = RangeTable(
+    #: Unassigned
+    (18, 19, 'Unassigned_{:d}'),
+    #: Unassigned
+    (27, 253, 'Unassigned_{:d}'),
+)
+
+
+class HandshakeType(IntEnum):
+    """[HandshakeType] TLS HandshakeType"""
+
+    #: hello_request_RESERVED [:rfc:`8446`]
+    hello_request_RESERVED = 0
+
+    #: client_hello [:rfc:`8446`]
+    client_hello = 1
+
+    #: server_hello [:rfc:`8446`]
+    server_hello = 2
+
+    #: hello_verify_request [:rfc:`6347`]
+    hello_verify_request = 3
+
+    #: new_session_ticket [:rfc:`4507`][:rfc:`8446`]
+    new_session_ticket = 4
+
+    #: end_of_early_data [:rfc:`8446`]
+    end_of_early_data = 5
+
+    #: hello_retry_request_RESERVED [:rfc:`8446`]
+    hello_retry_request_RESERVED = 6
+
+    #: Unassigned
+    Unassigned_7 = 7
+
+    #: encrypted_extensions [:rfc:`8446`]
+    encrypted_extensions = 8
+
+    #: request_connection_id [:rfc:`9147`]
+    request_connection_id = 9
+
+    #: new_connection_id [:rfc:`9147`]
+    new_connection_id = 10
+
+    #: certificate [:rfc:`8446`]
+    certificate = 11
+
+    #: server_key_exchange_RESERVED [:rfc:`8446`]
+    server_key_exchange_RESERVED = 12
+
+    #: certificate_request [:rfc:`8446`]
+    certificate_request = 13
+
+    #: server_hello_done_RESERVED [:rfc:`8446`]
+    server_hello_done_RESERVED = 14
+
+    #: certificate_verify [:rfc:`8446`]
+    certificate_verify = 15
+
+    #: client_key_exchange_RESERVED [:rfc:`8446`]
+    client_key_exchange_RESERVED = 16
+
+    #: client_certificate_request [:rfc:`9261`]
+    client_certificate_request = 17
+
+    #: finished [:rfc:`8446`]
+    finished = 20
+
+    #: certificate_url_RESERVED [:rfc:`8446`]
+    certificate_url_RESERVED = 21
+
+    #: certificate_status_RESERVED [:rfc:`8446`]
+    certificate_status_RESERVED = 22
+
+    #: supplemental_data_RESERVED [:rfc:`8446`]
+    supplemental_data_RESERVED = 23
+
+    #: key_update [:rfc:`8446`]
+    key_update = 24
+
+    #: compressed_certificate [:rfc:`8879`]
+    compressed_certificate = 25
+
+    #: ekt_key [:rfc:`8870`]
+    ekt_key = 26
+
+    #: message_hash [:rfc:`8446`]
+    message_hash = 254
+
+    #: Unassigned
+    Unassigned_255 = 255
+
+    @staticmethod
+    def get(key, default=-1):
+        """Backport support for original codes."""
+        if isinstance(key, int):
+            return HandshakeType(key)
+        if key not in HandshakeType._member_map_:  # pylint: disable=no-member
+            extend_enum(HandshakeType, key, default)
+        return HandshakeType[key]
+
+    @classmethod
+    def _missing_(cls, value):
+        """Lookup function used when value is not found."""
+        if not (isinstance(value, int) and 0 <= value <= 255):
+            raise ValueError('%r is not a valid %s' % (value, cls.__name__))
+        member = _MISSING.lookup(cls, value)
+        if member is None:
+            return super()._missing_(value)
+        return member
@@ -4,9 +4,17 @@
 
 from aenum import IntEnum, extend_enum
 
+from pcapkit.corekit.registry import RangeTable
+
 __all__ = ['PriorityLevel']
 
 
+#: Range table of values not assigned in :class:`PriorityLevel`.
+_MISSING = RangeTable(
+    default='Unassigned [0b{:03b}]',
+)
+
+
 class PriorityLevel(IntEnum):
     """[PriorityLevel] Priority levels defined in IEEE 802.1p."""
 
@@ -48,5 +56,7 @@ class PriorityLevel(IntEnum):
         """Lookup function used when value is not found."""
         if not (isinstance(value, int) and 0b000 <= value <= 0b111):
             raise ValueError('%r is not a valid %s' % (value, cls.__name__))
-        extend_enum(cls, 'Unassigned [0b%s]' % bin(value)[2:].zfill(3), value)
-        return cls(value)
+        member = _MISSING.lookup(cls, value)
+        if member is None:
+            return super()._missing_(value)
+        return member
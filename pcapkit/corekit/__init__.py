@@ -6,11 +6,21 @@
 for :mod:`pcapkit` implementation, including :obj:`dict` like
 class :class:`~pcapkit.corekit.infoclass.Info`,
 :obj:`tuple` like class :class:`~pcapkit.corekit.version.VersionInfo`,
-and protocol collection class :class:`~pcapkit.corekit.protochain.ProtoChain`.
+protocol collection class :class:`~pcapkit.corekit.protochain.ProtoChain`,
+type-length-value option engine class :class:`~pcapkit.corekit.tlv.TLVEngine`,
+interned address cache class :class:`~pcapkit.corekit.address.AddressCache`,
+range table class :class:`~pcapkit.corekit.registry.RangeTable` of
+constant enumerations, and frame store classes, e.g.
+:class:`~pcapkit.corekit.store.RingStore`, of extracted frames.
 
 """
+from pcapkit.corekit.address import AddressCache
 from pcapkit.corekit.infoclass import Info
 from pcapkit.corekit.protochain import ProtoChain
+from pcapkit.corekit.registry import RangeTable
+from pcapkit.corekit.store import FrameStore, IndexStore, ListStore, RingStore, SpillStore
+from pcapkit.corekit.tlv import TLVEngine
 from pcapkit.corekit.version import VersionInfo
 
-__all__ = ['Info', 'ProtoChain', 'VersionInfo']
+__all__ = ['AddressCache', 'Info', 'ProtoChain', 'RangeTable', 'TLVEngine', 'VersionInfo',
+           'FrameStore', 'ListStore', 'RingStore', 'IndexStore', 'SpillStore']
@@ -0,0 +1,261 @@
+# -*- coding: utf-8 -*-
+"""interned address cache
+
+:mod:`pcapkit.corekit.address` contains least recently used
+cache class :class:`~pcapkit.corekit.address.AddressCache`
+of IP and MAC addresses keyed by their raw bytes, so that
+addresses of the same endpoints are decoded once and shared
+as immutable objects across packets, and lazy address class
+:class:`~pcapkit.corekit.address.LazyAddress`, which keeps an
+address as raw bytes until it is first accessed.
+
+The default cache used by protocols is
+:data:`~pcapkit.corekit.address.ADDRESS_CACHE`.
+
+"""
+import collections
+import ipaddress
+import sys
+import threading
+
+__all__ = ['AddressCache', 'LazyAddress', 'ADDRESS_CACHE']
+
+
+def _decode_ip(raw):
+    """Decode IP address.
+
+    Args:
+        raw (bytes): packed IPv4 or IPv6 address
+
+    Returns:
+        Union[ipaddress.IPv4Address, ipaddress.IPv6Address]: Parsed IP address.
+
+    """
+    return ipaddress.ip_address(raw)
+
+
+def _decode_mac(raw):
+    """Decode MAC address.
+
+    Args:
+        raw (bytes): packed MAC address
+
+    Returns:
+        str: Colon (``:``) seperated *hex* encoded MAC address.
+
+    """
+    return sys.intern(raw.hex(':'))
+
+
+class LazyAddress:
+    """Address kept as raw bytes until accessed.
+
+    The address is decoded through the owning
+    :class:`~pcapkit.corekit.address.AddressCache` on first access
+    of its value, i.e. conversion to :obj:`str`, comparison, hashing
+    or attribute access, which is delegated to the decoded address.
+
+    Args:
+        raw (bytes): packed address
+        kind (str): address kind, i.e. ``'ip'`` or ``'mac'``
+        cache (AddressCache): cache to decode the address through
+
+    """
+
+    __slots__ = ('_raw', '_kind', '_cache', '_value')
+
+    @property
+    def raw(self):
+        """Packed address.
+
+        :rtype: bytes
+        """
+        return self._raw
+
+    @property
+    def value(self):
+        """Decoded address.
+
+        :rtype: Union[ipaddress.IPv4Address, ipaddress.IPv6Address, str]
+        """
+        if self._value is None:
+            self._value = self._cache.lookup(self._kind, self._raw)
+        return self._value
+
+    def __init__(self, raw, kind, cache):
+        """Initialisation."""
+        self._raw = raw
+        self._kind = kind
+        self._cache = cache
+        self._value = None
+
+    def __getattr__(self, name):
+        """Delegate attribute access to decoded address."""
+        if name in self.__slots__:
+            raise AttributeError(name)
+        return getattr(self.value, name)
+
+    def __reduce__(self):
+        """Pickle as decoded address."""
+        return (AddressCache.__decoder__[self._kind], (self._raw,))
+
+    def __str__(self):
+        return str(self.value)
+
+    def __repr__(self):
+        return repr(self.value)
+
+    def __bytes__(self):
+        return self._raw
+
+    def __hash__(self):
+        return hash(self.value)
+
+    def __eq__(self, other):
+        if isinstance(other, LazyAddress):
+            return self._kind == other._kind and self._raw == other._raw
+        return self.value == other
+
+    def __lt__(self, other):
+        if isinstance(other, LazyAddress):
+            other = other.value
+        return self.value < other
+
+
+class AddressCache:
+    """Least recently used cache of interned addresses.
+
+    Args:
+        maxsize (int): maximum number of addresses per kind,
+            ``0`` disables caching
+
+    Keyword Args:
+        lazy (bool): if keep addresses as raw bytes until accessed, c.f.
+            :class:`~pcapkit.corekit.address.LazyAddress`
+
+    """
+
+    #: Dict[str, Callable[[bytes], Any]]: Decoders per address kind.
+    __decoder__ = dict(
+        ip=_decode_ip,
+        mac=_decode_mac,
+    )
+
+    @property
+    def hits(self):
+        """Number of cache hits.
+
+        :rtype: int
+        """
+        return self._hits
+
+    @property
+    def misses(self):
+        """Number of cache misses.
+
+        :rtype: int
+        """
+        return self._misses
+
+    @property
+    def hit_rate(self):
+        """Ratio of cache hits to lookups.
+
+        :rtype: float
+        """
+        total = self._hits + self._misses
+        return self._hits / total if total else 0.0
+
+    def __init__(self, maxsize=65536, *, lazy=False):
+        """Initialisation."""
+        #: int: Maximum number of addresses per kind.
+        self.maxsize = maxsize
+        #: bool: If keep addresses as raw bytes until accessed.
+        self.lazy = lazy
+
+        #: Dict[str, OrderedDict[bytes, Any]]: Cached addresses per kind
+        #: (in least recently used order).
+        self._cache = {kind: collections.OrderedDict() for kind in self.__decoder__}
+        #: threading.Lock: Lock of cached addresses and counters, as the cache
+        #: may be shared by extractions in multiple threads.
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def __len__(self):
+        return sum(len(cache) for cache in self._cache.values())
+
+    def lookup(self, kind, raw):
+        """Decode address through cache.
+
+        Args:
+            kind (str): address kind, i.e. ``'ip'`` or ``'mac'``
+            raw (bytes): packed address
+
+        Returns:
+            Union[ipaddress.IPv4Address, ipaddress.IPv6Address, str]: Shared decoded address.
+
+        """
+        cache = self._cache[kind]
+        with self._lock:
+            value = cache.get(raw)
+            if value is None:
+                self._misses += 1
+                value = self.__decoder__[kind](raw)
+                if self.maxsize > 0:
+                    cache[raw] = value
+                    if len(cache) > self.maxsize:
+                        cache.popitem(last=False)
+            else:
+                self._hits += 1
+                cache.move_to_end(raw)
+        return value
+
+    def ip_address(self, raw):
+        """Get IP address.
+
+        Args:
+            raw (bytes): packed IPv4 or IPv6 address
+
+        Returns:
+            Union[ipaddress.IPv4Address, ipaddress.IPv6Address, LazyAddress]: Parsed IP address;
+            or the raw address wrapped as :class:`~pcapkit.corekit.address.LazyAddress` if
+            :attr:`lazy` is set.
+
+        Raises:
+            ValueError: If ``raw`` is not a valid IP address.
+
+        """
+        if self.lazy:
+            if len(raw) not in (4, 16):
+                raise ValueError(f'{raw!r} does not appear to be an IPv4 or IPv6 address')
+            return LazyAddress(raw, 'ip', self)
+        return self.lookup('ip', raw)
+
+    def mac_address(self, raw):
+        """Get MAC address.
+
+        Args:
+            raw (bytes): packed MAC address
+
+        Returns:
+            Union[str, LazyAddress]: Colon (``:``) seperated *hex* encoded MAC address;
+            or the raw address wrapped as :class:`~pcapkit.corekit.address.LazyAddress` if
+            :attr:`lazy` is set.
+
+        """
+        if self.lazy:
+            return LazyAddress(raw, 'mac', self)
+        return self.lookup('mac', raw)
+
+    def clear(self):
+        """Clear cache and counters."""
+        with self._lock:
+            for cache in self._cache.values():
+                cache.clear()
+            self._hits = 0
+            self._misses = 0
+
+
+#: AddressCache: Default address cache shared by protocols.
+ADDRESS_CACHE = AddressCache()
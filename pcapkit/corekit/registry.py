@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+"""range table of registries
+
+:mod:`pcapkit.corekit.registry` contains range table class
+:class:`~pcapkit.corekit.registry.RangeTable`, which resolves
+values not assigned in constant enumerations of
+:mod:`pcapkit.const` to members synthesised on demand,
+by bisecting a precomputed table of reserved ranges.
+
+Synthesised members are *not* registered to the enumeration,
+i.e. the enumeration class does not grow with unknown values;
+instead, they are kept in a least recently used cache of size
+:data:`~pcapkit.corekit.registry.RANGE_CACHE_SIZE` per table.
+
+"""
+import bisect
+import collections
+import threading
+
+__all__ = ['RangeTable']
+
+#: int: Default maximum number of synthesised members per range table.
+RANGE_CACHE_SIZE = 1024
+
+
+class RangeTable:
+    """Range table of values not assigned in an enumeration.
+
+    Args:
+        *ranges (Tuple[int, int, str]): reserved ranges, as tuples of
+            start and stop values (inclusive), and :meth:`str.format`
+            template of member names in the range; where ranges overlap,
+            the earlier one takes precedence
+
+    Keyword Args:
+        default (Optional[str]): template of member names for values
+            not in any of ``ranges``
+        maxsize (Optional[int]): maximum number of synthesised members,
+            defaults to :data:`~pcapkit.corekit.registry.RANGE_CACHE_SIZE`
+
+    """
+
+    def __init__(self, *ranges, default=None, maxsize=None):
+        """Initialisation."""
+        # split ranges into disjoint segments, in order of precedence
+        segments = list()
+        for (start, stop, name) in ranges:
+            pending = [(start, stop)]
+            for (lower, upper, _) in segments:
+                pending = [part for (head, tail) in pending
+                           for part in ((head, min(tail, lower - 1)), (max(head, upper + 1), tail))
+                           if part[0] <= part[1]]
+            segments.extend((head, tail, name) for (head, tail) in pending)
+        segments.sort()
+
+        #: List[int]: Start values of segments, for bisection.
+        self._starts = [start for (start, _, _) in segments]
+        #: List[int]: Stop values of segments.
+        self._stops = [stop for (_, stop, _) in segments]
+        #: List[str]: Name templates of segments.
+        self._names = [name for (_, _, name) in segments]
+        #: Optional[str]: Name template of values not in any range.
+        self._default = default
+
+        #: Optional[int]: Maximum number of synthesised members.
+        self.maxsize = maxsize
+        #: OrderedDict[int, aenum.IntEnum]: Synthesised members
+        #: (in least recently used order).
+        self._cache = collections.OrderedDict()
+        #: threading.Lock: Lock of synthesised members, as the table may be
+        #: shared by extractions in multiple threads.
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._cache)
+
+    def name(self, value):
+        """Name of unassigned value.
+
+        Args:
+            value (int): unassigned value
+
+        Returns:
+            Optional[str]: Name of the member, or :data:`None` if ``value``
+            is neither in a reserved range nor covered by a default template.
+
+        """
+        index = bisect.bisect_right(self._starts, value) - 1
+        if index >= 0 and value <= self._stops[index]:
+            return self._names[index].format(value)
+        if self._default is None:
+            return None
+        return self._default.format(value)
+
+    def lookup(self, cls, value):
+        """Lookup member of unassigned value.
+
+        Args:
+            cls (Type[aenum.IntEnum]): enumeration class
+            value (int): unassigned value
+
+        Returns:
+            Optional[aenum.IntEnum]: Synthesised member of ``cls``, or :data:`None`
+            if ``value`` is neither in a reserved range nor covered by a default template.
+
+        """
+        with self._lock:
+            member = self._cache.get(value)
+            if member is not None:
+                self._cache.move_to_end(value)
+                return member
+
+        name = self.name(value)
+        if name is None:
+            return None
+
+        member = int.__new__(cls, value)
+        member._name_ = name
+        member._value_ = value
+
+        maxsize = RANGE_CACHE_SIZE if self.maxsize is None else self.maxsize
+        if maxsize > 0:
+            with self._lock:
+                self._cache[value] = member
+                if len(self._cache) > maxsize:
+                    self._cache.popitem(last=False)
+        return member
+
+    def clear(self):
+        """Clear synthesised members."""
+        with self._lock:
+            self._cache.clear()
@@ -0,0 +1,450 @@
+# -*- coding: utf-8 -*-
+"""frame retention stores
+
+:mod:`pcapkit.corekit.store` contains frame store classes which
+implement retention policies of extracted frames, i.e.
+:class:`~pcapkit.corekit.store.ListStore` keeping all frames,
+:class:`~pcapkit.corekit.store.RingStore` keeping only the last
+frames in a ring buffer, and :class:`~pcapkit.corekit.store.IndexStore`
+keeping only file offsets of frames and reloading them on access,
+and :class:`~pcapkit.corekit.store.SpillStore` keeping all frames
+but spilling them to a temporary file once a memory budget is exceeded.
+
+All stores are read-only :class:`~collections.abc.Sequence` views
+with :math:`O(1)` indexing from the perspective of their users,
+while frames are appended by the extractor through :meth:`append`.
+
+"""
+import abc
+import array
+import collections
+import collections.abc
+import os
+import pickle
+import tempfile
+
+__all__ = ['FrameStore', 'ListStore', 'RingStore', 'IndexStore', 'SpillStore']
+
+#: int: Default maximum number of decoded frames cached by spilled stores.
+SPILL_CACHE_SIZE = 128
+
+
+class FrameStore(collections.abc.Sequence, metaclass=abc.ABCMeta):
+    """Base class for frame stores.
+
+    Indexes are relative to the retained frames, i.e. ``store[0]``
+    is the oldest retained frame and ``store[-1]`` the latest one.
+
+    """
+
+    ##########################################################################
+    # Properties.
+    ##########################################################################
+
+    @property
+    def count(self):
+        """Total number of frames appended, including those dropped.
+
+        :rtype: int
+        """
+        return self._count
+
+    ##########################################################################
+    # Methods.
+    ##########################################################################
+
+    @abc.abstractmethod
+    def append(self, frame, offset=None):
+        """Append a frame.
+
+        Args:
+            frame (Union[pcapkit.protocols.pcap.frame.Frame, Info]): extracted frame
+            offset (Optional[int]): offset of the frame in source file
+
+        """
+
+    ##########################################################################
+    # Data models.
+    ##########################################################################
+
+    def __init__(self):
+        """Initialise store."""
+        #: int: Total number of frames appended.
+        self._count = 0
+
+    def __repr__(self):
+        return f'<{type(self).__name__} of {len(self)} frames>'
+
+    @abc.abstractmethod
+    def __len__(self):
+        """Number of retained frames."""
+
+    @abc.abstractmethod
+    def __getitem__(self, index):
+        """Get retained frame(s)."""
+
+    ##########################################################################
+    # Utilities.
+    ##########################################################################
+
+    def _normalise(self, index):
+        """Normalise a negative index.
+
+        Args:
+            index (int): index of retained frame
+
+        Returns:
+            int: Non-negative index.
+
+        Raises:
+            IndexError: If ``index`` is out of range.
+
+        """
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError(f'{type(self).__name__} index out of range')
+        return index
+
+
+class ListStore(FrameStore):
+    """Frame store keeping all frames."""
+
+    def append(self, frame, offset=None):  # pylint: disable=unused-argument
+        """Append a frame.
+
+        Args:
+            frame (Union[pcapkit.protocols.pcap.frame.Frame, Info]): extracted frame
+            offset (Optional[int]): offset of the frame in source file (unused)
+
+        """
+        self._frames.append(frame)
+        self._count += 1
+
+    def __init__(self, frames=None):
+        """Initialise store.
+
+        Args:
+            frames (Optional[Iterable[Union[pcapkit.protocols.pcap.frame.Frame, Info]]]): initial frames
+
+        """
+        super().__init__()
+        #: List[Union[pcapkit.protocols.pcap.frame.Frame, Info]]: Retained frames.
+        self._frames = list()
+        for frame in frames or ():
+            self.append(frame)
+
+    def __len__(self):
+        return len(self._frames)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return tuple(self._frames[index])
+        return self._frames[index]
+
+
+class RingStore(FrameStore):
+    """Frame store keeping the last frames in a ring buffer.
+
+    Args:
+        maxlen (int): maximum number of retained frames
+
+    """
+
+    @property
+    def maxlen(self):
+        """Maximum number of retained frames.
+
+        :rtype: int
+        """
+        return self._maxlen
+
+    def append(self, frame, offset=None):  # pylint: disable=unused-argument
+        """Append a frame, dropping the oldest one if the buffer is full.
+
+        Args:
+            frame (Union[pcapkit.protocols.pcap.frame.Frame, Info]): extracted frame
+            offset (Optional[int]): offset of the frame in source file (unused)
+
+        """
+        if self._count < self._maxlen:
+            self._frames.append(frame)
+        else:
+            self._frames[self._count % self._maxlen] = frame
+        self._count += 1
+
+    def __init__(self, maxlen, frames=None):
+        """Initialise store.
+
+        Args:
+            maxlen (int): maximum number of retained frames
+            frames (Optional[Iterable[Union[pcapkit.protocols.pcap.frame.Frame, Info]]]): initial frames
+
+        Raises:
+            ValueError: If ``maxlen`` is not positive.
+
+        """
+        if maxlen <= 0:
+            raise ValueError(f'invalid maximum number of frames: {maxlen}')
+        super().__init__()
+        #: int: Maximum number of retained frames.
+        self._maxlen = maxlen
+        #: List[Union[pcapkit.protocols.pcap.frame.Frame, Info]]: Ring buffer of frames.
+        self._frames = list()
+        for frame in frames or ():
+            self.append(frame)
+
+    def __len__(self):
+        return len(self._frames)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return tuple(self[item] for item in range(*index.indices(len(self))))
+        index = self._normalise(index)
+        if self._count <= self._maxlen:
+            return self._frames[index]
+        return self._frames[(self._count + index) % self._maxlen]
+
+
+class IndexStore(FrameStore):
+    """Frame store keeping only file offsets of frames.
+
+    Frames are reloaded from the source file on access through ``loader``,
+    thus the store holds two integers per frame regardless of its size.
+
+    Args:
+        loader (Callable[[int, int], pcapkit.protocols.pcap.frame.Frame]): function
+            takes the offset and frame number as parameters and reloads the frame
+
+    """
+
+    def append(self, frame, offset=None):
+        """Append a frame by its offset.
+
+        Args:
+            frame (pcapkit.protocols.pcap.frame.Frame): extracted frame
+            offset (int): offset of the frame in source file
+
+        """
+        self._offsets.append(offset)
+        self._numbers.append(frame.info.number)
+        self._count += 1
+
+    def offset(self, index):
+        """Offset of a frame in source file.
+
+        Args:
+            index (int): index of retained frame
+
+        Returns:
+            int: Offset of the frame.
+
+        """
+        return self._offsets[self._normalise(index)]
+
+    def __init__(self, loader):
+        """Initialise store.
+
+        Args:
+            loader (Callable[[int, int], pcapkit.protocols.pcap.frame.Frame]): function
+                to reload a frame from its offset and frame number
+
+        """
+        super().__init__()
+        #: Callable[[int, int], pcapkit.protocols.pcap.frame.Frame]: Frame loader.
+        self._loader = loader
+        #: array.array: Offsets of frames in source file.
+        self._offsets = array.array('Q')
+        #: array.array: Numbers of frames.
+        self._numbers = array.array('Q')
+
+    def __len__(self):
+        return len(self._offsets)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return tuple(self[item] for item in range(*index.indices(len(self))))
+        index = self._normalise(index)
+        return self._loader(self._offsets[index], self._numbers[index])
+
+
+class SpillStore(FrameStore):
+    """Frame store keeping all frames, spilling to disk over a memory budget.
+
+    Frames are kept in memory until the total size of their serialised
+    records exceeds ``budget``, then all frames are serialised to an
+    append-only temporary file with an offset table, and decoded on access
+    through a least recently used cache of size ``cache``.
+
+    Args:
+        budget (int): maximum size (in bytes) of serialised records of frames
+            kept in memory
+
+    Keyword Args:
+        dump (Optional[Callable[[Any], bytes]]): function serialises a frame into
+            a record, defaults to :func:`pickle.dumps`
+        load (Optional[Callable[[bytes], Any]]): function decodes a frame from its
+            record, defaults to :func:`pickle.loads`
+        cache (Optional[int]): maximum number of decoded frames cached after spilled,
+            defaults to :data:`~pcapkit.corekit.store.SPILL_CACHE_SIZE`
+
+    Note:
+        Decoded frames typically take several times the size of their serialised
+        records in memory, as ``budget`` only accounts for the latter.
+
+    """
+
+    ##########################################################################
+    # Properties.
+    ##########################################################################
+
+    @property
+    def budget(self):
+        """Maximum size of serialised records of frames kept in memory.
+
+        :rtype: int
+        """
+        return self._budget
+
+    @property
+    def size(self):
+        """Total size of serialised records of frames.
+
+        :rtype: int
+        """
+        return self._size
+
+    @property
+    def spilled(self):
+        """If frames have been spilled to disk.
+
+        :rtype: bool
+        """
+        return self._file is not None
+
+    ##########################################################################
+    # Methods.
+    ##########################################################################
+
+    def append(self, frame, offset=None):  # pylint: disable=unused-argument
+        """Append a frame, spilling all frames to disk if the budget is exceeded.
+
+        Args:
+            frame (Union[pcapkit.protocols.pcap.frame.Frame, Info]): extracted frame
+            offset (Optional[int]): offset of the frame in source file (unused)
+
+        """
+        record = self._dump(frame)
+        self._size += len(record)
+        self._count += 1
+
+        if self._file is not None:
+            self._write(record)
+            return
+
+        self._frames.append(frame)
+        if self._size > self._budget:
+            self._spill()
+
+    def close(self):
+        """Close and remove the spill file; frames are no longer accessible if spilled."""
+        if self._file is not None:
+            self._file.close()
+        self._cache.clear()
+
+    ##########################################################################
+    # Data models.
+    ##########################################################################
+
+    def __init__(self, budget, *, dump=None, load=None, cache=None, frames=None):
+        """Initialise store.
+
+        Args:
+            budget (int): maximum size of serialised records of frames kept in memory
+
+        Keyword Args:
+            dump (Optional[Callable[[Any], bytes]]): frame serialiser
+            load (Optional[Callable[[bytes], Any]]): frame deserialiser
+            cache (Optional[int]): maximum number of decoded frames cached
+            frames (Optional[Iterable[Union[pcapkit.protocols.pcap.frame.Frame, Info]]]): initial frames
+
+        Raises:
+            ValueError: If ``budget`` is negative.
+
+        """
+        if budget < 0:
+            raise ValueError(f'invalid memory budget: {budget}')
+        super().__init__()
+        #: int: Maximum size of serialised records of frames kept in memory.
+        self._budget = budget
+        #: Callable[[Any], bytes]: Frame serialiser.
+        self._dump = dump or (lambda frame: pickle.dumps(frame, protocol=pickle.HIGHEST_PROTOCOL))
+        #: Callable[[bytes], Any]: Frame deserialiser.
+        self._load = load or pickle.loads
+        #: int: Maximum number of decoded frames cached.
+        self._maxsize = SPILL_CACHE_SIZE if cache is None else cache
+        #: int: Total size of serialised records.
+        self._size = 0
+
+        #: Optional[List[Union[pcapkit.protocols.pcap.frame.Frame, Info]]]: Frames kept in memory.
+        self._frames = list()
+        #: Optional[io.BufferedRandom]: Spill file.
+        self._file = None
+        #: array.array: Offsets of records in spill file, with a trailing end offset.
+        self._offsets = array.array('Q', [0])
+        #: collections.OrderedDict: Least recently used cache of decoded frames.
+        self._cache = collections.OrderedDict()
+
+        for frame in frames or ():
+            self.append(frame)
+
+    def __del__(self):
+        if getattr(self, '_file', None) is not None:
+            self._file.close()
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return tuple(self[item] for item in range(*index.indices(len(self))))
+        if self._file is None:
+            return self._frames[index]
+
+        index = self._normalise(index)
+        try:
+            self._cache.move_to_end(index)
+            return self._cache[index]
+        except KeyError:
+            pass
+
+        self._file.seek(self._offsets[index], os.SEEK_SET)
+        frame = self._load(self._file.read(self._offsets[index+1] - self._offsets[index]))
+
+        self._cache[index] = frame
+        if len(self._cache) > self._maxsize:
+            self._cache.popitem(last=False)
+        return frame
+
+    ##########################################################################
+    # Utilities.
+    ##########################################################################
+
+    def _spill(self):
+        """Spill all frames kept in memory to a temporary file."""
+        self._file = tempfile.TemporaryFile(prefix='pcapkit-', suffix='.spill')
+        for frame in self._frames:
+            self._write(self._dump(frame))
+        self._frames = None
+
+    def _write(self, record):
+        """Append a record to the spill file.
+
+        Args:
+            record (bytes): serialised frame
+
+        """
+        self._file.seek(self._offsets[-1], os.SEEK_SET)
+        self._file.write(record)
+        self._offsets.append(self._offsets[-1] + len(record))
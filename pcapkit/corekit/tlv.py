@@ -0,0 +1,202 @@
+# -*- coding: utf-8 -*-
+"""type-length-value option engine
+
+:mod:`pcapkit.corekit.tlv` contains table-driven
+type-length-value (TLV) option engine class
+:class:`~pcapkit.corekit.tlv.TLVEngine`, which is
+shared by option (parameter) lists of protocols, e.g.
+:class:`~pcapkit.protocols.transport.tcp.TCP`,
+:class:`~pcapkit.protocols.internet.ipv4.IPv4`,
+:class:`~pcapkit.protocols.internet.hopopt.HOPOPT`,
+:class:`~pcapkit.protocols.internet.ipv6_opts.IPv6_Opts`
+and :class:`~pcapkit.protocols.internet.hip.HIP`.
+
+"""
+from pcapkit.corekit.infoclass import Info
+
+__all__ = ['TLVEngine']
+
+
+class _DecoderTable(dict):
+    """Compiled table of option decoders for a protocol class.
+
+    Decoders are resolved from the naming table of the engine on the first
+    lookup of each option kind, and cached for the following lookups.
+
+    """
+
+    def __init__(self, cls, naming, default):
+        """Initialisation.
+
+        Args:
+            cls (Type[pcapkit.protocols.protocol.Protocol]): protocol class
+            naming (Callable[[int], Optional[str]]): mapping from option kind
+                to name of decoder method
+            default (Optional[str]): name of decoder method for unknown kinds
+
+        """
+        super().__init__()
+        self._cls = cls
+        self._naming = naming
+        self._default = None if default is None else getattr(cls, default)
+
+    def __missing__(self, kind):
+        """Resolve decoder of option kind.
+
+        Args:
+            kind (int): option kind
+
+        Returns:
+            Optional[Callable]: Unbound decoder method.
+
+        """
+        name = self._naming(kind)
+        func = self._default if name is None else getattr(self._cls, name, self._default)
+        self[kind] = func
+        return func
+
+
+class TLVEngine:
+    """Table-driven type-length-value option engine.
+
+    The engine walks through an option list over a :obj:`memoryview`
+    to find the boundaries of options, without reading the option
+    fields one by one from the source stream; option data are then
+    decoded by per-kind decoders compiled once per protocol class.
+
+    Args:
+        decoders (Optional[Union[Dict[int, str], Callable[[int], Optional[str]]]]):
+            mapping from option kind to name of decoder method
+        default (Optional[str]): name of decoder method for kinds not in ``decoders``
+
+    Keyword Args:
+        kind (int): size of the kind field
+        length (int): size of the length field
+        size (Callable[[int], int]): total size of an option from value of the
+            length field; defaults to the value itself
+        singles (Iterable[int]): kinds of one-octet options, i.e. without length field
+        end (Iterable[int]): kinds of options terminating the option list
+
+    """
+
+    def __init__(self, decoders=None, default=None, *, kind=1, length=1, size=None, singles=(), end=()):
+        """Initialisation."""
+        if decoders is None:
+            decoders = dict()
+        #: Callable[[int], Optional[str]]: Mapping from option kind to name of decoder method.
+        self._naming = decoders.get if isinstance(decoders, dict) else decoders
+        #: Optional[str]: Name of decoder method for unknown kinds.
+        self._default = default
+
+        #: int: Size of the kind field.
+        self._kind = kind
+        #: int: Size of the length field.
+        self._length = length
+        #: Callable[[int], int]: Total size of an option from value of the length field.
+        self._size = size or (lambda value: value)
+        #: FrozenSet[int]: Kinds of one-octet options.
+        self._singles = frozenset(singles)
+        #: FrozenSet[int]: Kinds of options terminating the option list.
+        self._end = frozenset(end)
+
+        #: Dict[type, _DecoderTable]: Compiled decoder tables per protocol class.
+        self._compiled = dict()
+
+    def compile(self, cls):
+        """Compile decoders for a protocol class.
+
+        Args:
+            cls (Type[pcapkit.protocols.protocol.Protocol]): protocol class
+
+        Returns:
+            Dict[int, Callable]: Mapping from option kind to unbound decoder method,
+            resolved on demand.
+
+        """
+        table = self._compiled.get(cls)
+        if table is None:
+            table = self._compiled[cls] = _DecoderTable(cls, self._naming, self._default)
+        return table
+
+    def walk(self, data):
+        """Walk through an option list.
+
+        Args:
+            data (bytes): option list
+
+        Returns:
+            Tuple[List[Tuple[int, int, int, Optional[int]]], int]: Boundaries of options,
+            as tuples of option kind, start and stop offsets and value of the length field
+            (:data:`None` for one-octet options); and offset where the walk stopped, i.e.
+            next to an option terminating the list, at a malformed option, or at (or beyond
+            if the last option is truncated) the end of ``data``.
+
+        """
+        view = memoryview(data)
+        size = len(view)
+
+        ksize = self._kind
+        lsize = self._length
+        hsize = ksize + lsize
+
+        items = list()
+        offset = 0
+        while offset + ksize <= size:
+            if ksize == 1:
+                kind = view[offset]
+            else:
+                kind = int.from_bytes(view[offset:offset+ksize], 'big')
+
+            if kind in self._singles:
+                stop = offset + ksize
+                value = None
+            else:
+                if offset + hsize > size:   # truncated header
+                    break
+                if lsize == 1:
+                    value = view[offset+ksize]
+                else:
+                    value = int.from_bytes(view[offset+ksize:offset+hsize], 'big')
+
+                stop = offset + self._size(value)
+                if stop < offset + hsize:   # malformed length
+                    break
+
+            items.append((kind, offset, stop, value))
+            offset = stop
+            if kind in self._end:
+                break
+        return items, offset
+
+    @staticmethod
+    def collect(records):
+        """Collect decoded options.
+
+        Args:
+            records (Iterable[Tuple[Any, Hashable, Any]]): decoded options, as tuples of
+                option kind (enumeration), key of the option in the result and option data
+
+        Returns:
+            Tuple[Tuple[Any], Dict[Hashable, Any]]: Option kinds in the order of their first
+            occurrence, and option data by keys; where data of repeated options are grouped
+            into a :obj:`tuple` of :class:`~pcapkit.corekit.infoclass.Info`, which is only
+            created after all options are decoded.
+
+        """
+        optkind = dict()    # ordered set of option kinds
+        values = dict()     # option data by keys
+
+        for (kind, key, data) in records:
+            if kind in optkind:
+                values[key].append(data)
+            else:
+                optkind[kind] = None
+                values[key] = [data]
+
+        options = dict()
+        for (key, value) in values.items():
+            if len(value) == 1:
+                options[key] = value[0]
+            else:
+                options[key] = tuple(Info(data) for data in value)
+        return tuple(optkind), options
@@ -1,16 +1,28 @@
 # -*- coding: utf-8 -*-
-# pylint: disable=unused-import, unused-wildcard-import
 """library foundation
 
 :mod:`pcapkit.foundation` is a collection of fundations for
 :mod:`pcapkit`, including PCAP file extraction tool
 :class:`~pcapkit.foundation.extraction.Extrator`, application
 layer protocol analyser :class:`~pcapkit.foundation.analysis.Analysis`,
-and TCP flow tracer :class:`~pcapkit.foundation.tractflow.TraceFlow`.
+TCP flow tracer :class:`~pcapkit.foundation.tractflow.TraceFlow`,
+protocol hierarchy statistics :class:`~pcapkit.foundation.hierarchy.ProtoHierarchy`,
+protocol decoding instrumentation :class:`~pcapkit.foundation.instrument.Instrument`,
+HTTP/1.* transaction extractor :class:`~pcapkit.foundation.httpv1.HTTPv1_Flow`,
+and HTTP/2 connection parser :class:`~pcapkit.foundation.httpv2.HTTPv2_Flow`.
 
 """
-from pcapkit.foundation.analysis import analyse as analyse2
-from pcapkit.foundation.extraction import *
-from pcapkit.foundation.traceflow import *
+from pcapkit.utilities.compat import lazy_import
 
-__all__ = ['analyse2', 'Extractor', 'TraceFlow']
+__all__ = ['analyse2', 'Extractor', 'TraceFlow', 'ProtoHierarchy', 'Instrument', 'HTTPv1_Flow', 'HTTPv2_Flow', 'HPACK']
+
+__getattr__, __dir__ = lazy_import(__name__, {
+    'analyse2': ('pcapkit.foundation.analysis', 'analyse'),
+    'Extractor': ('pcapkit.foundation.extraction', 'Extractor'),
+    'ProtoHierarchy': ('pcapkit.foundation.hierarchy', 'ProtoHierarchy'),
+    'Instrument': ('pcapkit.foundation.instrument', 'Instrument'),
+    'HTTPv1_Flow': ('pcapkit.foundation.httpv1', 'HTTPv1_Flow'),
+    'HTTPv2_Flow': ('pcapkit.foundation.httpv2', 'HTTPv2_Flow'),
+    'HPACK': ('pcapkit.foundation.httpv2', 'HPACK'),
+    'TraceFlow': ('pcapkit.foundation.traceflow', 'TraceFlow'),
+})
@@ -7,17 +7,24 @@ analyse and match application layer protocol. Then, call
 corresponding modules and functions to extract the attributes.
 
 """
+import collections
 import importlib
 import os
+import re
+import struct
+import threading
 
+from pcapkit.foundation import instrument
 from pcapkit.protocols.raw import Raw
 from pcapkit.utilities.decorators import seekset_ng
 from pcapkit.utilities.exceptions import ProtocolError
 
 ###############################################################################
+# from pcapkit.protocols.application.dns import DNS
 # from pcapkit.protocols.application.ftp import FTP
 # from pcapkit.protocols.application.httpv1 import HTTPv1
 # from pcapkit.protocols.application.httpv2 import HTTPv2
+# from pcapkit.protocols.application.tls import TLS
 ###############################################################################
 
 __all__ = ['analyse']
@@ -27,10 +34,64 @@ ANALYSE_PROTO = [
     ('pcapkit.protocols.application.ftp', 'FTP'),
     ('pcapkit.protocols.application.httpv1', 'HTTPv1'),
     ('pcapkit.protocols.application.httpv2', 'HTTPv2'),
+    ('pcapkit.protocols.application.tls', 'TLS'),
+    ('pcapkit.protocols.application.dns', 'DNS'),
 ]
 
+#: Dict[int, Tuple[str]]: Well-known ports of protocols supported by the analyser,
+#: protocols hinted by the ports will be tried first.
+ANALYSE_PORT = {
+    21: ('FTP',),
+    53: ('DNS',),
+    80: ('HTTPv1', 'HTTPv2'),
+    443: ('TLS',),
+    465: ('TLS',),
+    636: ('TLS',),
+    853: ('TLS',),
+    993: ('TLS',),
+    995: ('TLS',),
+    5353: ('DNS',),
+    5355: ('DNS',),
+    8000: ('HTTPv1', 'HTTPv2'),
+    8080: ('HTTPv1', 'HTTPv2'),
+    8443: ('TLS',),
+}
 
-def analyse(file, length=None, *, termination=False):
+#: Regular expression to match HTTP/1.* start line, c.f.
+#: :data:`pcapkit.protocols.application.httpv1.HTTP_METHODS`.
+_RE_HTTPv1 = re.compile(rb'GET|HEAD|POST|PUT|DELETE|TRACE|OPTIONS|CONNECT|PATCH|HTTP/\d\.\d')
+
+#: HTTP/2 connection preface [:rfc:`7540#section-3.5`].
+_HTTPv2_PREFACE = b'PRI * HTTP/2.0\r\n\r\nSM\r\n\r\n'
+
+#: Dict[str, Callable[[bytes, int], bool]]: Magic-byte checks of protocols supported
+#: by the analyser, which are necessary conditions for a payload to be parsed as such
+#: protocol; protocols failing the check will not be tried.
+ANALYSE_MAGIC = {
+    # single line terminated by CRLF
+    'FTP': lambda data, size: data.endswith(b'\r\n') and data.count(b'\n') == 1 and data.count(b'\r') == 1,
+    # request method or version string, with CRLF separated header
+    'HTTPv1': lambda data, size: _RE_HTTPv1.match(data) is not None and b'\r\n\r\n' in data,
+    # frame length and reserved bit
+    'HTTPv2': lambda data, size: len(data) >= 9 and int.from_bytes(data[:3], 'big') == size and not data[5] & 0x80,
+    # record content type, protocol version and length
+    'TLS': lambda data, size: (len(data) >= 5 and 20 <= data[0] <= 24 and data[1] == 3 and data[2] <= 4
+                               and int.from_bytes(data[3:5], 'big') <= 18432),
+    # reserved (Z) bit and minimum length of sections, with optional TCP length prefix
+    'DNS': lambda data, size: _check_dns(data) or _check_dns(data[2:]),
+}
+
+#: int: Maximum number of flows in the per-flow protocol cache.
+FLOW_CACHE_SIZE = 65536
+
+#: OrderedDict[Hashable, str]: Per-flow cache of identified application layer protocols,
+#: as mapping from flow key to protocol name (in least recently used order).
+_FLOW_CACHE = collections.OrderedDict()
+#: threading.Lock: Lock of the per-flow protocol cache.
+_FLOW_LOCK = threading.Lock()
+
+
+def analyse(file, length=None, *, termination=False, ports=None, flow=None, decode_policy='fast'):
     """Analyse application layer packets.
 
     Args:
@@ -39,18 +100,30 @@ def analyse(file, length=None, *, termination=False):
 
     Keyword Args:
         termination (bool): If terminate parsing application layer protocol.
+        ports (Optional[Tuple[int, int]]): source and destination ports as hints
+        flow (Optional[Hashable]): flow key to look up the per-flow protocol cache
+        decode_policy (Literal['fast', 'detect']): decoding policy of text fields
+            (c.f. :meth:`Protocol.decode <pcapkit.protocols.protocol.Protocol.decode>`)
 
     Returns:
         Protocol: Parsed application layer protocol.
 
     Notes:
-        Currently, the analysis processes in following order:
+        Candidate protocols are tried in following order, each at most once:
+
+        1. the protocol already identified in the same ``flow``
+        2. the protocols hinted by ``ports`` (c.f. :data:`~pcapkit.foundation.analysis.ANALYSE_PORT`)
+        3. the rest protocols, currently in following order:
 
-        1. :class:`~pcapkit.protocols.application.ftp.FTP`
-        2. :class:`HTTP/1.* <pcapkit.protocols.application.httpv1.HTTPv1>`
-        3. :class:`HTTP/2 <pcapkit.protocols.application.httpv2.HTTPv2>`
+           1. :class:`~pcapkit.protocols.application.ftp.FTP`
+           2. :class:`HTTP/1.* <pcapkit.protocols.application.httpv1.HTTPv1>`
+           3. :class:`HTTP/2 <pcapkit.protocols.application.httpv2.HTTPv2>`
+           4. :class:`~pcapkit.protocols.application.tls.TLS`
+           5. :class:`~pcapkit.protocols.application.dns.DNS`
 
-        and :class:`~pcapkit.protocols.raw.Raw` as the fallback result.
+        and :class:`~pcapkit.protocols.raw.Raw` as the fallback result. Candidates
+        whose magic-byte check (c.f. :data:`~pcapkit.foundation.analysis.ANALYSE_MAGIC`)
+        fails on the payload are skipped without parsing.
 
     See Also:
         The analysis processes order is defined by :data:`~pcapkit.foundation.analysis.ANALYSE_PROTO`.
@@ -58,15 +131,34 @@ def analyse(file, length=None, *, termination=False):
     """
     seekset = file.tell()
     if not termination:
-        for (module, name) in ANALYSE_PROTO:
+        data = file.read(length)
+        size = len(data) if length is None else length
+        file.seek(seekset, os.SEEK_SET)
+
+        # HTTP/2 connection preface starts an HTTP/2 flow
+        if flow is not None and data.startswith(_HTTPv2_PREFACE):
+            _cache_flow(flow, 'HTTPv2')
+
+        for (module, name) in _candidates(ports, flow):
+            magic = ANALYSE_MAGIC.get(name)
+            if magic is not None and not magic(data, size):
+                continue
+
             try:
                 protocol = getattr(importlib.import_module(module), name)
             except (ImportError, AttributeError):
                 continue
 
-            packet = _analyse(protocol, file, length, seekset=seekset)
+            packet = _analyse(protocol, file, length, seekset=seekset,
+                              _flow=flow, _decode_policy=decode_policy)
+            recorder = instrument.RECORDER.get()
+            if recorder is not None:
+                recorder.trial(name, packet is not None)
             if packet is None:
                 continue
+
+            if flow is not None:
+                _cache_flow(flow, name)
             return packet
 
         # backup file offset
@@ -76,8 +168,69 @@ def analyse(file, length=None, *, termination=False):
     return Raw(file, length)
 
 
+def _check_dns(data):
+    """Check DNS message header.
+
+    Args:
+        data (bytes): packet data
+
+    Returns:
+        bool: If the reserved (Z) bit is unset and the message is long enough
+        to hold all the questions and resource records counted in the header.
+
+    """
+    if len(data) < 12 or data[3] & 0x40:
+        return False
+    qdcount, ancount, nscount, arcount = struct.unpack_from('!4H', data, 4)
+    return qdcount + ancount + nscount + arcount > 0 \
+        and 12 + 5 * qdcount + 11 * (ancount + nscount + arcount) <= len(data)
+
+
+def _candidates(ports=None, flow=None):
+    """Candidate protocols for analysis.
+
+    Args:
+        ports (Optional[Tuple[int, int]]): source and destination ports as hints
+        flow (Optional[Hashable]): flow key to look up the per-flow protocol cache
+
+    Returns:
+        List[Tuple[str, str]]: module and class names of candidate protocols, in the
+        order of cached protocol, protocols hinted by ports and the rest protocols
+
+    """
+    names = list()
+    if flow is not None:
+        with _FLOW_LOCK:
+            name = _FLOW_CACHE.get(flow)
+            if name is not None:
+                _FLOW_CACHE.move_to_end(flow)
+        if name is not None:
+            names.append(name)
+    for port in ports or ():
+        names.extend(ANALYSE_PORT.get(port, ()))
+
+    if not names:
+        return ANALYSE_PROTO
+    return sorted(ANALYSE_PROTO, key=lambda item: names.index(item[1]) if item[1] in names else len(names))
+
+
+def _cache_flow(flow, name):
+    """Cache identified protocol of a flow.
+
+    Args:
+        flow (Hashable): flow key
+        name (str): protocol name
+
+    """
+    with _FLOW_LOCK:
+        _FLOW_CACHE[flow] = name
+        _FLOW_CACHE.move_to_end(flow)
+        if len(_FLOW_CACHE) > FLOW_CACHE_SIZE:
+            _FLOW_CACHE.popitem(last=False)
+
+
 @seekset_ng
-def _analyse(protocol, file, length=None, *, seekset=os.SEEK_SET):  # pylint: disable=unused-argument
+def _analyse(protocol, file, length=None, *, seekset=os.SEEK_SET, **kwargs):  # pylint: disable=unused-argument
     """Analyse packet.
 
     Args:
@@ -87,6 +240,7 @@ def _analyse(protocol, file, length=None, *, seekset=os.SEEK_SET):  # pylint: di
 
     Keyword Args:
         seekset (int): original file offset
+        **kwargs: arbitrary keyword arguments for ``protocol``
 
     Returns:
         Optional[Protocol]: If the packet is parsed successfully,
@@ -94,13 +248,13 @@ def _analyse(protocol, file, length=None, *, seekset=os.SEEK_SET):  # pylint: di
 
     """
     try:
-        packet = protocol(file, length)
+        packet = protocol(file, length, **kwargs)
     except ProtocolError:
         packet = None
     return packet
 
 
-def register(module, class_, *, index=None):
+def register(module, class_, *, index=None, ports=None, magic=None):
     """Register a new protocol class.
 
     Arguments:
@@ -110,6 +264,10 @@ def register(module, class_, *, index=None):
     Keyword Arguments:
         index (Optional[int]): Index of the protocol class
             when inserted to :data:`~pcapkit.foundation.analysis.ANALYSE_PROTO`.
+        ports (Optional[Iterable[int]]): Well-known ports of the protocol
+            (c.f. :data:`~pcapkit.foundation.analysis.ANALYSE_PORT`).
+        magic (Optional[Callable[[bytes, int], bool]]): Magic-byte check of the protocol, which
+            takes the payload and its length (c.f. :data:`~pcapkit.foundation.analysis.ANALYSE_MAGIC`).
 
     Notes:
         The full qualified class name of the new protocol class
@@ -120,3 +278,8 @@ def register(module, class_, *, index=None):
         ANALYSE_PROTO.append((module, class_))
     else:
         ANALYSE_PROTO.insert(index, (module, class_))
+
+    for port in ports or ():
+        ANALYSE_PORT[port] = ANALYSE_PORT.get(port, ()) + (class_,)
+    if magic is not None:
+        ANALYSE_MAGIC[class_] = magic
@@ -15,25 +15,33 @@ import builtins
 import collections
 import copy
 import datetime
+import glob
 import importlib
+import io
 import ipaddress
+import lzma
 import os
 import pathlib
 import random
 import re
+import struct
 import sys
 import time
 import warnings
+import zlib
 
 from pcapkit.corekit.infoclass import Info
+from pcapkit.corekit.store import IndexStore, ListStore, RingStore, SpillStore
+from pcapkit.foundation.instrument import INSTRUMENT, Instrument
 from pcapkit.protocols.pcap.frame import Frame
 from pcapkit.protocols.pcap.header import Header
 from pcapkit.utilities.compat import pathlib
 from pcapkit.utilities.exceptions import (CallableError, FileNotFound, FormatError, IterableError,
-                                          UnsupportedCall, stacklevel)
+                                          ModuleNotFound, ProtocolNotImplemented, UnsupportedCall,
+                                          stacklevel)
 from pcapkit.utilities.logging import logger
-from pcapkit.utilities.warnings import (AttributeWarning, DPKTWarning, EngineWarning, FormatWarning,
-                                        LayerWarning, ProtocolWarning)
+from pcapkit.utilities.warnings import (AttributeWarning, DPKTWarning, EngineWarning, FileWarning,
+                                        FormatWarning, LayerWarning, ProtocolWarning)
 
 ###############################################################################
 # import enum
@@ -61,6 +69,24 @@ from pcapkit.utilities.warnings import (AttributeWarning, DPKTWarning, EngineWar
 
 __all__ = ['Extractor']
 
+#: Unpack PCAP frame header (c.f. :class:`~pcapkit.protocols.pcap.frame.Frame`).
+_UNPACK_FRAME = struct.Struct('<IIII').unpack
+#: Initial interval (in seconds) of polling for data in follow mode.
+_FOLLOW_DELAY = 0.01
+#: Magic numbers of compressed input files.
+_COMPRESS_MAGIC = {
+    b'\x1f\x8b': 'gzip',
+    b'BZh': 'bz2',
+    b'\xfd7zXZ\x00': 'xz',
+    b'\x28\xb5\x2f\xfd': 'zstd',
+}
+#: Errors raised by decompressors on truncated or corrupted input files.
+_COMPRESS_ERRORS = (EOFError, OSError, zlib.error, lzma.LZMAError)
+#: File extensions of compressed input files.
+_COMPRESS_EXT = ('.gz', '.bz2', '.xz', '.zst')
+#: Buffer size (in bytes) of decompressed input streams.
+_COMPRESS_BUFSIZE = 1048576
+
 # check list
 #: List of layers.
 LAYER_LIST = {'None', 'Link', 'Internet', 'Transport', 'Application'}
@@ -83,7 +109,7 @@ PROTO_LIST = {
     'transport', 'tcp', 'udp',
 
     # Application layer
-    'application', 'ftp', 'http', 'httpv1', 'httpv2',
+    'application', 'dns', 'ftp', 'http', 'httpv1', 'httpv2', 'tls',
 }
 
 
@@ -96,6 +122,40 @@ else:
     CPU_CNT = os.cpu_count() or 1
 
 
+class _DecompressedInput(io.RawIOBase):
+    """Raw stream over a decompressor.
+
+    Each read is served by a single :meth:`read1` call of the
+    decompressor, so that data decompressed before a truncated or
+    corrupted block is returned first, and the decompressor error
+    is only raised on the next read.
+
+    Args:
+        stream (io.BufferedIOBase): decompressed file object, e.g.
+            :class:`gzip.GzipFile`
+
+    """
+
+    def __init__(self, stream):
+        """Initialisation."""
+        super().__init__()
+        #: io.BufferedIOBase: Decompressed file object.
+        self._stream = stream
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        data = self._stream.read1(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+
+    def close(self):
+        if not self.closed:
+            self._stream.close()
+        super().close()
+
+
 class Extractor:
     """Extractor for PCAP files.
 
@@ -208,16 +268,16 @@ class Extractor:
 
     @property
     def frame(self):
-        """Extracted frames.
+        """Extracted frames, as a read-only view of the frame store.
 
         Raises:
             UnsupportedCall: If :attr:`self._flag_d <pcapkit.foundation.extraction.Extractor._flag_d>`
-                is :data:`True`, as storing frame data is disabled.
+                is :data:`False`, as storing frame data is disabled.
 
-        :rtype: Tuple[Info[DataType_Frame]]
+        :rtype: pcapkit.corekit.store.FrameStore
         """
         if self._flag_d:
-            return tuple(self._frame)
+            return self._frame
         raise UnsupportedCall("'Extractor(store=False)' object has no attribute 'frame'")
 
     @property
@@ -251,6 +311,34 @@ class Extractor:
             return self._trace.index
         raise UnsupportedCall("'Extractor(trace=False)' object has no attribute 'trace'")
 
+    @property
+    def hierarchy(self):
+        """Protocol hierarchy statistics.
+
+        Raises:
+            UnsupportedCall: If :attr:`self._flag_s <pcapkit.foundation.extraction.Extractor._flag_s>`
+                is :data:`False`, as protocol hierarchy statistics is disabled.
+
+        :rtype: pcapkit.foundation.hierarchy.ProtoHierarchy
+        """
+        if self._flag_s:
+            return self._hrchy
+        raise UnsupportedCall("'Extractor(hierarchy=False)' object has no attribute 'hierarchy'")
+
+    @property
+    def instrument(self):
+        """Protocol decoding instrumentation.
+
+        Raises:
+            UnsupportedCall: If :attr:`self._flag_i <pcapkit.foundation.extraction.Extractor._flag_i>`
+                is :data:`False`, as instrumentation is disabled.
+
+        :rtype: pcapkit.foundation.instrument.Instrument
+        """
+        if self._flag_i:
+            return self._instr
+        raise UnsupportedCall("'Extractor(instrument=False)' object has no attribute 'instrument'")
+
     @property
     def engine(self):
         """PCAP extraction engine.
@@ -259,6 +347,53 @@ class Extractor:
         """
         return self._exeng
 
+    @property
+    def stats(self):
+        """Snapshot of extraction progress.
+
+        The snapshot is computed on access from counters which the extraction
+        already maintains, thus it is cheap to poll even for long extractions.
+
+        Note:
+            The file offset only advances for engines which read through the input
+            file, i.e. not for Scapy and PyShark engines; for the multiprocessing
+            engines it is only updated after the extraction. For input streams,
+            the size and progress are :data:`None` as the total size is unknown.
+
+        :rtype: Info
+        """
+        if self._flag_n or self._ifile.closed:
+            offset = self._ifoff
+        else:
+            offset = self._ifile.tell()
+        elapsed = (self._finish or time.perf_counter()) - self._start
+        bytes_ = max(offset - 24, 0)     # excluding PCAP global header
+
+        if self._flag_e:
+            eta = 0.0
+        elif bytes_ and self._ifsiz is not None and offset < self._ifsiz:
+            eta = elapsed * (self._ifsiz - offset) / bytes_
+        else:
+            eta = None
+
+        return Info(
+            frames=self._frnum,
+            bytes=bytes_,
+            offset=offset,
+            size=self._ifsiz,
+            progress=None if self._ifsiz is None else (offset / self._ifsiz if self._ifsiz else 1.0),
+            elapsed=elapsed,
+            frames_per_sec=self._frnum / elapsed if elapsed else 0.0,
+            mb_per_sec=bytes_ / elapsed / 1048576 if elapsed else 0.0,
+            eta=eta,
+            reassembly=Info(
+                ipv4=None if self._reasm[0] is None else self._reasm[0].buffered,
+                ipv6=None if self._reasm[1] is None else self._reasm[1].buffered,
+                tcp=None if self._reasm[2] is None else self._reasm[2].buffered,
+            ),
+            trace=self._trace.buffered if self._flag_t else None,
+        )
+
     ##########################################################################
     # Methods.
     ##########################################################################
@@ -289,6 +424,15 @@ class Extractor:
                 unknown.
 
         """
+        if self._flag_n and self._exeng not in ('default', 'pcapkit'):
+            warnings.warn(f"extraction engine '{self._exeng}' does not support non-seekable input; "
+                          'using default engine instead', EngineWarning, stacklevel=stacklevel())
+            self._exeng = 'default'
+        if self._flag_w and self._exeng not in ('default', 'pcapkit'):
+            warnings.warn(f"extraction engine '{self._exeng}' does not support follow mode; "
+                          'using default engine instead', EngineWarning, stacklevel=stacklevel())
+            self._exeng = 'default'
+
         flag = True
         if self._exeng == 'dpkt':
             flag, engine = self.import_test('dpkt', name='DPKT')
@@ -390,7 +534,9 @@ class Extractor:
 
         1. sanitise ``fin`` as the input PCAP filename; ``in.pcap`` as default value and
            append ``.pcap`` extension if needed and ``extension`` is :data:`True`; as well
-           as test if the file exists;
+           as test if the file exists (``.pcap`` files compressed with ``gzip``, ``bzip2``,
+           ``xz`` or ``zstd`` are accepted as is); if ``fin`` is a binary file-like object or ``'-'``
+           (for :data:`sys.stdin`), its name is used instead, or ``'<stream>'`` if not available;
         2. if ``nofile`` is :data:`True`, skips following processing;
         3. if ``fmt`` provided, then it presumes corresponding output file extension;
         4. if ``fout`` not provided, it presumes the output file name based on the presumptive
@@ -402,7 +548,7 @@ class Extractor:
            and ``extension`` is :data:`True`.
 
         Args:
-            fin (Optional[str]): Input filename.
+            fin (Optional[Union[str, BinaryIO]]): Input filename or file-like object.
             fout (Optional[str]): Output filename.
             fmt (str): Output file format.
             extension (bool): If append ``.pcap`` file extension to the input filename
@@ -429,14 +575,23 @@ class Extractor:
         """
         if fin is None:
             ifnm = 'in.pcap'
+        elif fin == '-':
+            ifnm = '<stdin>'
+        elif hasattr(fin, 'read'):
+            ifnm = getattr(fin, 'name', None)
+            if not isinstance(ifnm, str):
+                ifnm = '<stream>'
         else:
             if extension:  # pylint: disable=else-if-used
-                ifnm = fin if os.path.splitext(fin)[1] == '.pcap' else f'{fin}.pcap'
+                root, fext = os.path.splitext(fin)
+                if fext in _COMPRESS_EXT:
+                    root, fext = os.path.splitext(root)
+                ifnm = fin if fext == '.pcap' else f'{fin}.pcap'
             else:
                 ifnm = fin
 
-        if not os.path.isfile(ifnm):
-            raise FileNotFound(2, 'No such file or directory', ifnm)
+            if not os.path.isfile(ifnm):
+                raise FileNotFound(2, 'No such file or directory', ifnm)
 
         if nofile:
             ofnm = None
@@ -496,11 +651,19 @@ class Extractor:
 
         """
         # pylint: disable=attribute-defined-outside-init,protected-access
-        self._gbhdr = Header(self._ifile)
+        self._gbhdr = Header(io.BytesIO(self._read_input(24)) if self._flag_n else self._ifile)
         self._vinfo = self._gbhdr.version
         self._dlink = self._gbhdr.protocol
         self._nnsec = self._gbhdr.nanosecond
 
+        if self._exflt is not None:
+            try:
+                self._exprd = self._exflt.compile(self._dlink)
+            except ProtocolNotImplemented:
+                warnings.warn(f"'Extractor(filter={self._exflt.expression!r})' does not support "
+                              f"data link type {self._dlink!r}; filter ignored",
+                              AttributeWarning, stacklevel=stacklevel())
+
         if self._trace is not NotImplemented:
             self._trace._endian = self._gbhdr.byteorder
             self._trace._nnsecd = self._gbhdr.nanosecond
@@ -540,22 +703,35 @@ class Extractor:
 
     def __init__(self,
                  fin=None, fout=None, format=None,                          # basic settings  # pylint: disable=redefined-builtin
-                 auto=True, extension=True, store=True,                     # internal settings
+                 auto=True, extension=True, store=True, store_budget=None,  # internal settings
                  files=False, nofile=False, verbose=False,                  # output settings
-                 engine=None, layer=None, protocol=None,                    # extraction settings
+                 engine=None, layer=None, protocol=None, filter=None,       # extraction settings  # pylint: disable=redefined-builtin
+                 skip_options=False, decode_policy='fast',                  # extraction settings
                  ip=False, ipv4=False, ipv6=False, tcp=False, strict=True,  # reassembly settings
                  trace=False, trace_fout=None, trace_format=None,           # trace settings
-                 trace_byteorder=sys.byteorder, trace_nanosecond=False):    # trace settings
+                 trace_byteorder=sys.byteorder, trace_nanosecond=False,     # trace settings
+                 hierarchy=False, instrument=None,                          # statistics settings
+                 progress=None, progress_interval=1.0,                      # progress settings
+                 follow=False, follow_interval=1.0, follow_timeout=None,    # follow settings
+                 follow_rotate=None):                                       # follow settings
         """Initialise PCAP Reader.
 
         Arguments:
-            fin (Optiona[str]): file name to be read; if file not exist, raise :exc:`FileNotFound`
+            fin (Optiona[Union[str, BinaryIO]]): file name to be read; if file not exist, raise
+                :exc:`FileNotFound`; or a binary file-like object, e.g. pipes and sockets, or ``'-'``
+                for :data:`sys.stdin`, to be read in streaming mode without seeking
             fout (Optiona[str]): file name to be written
             format (Optional[Literal['plist', 'json', 'tree']]): file format of output
 
             auto (bool): if automatically run till EOF
             extension (bool): if check and append extensions to output file
-            store (bool): if store extracted packet info
+            store (Union[bool, int, Literal['index']]): retention policy of extracted frames, i.e.
+                if store all frames (:data:`True`), or only the last ``N`` frames in a ring buffer
+                (positive :obj:`int`), or only offsets of frames to reload them on access
+                (``'index'``, default engine only), c.f. :mod:`pcapkit.corekit.store`
+            store_budget (Optional[int]): memory budget (in bytes of serialised frames) of ``store=True``,
+                over which frames are spilled to a temporary file and decoded on access, c.f.
+                :class:`~pcapkit.corekit.store.SpillStore`
 
             files (bool): if split each frame into different files
             nofile (bool): if no output file is to be dumped
@@ -568,6 +744,14 @@ class Extractor:
                 extraction engine to be used
             layer (Optional[Literal['Link', 'Internet', 'Transport', 'Application']]): extract til which layer
             protocol (Optional[Union[str, Tuple[str], Type[Protocol]]]): extract til which protocol
+            filter (Optional[str]): filter expression (c.f. :mod:`pcapkit.foundation.filtering`) to
+                select frames on their raw bytes before protocol decoding
+            skip_options (Union[bool, str, Tuple[str]]): if keep options of protocols (all of
+                ``TCP``, ``IPv4``, ``HOPOPT``, ``IPv6_Opts`` and ``HIP`` if :data:`True`, or only
+                the given protocol names) as raw bytes instead of decoding them
+            decode_policy (Literal['fast', 'detect']): decoding policy of text fields, i.e. try strict
+                ASCII and UTF-8 before detecting the encoding (``'fast'``), or always detect the encoding
+                (``'detect'``), c.f. :meth:`Protocol.decode <pcapkit.protocols.protocol.Protocol.decode>`
 
             ip (bool): if record data for IPv4 & IPv6 reassembly
             ipv4 (bool): if perform IPv4 reassembly
@@ -582,6 +766,26 @@ class Extractor:
             trace_byteorder (Literal['little', 'big']): output file byte order
             trace_nanosecond (bool): output nanosecond-resolution file flag
 
+            hierarchy (bool): if collect protocol hierarchy statistics
+            instrument (Optional[bool]): if instrument protocol decoding (c.f.
+                :mod:`pcapkit.foundation.instrument`), defaults to the ``PCAPKIT_INSTRUMENT``
+                environment variable
+
+            progress (Optional[Union[bool, Callable[[pcapkit.foundation.extraction.Extractor,
+                pcapkit.corekit.infoclass.Info]]]]): a function takes the :class:`Extractor` instance
+                and its :attr:`stats` as parameters to report progress periodically, or :data:`True`
+                to print progress to :data:`sys.stderr`
+            progress_interval (float): minimum interval in seconds between progress reports
+
+            follow (bool): if follow the input file as it grows, i.e. wait for a truncated
+                trailing frame to be written instead of treating it as EOF (default engine only)
+            follow_interval (float): maximum interval in seconds of polling for new data, as
+                the polling backs off exponentially from 10 milliseconds
+            follow_timeout (Optional[float]): seconds without new frames after which EOF is
+                assumed; wait forever if :data:`None`
+            follow_rotate (Optional[str]): :mod:`glob` pattern of rotated input files, to move
+                to the next file (in lexicographical order) once it appears
+
         Warns:
             FormatWarning: Warns under following circumstances:
 
@@ -591,22 +795,53 @@ class Extractor:
         """
         ifnm, ofnm, fmt, ext, files = self.make_name(fin, fout, format, extension, files=files, nofile=nofile)
 
+        # compile filter expression
+        if filter is not None:
+            from pcapkit.foundation.filtering import Filter
+            self._exflt = Filter(filter)
+        else:
+            self._exflt = None
+        self._exprd = None
+
         # put back builtin
         format = builtins.format
+        filter = builtins.filter
 
         self._ifnm = ifnm               # input file name
+        self._ifcmp = None if fin == '-' or hasattr(fin, 'read') else self._detect_compression(ifnm)
+                                        # input file compression
         self._ofnm = ofnm               # output file name
         self._fext = ext                # output file extension
 
         self._flag_a = auto             # auto extract flag
-        self._flag_d = store            # store data flag
+        self._flag_d = bool(store)      # store data flag
         self._flag_e = False            # EOF flag
         self._flag_f = files            # split file flag
+        self._flag_i = INSTRUMENT if instrument is None else instrument
+                                        # instrumentation flag
         self._flag_m = False            # multiprocessing flag
+        self._flag_n = fin == '-' or hasattr(fin, 'read') or self._ifcmp is not None
+                                        # streaming (non-seekable input) flag
+        self._flag_w = follow           # follow (wait for data) flag
         self._flag_q = nofile           # no output flag
+        self._flag_s = hierarchy        # statistics flag
         self._flag_t = trace            # trace flag
         self._flag_v = bool(verbose)    # verbose output flag
 
+        # progress callback function
+        if progress is True:
+            self._pfunc = self._print_progress
+        else:
+            self._pfunc = progress or None
+        self._pintv = progress_interval # progress report interval
+        self._ptime = 0                 # next progress report time
+
+        self._wintv = follow_interval   # maximum polling interval
+        self._wtout = follow_timeout    # follow timeout
+        self._wrotp = follow_rotate     # rotation pattern of input files
+        self._wlast = None              # last time of new data
+        self._wdely = _FOLLOW_DELAY     # current polling interval
+
         # verbose callback function
         if isinstance(verbose, bool):
             self._vfunc = NotImplemented
@@ -614,12 +849,16 @@ class Extractor:
             self._vfunc = verbose
 
         self._frnum = 0                 # frame number
-        self._frame = list()            # frame record
+        self._exstr = store             # frame retention policy
+        self._exbgt = store_budget      # frame memory budget
+        self._frame = None              # frame record
         self._proto = None              # frame ProtoChain
 
         self._reasm = [None for _ in range(3)]
                                         # frame record for reassembly (IPv4 / IPv6 / TCP)
         self._trace = NotImplemented    # flow tracer
+        self._hrchy = NotImplemented    # protocol hierarchy statistics
+        self._instr = NotImplemented    # protocol decoding instrumentation
 
         self._ipv4 = ipv4 or ip         # IPv4 Reassembly
         self._ipv6 = ipv6 or ip         # IPv6 Reassembly
@@ -628,6 +867,47 @@ class Extractor:
         self._exptl = protocol or 'null'                    # extract til protocol
         self._exlyr = (layer or 'none').capitalize()        # extract til layer
         self._exeng = (engine or 'default').lower()         # extract using engine
+        self._exopt = skip_options or False                 # skip options of protocols
+        self._exdec = (decode_policy or 'fast').lower()     # decoding policy of text fields
+
+        if self._exdec not in ('fast', 'detect'):
+            warnings.warn(f"unsupported decode policy: {decode_policy}; using 'fast' instead",
+                          AttributeWarning, stacklevel=stacklevel())
+            self._exdec = 'fast'
+
+        if self._flag_w and self._flag_n:
+            warnings.warn("'Extractor(fin=<stream>)' does not support 'follow=True'; "
+                          'reading till EOF instead', AttributeWarning, stacklevel=stacklevel())
+            self._flag_w = False
+
+        if self._exstr == 'index' and self._flag_n:
+            warnings.warn("'Extractor(fin=<stream>)' does not support 'store=index'; "
+                          "using 'store=True' instead", AttributeWarning, stacklevel=stacklevel())
+            self._exstr = True
+        elif self._exstr == 'index' and self._flag_w and self._wrotp is not None:
+            warnings.warn("'Extractor(follow_rotate=...)' does not support 'store=index'; "
+                          "using 'store=True' instead", AttributeWarning, stacklevel=stacklevel())
+            self._exstr = True
+        elif self._exstr == 'index' and self._exeng not in ('default', 'pcapkit'):
+            warnings.warn(f"'Extractor(engine={self._exeng})' does not support 'store=index'; "
+                          "using 'store=True' instead", AttributeWarning, stacklevel=stacklevel())
+            self._exstr = True
+        elif self._exstr != 'index' and (not isinstance(self._exstr, int) or self._exstr < 0):
+            warnings.warn(f'unsupported retention policy: store={store!r}; using store=True instead',
+                          AttributeWarning, stacklevel=stacklevel())
+            self._exstr = self._flag_d = True
+        if self._exbgt is not None and (self._exstr is not True or self._exbgt < 0):
+            warnings.warn(f'unsupported memory budget: store_budget={store_budget!r} with store={self._exstr!r}; '
+                          'storing frames in memory instead', AttributeWarning, stacklevel=stacklevel())
+            self._exbgt = None
+        self._frame = self._make_store()
+
+        # compile termination threshold
+        self._exthrd = Frame._compile_threshold(            # pylint: disable=protected-access
+            self._exlyr, tuple(protocol) if isinstance(protocol, list) else self._exptl)
+        # compile protocols whose options are kept as raw bytes
+        self._exskp = Frame._compile_skip_options(          # pylint: disable=protected-access
+            tuple(self._exopt) if isinstance(self._exopt, list) else self._exopt)
 
         if self._ipv4:
             from pcapkit.reassembly.ipv4 import IPv4_Reassembly
@@ -648,7 +928,25 @@ class Extractor:
             self._trace = TraceFlow(fout=trace_fout, format=trace_format,
                                     byteorder=trace_byteorder, nanosecond=trace_nanosecond)
 
-        self._ifile = open(ifnm, 'rb')                                      # input file
+        if hierarchy:
+            from pcapkit.foundation.hierarchy import ProtoHierarchy
+            self._hrchy = ProtoHierarchy()
+
+        if self._flag_i:
+            self._instr = Instrument()
+
+        if self._ifcmp is not None:
+            self._ifile = self._open_compressed(ifnm, self._ifcmp)          # decompressed input stream
+            self._ifsiz = None                                              # input stream size (unknown)
+        elif self._flag_n:
+            self._ifile = sys.stdin.buffer if fin == '-' else fin           # input stream
+            self._ifsiz = None                                              # input stream size (unknown)
+        else:
+            self._ifile = open(ifnm, 'rb')                                  # input file
+            self._ifsiz = None if follow else os.path.getsize(ifnm)         # input file size
+        self._ifoff = 0                                                     # input file offset (after EOF)
+        self._start = time.perf_counter()                                   # extraction start time
+        self._finish = None                                                 # extraction finish time
         if not self._flag_q:
             if fmt == 'plist':
                 from dictdumper import PLIST as output  # output PLIST file
@@ -759,8 +1057,11 @@ class Extractor:
         return self
 
     def __exit__(self, exc_type, exc_value, traceback):  # pylint: disable=unused-argument
-        """Close the input file when exits."""
-        self._ifile.close()
+        """Close the input file when exits; input streams are left open to the caller."""
+        if not self._flag_n and not self._ifile.closed:
+            self._ifoff = self._ifile.tell()
+        if not self._flag_n or self._ifcmp is not None:
+            self._ifile.close()
 
     ##########################################################################
     # Utilities.
@@ -772,14 +1073,19 @@ class Extractor:
         The method clears the :attr:`self._expkg <Extractor._expkg>` and
         :attr:`self._extmp <Extractor._extmp>` attributes, sets
         :attr:`self._flag_e <pcapkit.foundation.extraction.Extractor._flag_e>`
-        as :data:`True` and closes the input file.
+        as :data:`True`, closes the input file and reports the final progress.
 
         """
         # pylint: disable=attribute-defined-outside-init
         self._expkg = None
         self._extmp = None
         self._flag_e = True
-        self._ifile.close()
+        if not self._flag_n and not self._ifile.closed:
+            self._ifoff = self._ifile.tell()
+        if not self._flag_n or self._ifcmp is not None:
+            self._ifile.close()
+        self._finish = time.perf_counter()
+        self._report_progress(final=True)
 
     def _aftermathmp(self):
         """Aftermath for multiprocessing.
@@ -794,12 +1100,14 @@ class Extractor:
         * assign :attr:`self._mpfrm <Extractor._mpfrm>` to :attr:`self._frame <Extractor._frame>`
         * assign :attr:`self._mprsm <Extractor._mprsm>` to :attr:`self._reasm <Extractor._reasm>`
         * copy :attr:`self._mpkit.trace <Extractor._mpkit.trace>` to :attr:`self._trace <Extractor._trace>`
+        * copy :attr:`self._mpkit.hierarchy <Extractor._mpkit.hierarchy>` to :attr:`self._hrchy <Extractor._hrchy>`
 
         For multiprocessing pipeline engine, it will
 
         * restore :attr:`self._frame <Extractor._frame>` from :attr:`self._mpkit.frames <Extractor._mpkit.frames>`
         * copy :attr:`self._mpkit.reassembly <Extractor._mpkit.reassembly>` to :attr:`self._reasm <Extractor._reasm>`
         * copy :attr:`self._mpkit.trace <Extractor._mpkit.trace>` to :attr:`self._trace <Extractor._trace>`
+        * copy :attr:`self._mpkit.hierarchy <Extractor._mpkit.hierarchy>` to :attr:`self._hrchy <Extractor._hrchy>`
 
         After restoring attributes, it will *shutdown* multiprocessing manager context
         :attr:`self._mpmng <Extractor._mpmng>`, delete all multiprocessing attributes (i.e. starts with `_mp`),
@@ -826,13 +1134,15 @@ class Extractor:
 
         # restore attributes
         if self._exeng == 'server':
-            self._frame = list(self._mpfrm)
+            self._frame = self._make_store(self._mpfrm)
             self._reasm = list(self._mprsm)
             self._trace = copy.deepcopy(self._mpkit.trace)
+            self._hrchy = copy.deepcopy(self._mpkit.hierarchy)
         if self._exeng == 'pipeline':
-            self._frame = [self._mpkit.frames[x] for x in sorted(self._mpkit.frames)]
+            self._frame = self._make_store(self._mpkit.frames[x] for x in sorted(self._mpkit.frames))
             self._reasm = copy.deepcopy(self._mpkit.reassembly)
             self._trace = copy.deepcopy(self._mpkit.trace)
+            self._hrchy = copy.deepcopy(self._mpkit.hierarchy)
 
         # shutdown & cleanup
         self._mpmng.shutdown()
@@ -844,12 +1154,185 @@ class Extractor:
 
         This method calls :meth:`_aftermathmp` to cleanup multiproccessing stuff,
         closes the input file and toggle :attr:`self._flag_e <pcapkit.foundation.extraction.Extractor._flag_e>`
-        as :data:`True`.
+        as :data:`True`, then reports the final progress.
 
         """
         self._aftermathmp()
         self._ifile.close()
+        self._ifoff = self._ifsiz
         self._flag_e = True
+        self._finish = time.perf_counter()
+        self._report_progress(final=True)
+
+    @staticmethod
+    def _detect_compression(path):
+        """Detect compression of the input file by its magic number.
+
+        Args:
+            path (str): input file name
+
+        Returns:
+            Optional[Literal['gzip', 'bz2', 'xz', 'zstd']]: Compression format;
+            :data:`None` if not compressed.
+
+        """
+        with open(path, 'rb') as file:
+            magic = file.read(6)
+        for prefix, compression in _COMPRESS_MAGIC.items():
+            if magic.startswith(prefix):
+                return compression
+        return None
+
+    @staticmethod
+    def _open_compressed(path, compression):
+        """Open a compressed input file as a decompressed stream.
+
+        The decompressor is wrapped in a :class:`io.BufferedReader` of
+        ``1`` MiB, so that frames are read from large decompressed blocks,
+        through :class:`_DecompressedInput`, so that a truncated or corrupted
+        compressed stream does not discard data decompressed before it.
+
+        Args:
+            path (str): input file name
+            compression (Literal['gzip', 'bz2', 'xz', 'zstd']): compression format
+
+        Returns:
+            io.BufferedReader: Decompressed input stream.
+
+        Raises:
+            ModuleNotFound: If ``zstd`` compressed while neither :mod:`compression.zstd`
+                (Python 3.14+) nor `zstandard`_ is available.
+
+        .. _zstandard: https://pypi.org/project/zstandard/
+
+        """
+        if compression == 'gzip':
+            import gzip
+            stream = gzip.open(path, 'rb')
+        elif compression == 'bz2':
+            import bz2
+            stream = bz2.open(path, 'rb')
+        elif compression == 'xz':
+            import lzma
+            stream = lzma.open(path, 'rb')
+        else:
+            try:
+                from compression import zstd  # pylint: disable=import-error
+            except ImportError:
+                try:
+                    import zstandard as zstd  # pylint: disable=import-error
+                except ImportError:
+                    raise ModuleNotFound("No module named 'zstandard'", name='zstandard') from None
+            stream = zstd.open(path, 'rb')
+        return io.BufferedReader(_DecompressedInput(stream), buffer_size=_COMPRESS_BUFSIZE)
+
+    def _make_store(self, frames=None):
+        """Make frame store per retention policy.
+
+        Args:
+            frames (Optional[Iterable[pcapkit.protocols.pcap.frame.Frame]]): initial frames,
+                e.g. as collected from multiprocessing engines
+
+        Returns:
+            Optional[pcapkit.corekit.store.FrameStore]: Frame store as per
+            :attr:`self._exstr <Extractor._exstr>`; :data:`None` if storing
+            frame data is disabled.
+
+        """
+        if not self._flag_d:
+            return None
+        if self._exstr == 'index':
+            return IndexStore(self._load_frame)
+        if self._exstr is not True:
+            return RingStore(self._exstr, frames)
+        if self._exbgt is None:
+            return ListStore(frames)
+        if self._exeng in ('default', 'pcapkit', 'server', 'pipeline'):
+            return SpillStore(self._exbgt, dump=self._dump_frame, load=self._restore_frame, frames=frames)
+        return SpillStore(self._exbgt, frames=frames)
+
+    def _load_frame(self, offset, number):
+        """Reload a frame from the input file.
+
+        Args:
+            offset (int): offset of the frame in the input file
+            number (int): frame number
+
+        Returns:
+            pcapkit.protocols.pcap.frame.Frame: Reloaded frame.
+
+        """
+        with open(self._ifnm, 'rb') as file:
+            file.seek(offset, os.SEEK_SET)
+            return Frame(file, num=number, proto=self._dlink, nanosecond=self._nnsec,
+                         _threshold=self._exthrd, _skip_options=self._exskp, _decode_policy=self._exdec)
+
+    def _dump_frame(self, frame):  # pylint: disable=no-self-use
+        """Serialise a frame for spilling to disk.
+
+        The record consists of the frame number, followed by the frame
+        header and packet data as in the PCAP file (in little-endian).
+
+        Args:
+            frame (pcapkit.protocols.pcap.frame.Frame): extracted frame
+
+        Returns:
+            bytes: Serialised frame record.
+
+        """
+        info = frame.info.frame_info
+        return b'%s%s' % (struct.pack('<5I', frame.info.number, info.ts_sec, info.ts_usec,
+                                      info.incl_len, info.orig_len), frame.info.packet)
+
+    def _restore_frame(self, record):
+        """Decode a frame spilled to disk.
+
+        Args:
+            record (bytes): serialised frame record, as from :meth:`_dump_frame`
+
+        Returns:
+            pcapkit.protocols.pcap.frame.Frame: Decoded frame.
+
+        """
+        number, = struct.unpack('<I', record[:4])
+        return Frame(io.BytesIO(record[4:]), num=number, proto=self._dlink, nanosecond=self._nnsec,
+                     _threshold=self._exthrd, _skip_options=self._exskp, _decode_policy=self._exdec)
+
+    def _report_progress(self, *, final=False):
+        """Report progress through :attr:`self._pfunc <Extractor._pfunc>`.
+
+        Reports are throttled by time, i.e. at most one per
+        :attr:`self._pintv <Extractor._pintv>` seconds, so that checking
+        costs only a clock read per frame.
+
+        Keyword Args:
+            final (bool): if report regardless of the interval, e.g. upon EOF
+
+        """
+        if self._pfunc is None:
+            return
+        now = time.monotonic()
+        if final or now >= self._ptime:
+            self._ptime = now + self._pintv
+            self._pfunc(self, self.stats)
+
+    @staticmethod
+    def _print_progress(extractor, stats):  # pylint: disable=unused-argument
+        """Print progress to :data:`sys.stderr`.
+
+        Args:
+            extractor (Extractor): extractor instance
+            stats (Info): progress snapshot, c.f. :attr:`Extractor.stats`
+
+        """
+        eta = '--' if stats.eta is None else f'{stats.eta:.0f}s'
+        if stats.size is None:
+            read = f'{stats.offset} bytes read'
+        else:
+            read = f'{stats.progress:.1%} of {stats.size} bytes'
+        print(f'{stats.frames} frames, {read}, '
+              f'{stats.frames_per_sec:.1f} frames/s, {stats.mb_per_sec:.2f} MB/s, ETA {eta}',
+              file=sys.stderr)
 
     def _read_frame(self):
         """Headquarters for frame reader.
@@ -859,18 +1342,28 @@ class Extractor:
         * For Scapy engine, calls :meth:`_scapy_read_frame`.
         * For DPKT engine, calls :meth:`_dpkt_read_frame`.
         * For PyShark engine, calls :meth:`_pyshark_read_frame`.
-        * For default (PyPCAPKit) engine, calls :meth:`_default_read_frame`.
+        * For default (PyPCAPKit) engine, calls :meth:`_default_read_frame`,
+          within :attr:`self._instr <Extractor._instr>` if instrumentation is enabled.
+
+        Before parsing, progress is reported through :meth:`_report_progress`
+        if a progress callback is set.
 
         Returns:
             The parsed frame instance.
 
         """
+        if self._pfunc is not None:
+            self._report_progress()
+
         if self._exeng == 'scapy':
             return self._scapy_read_frame()
         if self._exeng == 'dpkt':
             return self._dpkt_read_frame()
         if self._exeng == 'pyshark':
             return self._pyshark_read_frame()
+        if self._flag_i:
+            with self._instr:
+                return self._default_read_frame()
         return self._default_read_frame()
 
     def _default_read_frame(self, *, frame=None, mpkit=None):
@@ -898,16 +1391,27 @@ class Extractor:
                                              tcp_traceflow)
 
         # read frame header
+        offset = None
         if not self._flag_m:
-            frame = Frame(self._ifile, num=self._frnum+1, proto=self._dlink,
-                          layer=self._exlyr, protocol=self._exptl, nanosecond=self._nnsec)
+            if self._exprd is None and not (self._flag_n or self._flag_w):
+                file = self._ifile
+                if self._exstr == 'index':
+                    offset = file.tell()
+            else:
+                # read whole records, so that frames are never decoded from partial data
+                file = self._filter_frame() if self._exprd is not None else io.BytesIO(b''.join(self._read_record()))
+                if self._exstr == 'index':
+                    offset = self._ifile.tell() - len(file.getbuffer())
+            frame = Frame(file, num=self._frnum+1, proto=self._dlink, nanosecond=self._nnsec,
+                          _threshold=self._exthrd, _skip_options=self._exskp, _decode_policy=self._exdec)
             self._frnum += 1
+        chain = frame.protochain.chain
 
         # verbose output
-        logger.info(f'Frame {self._frnum:>3d}: {frame.protochain}')  # pylint: disable=logging-fstring-interpolation
+        logger.info(f'Frame {self._frnum:>3d}: {chain}')  # pylint: disable=logging-fstring-interpolation
         if self._flag_v:
             if self._vfunc is NotImplemented:
-                print(f' - Frame {self._frnum:>3d}: {frame.protochain}')
+                print(f' - Frame {self._frnum:>3d}: {chain}')
             else:
                 self._vfunc(self, frame)
 
@@ -940,6 +1444,10 @@ class Extractor:
             if flag:
                 self._trace(data)
 
+        # protocol hierarchy
+        if self._flag_s:
+            self._hrchy(chain, frame.info.len)
+
         # record frames
         if self._exeng == 'pipeline':
             if self._flag_d:
@@ -956,12 +1464,172 @@ class Extractor:
             self._frnum += 1
         else:
             if self._flag_d:
-                self._frame.append(frame)
-            self._proto = frame.protochain.chain
+                self._frame.append(frame, offset)
+            self._proto = chain
 
         # return frame record
         return frame
 
+    def _filter_frame(self):
+        """Skip frames not matching the filter.
+
+        This method reads the PCAP frame header and raw packet data of each
+        frame, and checks the packet data against the compiled filter
+        predicate :attr:`self._exprd <Extractor._exprd>`. Frames not matching
+        are skipped (though counted in :attr:`self._frnum <Extractor._frnum>`)
+        without any protocol decoding.
+
+        Returns:
+            io.BytesIO: Source data stream of the first matching frame.
+
+        Raises:
+            EOFError: If the input file reaches EOF.
+
+        """
+        while True:
+            header, packet = self._read_record()
+            if self._exprd(packet):
+                return io.BytesIO(header + packet)
+            self._frnum += 1
+
+    def _read_record(self):
+        """Read the PCAP frame header and raw packet data of next frame.
+
+        In follow mode, a truncated trailing frame is not yet available rather
+        than EOF, thus the method rewinds to the start of the frame and waits
+        for more data through :meth:`_wait_input`.
+
+        Returns:
+            Tuple[bytes, bytes]: Frame header and packet data.
+
+        Raises:
+            EOFError: If the input file reaches EOF, or the last frame is truncated.
+
+        """
+        while True:
+            if self._flag_w:
+                start = self._ifile.tell()
+
+            header = self._read_input(16)
+            if len(header) == 16:
+                length = _UNPACK_FRAME(header)[2]
+                packet = self._read_input(length)
+                if len(packet) == length:
+                    self._wlast = None
+                    return header, packet
+
+            if not self._flag_w:
+                raise EOFError
+            self._ifile.seek(start, os.SEEK_SET)
+            self._wait_input(partial=bool(header))
+
+    def _wait_input(self, *, partial=False):
+        """Wait for more data of the input file in follow mode.
+
+        The method moves to the next rotated input file if any, else it sleeps
+        with exponential backoff from ``10`` milliseconds up to
+        :attr:`self._wintv <Extractor._wintv>` seconds.
+
+        Keyword Args:
+            partial (bool): if a truncated trailing frame is pending
+
+        Raises:
+            EOFError: If no new frames for :attr:`self._wtout <Extractor._wtout>` seconds.
+
+        """
+        now = time.monotonic()
+        if self._wlast is None:
+            self._wlast = now
+            self._wdely = _FOLLOW_DELAY
+
+        if self._wrotp is not None and self._rotate_input(partial=partial):
+            return
+        if self._wtout is not None and now - self._wlast >= self._wtout:
+            raise EOFError
+
+        time.sleep(self._wdely)
+        self._wdely = min(self._wdely * 2, self._wintv)
+
+    def _rotate_input(self, *, partial=False):
+        """Move to the next rotated input file.
+
+        The next file is the first one matching :attr:`self._wrotp <Extractor._wrotp>`
+        after the current input file in lexicographical order, once its PCAP global
+        header is written.
+
+        Keyword Args:
+            partial (bool): if a truncated trailing frame is pending, which is dropped
+
+        Returns:
+            bool: If moved to the next input file.
+
+        Raises:
+            EOFError: If the next input file is of a different data link type.
+
+        """
+        current = os.path.abspath(self._ifnm)
+        for path in sorted(glob.glob(self._wrotp), key=os.path.abspath):
+            if os.path.abspath(path) > current:
+                break
+        else:
+            return False
+
+        if os.path.getsize(path) < 24:
+            return False
+        ifile = open(path, 'rb')
+        header = Header(ifile)
+        if header.protocol != self._dlink:
+            ifile.close()
+            warnings.warn(f'rotated input file {path!r} is of data link type {header.protocol!r}; '
+                          f'expected {self._dlink!r}', FileWarning, stacklevel=stacklevel())
+            raise EOFError
+        if partial:
+            warnings.warn(f'truncated trailing frame of input file {self._ifnm!r} dropped',
+                          FileWarning, stacklevel=stacklevel())
+
+        self._ifile.close()
+        self._ifile = ifile
+        self._ifnm = path
+        self._nnsec = header.nanosecond
+        self._wlast = None
+        return True
+
+    def _read_input(self, size):
+        """Read from the input file without seeking.
+
+        Short reads, e.g. from pipes and sockets, are retried until ``size``
+        bytes are read or EOF is reached, and counted in
+        :attr:`self._ifoff <Extractor._ifoff>` for input streams.
+
+        For compressed input files, a truncated or corrupted compressed stream
+        is treated as EOF, so that frames decoded so far are kept.
+
+        Args:
+            size (int): number of bytes to read
+
+        Returns:
+            bytes: Data read; fewer than ``size`` bytes only if EOF is reached.
+
+        Warns:
+            FileWarning: If the compressed input file is truncated or corrupted.
+
+        """
+        data = b''
+        try:
+            while len(data) < size:
+                chunk = self._ifile.read(size - len(data))
+                if not chunk:
+                    break
+                data += chunk
+        except _COMPRESS_ERRORS as error:
+            if self._ifcmp is None:
+                raise
+            warnings.warn(f'truncated or corrupted compressed input file {self._ifnm!r}: {error}',
+                          FileWarning, stacklevel=stacklevel())
+        if self._flag_n:
+            self._ifoff += len(data)
+        return data
+
     def _run_scapy(self, scapy_all):
         """Call :func:`scapy.all.sniff` to extract PCAP files.
 
@@ -989,6 +1657,21 @@ class Extractor:
                           f"'layer={self._exlyr}' and 'protocol={self._exptl}' ignored",
                           AttributeWarning, stacklevel=stacklevel())
 
+        if self._exopt:
+            warnings.warn("'Extractor(engine=scapy)' does not support skipping options; "
+                          f"'skip_options={self._exopt}' ignored",
+                          AttributeWarning, stacklevel=stacklevel())
+
+        if self._exdec != 'fast':
+            warnings.warn("'Extractor(engine=scapy)' does not support decode policy; "
+                          f"'decode_policy={self._exdec}' ignored",
+                          AttributeWarning, stacklevel=stacklevel())
+
+        if self._exflt is not None:
+            warnings.warn("'Extractor(engine=scapy)' does not support filter; "
+                          f"'filter={self._exflt.expression!r}' ignored",
+                          AttributeWarning, stacklevel=stacklevel())
+
         # extract & analyse file
         self._expkg = scapy_all
         self._extmp = iter(scapy_all.sniff(offline=self._ifnm))
@@ -1058,6 +1741,10 @@ class Extractor:
             if flag:
                 self._trace(data)
 
+        # protocol hierarchy
+        if self._flag_s:
+            self._hrchy(self._proto, len(packet))
+
         return packet
 
     def _run_dpkt(self, dpkt):
@@ -1086,6 +1773,16 @@ class Extractor:
                           f"'layer={self._exlyr}' and 'protocol={self._exptl}' ignored",
                           AttributeWarning, stacklevel=stacklevel())
 
+        if self._exopt:
+            warnings.warn("'Extractor(engine=dpkt)' does not support skipping options; "
+                          f"'skip_options={self._exopt}' ignored",
+                          AttributeWarning, stacklevel=stacklevel())
+
+        if self._exdec != 'fast':
+            warnings.warn("'Extractor(engine=dpkt)' does not support decode policy; "
+                          f"'decode_policy={self._exdec}' ignored",
+                          AttributeWarning, stacklevel=stacklevel())
+
         # extract global header
         self.record_header()
         self._ifile.seek(0, os.SEEK_SET)
@@ -1112,6 +1809,10 @@ class Extractor:
 
         # fetch DPKT packet
         timestamp, packet = next(self._extmp)
+        if self._exprd is not None:
+            while not self._exprd(packet):
+                self._frnum += 1
+                timestamp, packet = next(self._extmp)
 
         # extract packet
         if self._dlink.value == 1:
@@ -1174,6 +1875,10 @@ class Extractor:
             if flag:
                 self._trace(data)
 
+        # protocol hierarchy
+        if self._flag_s:
+            self._hrchy(self._proto, len(packet))
+
         return packet
 
     def _run_pyshark(self, pyshark):
@@ -1206,6 +1911,21 @@ class Extractor:
                           f"'layer={self._exlyr}' and 'protocol={self._exptl}' ignored",
                           AttributeWarning, stacklevel=stacklevel())
 
+        if self._exopt:
+            warnings.warn("'Extractor(engine=pyshark)' does not support skipping options; "
+                          f"'skip_options={self._exopt}' ignored",
+                          AttributeWarning, stacklevel=stacklevel())
+
+        if self._exdec != 'fast':
+            warnings.warn("'Extractor(engine=pyshark)' does not support decode policy; "
+                          f"'decode_policy={self._exdec}' ignored",
+                          AttributeWarning, stacklevel=stacklevel())
+
+        if self._exflt is not None:
+            warnings.warn("'Extractor(engine=pyshark)' does not support filter; "
+                          f"'filter={self._exflt.expression!r}' ignored",
+                          AttributeWarning, stacklevel=stacklevel())
+
         if (self._ipv4 or self._ipv6 or self._tcp):
             self._ipv4 = self._ipv6 = self._tcp = False
             self._reasm = [None, None, None]
@@ -1274,6 +1994,10 @@ class Extractor:
             if flag:
                 self._trace(data)
 
+        # protocol hierarchy
+        if self._flag_s:
+            self._hrchy(self._proto, int(packet.length))
+
         return packet
 
     def _run_pipeline(self, multiprocessing):
@@ -1339,6 +2063,11 @@ class Extractor:
             warnings.warn("'Extractor(engine=pipeline)' does not support output; "
                           f"'fout={self._ofnm}' ignored", AttributeWarning, stacklevel=stacklevel())
 
+        if self._exflt is not None:
+            self._exflt = None
+            warnings.warn("'Extractor(engine=pipeline)' does not support filter; "
+                          "'filter' ignored", AttributeWarning, stacklevel=stacklevel())
+
         self._frnum = 1                                                 # frame number (revised)
         self._expkg = multiprocessing                                   # multiprocessing module
         self._mpprc = list()                                            # multiprocessing process list
@@ -1353,6 +2082,7 @@ class Extractor:
         self._mpkit.eof = False                                         # EOF flag
         self._mpkit.frames = dict()                                     # frame storage
         self._mpkit.trace = self._trace                                 # flow tracer
+        self._mpkit.hierarchy = self._hrchy                             # protocol hierarchy statistics
         self._mpkit.reassembly = copy.deepcopy(self._reasm)             # reassembly buffers
 
         # preparation
@@ -1434,18 +2164,21 @@ class Extractor:
             # analysis and storage
             # print(self._frnum, 'get')
             self._trace = mpkit.trace
+            self._hrchy = mpkit.hierarchy
             self._reasm = mpkit.reassembly
             self._default_read_frame(frame=frame, mpkit=mpkit)
             # print(self._frnum, 'analysed')
             mpkit.trace = copy.deepcopy(self._trace)
+            mpkit.hierarchy = copy.deepcopy(self._hrchy)
             mpkit.reassembly = copy.deepcopy(self._reasm)
             # print(self._frnum, 'put')
 
         # extract frame
         try:
             # extraction
-            frame = Frame(self._ifile, num=self._frnum, proto=self._dlink, layer=self._exlyr,
-                          protocol=self._exptl, nanosecond=self._nnsec, mpkit=mpkit, mpfdp=mpfdp)
+            frame = Frame(self._ifile, num=self._frnum, proto=self._dlink, nanosecond=self._nnsec,
+                          mpkit=mpkit, mpfdp=mpfdp, _threshold=self._exthrd, _skip_options=self._exskp,
+                          _decode_policy=self._exdec)
             # analysis
             _analyse_frame(frame=frame, mpkit=mpkit)
         except EOFError:
@@ -1527,6 +2260,11 @@ class Extractor:
             warnings.warn("'Extractor(engine=pipeline)' does not support output; "
                           f"'fout={self._ofnm}' ignored", AttributeWarning, stacklevel=stacklevel())
 
+        if self._exflt is not None:
+            self._exflt = None
+            warnings.warn("'Extractor(engine=server)' does not support filter; "
+                          "'filter' ignored", AttributeWarning, stacklevel=stacklevel())
+
         self._frnum = 1                                                 # frame number (revised)
         self._expkg = multiprocessing                                   # multiprocessing module
         self._mpsrv = NotImplemented                                    # multiprocessing server process
@@ -1543,6 +2281,7 @@ class Extractor:
         self._mpkit.pool = 1                                            # work pool (ready)
         self._mpkit.eof = False                                         # EOF flag
         self._mpkit.trace = None                                        # flow tracer
+        self._mpkit.hierarchy = None                                    # protocol hierarchy statistics
 
         # preparation
         self.record_header()
@@ -1618,8 +2357,9 @@ class Extractor:
 
         # extract frame
         try:
-            frame = Frame(self._ifile, num=self._frnum, proto=self._dlink, layer=self._exlyr,
-                          protocol=self._exptl, nanosecond=self._nnsec, mpkit=mpkit, mpfdp=mpfdp)
+            frame = Frame(self._ifile, num=self._frnum, proto=self._dlink, nanosecond=self._nnsec,
+                          mpkit=mpkit, mpfdp=mpfdp, _threshold=self._exthrd, _skip_options=self._exskp,
+                          _decode_policy=self._exdec)
             # frame._file = NotImplemented
             mpbuf[self._frnum] = frame
         except EOFError:
@@ -1639,7 +2379,8 @@ class Extractor:
 
         Once the frame popped is :exc:`EOFError`, i.e. the frame parsing had finished, it
         breaks from the clause and updates ``mpfrm`` with :attr:`self._frame <Extractor._frame>`, ``mprsm`` with
-        :attr:`self._reasm <Extractor._reasm>`, and ``mpkit.trace`` with :attr:`self._trace <Extractor._trace>`.
+        :attr:`self._reasm <Extractor._reasm>`, ``mpkit.trace`` with :attr:`self._trace <Extractor._trace>`, and
+        ``mpkit.hierarchy`` with :attr:`self._hrchy <Extractor._hrchy>`.
 
         Keyword Args:
             mpkit (multiprocessing.managers.SyncManager.Namespace):
@@ -1665,3 +2406,4 @@ class Extractor:
         mpfrm += self._frame
         mprsm += self._reasm
         mpkit.trace = copy.deepcopy(self._trace)
+        mpkit.hierarchy = copy.deepcopy(self._hrchy)
@@ -0,0 +1,606 @@
+# -*- coding: utf-8 -*-
+"""packet filter on raw bytes
+
+:mod:`pcapkit.foundation.filtering` contains
+:class:`~pcapkit.foundation.filtering.Filter` only,
+which compiles a small BPF-like filter expression into a
+predicate over the raw packet bytes of a PCAP frame, so that
+unwanted frames can be dropped before any protocol decoding.
+
+Syntax
+------
+
+A filter expression is made of *primitives* combined with ``and``
+(``&&``), ``or`` (``||``), ``not`` (``!``) and parentheses, where
+``not`` binds tighter than ``and``, which binds tighter than ``or``.
+Supported primitives are:
+
+.. code-block:: text
+
+   [ip|ip6|tcp|udp|sctp] [src|dst] host <address>
+   [ip|ip6|tcp|udp|sctp] [src|dst] net <address>/<prefix>
+   [tcp|udp|sctp] [src|dst] port <number>
+   [tcp|udp|sctp] [src|dst] portrange <number>-<number>
+   [ip|ip6] proto <number|name>
+   [src|dst] <address>
+   vlan [<id>]
+   ip | ip6 | arp | rarp | tcp | udp | sctp | icmp | icmp6
+   less <length> | greater <length>
+
+The predicate reads fixed offsets of the link, internet and transport
+layer headers straight from the raw packet bytes, according to the link
+type from the PCAP global header (:attr:`Header.protocol <pcapkit.protocols.pcap.header.Header.protocol>`).
+Currently, Ethernet (with 802.1Q/802.1ad tags), raw IP, raw IPv4 and raw
+IPv6 link types are supported.
+
+"""
+import ipaddress
+import re
+import struct
+
+from pcapkit.utilities.exceptions import FilterError, ProtocolNotImplemented
+
+__all__ = ['Filter']
+
+#: Tokeniser for filter expressions.
+_RE_TOKEN = re.compile(r'\s*(\(|\)|&&|\|\||!|[^\s()!&|]+)')
+
+#: Unpack two unsigned shorts in network byte order.
+_UNPACK_HH = struct.Struct('!HH').unpack_from
+
+#: Ethertype of 802.1Q/802.1ad VLAN tags.
+_VLAN_TPID = {0x8100, 0x88A8, 0x9100}
+
+#: IPv6 extension headers to be skipped before the transport layer.
+_IPV6_EXTENSION = {0, 43, 60, 135, 139, 140, 253, 254}
+
+#: Transport layer protocols with source and destination ports.
+_PORT_PROTO = {6, 17, 132}
+
+#: Protocol names for the ``proto`` primitive.
+_PROTO_NAME = {
+    'icmp': 1, 'igmp': 2, 'tcp': 6, 'udp': 17, 'ipv6': 41, 'gre': 47,
+    'esp': 50, 'ah': 51, 'icmp6': 58, 'ospf': 89, 'pim': 103, 'sctp': 132,
+}
+
+#: Directions qualifiers.
+_DIRECTION = {'src', 'dst'}
+
+#: Type qualifiers.
+_TYPE = {'host', 'net', 'port', 'portrange', 'proto'}
+
+#: Protocol qualifiers.
+_QUALIFIER = {'ip', 'ip6', 'tcp', 'udp', 'sctp'}
+
+
+class _Dissection:
+    """Header fields dissected from raw packet bytes."""
+
+    __slots__ = ('length', 'vlan', 'ethertype', 'version', 'src', 'dst', 'proto', 'srcport', 'dstport')
+
+    def __init__(self, length):
+        #: int: Length of the packet.
+        self.length = length
+        #: Tuple[int]: VLAN identifiers (outermost first).
+        self.vlan = ()
+        #: Optional[int]: Ethertype of the internet layer.
+        self.ethertype = None
+        #: Optional[int]: IP version.
+        self.version = None
+        #: Optional[bytes]: Source IP address (packed).
+        self.src = None
+        #: Optional[bytes]: Destination IP address (packed).
+        self.dst = None
+        #: Optional[int]: Transport layer protocol number.
+        self.proto = None
+        #: Optional[int]: Source port.
+        self.srcport = None
+        #: Optional[int]: Destination port.
+        self.dstport = None
+
+
+def _dissect_ip(view, packet, offset):
+    """Dissect internet and transport layer headers.
+
+    Args:
+        view (_Dissection): dissection buffer
+        packet (bytes): raw packet data
+        offset (int): offset of the internet layer header
+
+    Returns:
+        _Dissection: dissection buffer
+
+    """
+    length = len(packet)
+    if length <= offset:
+        return view
+    version = packet[offset] >> 4
+
+    if version == 4:
+        if length < offset + 20:
+            return view
+        view.ethertype = 0x0800
+        view.version = 4
+        view.proto = proto = packet[offset+9]
+        view.src = packet[offset+12:offset+16]
+        view.dst = packet[offset+16:offset+20]
+
+        # non-first fragments carry no transport layer header
+        if (packet[offset+6] & 0x1F) or packet[offset+7]:
+            return view
+        offset += (packet[offset] & 0x0F) * 4
+    elif version == 6:
+        if length < offset + 40:
+            return view
+        view.ethertype = 0x86DD
+        view.version = 6
+        view.src = packet[offset+8:offset+24]
+        view.dst = packet[offset+24:offset+40]
+
+        proto = packet[offset+6]
+        offset += 40
+        while True:
+            if proto in _IPV6_EXTENSION:
+                if length < offset + 2:
+                    return view
+                proto, offset = packet[offset], offset + (packet[offset+1] + 1) * 8
+            elif proto == 44:   # IPv6-Frag
+                if length < offset + 8:
+                    return view
+                view.proto = packet[offset]
+                if (packet[offset+2] << 5) | (packet[offset+3] >> 3):
+                    return view
+                proto, offset = packet[offset], offset + 8
+            elif proto == 51:   # AH
+                if length < offset + 2:
+                    return view
+                proto, offset = packet[offset], offset + (packet[offset+1] + 2) * 4
+            else:
+                break
+        view.proto = proto
+    else:
+        return view
+
+    if proto in _PORT_PROTO and length >= offset + 4:
+        view.srcport, view.dstport = _UNPACK_HH(packet, offset)
+    return view
+
+
+def _dissect_ethernet(packet):
+    """Dissect packet of Ethernet link type.
+
+    Args:
+        packet (bytes): raw packet data
+
+    Returns:
+        _Dissection: dissected header fields
+
+    """
+    view = _Dissection(len(packet))
+    if view.length < 14:
+        return view
+
+    offset = 14
+    ethertype = (packet[12] << 8) | packet[13]
+    if ethertype in _VLAN_TPID:
+        vlan = list()
+        while ethertype in _VLAN_TPID and view.length >= offset + 4:
+            tci, ethertype = _UNPACK_HH(packet, offset)
+            vlan.append(tci & 0x0FFF)
+            offset += 4
+        view.vlan = tuple(vlan)
+
+    if ethertype in (0x0800, 0x86DD):
+        return _dissect_ip(view, packet, offset)
+    view.ethertype = ethertype
+    return view
+
+
+def _dissect_raw(packet):
+    """Dissect packet of raw IP link types.
+
+    Args:
+        packet (bytes): raw packet data
+
+    Returns:
+        _Dissection: dissected header fields
+
+    """
+    return _dissect_ip(_Dissection(len(packet)), packet, 0)
+
+
+#: Dissectors for supported link types, c.f. :class:`~pcapkit.const.reg.linktype.LinkType`.
+DISSECTOR = {
+    1: _dissect_ethernet,   # ETHERNET
+    101: _dissect_raw,      # RAW
+    228: _dissect_raw,      # IPV4
+    229: _dissect_raw,      # IPV6
+}
+
+
+class Filter:
+    """Packet filter on raw bytes."""
+
+    ##########################################################################
+    # Properties.
+    ##########################################################################
+
+    @property
+    def expression(self):
+        """Source filter expression.
+
+        :rtype: str
+        """
+        return self._expr
+
+    ##########################################################################
+    # Methods.
+    ##########################################################################
+
+    def compile(self, linktype):
+        """Compile the filter expression into a predicate.
+
+        Args:
+            linktype (pcapkit.const.reg.linktype.LinkType): data link type
+                from the PCAP global header
+
+        Returns:
+            Callable[[bytes], bool]: predicate on raw packet data
+
+        Raises:
+            ProtocolNotImplemented: If the link type is not supported.
+
+        """
+        try:
+            dissect = DISSECTOR[int(linktype)]
+        except KeyError:
+            raise ProtocolNotImplemented(f'filter on link type {linktype!r} not implemented') from None
+
+        match = self._func
+
+        def predicate(packet):
+            return match(dissect(packet))
+        return predicate
+
+    ##########################################################################
+    # Data models.
+    ##########################################################################
+
+    def __init__(self, expression):
+        """Initialisation.
+
+        Args:
+            expression (str): filter expression
+
+        Raises:
+            FilterError: If the filter expression is invalid.
+
+        """
+        #: str: Source filter expression.
+        self._expr = expression
+        #: List[str]: Tokens of the filter expression.
+        self._toks = self._tokenise(expression)
+        #: Callable[[_Dissection], bool]: Compiled predicate on dissected header fields.
+        self._func = self._parse_or()
+        if self._toks:
+            self._error(f'unexpected token {self._toks[0]!r}')
+
+    def __repr__(self):
+        return f'Filter({self._expr!r})'
+
+    ##########################################################################
+    # Utilities.
+    ##########################################################################
+
+    def _error(self, message):
+        """Raise filter expression error.
+
+        Args:
+            message (str): error message
+
+        Raises:
+            FilterError: The filter expression is invalid.
+
+        """
+        raise FilterError(f'invalid filter expression {self._expr!r}: {message}')
+
+    def _tokenise(self, expression):
+        """Split filter expression into tokens.
+
+        Args:
+            expression (str): filter expression
+
+        Returns:
+            List[str]: tokens in reversed order (for :meth:`list.pop`)
+
+        """
+        tokens = list()
+        offset = 0
+        expression = expression.strip()
+        while offset < len(expression):
+            match = _RE_TOKEN.match(expression, offset)
+            if match is None:
+                self._error(f'invalid token at position {offset}')
+            tokens.append(match.group(1).lower())
+            offset = match.end()
+        if not tokens:
+            self._error('empty expression')
+        tokens.reverse()
+        return tokens
+
+    def _peek(self, depth=0):
+        """Peek next token.
+
+        Args:
+            depth (int): look-ahead depth
+
+        Returns:
+            Optional[str]: the token
+
+        """
+        try:
+            return self._toks[-1-depth]
+        except IndexError:
+            return None
+
+    def _pop(self, what='token'):
+        """Pop next token.
+
+        Args:
+            what (str): expected token description
+
+        Returns:
+            str: the token
+
+        """
+        if not self._toks:
+            self._error(f'expecting {what}')
+        return self._toks.pop()
+
+    def _parse_or(self):
+        """Parse ``or`` expressions."""
+        left = self._parse_and()
+        while self._peek() in ('or', '||'):
+            self._pop()
+            right = self._parse_and()
+            left = (lambda l, r: lambda v: l(v) or r(v))(left, right)
+        return left
+
+    def _parse_and(self):
+        """Parse ``and`` expressions."""
+        left = self._parse_not()
+        while self._peek() in ('and', '&&'):
+            self._pop()
+            right = self._parse_not()
+            left = (lambda l, r: lambda v: l(v) and r(v))(left, right)
+        return left
+
+    def _parse_not(self):
+        """Parse ``not`` expressions."""
+        if self._peek() in ('not', '!'):
+            self._pop()
+            func = self._parse_not()
+            return lambda v: not func(v)
+        if self._peek() == '(':
+            self._pop()
+            func = self._parse_or()
+            if self._pop("')'") != ')':
+                self._error("expecting ')'")
+            return func
+        return self._parse_primitive()
+
+    def _parse_primitive(self):  # pylint: disable=too-many-branches,too-many-return-statements
+        """Parse primitives."""
+        token = self._peek()
+
+        # protocol qualifier
+        qualifier = None
+        if token in _QUALIFIER and (self._peek(1) in _DIRECTION or self._peek(1) in _TYPE):
+            qualifier = self._pop()
+            token = self._peek()
+
+        # direction qualifier
+        direction = None
+        if token in _DIRECTION:
+            direction = self._pop()
+            token = self._peek()
+
+        if token in _TYPE:
+            kind = self._pop()
+        elif direction is not None:
+            kind = 'host'
+        elif qualifier is None and token is not None:
+            return self._make_keyword(self._pop())
+        else:
+            return self._error('expecting primitive')
+
+        if kind == 'host':
+            func = self._make_host(self._pop('address'), direction)
+        elif kind == 'net':
+            func = self._make_net(self._pop('network'), direction)
+        elif kind == 'port':
+            func = self._make_port(self._pop('port'), self._pop_port, direction)
+        elif kind == 'portrange':
+            func = self._make_port(self._pop('port range'), self._pop_range, direction)
+        else:
+            if direction is not None:
+                self._error(f"invalid direction {direction!r} for 'proto'")
+            func = self._make_proto(self._pop('protocol'))
+
+        if qualifier is None:
+            return func
+        if kind in ('port', 'portrange') and qualifier in ('ip', 'ip6'):
+            self._error(f"invalid qualifier {qualifier!r} for {kind!r}")
+        if kind in ('host', 'net') and qualifier not in ('ip', 'ip6'):
+            self._error(f"invalid qualifier {qualifier!r} for {kind!r}")
+        if kind == 'proto' and qualifier not in ('ip', 'ip6'):
+            self._error(f"invalid qualifier {qualifier!r} for 'proto'")
+        cond = self._make_keyword(qualifier)
+        return lambda v: cond(v) and func(v)
+
+    def _make_keyword(self, token):
+        """Make predicate for protocol keywords.
+
+        Args:
+            token (str): protocol keyword
+
+        Returns:
+            Callable[[_Dissection], bool]: compiled predicate
+
+        """
+        if token == 'ip':
+            return lambda v: v.version == 4
+        if token == 'ip6':
+            return lambda v: v.version == 6
+        if token == 'arp':
+            return lambda v: v.ethertype == 0x0806
+        if token == 'rarp':
+            return lambda v: v.ethertype == 0x8035
+        if token == 'icmp':
+            return lambda v: v.version == 4 and v.proto == 1
+        if token == 'icmp6':
+            return lambda v: v.version == 6 and v.proto == 58
+        if token in ('tcp', 'udp', 'sctp'):
+            proto = _PROTO_NAME[token]
+            return lambda v: v.proto == proto
+        if token == 'vlan':
+            if self._peek() is not None and self._peek().isdigit():
+                vid = int(self._pop())
+                return lambda v: vid in v.vlan
+            return lambda v: bool(v.vlan)
+        if token in ('less', 'greater'):
+            value = self._pop('length')
+            if not value.isdigit():
+                self._error(f'invalid length {value!r}')
+            size = int(value)
+            if token == 'less':
+                return lambda v: v.length <= size
+            return lambda v: v.length >= size
+        return self._error(f'unknown primitive {token!r}')
+
+    def _make_host(self, value, direction):
+        """Make predicate for ``host`` primitives.
+
+        Args:
+            value (str): IP address
+            direction (Optional[str]): direction qualifier
+
+        Returns:
+            Callable[[_Dissection], bool]: compiled predicate
+
+        """
+        try:
+            addr = ipaddress.ip_address(value).packed
+        except ValueError:
+            return self._error(f'invalid host {value!r}')
+
+        if direction == 'src':
+            return lambda v: v.src == addr
+        if direction == 'dst':
+            return lambda v: v.dst == addr
+        return lambda v: v.src == addr or v.dst == addr
+
+    def _make_net(self, value, direction):
+        """Make predicate for ``net`` primitives.
+
+        Args:
+            value (str): IP network
+            direction (Optional[str]): direction qualifier
+
+        Returns:
+            Callable[[_Dissection], bool]: compiled predicate
+
+        """
+        try:
+            network = ipaddress.ip_network(value, strict=False)
+        except ValueError:
+            return self._error(f'invalid net {value!r}')
+
+        size = network.max_prefixlen // 8
+        mask = int(network.netmask)
+        base = int(network.network_address)
+
+        def match(addr):
+            return addr is not None and len(addr) == size and (int.from_bytes(addr, 'big') & mask) == base
+
+        if direction == 'src':
+            return lambda v: match(v.src)
+        if direction == 'dst':
+            return lambda v: match(v.dst)
+        return lambda v: match(v.src) or match(v.dst)
+
+    def _pop_port(self, value):
+        """Parse port number.
+
+        Args:
+            value (str): port number
+
+        Returns:
+            Tuple[int, int]: port range
+
+        """
+        if not value.isdigit() or int(value) > 0xFFFF:
+            self._error(f'invalid port {value!r}')
+        return int(value), int(value)
+
+    def _pop_range(self, value):
+        """Parse port range.
+
+        Args:
+            value (str): port range
+
+        Returns:
+            Tuple[int, int]: port range
+
+        """
+        start, _, stop = value.partition('-')
+        if not (start.isdigit() and stop.isdigit()) or int(start) > int(stop) or int(stop) > 0xFFFF:
+            self._error(f'invalid port range {value!r}')
+        return int(start), int(stop)
+
+    def _make_port(self, value, parser, direction):
+        """Make predicate for ``port`` and ``portrange`` primitives.
+
+        Args:
+            value (str): port number or range
+            parser (Callable[[str], Tuple[int, int]]): value parser
+            direction (Optional[str]): direction qualifier
+
+        Returns:
+            Callable[[_Dissection], bool]: compiled predicate
+
+        """
+        start, stop = parser(value)
+        if start == stop:
+            if direction == 'src':
+                return lambda v: v.srcport == start
+            if direction == 'dst':
+                return lambda v: v.dstport == start
+            return lambda v: v.srcport == start or v.dstport == start
+
+        def match(port):
+            return port is not None and start <= port <= stop
+
+        if direction == 'src':
+            return lambda v: match(v.srcport)
+        if direction == 'dst':
+            return lambda v: match(v.dstport)
+        return lambda v: match(v.srcport) or match(v.dstport)
+
+    def _make_proto(self, value):
+        """Make predicate for ``proto`` primitives.
+
+        Args:
+            value (str): protocol number or name
+
+        Returns:
+            Callable[[_Dissection], bool]: compiled predicate
+
+        """
+        if value.isdigit() and int(value) <= 0xFF:
+            proto = int(value)
+        elif value in _PROTO_NAME:
+            proto = _PROTO_NAME[value]
+        else:
+            return self._error(f'invalid protocol {value!r}')
+        return lambda v: v.proto == proto
@@ -0,0 +1,266 @@
+# -*- coding: utf-8 -*-
+"""protocol hierarchy statistics
+
+:mod:`pcapkit.foundation.hierarchy` is the interface to collect
+protocol hierarchy statistics, i.e. number of frames and bytes
+per protocol chain, as ``tshark -z io,phs`` does, from a series
+of packets without storing any of them.
+
+Glossary
+--------
+
+hierarchy.buffer
+    Data structure for internal counting when performing protocol hierarchy
+    statistics (:attr:`~pcapkit.foundation.hierarchy.ProtoHierarchy._buffer`)
+    is as following:
+
+    .. code-block:: python
+
+       (dict) buffer --> memory buffer for statistics
+        |--> (tuple) CHAIN : (list)
+        |       |--> alias #0  |
+        |       |--> alias #1  |
+        |       |--> ...       |
+        |                      |--> (int) number of frames
+        |                      |--> (int) number of bytes
+        |--> (tuple) CHAIN ...
+
+hierarchy.index
+    Data structure for **protocol hierarchy statistics** (element from
+    :attr:`~pcapkit.foundation.hierarchy.ProtoHierarchy.index` *tuple*)
+    is as following:
+
+    .. code-block:: python
+
+       (tuple) index
+        |--> (Info) data
+        |     |--> 'chain' : (str) protocol chain, e.g. ``'Ethernet:IPv4'``
+        |     |--> 'level' : (int) depth of the protocol chain
+        |     |--> 'frames': (int) number of frames containing the chain
+        |     |--> 'bytes' : (int) number of bytes of such frames
+        |--> (Info) data ...
+
+"""
+import sys
+
+from pcapkit.corekit.infoclass import Info
+
+__all__ = ['ProtoHierarchy']
+
+
+class ProtoHierarchy:
+    """Protocol hierarchy statistics."""
+
+    ##########################################################################
+    # Properties.
+    ##########################################################################
+
+    @property
+    def index(self):
+        """Index table for protocol hierarchy statistics (:term:`hierarchy.index`).
+
+        :rtype: Tuple[Info]
+        """
+        if self._newflg:
+            return self.submit()
+        return self._stream
+
+    @property
+    def frames(self):
+        """Total number of frames counted.
+
+        :rtype: int
+        """
+        return sum(record[0] for record in self._buffer.values())
+
+    @property
+    def bytes(self):
+        """Total number of bytes counted.
+
+        :rtype: int
+        """
+        return sum(record[1] for record in self._buffer.values())
+
+    ##########################################################################
+    # Methods.
+    ##########################################################################
+
+    def count(self, chain, length):
+        """Count a frame.
+
+        Arguments:
+            chain (Union[str, Tuple[str], pcapkit.corekit.protochain.ProtoChain]): protocol
+                chain of the frame, either as a colon (``:``) separated string or a sequence
+                of protocol aliases
+            length (int): number of bytes of the frame
+
+        """
+        self._newflg = True
+
+        key = self._intern(chain)
+        record = self._buffer.get(key)
+        if record is None:
+            self._buffer[key] = [1, length]
+        else:
+            record[0] += 1
+            record[1] += length
+
+    def merge(self, *others):
+        """Merge statistics from other collectors.
+
+        Arguments:
+            *others (ProtoHierarchy): collectors to be merged, e.g. from parallel
+                workers or from other PCAP files
+
+        Returns:
+            ProtoHierarchy: the current collector (for chaining)
+
+        """
+        self._newflg = True
+        for other in others:
+            for (chain, (frames, bytes_)) in other._buffer.items():  # pylint: disable=protected-access
+                key = self._intern(chain)
+                record = self._buffer.get(key)
+                if record is None:
+                    self._buffer[key] = [frames, bytes_]
+                else:
+                    record[0] += frames
+                    record[1] += bytes_
+        return self
+
+    def submit(self):
+        """Submit protocol hierarchy statistics.
+
+        The counted protocol chains are accumulated into each of their
+        prefixes, so that a frame of ``Ethernet:IPv4:TCP`` is counted under
+        ``Ethernet``, ``Ethernet:IPv4`` and ``Ethernet:IPv4:TCP``.
+
+        Returns:
+            Tuple[Info]: protocol hierarchy statistics (:term:`hierarchy.index`),
+            sorted in a depth-first order of the hierarchy
+
+        """
+        self._newflg = False
+
+        counter = dict()
+        for (chain, (frames, bytes_)) in self._buffer.items():
+            for level in range(1, len(chain) + 1):
+                prefix = chain[:level]
+                record = counter.get(prefix)
+                if record is None:
+                    counter[prefix] = [frames, bytes_]
+                else:
+                    record[0] += frames
+                    record[1] += bytes_
+
+        self._stream = tuple(Info(
+            chain=':'.join(prefix),
+            level=len(prefix),
+            frames=frames,
+            bytes=bytes_,
+        ) for (prefix, (frames, bytes_)) in sorted(counter.items()))
+        return self._stream
+
+    def tree(self):
+        """Protocol hierarchy statistics as a nested :obj:`dict`.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Mapping of protocol aliases to their
+            ``frames``, ``bytes`` and upper layer protocols as in ``next``.
+
+        """
+        root = dict()
+        for record in self.index:
+            branch = root
+            *parents, alias = record.chain.split(':')
+            for parent in parents:
+                branch = branch[parent]['next']
+            branch[alias] = dict(frames=record.frames, bytes=record.bytes, next=dict())
+        return root
+
+    ##########################################################################
+    # Data models.
+    ##########################################################################
+
+    def __init__(self):
+        """Initialise instance."""
+        #: bool: New packet flag.
+        self._newflg = False
+
+        #: dict: Buffer field (:term:`hierarchy.buffer`).
+        self._buffer = dict()
+        #: Tuple[Info]: Statistics index (:term:`hierarchy.index`).
+        self._stream = tuple()
+        #: Dict[str, Tuple[str]]: Interned protocol chains.
+        self._chains = dict()
+
+    def __call__(self, chain, length):
+        """Count a frame.
+
+        Arguments:
+            chain (Union[str, Tuple[str], pcapkit.corekit.protochain.ProtoChain]): protocol chain
+            length (int): number of bytes of the frame
+
+        """
+        self.count(chain, length)
+
+    def __add__(self, other):
+        """Merge statistics into a new collector.
+
+        Arguments:
+            other (ProtoHierarchy): collector to be merged
+
+        Returns:
+            ProtoHierarchy: merged statistics
+
+        """
+        if not isinstance(other, ProtoHierarchy):
+            return NotImplemented
+        return ProtoHierarchy().merge(self, other)
+
+    def __iadd__(self, other):
+        """Merge statistics into the current collector.
+
+        Arguments:
+            other (ProtoHierarchy): collector to be merged
+
+        Returns:
+            ProtoHierarchy: the current collector
+
+        """
+        if not isinstance(other, ProtoHierarchy):
+            return NotImplemented
+        return self.merge(other)
+
+    def __getstate__(self):
+        """Drop the intern cache when pickling (e.g. to multiprocessing workers)."""
+        state = self.__dict__.copy()
+        state['_chains'] = dict()
+        return state
+
+    ##########################################################################
+    # Utilities.
+    ##########################################################################
+
+    def _intern(self, chain):
+        """Intern a protocol chain.
+
+        Arguments:
+            chain (Union[str, Tuple[str], pcapkit.corekit.protochain.ProtoChain]): protocol chain
+
+        Returns:
+            Tuple[str]: Interned tuple of protocol aliases, which is shared
+            among all frames with the same protocol chain.
+
+        """
+        if isinstance(chain, tuple):
+            return self._chains.setdefault(chain, chain)
+
+        # fetch chain string from ProtoChain
+        text = chain if isinstance(chain, str) else str(chain)
+
+        key = self._chains.get(text)
+        if key is None:
+            key = tuple(sys.intern(alias) for alias in text.split(':'))
+            key = self._chains[text] = self._chains.setdefault(key, key)
+        return key
@@ -0,0 +1,694 @@
+# -*- coding: utf-8 -*-
+"""HTTP/1.* transaction extractor
+
+:mod:`pcapkit.foundation.httpv1` is the interface to extract HTTP/1.*
+transactions [:rfc:`7230`] from TCP payloads, either from the reassembled
+:term:`datagrams <tcp.datagram>` of :class:`~pcapkit.reassembly.tcp.TCP_Reassembly`
+or from TCP segments fed in order. Contrary to
+:class:`~pcapkit.protocols.application.httpv1.HTTPv1`, which parses one TCP
+payload at a time, the extractor follows each direction of a connection,
+so that messages spanning several segments, pipelined requests and
+``Content-Length`` or ``chunked`` bodies are accounted for.
+
+Message bodies are only counted and never buffered, thus memory use is
+bounded by the in-flight transactions of each connection.
+
+Glossary
+--------
+
+httpv1.buffer
+    Data structure for internal buffering when extracting HTTP/1.* transactions
+    (:attr:`~pcapkit.foundation.httpv1.HTTPv1_Flow._buffer`) is as following:
+
+    .. code-block:: python
+
+       (dict) buffer --> memory buffer for extraction
+        |--> (tuple) DIRECTION : (dict)
+        |       |--> (tuple) src      |
+        |       |     |--> ip.src     |
+        |       |     |--> tcp.srcport|
+        |       |--> (tuple) dst      |
+        |             |--> ip.dst     |
+        |             |--> tcp.dstport|
+        |                             |--> 'role' : (Optional[Union[str, bool]]) ``'request'``,
+        |                             |              ``'response'``, or ``False`` if not HTTP/1.*
+        |                             |--> 'buf' : (bytearray) unparsed data
+        |                             |--> 'pos' : (int) stream offset of unparsed data
+        |                             |--> 'seg' : (deque) segments of unparsed data
+        |                             |             |--> (list) segment
+        |                             |                   |--> (int) stream offset of segment end
+        |                             |                   |--> (Optional[float]) timestamp
+        |                             |                   |--> (tuple) packet numbers
+        |                             |--> 'last' : (Optional[float]) timestamp of last released segment
+        |                             |--> 'ind' : (Optional[list]) packet numbers of current message
+        |                             |--> 'msg' : (Optional[dict]) transaction of current message
+        |                             |--> 'side' : (Optional[str]) side of current message
+        |                             |--> 'state' : (str) parser state
+        |                             |--> 'left' : (int) remaining octets of body or chunk
+        |--> (tuple) DIRECTION ...
+
+httpv1.index
+    Data structure for **HTTP/1.* transactions** (element from
+    :attr:`~pcapkit.foundation.httpv1.HTTPv1_Flow.index` *tuple*)
+    is as following:
+
+    .. code-block:: python
+
+       (tuple) index
+        |--> (Info) data
+        |     |--> 'id' : (Info) connection identifier
+        |     |            |--> 'src' --> (tuple) client
+        |     |            |               |--> (str) ip.src
+        |     |            |               |--> (int) tcp.srcport
+        |     |            |--> 'dst' --> (tuple) server
+        |     |                            |--> (str) ip.dst
+        |     |                            |--> (int) tcp.dstport
+        |     |--> 'index' : (tuple) packet numbers of the transaction
+        |     |--> 'method' : (Optional[str]) request method
+        |     |--> 'target' : (Optional[str]) request target
+        |     |--> 'version' : (Optional[str]) HTTP version of the request
+        |     |--> 'status' : (Optional[int]) response status code
+        |     |--> 'reason' : (Optional[str]) response reason phrase
+        |     |--> 'request_size' : (int) octets of request on the wire
+        |     |--> 'request_body' : (int) octets of request body (without chunk framing)
+        |     |--> 'response_size' : (int) octets of response(s) on the wire
+        |     |--> 'response_body' : (int) octets of response body (without chunk framing)
+        |     |--> 'request_time' : (Optional[float]) timestamp of first octet of request
+        |     |--> 'request_end' : (Optional[float]) timestamp of last octet of request
+        |     |--> 'response_time' : (Optional[float]) timestamp of first octet of response
+        |     |--> 'response_end' : (Optional[float]) timestamp of last octet of response
+        |--> (Info) data ...
+
+"""
+import collections
+
+from pcapkit.corekit.infoclass import Info
+from pcapkit.protocols.application.httpv1 import HTTP_METHODS
+from pcapkit.protocols.protocol import Protocol
+
+__all__ = ['HTTPv1_Flow']
+
+#: int: Maximum size of a header section.
+HEADER_SIZE = 65536
+#: int: Maximum size of buffered responses whose requests are not seen yet.
+BUFFER_SIZE = 1048576
+
+#: Tuple[bytes]: Prefixes of request lines.
+_REQUEST_START = tuple(f'{method} '.encode() for method in HTTP_METHODS)
+#: bytes: Prefix of status lines.
+_RESPONSE_START = b'HTTP/'
+
+
+class HTTPv1_Flow:
+    """Extract HTTP/1.* transactions from TCP payloads.
+
+    Example:
+        >>> from pcapkit.foundation.httpv1 import HTTPv1_Flow
+        >>> from pcapkit.reassembly import TCP_Reassembly
+        # reassemble TCP payloads:
+        >>> tcp_reassembly = TCP_Reassembly()
+        >>> tcp_reassembly.run(packets)
+        # extract HTTP/1.* transactions:
+        >>> http = HTTPv1_Flow()
+        >>> http.run(tcp_reassembly.datagram)
+        # fetch transaction records:
+        >>> result = http.index
+
+    """
+
+    ##########################################################################
+    # Properties.
+    ##########################################################################
+
+    @property
+    def index(self):
+        """Transaction records (:term:`httpv1.index`).
+
+        :rtype: Tuple[Info]
+        """
+        return tuple(self._stream)
+
+    ##########################################################################
+    # Methods.
+    ##########################################################################
+
+    def feed(self, src, dst, data, *, index=(), timestamp=None):
+        """Feed payload of one direction of a connection.
+
+        Data of the same direction must be fed in order, and may be cut at
+        arbitrary boundaries, e.g. as TCP segments.
+
+        Arguments:
+            src (Tuple[str, int]): source IP address and TCP port
+            dst (Tuple[str, int]): destination IP address and TCP port
+            data (bytes): payload data
+
+        Keyword Arguments:
+            index (Tuple[int]): packet numbers of the payload data
+            timestamp (Optional[float]): timestamp of the payload data
+
+        Returns:
+            List[Info]: transaction records (:term:`httpv1.index`) completed by
+            the payload data
+
+        """
+        key = (src, dst)
+        buf = self._buffer.get(key)
+        if buf is None:
+            buf = self._buffer[key] = self._make_buffer()
+        if buf['role'] is False or not data:
+            return list()
+
+        buf['buf'] += data
+        buf['seg'].append([buf['pos'] + len(buf['buf']), timestamp, tuple(index)])
+
+        if buf['role'] is None:
+            buf['role'] = self._check_role(buf['buf'])
+            if buf['role'] is None:
+                return list()
+            if buf['role'] is False:
+                self._drop(buf)
+                return list()
+
+        conn = self._fetch_conn(src, dst, buf['role'])
+        records = list()
+        self._read_messages(key, buf, conn, records)
+
+        # responses buffered for requests not seen yet may be released
+        if buf['role'] == 'request':
+            peer = self._buffer.get((dst, src))
+            if peer is not None and peer['role'] == 'response' and peer['buf']:
+                self._read_messages((dst, src), peer, conn, records)
+
+        if self._flag_d:
+            self._stream.extend(records)
+        return records
+
+    def close(self, src, dst):
+        """Close a connection and release its buffers.
+
+        Bodies delimited by connection close are completed, and in-flight
+        transactions are submitted without responses.
+
+        Arguments:
+            src (Tuple[str, int]): IP address and TCP port of one endpoint
+            dst (Tuple[str, int]): IP address and TCP port of the other endpoint
+
+        Returns:
+            List[Info]: transaction records (:term:`httpv1.index`) completed
+            by closing the connection
+
+        """
+        records = list()
+        conn = self._conns.pop(tuple(sorted((src, dst))), None)
+        for key in ((src, dst), (dst, src)):
+            buf = self._buffer.pop(key, None)
+            if buf is None or buf['msg'] is None:
+                continue
+            if buf['role'] == 'response' and buf['state'] == 'eof':
+                self._done_message(buf, buf['pos'])
+            elif buf['role'] == 'request' and buf['msg']['response_done']:
+                # response completed before the request
+                records.append(self._make_record(conn, buf['msg']))
+
+        if conn is not None:
+            for msg in conn['queue']:
+                records.append(self._make_record(conn, msg))
+
+        if self._flag_d:
+            self._stream.extend(records)
+        return records
+
+    def flush(self):
+        """Close all connections.
+
+        Returns:
+            List[Info]: transaction records (:term:`httpv1.index`) completed
+            by closing the connections
+
+        """
+        records = list()
+        for (src, dst) in list(self._conns):
+            records.extend(self.close(src, dst))
+        self._buffer.clear()
+        return records
+
+    def run(self, datagrams):
+        """Run automatically.
+
+        As all data is expected to be given, the connections are closed
+        afterwards (c.f. :meth:`flush`).
+
+        Arguments:
+            datagrams (Iterable[Info]): reassembled :term:`datagrams <tcp.datagram>`
+                from :class:`~pcapkit.reassembly.tcp.TCP_Reassembly`
+
+        """
+        for datagram in datagrams:
+            self(datagram)
+        self.flush()
+
+    ##########################################################################
+    # Data models.
+    ##########################################################################
+
+    def __init__(self, *, store=True, decode_policy='fast'):
+        """Initialise HTTP/1.* transaction extractor.
+
+        Keyword Arguments:
+            store (bool): if store transaction records in :attr:`index`; if :data:`False`,
+                records are only returned by :meth:`feed`, :meth:`close` and :meth:`flush`
+            decode_policy (Literal['fast', 'detect']): decoding policy of start lines
+                (c.f. :meth:`Protocol.decode <pcapkit.protocols.protocol.Protocol.decode>`)
+
+        """
+        #: bool: Data storing flag.
+        self._flag_d = store
+        #: str: Decoding policy of start lines.
+        self._policy = decode_policy
+
+        #: dict: Buffer field (:term:`httpv1.buffer`).
+        self._buffer = dict()
+        #: Dict[Tuple[Tuple[str, int], Tuple[str, int]], dict]: In-flight transactions per connection.
+        self._conns = dict()
+        #: List[Info]: Transaction records (:term:`httpv1.index`).
+        self._stream = list()
+
+    def __call__(self, datagram):
+        """Extract transactions from a reassembled TCP datagram.
+
+        Arguments:
+            datagram (Info): reassembled :term:`datagram <tcp.datagram>`
+
+        Returns:
+            List[Info]: transaction records (:term:`httpv1.index`) completed by the datagram
+
+        """
+        src = datagram.id.src
+        dst = datagram.id.dst
+        if datagram.NotImplemented:
+            # the payload has holes, so the direction cannot be followed any more
+            buf = self._buffer.get((src, dst))
+            if buf is None:
+                buf = self._buffer[(src, dst)] = self._make_buffer()
+            self._drop(buf)
+            return list()
+        return self.feed(src, dst, datagram.payload, index=datagram.index)
+
+    ##########################################################################
+    # Utilities.
+    ##########################################################################
+
+    @staticmethod
+    def _check_role(data):
+        """Check if a direction carries HTTP/1.* requests or responses.
+
+        Arguments:
+            data (bytearray): buffered data of the direction
+
+        Returns:
+            Optional[Union[str, bool]]: ``'request'`` or ``'response'``, :data:`False` if
+            not HTTP/1.*, or :data:`None` if more data is needed.
+
+        """
+        head = bytes(data[:8])
+        if head.startswith(_REQUEST_START):
+            return 'request'
+        if head.startswith(_RESPONSE_START):
+            return 'response'
+        if len(head) < 8 and any(start.startswith(head) for start in _REQUEST_START + (_RESPONSE_START,)):
+            return None
+        return False
+
+    @staticmethod
+    def _drop(buf):
+        """Stop following a direction.
+
+        Arguments:
+            buf (dict): buffer of the direction (:term:`httpv1.buffer`)
+
+        """
+        buf['role'] = False
+        buf['buf'] = bytearray()
+        buf['seg'].clear()
+        buf['ind'] = None
+        buf['msg'] = None
+
+    def _fetch_conn(self, src, dst, role):
+        """Fetch in-flight transactions of a connection.
+
+        Arguments:
+            src (Tuple[str, int]): source of the direction
+            dst (Tuple[str, int]): destination of the direction
+            role (str): role of the direction
+
+        Returns:
+            dict: connection state, with ``client`` and ``server`` endpoints and
+            ``queue`` of in-flight transactions
+
+        """
+        key = tuple(sorted((src, dst)))
+        conn = self._conns.get(key)
+        if conn is None:
+            (client, server) = (src, dst) if role == 'request' else (dst, src)
+            conn = self._conns[key] = dict(client=client, server=server, queue=collections.deque())
+        return conn
+
+    def _read_messages(self, key, buf, conn, records):  # pylint: disable=too-many-branches,too-many-statements
+        """Parse buffered data of a direction.
+
+        Arguments:
+            key (Tuple[Tuple[str, int], Tuple[str, int]]): direction of the connection
+            buf (dict): buffer of the direction (:term:`httpv1.buffer`)
+            conn (dict): connection state
+            records (List[Info]): completed transaction records
+
+        """
+        data = buf['buf']
+        offset = 0
+        while buf['role'] and offset < len(data):
+            state = buf['state']
+
+            if state == 'line':
+                if buf['role'] == 'response' and not conn['queue'] and len(data) - offset <= BUFFER_SIZE:
+                    break   # wait for the request
+
+                stop = data.find(b'\r\n\r\n', offset)
+                if stop == -1:
+                    if len(data) - offset > HEADER_SIZE:
+                        self._drop(buf)
+                        return
+                    break
+                stop += 4
+
+                head = bytes(data[offset:stop])
+                msg = self._read_header(buf, conn, head, buf['pos'] + offset)
+                if msg is None:
+                    self._drop(buf)
+                    return
+                offset = stop
+
+                if buf['state'] == 'done':
+                    self._done_message(buf, buf['pos'] + offset)
+                    self._submit(key, buf, conn, msg, records)
+                continue
+
+            if state in ('body', 'chunk', 'eof'):
+                size = len(data) - offset
+                if state != 'eof':
+                    size = min(size, buf['left'])
+                    buf['left'] -= size
+                buf['msg'][buf['side'] + '_body'] += size
+                offset += size
+                if state == 'eof' or buf['left']:
+                    continue
+                if state == 'chunk':
+                    buf['state'] = 'crlf'
+                    continue
+                self._done_message(buf, buf['pos'] + offset)
+                self._submit(key, buf, conn, buf['msg'], records)
+                continue
+
+            stop = data.find(b'\r\n', offset)
+            if stop == -1:
+                if len(data) - offset > HEADER_SIZE:
+                    self._drop(buf)
+                    return
+                break
+            line = bytes(data[offset:stop])
+            offset = stop + 2
+
+            if state == 'size':
+                try:
+                    size = int(line.split(b';', 1)[0].strip(), base=16)
+                except ValueError:
+                    self._drop(buf)
+                    return
+                buf['left'] = size
+                buf['state'] = 'chunk' if size else 'trailer'
+            elif state == 'crlf':
+                buf['state'] = 'size'
+            elif state == 'trailer' and not line:
+                self._done_message(buf, buf['pos'] + offset)
+                self._submit(key, buf, conn, buf['msg'], records)
+
+        # discard parsed data
+        if buf['role']:
+            self._consume(buf, buf['pos'] + offset)
+            del data[:offset]
+            buf['pos'] += offset
+
+    def _read_header(self, buf, conn, head, start):
+        """Parse the header section of a message.
+
+        Arguments:
+            buf (dict): buffer of the direction (:term:`httpv1.buffer`)
+            conn (dict): connection state
+            head (bytes): header section, including the start line
+            start (int): stream offset of the message
+
+        Returns:
+            Optional[dict]: transaction of the message, or :data:`None` if malformed
+
+        """
+        (line, _, fields) = head.partition(b'\r\n')
+        length = None
+        chunked = False
+        for field in fields.split(b'\r\n'):
+            (name, sep, value) = field.partition(b':')
+            if not sep:
+                continue
+            name = name.strip().lower()
+            if name == b'content-length':
+                try:
+                    length = int(value.strip().split(b',', 1)[0])
+                except ValueError:
+                    return None
+            elif name == b'transfer-encoding':
+                chunked = value.strip().lower().endswith(b'chunked')
+
+        if buf['role'] == 'request':
+            (method, _, rest) = line.partition(b' ')
+            (target, _, version) = rest.rpartition(b' ')
+            if not version.startswith(_RESPONSE_START):
+                return None
+            msg = self._make_message()
+            msg['method'] = Protocol.decode(method, policy=self._policy)
+            msg['target'] = Protocol.decode(target, policy=self._policy)
+            msg['version'] = Protocol.decode(version[5:], policy=self._policy)
+            conn['queue'].append(msg)
+            side = 'request'
+            body = chunked or bool(length)
+            eof = False
+        else:
+            (version, _, rest) = line.partition(b' ')
+            (status, _, reason) = rest.partition(b' ')
+            if not version.startswith(_RESPONSE_START) or not status.isdigit():
+                return None
+            status = int(status)
+
+            if conn['queue']:
+                msg = conn['queue'][0]
+            else:
+                msg = self._make_message()
+                conn['queue'].append(msg)
+            if msg['status'] is None or 100 <= msg['status'] < 200:
+                msg['status'] = status
+                msg['reason'] = Protocol.decode(reason, policy=self._policy)
+            side = 'response'
+
+            if (100 <= status < 200 or status in (204, 304) or msg['method'] == 'HEAD'
+                    or (msg['method'] == 'CONNECT' and 200 <= status < 300)):
+                body = eof = False
+            else:
+                body = chunked or bool(length)
+                eof = not chunked and length is None
+
+        buf['ind'] = None
+        self._consume(buf, start)
+        buf['ind'] = list()
+        if msg[side + '_time'] is None:
+            msg[side + '_time'] = self._fetch_time(buf, start)
+            msg[side + '_start'] = start
+
+        buf['msg'] = msg
+        buf['side'] = side
+        if eof:
+            buf['state'] = 'eof'
+        elif not body:
+            buf['state'] = 'done'
+        elif chunked:
+            buf['state'] = 'size'
+        else:
+            buf['state'] = 'body'
+            buf['left'] = length
+        return msg
+
+    def _submit(self, key, buf, conn, msg, records):
+        """Submit a completed message.
+
+        Arguments:
+            key (Tuple[Tuple[str, int], Tuple[str, int]]): direction of the connection
+            buf (dict): buffer of the direction (:term:`httpv1.buffer`)
+            conn (dict): connection state
+            msg (dict): transaction of the message
+            records (List[Info]): completed transaction records
+
+        """
+        side = buf['side']
+        buf['state'] = 'line'
+        buf['msg'] = None
+
+        if side == 'request':
+            msg['request_done'] = True
+            if msg['response_done']:
+                records.append(self._make_record(conn, msg))
+            return
+        if 100 <= msg['status'] < 200 and msg['status'] != 101:
+            return  # interim response
+        conn['queue'].popleft()
+        msg['response_done'] = True
+        if msg['request_done'] or msg['method'] is None:
+            records.append(self._make_record(conn, msg))
+
+        # switching protocols or tunnelling, so the connection is no longer HTTP/1.*
+        if msg['status'] == 101 or (msg['method'] == 'CONNECT' and 200 <= msg['status'] < 300):
+            self._drop(buf)
+            peer = self._buffer.get((key[1], key[0]))
+            if peer is not None:
+                self._drop(peer)
+
+    def _done_message(self, buf, stop):
+        """Record the end of current message.
+
+        Arguments:
+            buf (dict): buffer of the direction (:term:`httpv1.buffer`)
+            stop (int): stream offset after the message
+
+        """
+        msg = buf['msg']
+        if msg is None:
+            return
+        side = buf['side']
+        msg[side + '_end'] = self._fetch_time(buf, stop - 1)
+        msg[side + '_size'] = stop - msg[side + '_start']
+
+        # the last segment may be shared with the next message
+        end = self._consume(buf, stop)
+        if end != stop and buf['seg']:
+            buf['ind'].extend(buf['seg'][0][2])
+        msg[side + '_index'].extend(buf['ind'])
+        buf['ind'] = None
+
+    @staticmethod
+    def _consume(buf, stop):
+        """Release segments of parsed data.
+
+        Packet numbers of the released segments are collected into
+        ``buf['ind']`` if a message is being parsed, and the timestamp of
+        the last released segment is kept as ``buf['last']``.
+
+        Arguments:
+            buf (dict): buffer of the direction (:term:`httpv1.buffer`)
+            stop (int): stream offset of parsed data
+
+        Returns:
+            Optional[int]: stream offset of the end of last released segment
+
+        """
+        seg = buf['seg']
+        ind = buf['ind']
+        end = None
+        while seg and seg[0][0] <= stop:
+            (end, buf['last'], index) = seg.popleft()
+            if ind is not None:
+                ind.extend(index)
+        return end
+
+    @staticmethod
+    def _fetch_time(buf, offset):
+        """Fetch timestamp of data at a stream offset.
+
+        Arguments:
+            buf (dict): buffer of the direction (:term:`httpv1.buffer`)
+            offset (int): stream offset
+
+        Returns:
+            Optional[float]: timestamp of the segment containing the offset, or
+            of the last segment if the offset is beyond the unparsed data, e.g.
+            for bodies delimited by connection close
+
+        """
+        for (stop, timestamp, _) in buf['seg']:
+            if offset < stop:
+                return timestamp
+        return buf['seg'][-1][1] if buf['seg'] else buf['last']
+
+    @staticmethod
+    def _make_buffer():
+        """Make an empty buffer of a direction.
+
+        Returns:
+            dict: buffer of the direction (:term:`httpv1.buffer`)
+
+        """
+        return dict(
+            role=None,
+            buf=bytearray(),
+            pos=0,
+            seg=collections.deque(),
+            last=None,
+            ind=None,
+            msg=None,
+            side=None,
+            state='line',
+            left=0,
+        )
+
+    @staticmethod
+    def _make_message():
+        """Make an empty transaction.
+
+        Returns:
+            dict: transaction of a request/response pair
+
+        """
+        return dict(
+            method=None, target=None, version=None, status=None, reason=None,
+            request_size=0, request_body=0, request_start=0, request_time=None, request_end=None,
+            request_index=list(), response_size=0, response_body=0, response_start=0, response_time=None,
+            response_end=None, response_index=list(), request_done=False, response_done=False,
+        )
+
+    @staticmethod
+    def _make_record(conn, msg):
+        """Make a transaction record.
+
+        Arguments:
+            conn (dict): connection state
+            msg (dict): transaction of a request/response pair
+
+        Returns:
+            Info: transaction record (:term:`httpv1.index`)
+
+        """
+        return Info(
+            id=Info(
+                src=conn['client'],
+                dst=conn['server'],
+            ),
+            index=tuple(sorted(set(msg['request_index'] + msg['response_index']))),
+            method=msg['method'],
+            target=msg['target'],
+            version=msg['version'],
+            status=msg['status'],
+            reason=msg['reason'],
+            request_size=msg['request_size'],
+            request_body=msg['request_body'],
+            response_size=msg['response_size'],
+            response_body=msg['response_body'],
+            request_time=msg['request_time'],
+            request_end=msg['request_end'],
+            response_time=msg['response_time'],
+            response_end=msg['response_end'],
+        )
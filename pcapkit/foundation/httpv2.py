@@ -0,0 +1,854 @@
+# -*- coding: utf-8 -*-
+"""HTTP/2 connection parser
+
+:mod:`pcapkit.foundation.httpv2` is the interface to parse HTTP/2
+connections [:rfc:`7540`] from reassembled TCP payloads, i.e. the
+:term:`datagrams <tcp.datagram>` of
+:class:`~pcapkit.reassembly.tcp.TCP_Reassembly`. Contrary to
+:class:`~pcapkit.protocols.application.httpv2.HTTPv2`, which expects
+exactly one frame per TCP segment, the parser buffers each direction of
+a connection, splits the byte stream into frames and decodes the header
+blocks with a per-direction HPACK [:rfc:`7541`] dynamic table.
+
+Glossary
+--------
+
+httpv2.buffer
+    Data structure for internal buffering when parsing HTTP/2 connections
+    (:attr:`~pcapkit.foundation.httpv2.HTTPv2_Flow._buffer`) is as following:
+
+    .. code-block:: python
+
+       (dict) buffer --> memory buffer for parsing
+        |--> (tuple) DIRECTION : (dict)
+        |       |--> (tuple) src      |
+        |       |     |--> ip.src     |
+        |       |     |--> tcp.srcport|
+        |       |--> (tuple) dst      |
+        |             |--> ip.dst     |
+        |             |--> tcp.dstport|
+        |                             |--> 'h2' : (Optional[bool]) if the direction is HTTP/2
+        |                             |--> 'buf' : (bytearray) incomplete frame data
+        |                             |--> 'ind' : (list) packet numbers of buffered data
+        |                             |--> 'hdl' : (Optional[list]) pending header block
+        |                             |             |--> (int) stream identifier
+        |                             |             |--> (str) frame type
+        |                             |             |--> (Optional[int]) promised stream identifier
+        |                             |             |--> (bool) END_STREAM flag
+        |                             |             |--> (bytearray) header block fragments
+        |                             |--> 'hpack' : (HPACK) HPACK decoder of the direction
+        |--> (tuple) DIRECTION ...
+
+httpv2.index
+    Data structure for **decoded header lists** (element from
+    :attr:`~pcapkit.foundation.httpv2.HTTPv2_Flow.index` *tuple*)
+    is as following:
+
+    .. code-block:: python
+
+       (tuple) index
+        |--> (Info) data
+        |     |--> 'id' : (Info) connection identifier
+        |     |            |--> 'src' --> (tuple)
+        |     |            |               |--> (str) ip.src
+        |     |            |               |--> (int) tcp.srcport
+        |     |            |--> 'dst' --> (tuple)
+        |     |                            |--> (str) ip.dst
+        |     |                            |--> (int) tcp.dstport
+        |     |--> 'index' : (tuple) packet numbers carrying the header block
+        |     |--> 'sid' : (int) stream identifier
+        |     |--> 'type' : (str) frame type, ``'HEADERS'`` or ``'PUSH_PROMISE'``
+        |     |--> 'promised' : (Optional[int]) promised stream identifier
+        |     |--> 'end_stream' : (bool) END_STREAM flag
+        |     |--> 'headers' : (Tuple[Tuple[str, str]]) decoded header list
+        |--> (Info) data ...
+
+"""
+import collections
+
+from pcapkit.corekit.infoclass import Info
+from pcapkit.protocols.protocol import Protocol
+from pcapkit.utilities.exceptions import ProtocolError
+
+__all__ = ['HTTPv2_Flow', 'HPACK']
+
+#: bytes: HTTP/2 connection preface sent by clients [:rfc:`7540#section-3.5`].
+PREFACE = b'PRI * HTTP/2.0\r\n\r\nSM\r\n\r\n'
+
+#: Tuple[Tuple[bytes, bytes]]: HPACK static table [:rfc:`7541#appendix-A`].
+STATIC_TABLE = (
+    (b':authority', b''),
+    (b':method', b'GET'),
+    (b':method', b'POST'),
+    (b':path', b'/'),
+    (b':path', b'/index.html'),
+    (b':scheme', b'http'),
+    (b':scheme', b'https'),
+    (b':status', b'200'),
+    (b':status', b'204'),
+    (b':status', b'206'),
+    (b':status', b'304'),
+    (b':status', b'400'),
+    (b':status', b'404'),
+    (b':status', b'500'),
+    (b'accept-charset', b''),
+    (b'accept-encoding', b'gzip, deflate'),
+    (b'accept-language', b''),
+    (b'accept-ranges', b''),
+    (b'accept', b''),
+    (b'access-control-allow-origin', b''),
+    (b'age', b''),
+    (b'allow', b''),
+    (b'authorization', b''),
+    (b'cache-control', b''),
+    (b'content-disposition', b''),
+    (b'content-encoding', b''),
+    (b'content-language', b''),
+    (b'content-length', b''),
+    (b'content-location', b''),
+    (b'content-range', b''),
+    (b'content-type', b''),
+    (b'cookie', b''),
+    (b'date', b''),
+    (b'etag', b''),
+    (b'expect', b''),
+    (b'expires', b''),
+    (b'from', b''),
+    (b'host', b''),
+    (b'if-match', b''),
+    (b'if-modified-since', b''),
+    (b'if-none-match', b''),
+    (b'if-range', b''),
+    (b'if-unmodified-since', b''),
+    (b'last-modified', b''),
+    (b'link', b''),
+    (b'location', b''),
+    (b'max-forwards', b''),
+    (b'proxy-authenticate', b''),
+    (b'proxy-authorization', b''),
+    (b'range', b''),
+    (b'referer', b''),
+    (b'refresh', b''),
+    (b'retry-after', b''),
+    (b'server', b''),
+    (b'set-cookie', b''),
+    (b'strict-transport-security', b''),
+    (b'transfer-encoding', b''),
+    (b'user-agent', b''),
+    (b'vary', b''),
+    (b'via', b''),
+    (b'www-authenticate', b''),
+)
+
+#: Tuple[Tuple[int, int]]: HPACK Huffman code, as ``(code, length)`` of
+#: each symbol, where symbol ``256`` is EOS [:rfc:`7541#appendix-B`].
+HUFFMAN_CODE = (
+    (0x1ff8, 13), (0x7fffd8, 23), (0xfffffe2, 28), (0xfffffe3, 28),
+    (0xfffffe4, 28), (0xfffffe5, 28), (0xfffffe6, 28), (0xfffffe7, 28),
+    (0xfffffe8, 28), (0xffffea, 24), (0x3ffffffc, 30), (0xfffffe9, 28),
+    (0xfffffea, 28), (0x3ffffffd, 30), (0xfffffeb, 28), (0xfffffec, 28),
+    (0xfffffed, 28), (0xfffffee, 28), (0xfffffef, 28), (0xffffff0, 28),
+    (0xffffff1, 28), (0xffffff2, 28), (0x3ffffffe, 30), (0xffffff3, 28),
+    (0xffffff4, 28), (0xffffff5, 28), (0xffffff6, 28), (0xffffff7, 28),
+    (0xffffff8, 28), (0xffffff9, 28), (0xffffffa, 28), (0xffffffb, 28),
+    (0x14, 6), (0x3f8, 10), (0x3f9, 10), (0xffa, 12),
+    (0x1ff9, 13), (0x15, 6), (0xf8, 8), (0x7fa, 11),
+    (0x3fa, 10), (0x3fb, 10), (0xf9, 8), (0x7fb, 11),
+    (0xfa, 8), (0x16, 6), (0x17, 6), (0x18, 6),
+    (0x0, 5), (0x1, 5), (0x2, 5), (0x19, 6),
+    (0x1a, 6), (0x1b, 6), (0x1c, 6), (0x1d, 6),
+    (0x1e, 6), (0x1f, 6), (0x5c, 7), (0xfb, 8),
+    (0x7ffc, 15), (0x20, 6), (0xffb, 12), (0x3fc, 10),
+    (0x1ffa, 13), (0x21, 6), (0x5d, 7), (0x5e, 7),
+    (0x5f, 7), (0x60, 7), (0x61, 7), (0x62, 7),
+    (0x63, 7), (0x64, 7), (0x65, 7), (0x66, 7),
+    (0x67, 7), (0x68, 7), (0x69, 7), (0x6a, 7),
+    (0x6b, 7), (0x6c, 7), (0x6d, 7), (0x6e, 7),
+    (0x6f, 7), (0x70, 7), (0x71, 7), (0x72, 7),
+    (0xfc, 8), (0x73, 7), (0xfd, 8), (0x1ffb, 13),
+    (0x7fff0, 19), (0x1ffc, 13), (0x3ffc, 14), (0x22, 6),
+    (0x7ffd, 15), (0x3, 5), (0x23, 6), (0x4, 5),
+    (0x24, 6), (0x5, 5), (0x25, 6), (0x26, 6),
+    (0x27, 6), (0x6, 5), (0x74, 7), (0x75, 7),
+    (0x28, 6), (0x29, 6), (0x2a, 6), (0x7, 5),
+    (0x2b, 6), (0x76, 7), (0x2c, 6), (0x8, 5),
+    (0x9, 5), (0x2d, 6), (0x77, 7), (0x78, 7),
+    (0x79, 7), (0x7a, 7), (0x7b, 7), (0x7ffe, 15),
+    (0x7fc, 11), (0x3ffd, 14), (0x1ffd, 13), (0xffffffc, 28),
+    (0xfffe6, 20), (0x3fffd2, 22), (0xfffe7, 20), (0xfffe8, 20),
+    (0x3fffd3, 22), (0x3fffd4, 22), (0x3fffd5, 22), (0x7fffd9, 23),
+    (0x3fffd6, 22), (0x7fffda, 23), (0x7fffdb, 23), (0x7fffdc, 23),
+    (0x7fffdd, 23), (0x7fffde, 23), (0xffffeb, 24), (0x7fffdf, 23),
+    (0xffffec, 24), (0xffffed, 24), (0x3fffd7, 22), (0x7fffe0, 23),
+    (0xffffee, 24), (0x7fffe1, 23), (0x7fffe2, 23), (0x7fffe3, 23),
+    (0x7fffe4, 23), (0x1fffdc, 21), (0x3fffd8, 22), (0x7fffe5, 23),
+    (0x3fffd9, 22), (0x7fffe6, 23), (0x7fffe7, 23), (0xffffef, 24),
+    (0x3fffda, 22), (0x1fffdd, 21), (0xfffe9, 20), (0x3fffdb, 22),
+    (0x3fffdc, 22), (0x7fffe8, 23), (0x7fffe9, 23), (0x1fffde, 21),
+    (0x7fffea, 23), (0x3fffdd, 22), (0x3fffde, 22), (0xfffff0, 24),
+    (0x1fffdf, 21), (0x3fffdf, 22), (0x7fffeb, 23), (0x7fffec, 23),
+    (0x1fffe0, 21), (0x1fffe1, 21), (0x3fffe0, 22), (0x1fffe2, 21),
+    (0x7fffed, 23), (0x3fffe1, 22), (0x7fffee, 23), (0x7fffef, 23),
+    (0xfffea, 20), (0x3fffe2, 22), (0x3fffe3, 22), (0x3fffe4, 22),
+    (0x7ffff0, 23), (0x3fffe5, 22), (0x3fffe6, 22), (0x7ffff1, 23),
+    (0x3ffffe0, 26), (0x3ffffe1, 26), (0xfffeb, 20), (0x7fff1, 19),
+    (0x3fffe7, 22), (0x7ffff2, 23), (0x3fffe8, 22), (0x1ffffec, 25),
+    (0x3ffffe2, 26), (0x3ffffe3, 26), (0x3ffffe4, 26), (0x7ffffde, 27),
+    (0x7ffffdf, 27), (0x3ffffe5, 26), (0xfffff1, 24), (0x1ffffed, 25),
+    (0x7fff2, 19), (0x1fffe3, 21), (0x3ffffe6, 26), (0x7ffffe0, 27),
+    (0x7ffffe1, 27), (0x3ffffe7, 26), (0x7ffffe2, 27), (0xfffff2, 24),
+    (0x1fffe4, 21), (0x1fffe5, 21), (0x3ffffe8, 26), (0x3ffffe9, 26),
+    (0xffffffd, 28), (0x7ffffe3, 27), (0x7ffffe4, 27), (0x7ffffe5, 27),
+    (0xfffec, 20), (0xfffff3, 24), (0xfffed, 20), (0x1fffe6, 21),
+    (0x3fffe9, 22), (0x1fffe7, 21), (0x1fffe8, 21), (0x7ffff3, 23),
+    (0x3fffea, 22), (0x3fffeb, 22), (0x1ffffee, 25), (0x1ffffef, 25),
+    (0xfffff4, 24), (0xfffff5, 24), (0x3ffffea, 26), (0x7ffff4, 23),
+    (0x3ffffeb, 26), (0x7ffffe6, 27), (0x3ffffec, 26), (0x3ffffed, 26),
+    (0x7ffffe7, 27), (0x7ffffe8, 27), (0x7ffffe9, 27), (0x7ffffea, 27),
+    (0x7ffffeb, 27), (0xffffffe, 28), (0x7ffffec, 27), (0x7ffffed, 27),
+    (0x7ffffee, 27), (0x7ffffef, 27), (0x7fffff0, 27), (0x3ffffee, 26),
+    (0x3fffffff, 30),
+)
+
+
+def _build_huffman():
+    """Build the Huffman decoding state machine.
+
+    The Huffman code tree is walked four bits (a nibble) at a time, so that
+    decoding a string costs two table lookups per octet.
+
+    Returns:
+        Tuple[Tuple[Tuple[int, bytes, bool]], FrozenSet[int]]: For each state (internal
+        node of the code tree) and each nibble, the next state, the decoded symbols and
+        if the transition failed (i.e. decoded EOS); and the set of accepting states,
+        i.e. prefixes of EOS no longer than 7 bits which are valid paddings.
+
+    """
+    tree = [[None, None]]
+    for (symbol, (code, length)) in enumerate(HUFFMAN_CODE):
+        node = 0
+        for shift in range(length - 1, 0, -1):
+            bit = (code >> shift) & 1
+            if tree[node][bit] is None:
+                tree[node][bit] = len(tree)
+                tree.append([None, None])
+            node = tree[node][bit]
+        tree[node][code & 1] = ~symbol
+
+    table = list()
+    for node in range(len(tree)):
+        trans = list()
+        for nibble in range(16):
+            (state, data, fail) = (node, bytearray(), False)
+            for shift in (3, 2, 1, 0):
+                state = tree[state][(nibble >> shift) & 1]
+                if state < 0:
+                    if state == ~256:
+                        fail = True
+                        break
+                    data.append(~state)
+                    state = 0
+            trans.append((state, bytes(data), fail))
+        table.append(tuple(trans))
+
+    accept = {0}
+    node = 0
+    for _ in range(7):
+        node = tree[node][1]
+        accept.add(node)
+    return tuple(table), frozenset(accept)
+
+
+_HUFFMAN_TABLE, _HUFFMAN_ACCEPT = _build_huffman()
+
+
+class HPACK:
+    """HPACK decoder [:rfc:`7541`].
+
+    The decoder keeps the dynamic table of one direction of an HTTP/2
+    connection, thus the header blocks must be decoded in order.
+
+    """
+
+    ##########################################################################
+    # Properties.
+    ##########################################################################
+
+    @property
+    def size(self):
+        """Current size of the dynamic table.
+
+        :rtype: int
+        """
+        return self._size
+
+    @property
+    def table(self):
+        """Dynamic table, newest entry first.
+
+        :rtype: Tuple[Tuple[bytes, bytes]]
+        """
+        return tuple(self._table)
+
+    ##########################################################################
+    # Methods.
+    ##########################################################################
+
+    def decode(self, data):
+        """Decode a header block.
+
+        Arguments:
+            data (bytes): complete header block (i.e. concatenated fragments)
+
+        Returns:
+            List[Tuple[bytes, bytes]]: decoded header list
+
+        Raises:
+            ProtocolError: If the header block is malformed.
+
+        """
+        headers = list()
+        offset = 0
+        length = len(data)
+        while offset < length:
+            byte = data[offset]
+            if byte & 0x80:     # indexed header field
+                index, offset = self._decode_integer(data, offset, 7)
+                headers.append(self._lookup(index))
+            elif byte & 0x40:   # literal header field with incremental indexing
+                index, offset = self._decode_integer(data, offset, 6)
+                name, offset = self._decode_name(data, offset, index)
+                value, offset = self._decode_string(data, offset)
+                self._insert(name, value)
+                headers.append((name, value))
+            elif byte & 0x20:   # dynamic table size update
+                size, offset = self._decode_integer(data, offset, 5)
+                if size > self._limit:
+                    raise ProtocolError(f'HPACK: invalid table size {size}', quiet=True)
+                self._maxsz = size
+                self._evict(0)
+            else:               # literal header field without indexing / never indexed
+                index, offset = self._decode_integer(data, offset, 4)
+                name, offset = self._decode_name(data, offset, index)
+                value, offset = self._decode_string(data, offset)
+                headers.append((name, value))
+        return headers
+
+    def resize(self, size):
+        """Update the maximum size of the dynamic table.
+
+        The value is as ``SETTINGS_HEADER_TABLE_SIZE`` announced by the
+        decoding side of the direction.
+
+        Arguments:
+            size (int): maximum size allowed
+
+        """
+        self._limit = size
+        if self._maxsz > size:
+            self._maxsz = size
+            self._evict(0)
+
+    @staticmethod
+    def huffman(data):
+        """Decode a Huffman encoded string.
+
+        Arguments:
+            data (bytes): Huffman encoded string
+
+        Returns:
+            bytes: decoded string
+
+        Raises:
+            ProtocolError: If the string is malformed or incorrectly padded.
+
+        """
+        table = _HUFFMAN_TABLE
+        state = 0
+        buffer = bytearray()
+        for byte in data:
+            for nibble in (byte >> 4, byte & 0x0f):
+                (state, symbols, fail) = table[state][nibble]
+                if fail:
+                    raise ProtocolError('HPACK: invalid Huffman code', quiet=True)
+                buffer += symbols
+        if state not in _HUFFMAN_ACCEPT:
+            raise ProtocolError('HPACK: invalid Huffman padding', quiet=True)
+        return bytes(buffer)
+
+    ##########################################################################
+    # Data models.
+    ##########################################################################
+
+    def __init__(self, size=4096):
+        """Initialise HPACK decoder.
+
+        Arguments:
+            size (int): initial maximum size of the dynamic table
+
+        """
+        #: int: Maximum size allowed by settings.
+        self._limit = size
+        #: int: Maximum size of the dynamic table.
+        self._maxsz = size
+        #: int: Current size of the dynamic table.
+        self._size = 0
+        #: Deque[Tuple[bytes, bytes]]: Dynamic table, newest entry first.
+        self._table = collections.deque()
+
+    def __len__(self):
+        """Number of entries in the dynamic table."""
+        return len(self._table)
+
+    ##########################################################################
+    # Utilities.
+    ##########################################################################
+
+    @staticmethod
+    def _decode_integer(data, offset, prefix):
+        """Decode an integer with ``prefix`` bits prefix.
+
+        Arguments:
+            data (bytes): header block
+            offset (int): offset of the integer
+            prefix (int): number of bits of the prefix
+
+        Returns:
+            Tuple[int, int]: decoded integer and offset of the next field
+
+        Raises:
+            ProtocolError: If the integer is truncated.
+
+        """
+        mask = (1 << prefix) - 1
+        value = data[offset] & mask
+        offset += 1
+        if value < mask:
+            return value, offset
+
+        shift = 0
+        length = len(data)
+        while offset < length:
+            byte = data[offset]
+            offset += 1
+            value += (byte & 0x7f) << shift
+            if not byte & 0x80:
+                return value, offset
+            shift += 7
+        raise ProtocolError('HPACK: truncated integer', quiet=True)
+
+    def _decode_string(self, data, offset):
+        """Decode a string literal.
+
+        Arguments:
+            data (bytes): header block
+            offset (int): offset of the string
+
+        Returns:
+            Tuple[bytes, int]: decoded string and offset of the next field
+
+        Raises:
+            ProtocolError: If the string is truncated.
+
+        """
+        if offset >= len(data):
+            raise ProtocolError('HPACK: truncated string', quiet=True)
+        huffman = data[offset] & 0x80
+        length, offset = self._decode_integer(data, offset, 7)
+
+        stop = offset + length
+        if stop > len(data):
+            raise ProtocolError('HPACK: truncated string', quiet=True)
+        string = bytes(data[offset:stop])
+        if huffman:
+            string = self.huffman(string)
+        return string, stop
+
+    def _decode_name(self, data, offset, index):
+        """Decode the name of a literal header field.
+
+        Arguments:
+            data (bytes): header block
+            offset (int): offset after the index
+            index (int): index of the name, ``0`` if the name is a literal
+
+        Returns:
+            Tuple[bytes, int]: header name and offset of the next field
+
+        """
+        if index:
+            return self._lookup(index)[0], offset
+        return self._decode_string(data, offset)
+
+    def _lookup(self, index):
+        """Look up the static and dynamic tables.
+
+        Arguments:
+            index (int): index of the header field
+
+        Returns:
+            Tuple[bytes, bytes]: header field
+
+        Raises:
+            ProtocolError: If the index is invalid.
+
+        """
+        if 0 < index <= 61:
+            return STATIC_TABLE[index - 1]
+        try:
+            return self._table[index - 62]
+        except IndexError:
+            raise ProtocolError(f'HPACK: invalid index {index}', quiet=True) from None
+
+    def _insert(self, name, value):
+        """Insert an entry into the dynamic table.
+
+        Arguments:
+            name (bytes): header name
+            value (bytes): header value
+
+        """
+        size = 32 + len(name) + len(value)
+        self._evict(size)
+        if size <= self._maxsz:
+            self._table.appendleft((name, value))
+            self._size += size
+
+    def _evict(self, size):
+        """Evict entries to make room in the dynamic table.
+
+        Arguments:
+            size (int): size of the entry to be inserted
+
+        """
+        while self._table and self._size + size > self._maxsz:
+            (name, value) = self._table.pop()
+            self._size -= 32 + len(name) + len(value)
+
+
+class HTTPv2_Flow:
+    """Parse HTTP/2 connections from reassembled TCP payloads.
+
+    Example:
+        >>> from pcapkit.foundation.httpv2 import HTTPv2_Flow
+        >>> from pcapkit.reassembly import TCP_Reassembly
+        # reassemble TCP payloads:
+        >>> tcp_reassembly = TCP_Reassembly()
+        >>> tcp_reassembly.run(packets)
+        # parse HTTP/2 connections:
+        >>> http2 = HTTPv2_Flow()
+        >>> http2.run(tcp_reassembly.datagram)
+        # fetch decoded header lists:
+        >>> result = http2.index
+
+    """
+
+    ##########################################################################
+    # Properties.
+    ##########################################################################
+
+    @property
+    def index(self):
+        """Decoded header lists (:term:`httpv2.index`).
+
+        :rtype: Tuple[Info]
+        """
+        return tuple(self._stream)
+
+    ##########################################################################
+    # Methods.
+    ##########################################################################
+
+    def feed(self, src, dst, data, *, index=()):
+        """Feed payload of one direction of a connection.
+
+        Data of the same direction must be fed in order, and may be cut at
+        arbitrary boundaries, e.g. as TCP segments.
+
+        Arguments:
+            src (Tuple[str, int]): source IP address and TCP port
+            dst (Tuple[str, int]): destination IP address and TCP port
+            data (bytes): payload data
+
+        Keyword Arguments:
+            index (Tuple[int]): packet numbers of the payload data
+
+        Returns:
+            List[Info]: decoded header lists (:term:`httpv2.index`) completed by
+            the payload data
+
+        """
+        key = (src, dst)
+        buf = self._buffer.get(key)
+        if buf is None:
+            buf = self._buffer[key] = self._make_buffer()
+        if buf['h2'] is False:
+            return list()
+
+        if not buf['buf'] and buf['hdl'] is None:
+            buf['ind'].clear()
+        buf['ind'].extend(index)
+        buf['buf'] += data
+
+        if buf['h2'] is None:
+            buf['h2'] = self._check_preface(buf)
+            if not buf['h2']:
+                if buf['h2'] is False:
+                    buf['buf'].clear()
+                    buf['ind'].clear()
+                    buf['hdl'] = None
+                return list()
+
+        try:
+            records = self._read_frames(key, buf)
+        except ProtocolError:
+            # the HPACK state is lost, thus we stop parsing the direction
+            buf['h2'] = False
+            buf['buf'].clear()
+            buf['ind'].clear()
+            buf['hdl'] = None
+            return list()
+        self._stream.extend(records)
+        return records
+
+    def close(self, src, dst):
+        """Release buffers of a connection.
+
+        Arguments:
+            src (Tuple[str, int]): IP address and TCP port of one endpoint
+            dst (Tuple[str, int]): IP address and TCP port of the other endpoint
+
+        """
+        self._buffer.pop((src, dst), None)
+        self._buffer.pop((dst, src), None)
+
+    def run(self, datagrams):
+        """Run automatically.
+
+        Arguments:
+            datagrams (Iterable[Info]): reassembled :term:`datagrams <tcp.datagram>`
+                from :class:`~pcapkit.reassembly.tcp.TCP_Reassembly`
+
+        """
+        for datagram in datagrams:
+            self(datagram)
+
+    ##########################################################################
+    # Data models.
+    ##########################################################################
+
+    def __init__(self, *, decode_policy='fast'):
+        """Initialise HTTP/2 connection parser.
+
+        Keyword Arguments:
+            decode_policy (Literal['fast', 'detect']): decoding policy of header
+                names and values (c.f. :meth:`Protocol.decode <pcapkit.protocols.protocol.Protocol.decode>`)
+
+        """
+        #: str: Decoding policy of header fields.
+        self._policy = decode_policy
+
+        #: dict: Buffer field (:term:`httpv2.buffer`).
+        self._buffer = dict()
+        #: List[Info]: Decoded header lists (:term:`httpv2.index`).
+        self._stream = list()
+
+    def __call__(self, datagram):
+        """Parse a reassembled TCP datagram.
+
+        Arguments:
+            datagram (Info): reassembled :term:`datagram <tcp.datagram>`
+
+        """
+        src = datagram.id.src
+        dst = datagram.id.dst
+        if datagram.NotImplemented:
+            # the payload has holes, so the direction cannot be followed any more
+            buf = self._buffer.get((src, dst))
+            if buf is None:
+                self._buffer[(src, dst)] = dict(h2=False, buf=bytearray(), ind=list(), hdl=None, hpack=None)
+            else:
+                buf['h2'] = False
+                buf['buf'].clear()
+                buf['ind'].clear()
+                buf['hdl'] = None
+            return
+        self.feed(src, dst, datagram.payload, index=datagram.index)
+
+    ##########################################################################
+    # Utilities.
+    ##########################################################################
+
+    @staticmethod
+    def _make_buffer():
+        """Make buffer of a new direction.
+
+        Returns:
+            dict: buffer of the direction (:term:`httpv2.buffer`)
+
+        """
+        return dict(
+            h2=None,
+            buf=bytearray(),
+            ind=list(),
+            hdl=None,
+            hpack=HPACK(),
+        )
+
+    @staticmethod
+    def _check_preface(buf):
+        """Check if a direction is HTTP/2.
+
+        The client side starts with the connection preface, and the server
+        side starts with a ``SETTINGS`` frame [:rfc:`7540#section-3.5`].
+
+        Arguments:
+            buf (dict): buffer of the direction (:term:`httpv2.buffer`)
+
+        Returns:
+            Optional[bool]: If the direction is HTTP/2, or :data:`None` if
+            more data is needed.
+
+        """
+        data = buf['buf']
+        if data[:24] == PREFACE[:len(data)]:
+            if len(data) < 24:
+                return None
+            del data[:24]
+            return True
+
+        if len(data) < 9:
+            return None
+        length = int.from_bytes(data[:3], 'big')
+        return (data[3] == 0x04 and data[4] & 0xfe == 0                             # SETTINGS
+                and length % 6 == 0 and int.from_bytes(data[5:9], 'big') == 0)
+
+    def _read_frames(self, key, buf):
+        """Split buffered data into frames and decode header blocks.
+
+        Arguments:
+            key (Tuple[Tuple[str, int], Tuple[str, int]]): direction of the connection
+            buf (dict): buffer of the direction (:term:`httpv2.buffer`)
+
+        Returns:
+            List[Info]: decoded header lists (:term:`httpv2.index`)
+
+        Raises:
+            ProtocolError: If the frames or the header blocks are malformed.
+
+        """
+        records = list()
+        data = buf['buf']
+        size = len(data)
+        offset = 0
+        while size - offset >= 9:
+            length = int.from_bytes(data[offset:offset+3], 'big')
+            stop = offset + 9 + length
+            if stop > size:
+                break
+
+            kind = data[offset+3]
+            flag = data[offset+4]
+            sid = int.from_bytes(data[offset+5:offset+9], 'big') & 0x7fffffff
+            payload = data[offset+9:stop]
+            offset = stop
+
+            pending = buf['hdl']
+            if pending is not None:
+                # only CONTINUATION frames of the same stream may follow
+                if kind != 0x09 or sid != pending[0]:
+                    raise ProtocolError(f'HTTP/2: [Type {kind}] invalid format', quiet=True)
+                pending[4] += payload
+                if flag & 0x04:     # END_HEADERS
+                    buf['hdl'] = None
+                    records.append(self._make_record(key, buf, *pending))
+                continue
+
+            if kind == 0x01:    # HEADERS
+                start = 0
+                if flag & 0x08:     # PADDED
+                    start = 1
+                    payload = payload[:len(payload)-payload[0]] if payload else payload
+                if flag & 0x20:     # PRIORITY
+                    start += 5
+                block = [sid, 'HEADERS', None, bool(flag & 0x01), bytearray(payload[start:])]
+            elif kind == 0x05:  # PUSH_PROMISE
+                start = 4
+                if flag & 0x08:     # PADDED
+                    start = 5
+                    payload = payload[:len(payload)-payload[0]] if payload else payload
+                promised = int.from_bytes(payload[start-4:start], 'big') & 0x7fffffff
+                block = [sid, 'PUSH_PROMISE', promised, False, bytearray(payload[start:])]
+            elif kind == 0x04:  # SETTINGS
+                if not flag & 0x01:     # not ACK
+                    self._read_settings(key, payload)
+                continue
+            elif kind == 0x09:  # CONTINUATION
+                raise ProtocolError(f'HTTP/2: [Type {kind}] invalid format', quiet=True)
+            else:
+                continue
+
+            if flag & 0x04:     # END_HEADERS
+                records.append(self._make_record(key, buf, *block))
+            else:
+                buf['hdl'] = block
+        del data[:offset]
+        return records
+
+    def _read_settings(self, key, payload):
+        """Apply ``SETTINGS_HEADER_TABLE_SIZE`` of a ``SETTINGS`` frame.
+
+        The setting announced by one endpoint limits the dynamic table of
+        the opposite direction, i.e. the one it decodes. Should no data of
+        the opposite direction be seen yet, its buffer is created so that
+        the setting applies once its data arrives.
+
+        Arguments:
+            key (Tuple[Tuple[str, int], Tuple[str, int]]): direction of the ``SETTINGS`` frame
+            payload (bytearray): frame payload
+
+        """
+        peer = self._buffer.get((key[1], key[0]))
+        if peer is None:
+            peer = self._buffer[(key[1], key[0])] = self._make_buffer()
+        if peer['hpack'] is None:
+            return
+        for offset in range(0, len(payload) - 5, 6):
+            if int.from_bytes(payload[offset:offset+2], 'big') == 0x01:
+                peer['hpack'].resize(int.from_bytes(payload[offset+2:offset+6], 'big'))
+
+    def _make_record(self, key, buf, sid, kind, promised, end_stream, block):  # pylint: disable=too-many-arguments
+        """Decode a complete header block.
+
+        Arguments:
+            key (Tuple[Tuple[str, int], Tuple[str, int]]): direction of the connection
+            buf (dict): buffer of the direction (:term:`httpv2.buffer`)
+            sid (int): stream identifier
+            kind (str): frame type
+            promised (Optional[int]): promised stream identifier
+            end_stream (bool): END_STREAM flag
+            block (bytearray): header block
+
+        Returns:
+            Info: decoded header list (:term:`httpv2.index`)
+
+        Raises:
+            ProtocolError: If the header block is malformed.
+
+        """
+        headers = tuple(
+            (Protocol.decode(name, policy=self._policy), Protocol.decode(value, policy=self._policy))
+            for (name, value) in buf['hpack'].decode(block)
+        )
+        return Info(
+            id=Info(
+                src=key[0],
+                dst=key[1],
+            ),
+            index=tuple(dict.fromkeys(buf['ind'])),
+            sid=sid,
+            type=kind,
+            promised=promised,
+            end_stream=end_stream,
+            headers=headers,
+        )
@@ -0,0 +1,369 @@
+# -*- coding: utf-8 -*-
+"""protocol decoding instrumentation
+
+:mod:`pcapkit.foundation.instrument` is the opt-in instrumentation
+of protocol decoding, i.e. number of decodings, cumulative and
+percentile decoding time and bytes processed per protocol class,
+as well as fallbacks to :class:`~pcapkit.protocols.raw.Raw` and
+trial failures of application layer analysis.
+
+Instrumentation is enabled on ``Extractor(instrument=True)``
+(c.f. :class:`~pcapkit.foundation.extraction.Extractor`), or by
+setting the environment variable ``PCAPKIT_INSTRUMENT``, or by
+entering an :class:`~pcapkit.foundation.instrument.Instrument` as
+a context manager. When disabled, the hooks in protocols cost no
+more than checking the value of :data:`~pcapkit.foundation.instrument.RECORDER`
+against :data:`None`.
+
+The active instrumentation is held in a context variable, so that
+extractions running concurrently in separate threads or tasks, e.g.
+through :func:`~pcapkit.interface.core.aextract`, each record into
+their own :class:`~pcapkit.foundation.instrument.Instrument`.
+
+Glossary
+--------
+
+instrument.buffer
+    Data structure for internal counting when performing instrumentation
+    (:attr:`~pcapkit.foundation.instrument.Instrument._buffer`) is as following:
+
+    .. code-block:: python
+
+       (dict) buffer --> memory buffer for instrumentation
+        |--> (str) protocol : (list)
+        |       |--> (int) number of decodings
+        |       |--> (int) cumulative decoding time in nanoseconds
+        |       |--> (int) decoding time excluding upper layers in nanoseconds
+        |       |--> (int) number of bytes processed
+        |       |--> (int) number of decoding errors
+        |       |--> (list) number of decodings per bucket of decoding time
+        |--> (str) protocol ...
+
+instrument.index
+    Data structure for **instrumentation** (element from
+    :attr:`~pcapkit.foundation.instrument.Instrument.index` *tuple*)
+    is as following:
+
+    .. code-block:: python
+
+       (tuple) index
+        |--> (Info) data
+        |     |--> 'protocol': (str) name of the protocol class
+        |     |--> 'count'   : (int) number of decodings
+        |     |--> 'time'    : (float) cumulative decoding time in seconds,
+        |     |                including decoding of upper layers
+        |     |--> 'self'    : (float) decoding time in seconds, excluding
+        |     |                decoding of upper layers
+        |     |--> 'p50'     : (float) median of decoding time in seconds
+        |     |--> 'p90'     : (float) 90th percentile of decoding time in seconds
+        |     |--> 'p99'     : (float) 99th percentile of decoding time in seconds
+        |     |--> 'bytes'   : (int) number of bytes processed
+        |     |--> 'errors'  : (int) number of decoding errors
+        |--> (Info) data ...
+
+"""
+import contextvars
+import os
+import time
+
+from pcapkit.corekit.infoclass import Info
+from pcapkit.utilities.exceptions import BOOLEAN_STATES
+
+__all__ = ['Instrument']
+
+#: bool: Instrumentation flag from environment (``PCAPKIT_INSTRUMENT``).
+INSTRUMENT = BOOLEAN_STATES.get(os.environ.get('PCAPKIT_INSTRUMENT', 'false').casefold(), False)
+
+#: contextvars.ContextVar[Optional[Instrument]]: Active instrumentation of the
+#: current context, :data:`None` if disabled.
+RECORDER = contextvars.ContextVar('RECORDER', default=None)
+
+#: Tuple[int]: Upper bounds of buckets of decoding time in nanoseconds, i.e. powers
+#: of 2 from 256 ns to about 1 s; longer decodings are counted in an extra bucket.
+BUCKETS = tuple(1 << exponent for exponent in range(8, 31))
+
+
+class Instrument:
+    """Protocol decoding instrumentation."""
+
+    ##########################################################################
+    # Properties.
+    ##########################################################################
+
+    @property
+    def index(self):
+        """Index table for instrumentation (:term:`instrument.index`).
+
+        :rtype: Tuple[Info]
+        """
+        return tuple(Info(
+            protocol=name,
+            count=count,
+            time=total / 1e9,
+            self=self_ / 1e9,
+            p50=self._percentile(buckets, 0.50),
+            p90=self._percentile(buckets, 0.90),
+            p99=self._percentile(buckets, 0.99),
+            bytes=bytes_,
+            errors=errors,
+        ) for (name, (count, total, self_, bytes_, errors, buckets)) in sorted(self._buffer.items()))
+
+    @property
+    def fallbacks(self):
+        """Number of fallbacks to :class:`~pcapkit.protocols.raw.Raw`, per protocol
+        whose payload failed to be decoded.
+
+        :rtype: Dict[str, int]
+        """
+        return dict(self._fallbacks)
+
+    @property
+    def trials(self):
+        """Number of application layer analysis trials, per candidate protocol,
+        as tuples of attempts and failures.
+
+        :rtype: Dict[str, Tuple[int, int]]
+        """
+        return {name: tuple(record) for (name, record) in self._trials.items()}
+
+    ##########################################################################
+    # Methods.
+    ##########################################################################
+
+    def decode(self, protocol, file, length, **kwargs):
+        """Decode a protocol whilst recording its counters.
+
+        Arguments:
+            protocol (pcapkit.protocols.protocol.Protocol): protocol instance being initialised
+            file (Optional[io.BytesIO]): source packet stream
+            length (Optional[int]): length of packet data
+            **kwargs: arbitrary keyword arguments of
+                :meth:`Protocol.__post_init__ <pcapkit.protocols.protocol.Protocol.__post_init__>`
+
+        """
+        self._stack.append(0)
+        start = time.perf_counter_ns()
+        try:
+            protocol.__post_init__(file, length, **kwargs)
+        except EOFError:
+            # end of file, not a decoding
+            self._stack.pop()
+            raise
+        except BaseException:
+            self._leave(protocol, start, error=True)
+            raise
+        self._leave(protocol, start)
+
+    def fallback(self, name):
+        """Count a fallback to :class:`~pcapkit.protocols.raw.Raw`.
+
+        Arguments:
+            name (str): name of the protocol whose payload failed to be decoded
+
+        """
+        self._fallbacks[name] = self._fallbacks.get(name, 0) + 1
+
+    def trial(self, name, success):
+        """Count an application layer analysis trial.
+
+        Arguments:
+            name (str): name of the candidate protocol
+            success (bool): if the payload was parsed as the candidate
+
+        """
+        record = self._trials.get(name)
+        if record is None:
+            record = self._trials[name] = [0, 0]
+        record[0] += 1
+        if not success:
+            record[1] += 1
+
+    def merge(self, *others):
+        """Merge counters from other instrumentations.
+
+        Arguments:
+            *others (Instrument): instrumentations to be merged, e.g. from
+                other extractions
+
+        Returns:
+            Instrument: the current instrumentation (for chaining)
+
+        """
+        for other in others:
+            for (name, source) in other._buffer.items():  # pylint: disable=protected-access
+                record = self._record(name)
+                for index in range(5):
+                    record[index] += source[index]
+                record[5] = [this + that for (this, that) in zip(record[5], source[5])]
+            for (name, count) in other._fallbacks.items():  # pylint: disable=protected-access
+                self._fallbacks[name] = self._fallbacks.get(name, 0) + count
+            for (name, (attempts, failures)) in other._trials.items():  # pylint: disable=protected-access
+                record = self._trials.setdefault(name, [0, 0])
+                record[0] += attempts
+                record[1] += failures
+        return self
+
+    def asdict(self):
+        """Instrumentation as a :obj:`dict`.
+
+        Returns:
+            Dict[str, Any]: Mapping with ``protocols`` (c.f. :term:`instrument.index`,
+            keyed by protocol name), ``fallbacks`` and ``trials``.
+
+        """
+        protocols = dict()
+        for record in self.index:
+            data = record.info2dict()
+            protocols[data.pop('protocol')] = data
+        trials = {name: dict(attempts=attempts, failures=failures)
+                  for (name, (attempts, failures)) in self.trials.items()}
+        return dict(protocols=protocols, fallbacks=self.fallbacks, trials=trials)
+
+    def prometheus(self, prefix='pcapkit'):
+        """Instrumentation in Prometheus text exposition format.
+
+        Arguments:
+            prefix (str): prefix of metric names
+
+        Returns:
+            str: Metrics, i.e. ``<prefix>_decode_seconds`` histogram, ``<prefix>_decode_self_seconds_total``,
+            ``<prefix>_decode_bytes_total``, ``<prefix>_decode_errors_total``, ``<prefix>_fallbacks_total``,
+            ``<prefix>_analysis_trials_total`` and ``<prefix>_analysis_failures_total`` counters.
+
+        """
+        lines = list()
+
+        def metric(name, kind, help_):
+            lines.append(f'# HELP {prefix}_{name} {help_}')
+            lines.append(f'# TYPE {prefix}_{name} {kind}')
+
+        buffer = sorted(self._buffer.items())
+        metric('decode_seconds', 'histogram', 'Decoding time per protocol, including upper layers.')
+        for (name, (count, total, _, _, _, buckets)) in buffer:
+            cumulative = 0
+            for (bound, number) in zip(BUCKETS, buckets):
+                cumulative += number
+                lines.append(f'{prefix}_decode_seconds_bucket{{protocol="{name}",le="{bound / 1e9}"}} {cumulative}')
+            lines.append(f'{prefix}_decode_seconds_bucket{{protocol="{name}",le="+Inf"}} {count}')
+            lines.append(f'{prefix}_decode_seconds_sum{{protocol="{name}"}} {total / 1e9}')
+            lines.append(f'{prefix}_decode_seconds_count{{protocol="{name}"}} {count}')
+
+        metric('decode_self_seconds_total', 'counter', 'Decoding time per protocol, excluding upper layers.')
+        for (name, record) in buffer:
+            lines.append(f'{prefix}_decode_self_seconds_total{{protocol="{name}"}} {record[2] / 1e9}')
+        metric('decode_bytes_total', 'counter', 'Bytes processed per protocol.')
+        for (name, record) in buffer:
+            lines.append(f'{prefix}_decode_bytes_total{{protocol="{name}"}} {record[3]}')
+        metric('decode_errors_total', 'counter', 'Decoding errors per protocol.')
+        for (name, record) in buffer:
+            lines.append(f'{prefix}_decode_errors_total{{protocol="{name}"}} {record[4]}')
+
+        metric('fallbacks_total', 'counter', 'Fallbacks to Raw per protocol whose payload failed to be decoded.')
+        for (name, count) in sorted(self._fallbacks.items()):
+            lines.append(f'{prefix}_fallbacks_total{{protocol="{name}"}} {count}')
+        metric('analysis_trials_total', 'counter', 'Application layer analysis trials per candidate protocol.')
+        for (name, (attempts, _)) in sorted(self._trials.items()):
+            lines.append(f'{prefix}_analysis_trials_total{{protocol="{name}"}} {attempts}')
+        metric('analysis_failures_total', 'counter', 'Failed application layer analysis trials per candidate protocol.')
+        for (name, (_, failures)) in sorted(self._trials.items()):
+            lines.append(f'{prefix}_analysis_failures_total{{protocol="{name}"}} {failures}')
+        return '\n'.join(lines) + '\n'
+
+    def clear(self):
+        """Clear counters."""
+        self._buffer.clear()
+        self._fallbacks.clear()
+        self._trials.clear()
+
+    ##########################################################################
+    # Data models.
+    ##########################################################################
+
+    def __init__(self):
+        """Initialise instance."""
+        #: dict: Buffer field (:term:`instrument.buffer`).
+        self._buffer = dict()
+        #: Dict[str, int]: Fallbacks to Raw per protocol.
+        self._fallbacks = dict()
+        #: Dict[str, List[int]]: Analysis attempts and failures per protocol.
+        self._trials = dict()
+
+        #: List[int]: Decoding time of upper layers per protocol being decoded.
+        self._stack = list()
+        #: List[contextvars.Token]: Tokens of recorders replaced on entering.
+        self._saved = list()
+
+    def __enter__(self):
+        """Activate instrumentation."""
+        self._saved.append(RECORDER.set(self))
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):  # pylint: disable=unused-argument
+        """Deactivate instrumentation."""
+        RECORDER.reset(self._saved.pop())
+
+    ##########################################################################
+    # Utilities.
+    ##########################################################################
+
+    def _record(self, name):
+        """Get counters of a protocol.
+
+        Arguments:
+            name (str): name of the protocol class
+
+        Returns:
+            list: Counters of the protocol (c.f. :term:`instrument.buffer`).
+
+        """
+        record = self._buffer.get(name)
+        if record is None:
+            record = self._buffer[name] = [0, 0, 0, 0, 0, [0] * (len(BUCKETS) + 1)]
+        return record
+
+    def _leave(self, protocol, start, *, error=False):
+        """Record a decoding.
+
+        Arguments:
+            protocol (pcapkit.protocols.protocol.Protocol): decoded protocol instance
+            start (int): start of decoding from :func:`time.perf_counter_ns`
+
+        Keyword Arguments:
+            error (bool): if decoding raised an exception
+
+        """
+        elapsed = time.perf_counter_ns() - start
+        upper = self._stack.pop()
+        if self._stack:
+            self._stack[-1] += elapsed
+
+        record = self._record(type(protocol).__name__)
+        record[0] += 1
+        record[1] += elapsed
+        record[2] += elapsed - upper
+        if error:
+            record[4] += 1
+        else:
+            record[3] += len(getattr(protocol, '_data', b''))
+        record[5][min(max((elapsed - 1).bit_length() - 8, 0), len(BUCKETS))] += 1
+
+    @staticmethod
+    def _percentile(buckets, quantile):
+        """Estimate percentile of decoding time.
+
+        Arguments:
+            buckets (List[int]): number of decodings per bucket
+            quantile (float): quantile, e.g. ``0.99``
+
+        Returns:
+            Optional[float]: Upper bound of the bucket in seconds where the percentile
+            falls into, :data:`None` if in the extra bucket or nothing counted.
+
+        """
+        rank = quantile * sum(buckets)
+        cumulative = 0
+        for (bound, number) in zip(BUCKETS, buckets):
+            cumulative += number
+            if number and cumulative >= rank:
+                return bound / 1e9
+        return None
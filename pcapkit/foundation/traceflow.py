@@ -102,6 +102,14 @@ class TraceFlow:
             return self.submit()
         return tuple(self._stream)
 
+    @property
+    def buffered(self):
+        """Number of flows being traced in buffer.
+
+        :rtype: int
+        """
+        return len(self._buffer)
+
     ##########################################################################
     # Methods.
     ##########################################################################
@@ -7,6 +7,9 @@ interfaces, variables, and etc., which wraps around the
 foundation classes from :mod:`pcapkit.foundation`.
 
 """
+import asyncio
+import concurrent.futures
+import functools
 import io
 import sys
 
@@ -21,7 +24,8 @@ from pcapkit.utilities.exceptions import FormatError
 from pcapkit.utilities.validations import bool_check, int_check, io_check, str_check
 
 __all__ = [
-    'extract', 'analyse', 'reassemble', 'trace',            # interface functions
+    'extract', 'aextract', 'analyse', 'reassemble', 'trace',
+                                                            # interface functions
     'TREE', 'JSON', 'PLIST', 'PCAP',                        # format macros
     'LINK', 'INET', 'TRANS', 'APP', 'RAW',                  # layer macros
     'DPKT', 'Scapy', 'PyShark', 'MPServer', 'MPPipeline', 'PCAPKit',
@@ -51,22 +55,35 @@ MPPipeline = 'pipeline'
 
 
 def extract(fin=None, fout=None, format=None,                           # basic settings  # pylint: disable=redefined-builtin
-            auto=True, extension=True, store=True,                      # internal settings
+            auto=True, extension=True, store=True, store_budget=None,   # internal settings
             files=False, nofile=False, verbose=False,                   # output settings
-            engine=None, layer=None, protocol=None,                     # extraction settings
+            engine=None, layer=None, protocol=None, filter=None,        # extraction settings  # pylint: disable=redefined-builtin
+            skip_options=False, decode_policy='fast',                   # extraction settings
             ip=False, ipv4=False, ipv6=False, tcp=False, strict=True,   # reassembly settings
             trace=False, trace_fout=None, trace_format=None,            # trace settings  # pylint: disable=redefined-outer-name
-            trace_byteorder=sys.byteorder, trace_nanosecond=False):     # trace settings
+            trace_byteorder=sys.byteorder, trace_nanosecond=False,      # trace settings
+            hierarchy=False, instrument=None,                           # statistics settings
+            progress=None, progress_interval=1.0,                       # progress settings
+            follow=False, follow_interval=1.0, follow_timeout=None,     # follow settings
+            follow_rotate=None):                                        # follow settings
     """Extract a PCAP file.
 
     Arguments:
-        fin (Optiona[str]): file name to be read; if file not exist, raise :exc:`FileNotFound`
+        fin (Optiona[Union[str, BinaryIO]]): file name to be read; if file not exist, raise
+            :exc:`FileNotFound`; or a binary file-like object, e.g. pipes and sockets, or ``'-'``
+            for :data:`sys.stdin`, to be read in streaming mode without seeking
         fout (Optiona[str]): file name to be written
         format (Optional[Literal['plist', 'json', 'tree']]): file format of output
 
         auto (bool): if automatically run till EOF
         extension (bool): if check and append extensions to output file
-        store (bool): if store extracted packet info
+        store (Union[bool, int, Literal['index']]): retention policy of extracted frames, i.e.
+            if store all frames (:data:`True`), or only the last ``N`` frames in a ring buffer
+            (positive :obj:`int`), or only offsets of frames to reload them on access
+            (``'index'``, default engine only), c.f. :mod:`pcapkit.corekit.store`
+        store_budget (Optional[int]): memory budget (in bytes of serialised frames) of ``store=True``,
+            over which frames are spilled to a temporary file and decoded on access, c.f.
+            :class:`~pcapkit.corekit.store.SpillStore`
 
         files (bool): if split each frame into different files
         nofile (bool): if no output file is to be dumped
@@ -76,6 +93,14 @@ def extract(fin=None, fout=None, format=None,                           # basic
             extraction engine to be used
         layer (Optional[Literal['Link', 'Internet', 'Transport', 'Application']]): extract til which layer
         protocol (Optional[Union[str, Tuple[str], Type[Protocol]]]): extract til which protocol
+        filter (Optional[str]): filter expression (c.f. :mod:`pcapkit.foundation.filtering`) to
+            select frames on their raw bytes before protocol decoding
+        skip_options (Union[bool, str, Tuple[str]]): if keep options of protocols (all of
+            ``TCP``, ``IPv4``, ``HOPOPT``, ``IPv6_Opts`` and ``HIP`` if :data:`True`, or only
+            the given protocol names) as raw bytes instead of decoding them
+        decode_policy (Literal['fast', 'detect']): decoding policy of text fields, i.e. try strict
+            ASCII and UTF-8 before detecting the encoding (``'fast'``), or always detect the encoding
+            (``'detect'``), c.f. :meth:`Protocol.decode <pcapkit.protocols.protocol.Protocol.decode>`
 
         ip (bool): if record data for IPv4 & IPv6 reassembly
         ipv4 (bool): if perform IPv4 reassembly
@@ -90,6 +115,26 @@ def extract(fin=None, fout=None, format=None,                           # basic
         trace_byteorder (Literal['little', 'big']): output file byte order
         trace_nanosecond (bool): output nanosecond-resolution file flag
 
+        hierarchy (bool): if collect protocol hierarchy statistics
+        instrument (Optional[bool]): if instrument protocol decoding (c.f.
+            :mod:`pcapkit.foundation.instrument`), defaults to the ``PCAPKIT_INSTRUMENT``
+            environment variable
+
+        progress (Optional[Union[bool, Callable[[pcapkit.foundation.extraction.Extractor,
+            pcapkit.corekit.infoclass.Info]]]]): a function takes the :class:`Extractor` instance
+            and its :attr:`~pcapkit.foundation.extraction.Extractor.stats` as parameters to report
+            progress periodically, or :data:`True` to print progress to :data:`sys.stderr`
+        progress_interval (float): minimum interval in seconds between progress reports
+
+        follow (bool): if follow the input file as it grows, i.e. wait for a truncated
+            trailing frame to be written instead of treating it as EOF (default engine only)
+        follow_interval (float): maximum interval in seconds of polling for new data, as
+            the polling backs off exponentially from 10 milliseconds
+        follow_timeout (Optional[float]): seconds without new frames after which EOF is
+            assumed; wait forever if :data:`None`
+        follow_rotate (Optional[str]): :mod:`glob` pattern of rotated input files, to move
+            to the next file (in lexicographical order) once it appears
+
     Returns:
         Extractor -- an :class:`~pcapkit.foundation.extraction.Extractor` object
 
@@ -98,20 +143,133 @@ def extract(fin=None, fout=None, format=None,                           # basic
         layer = layer.__layer__
     if isinstance(protocol, type) and issubclass(protocol, Protocol):
         protocol = protocol.id()
+    if isinstance(skip_options, type) and issubclass(skip_options, Protocol):
+        skip_options = skip_options.id()
 
-    str_check(fin or '', fout or '', format or '',
-              trace_fout or '', trace_format or '',
+    str_check('' if hasattr(fin, 'read') else (fin or ''), fout or '', format or '',
+              trace_fout or '', trace_format or '', filter or '', decode_policy or '',
+              follow_rotate or '',
               engine or '', layer or '', *(protocol or ''))
-    bool_check(files, nofile, verbose, auto, extension, store,
-               ip, ipv4, ipv6, tcp, strict, trace)
+    if not isinstance(skip_options, bool):
+        str_check(*(skip_options or ''))
+    if store != 'index':
+        int_check(store)
+    if store_budget is not None:
+        int_check(store_budget)
+    bool_check(files, nofile, verbose, auto, extension,
+               ip, ipv4, ipv6, tcp, strict, trace, hierarchy, follow)
+    if instrument is not None:
+        bool_check(instrument)
 
     return Extractor(fin=fin, fout=fout, format=format,
-                     store=store, files=files, nofile=nofile,
+                     store=store, store_budget=store_budget, files=files, nofile=nofile,
                      auto=auto, verbose=verbose, extension=extension,
-                     engine=engine, layer=layer, protocol=protocol,
+                     engine=engine, layer=layer, protocol=protocol, filter=filter,
+                     skip_options=skip_options, decode_policy=decode_policy,
                      ip=ip, ipv4=ipv4, ipv6=ipv6, tcp=tcp, strict=strict,
                      trace=trace, trace_fout=trace_fout, trace_format=trace_format,
-                     trace_byteorder=trace_byteorder, trace_nanosecond=trace_nanosecond)
+                     trace_byteorder=trace_byteorder, trace_nanosecond=trace_nanosecond,
+                     hierarchy=hierarchy, instrument=instrument,
+                     progress=progress, progress_interval=progress_interval,
+                     follow=follow, follow_interval=follow_interval, follow_timeout=follow_timeout,
+                     follow_rotate=follow_rotate)
+
+
+async def aextract(fin=None, fout=None, format=None, *,                 # basic settings  # pylint: disable=redefined-builtin
+                   batch=64, maxsize=1024, executor=None,               # asynchronous settings
+                   **kwargs):
+    """Extract a PCAP file asynchronously.
+
+    The extraction runs with ``auto=False`` in ``executor``, so that neither
+    file reads nor protocol decoding blocks the event loop; frames are decoded
+    in batches of ``batch`` per executor call, and passed to the consumer
+    through an :class:`asyncio.Queue` bounded by ``maxsize`` frames, which
+    suspends the extraction until the consumer catches up (backpressure).
+
+    Concurrent extractions share the module-level caches of protocol decoding,
+    e.g. :data:`~pcapkit.corekit.address.ADDRESS_CACHE` and the per-flow caches
+    of identified protocols and charsets, which are guarded by locks; their
+    hit and miss counters are thus aggregated over all extractions.
+
+    Arguments:
+        fin (Optiona[Union[str, BinaryIO]]): file name to be read; if file not exist, raise
+            :exc:`FileNotFound`; or a binary file-like object, e.g. pipes and sockets, or ``'-'``
+            for :data:`sys.stdin`, to be read in streaming mode without seeking
+        fout (Optiona[str]): file name to be written
+        format (Optional[Literal['plist', 'json', 'tree']]): file format of output
+
+        batch (int): number of frames decoded per executor call
+        maxsize (int): maximum number of decoded frames pending for the consumer
+        executor (Optional[concurrent.futures.Executor]): executor to run the extraction in,
+            defaults to a dedicated single-thread executor; it must run calls in submission
+            order, as the extraction is stateful
+
+    Keyword Args:
+        **kwargs: arbitrary keyword arguments of :func:`~pcapkit.interface.core.extract`,
+            except ``auto`` which is always :data:`False`
+
+    Yields:
+        Union[pcapkit.protocols.pcap.frame.Frame, Any]: Extracted frames (depends on
+        extraction engine selected).
+
+    Example:
+        .. code-block:: python
+
+           async for frame in pcapkit.aextract('in.pcap', nofile=True, store=False):
+               ...
+
+    """
+    int_check(batch, maxsize)
+    kwargs['auto'] = False
+
+    loop = asyncio.get_running_loop()
+    dedicated = executor is None
+    if dedicated:
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix='pcapkit')
+    extraction = None
+    producer = None
+    pending = None
+
+    async def produce():
+        nonlocal pending
+        try:
+            while True:
+                # keep a reference to the executor call, so that it can be
+                # waited on before closing the extraction if cancelled
+                pending = loop.run_in_executor(executor, _extract_batch, extraction, batch)
+                frames = await asyncio.shield(pending)
+                for frame in frames:
+                    await queue.put(frame)
+                if len(frames) < batch:
+                    break
+        except Exception as error:  # pylint: disable=broad-except
+            await queue.put(_Done(error))
+        else:
+            await queue.put(_Done())
+
+    try:
+        extraction = await loop.run_in_executor(executor, functools.partial(
+            extract, fin=fin, fout=fout, format=format, **kwargs))
+
+        queue = asyncio.Queue(maxsize)
+        producer = asyncio.ensure_future(produce())
+        while True:
+            frame = await queue.get()
+            if isinstance(frame, _Done):
+                if frame.error is not None:
+                    raise frame.error
+                break
+            yield frame
+    finally:
+        if producer is not None:
+            producer.cancel()
+            await asyncio.gather(producer, return_exceptions=True)
+        if pending is not None:
+            await asyncio.gather(pending, return_exceptions=True)
+        if extraction is not None:
+            await loop.run_in_executor(executor, extraction.__exit__, None, None, None)
+        if dedicated:
+            executor.shutdown(wait=False)
 
 
 def analyse(file, length=None):
@@ -179,3 +337,37 @@ def trace(fout=None, format=None, byteorder=sys.byteorder, nanosecond=False):  #
     """
     str_check(fout or '', format or '')
     return TraceFlow(fout=fout, format=format, byteorder=byteorder, nanosecond=nanosecond)
+
+
+class _Done:
+    """End of asynchronous extraction.
+
+    Args:
+        error (Optional[Exception]): exception raised from the extraction
+
+    """
+
+    def __init__(self, error=None):
+        """Initialisation."""
+        #: Optional[Exception]: Exception raised from the extraction.
+        self.error = error
+
+
+def _extract_batch(extraction, size):
+    """Extract a batch of frames.
+
+    Args:
+        extraction (pcapkit.foundation.extraction.Extractor): extractor with ``auto=False``
+        size (int): maximum number of frames to extract
+
+    Returns:
+        List[Union[pcapkit.protocols.pcap.frame.Frame, Any]]: Extracted frames; fewer
+        than ``size`` frames if EOF reached.
+
+    """
+    frames = list()
+    for frame in extraction:
+        frames.append(frame)
+        if len(frames) >= size:
+            break
+    return frames
@@ -8,24 +8,7 @@ with detailed implementation and methods.
 """
 # TODO: Implement specified classes for MAC and IP addresses.
 
-# Base Class for Protocols
-from pcapkit.protocols.protocol import Protocol
-
-# Utility Classes for Protocols
-from pcapkit.protocols.raw import *
-from pcapkit.protocols.null import *
-from pcapkit.protocols.pcap import *
-
-# Protocols & Macros
-from pcapkit.protocols.link import *
-from pcapkit.protocols.internet import *
-from pcapkit.protocols.transport import *
-from pcapkit.protocols.application import *
-
-# Deprecated / Base Protocols
-from pcapkit.protocols.internet.ip import IP
-from pcapkit.protocols.internet.ipsec import IPsec
-from pcapkit.protocols.application.http import HTTP
+from pcapkit.utilities.compat import lazy_import
 
 __all__ = [
     # Protocol Numbers
@@ -55,5 +38,71 @@ __all__ = [
     'TCP', 'UDP',
 
     # Application Layer
-    'FTP', 'HTTP',
+    'DNS', 'FTP', 'HTTP', 'TLS',
 ]
+
+__getattr__, __dir__ = lazy_import(__name__, {
+    # Base Class for Protocols
+    'Protocol': ('pcapkit.protocols.protocol', 'Protocol'),
+
+    # Utility Classes for Protocols
+    'Raw': ('pcapkit.protocols.raw', 'Raw'),
+    'NoPayload': ('pcapkit.protocols.null', 'NoPayload'),
+    'Frame': ('pcapkit.protocols.pcap.frame', 'Frame'),
+    'Header': ('pcapkit.protocols.pcap.header', 'Header'),
+
+    # Protocol Numbers
+    'LINKTYPE': ('pcapkit.protocols.link.link', 'LINKTYPE'),
+    'ETHERTYPE': ('pcapkit.protocols.internet.internet', 'ETHERTYPE'),
+    'TP_PROTO': ('pcapkit.protocols.transport.transport', 'TP_PROTO'),
+
+    # Link Layer
+    'ARP': ('pcapkit.protocols.link.arp', 'ARP'),
+    'DRARP': ('pcapkit.protocols.link.rarp', 'RARP'),
+    'Ethernet': ('pcapkit.protocols.link.ethernet', 'Ethernet'),
+    'InARP': ('pcapkit.protocols.link.arp', 'ARP'),
+    'L2TP': ('pcapkit.protocols.link.l2tp', 'L2TP'),
+    'OSPF': ('pcapkit.protocols.link.ospf', 'OSPF'),
+    'RARP': ('pcapkit.protocols.link.rarp', 'RARP'),
+    'VLAN': ('pcapkit.protocols.link.vlan', 'VLAN'),
+
+    # Internet Layer
+    'AH': ('pcapkit.protocols.internet.ah', 'AH'),
+    'IPv4': ('pcapkit.protocols.internet.ipv4', 'IPv4'),
+    'IPv6': ('pcapkit.protocols.internet.ipv6', 'IPv6'),
+    'IPX': ('pcapkit.protocols.internet.ipx', 'IPX'),
+
+    # IPv6 Extension Header
+    'HIP': ('pcapkit.protocols.internet.hip', 'HIP'),
+    'HOPOPT': ('pcapkit.protocols.internet.hopopt', 'HOPOPT'),
+    'IPv6_Frag': ('pcapkit.protocols.internet.ipv6_frag', 'IPv6_Frag'),
+    'IPv6_Opts': ('pcapkit.protocols.internet.ipv6_opts', 'IPv6_Opts'),
+    'IPv6_Route': ('pcapkit.protocols.internet.ipv6_route', 'IPv6_Route'),
+    'MH': ('pcapkit.protocols.internet.mh', 'MH'),
+
+    # Transport Layer
+    'TCP': ('pcapkit.protocols.transport.tcp', 'TCP'),
+    'UDP': ('pcapkit.protocols.transport.udp', 'UDP'),
+
+    # Application Layer
+    'DNS': ('pcapkit.protocols.application.dns', 'DNS'),
+    'FTP': ('pcapkit.protocols.application.ftp', 'FTP'),
+    'HTTPv1': ('pcapkit.protocols.application.httpv1', 'HTTPv1'),
+    'HTTPv2': ('pcapkit.protocols.application.httpv2', 'HTTPv2'),
+    'TLS': ('pcapkit.protocols.application.tls', 'TLS'),
+
+    # Deprecated / Base Protocols
+    'IP': ('pcapkit.protocols.internet.ip', 'IP'),
+    'IPsec': ('pcapkit.protocols.internet.ipsec', 'IPsec'),
+    'HTTP': ('pcapkit.protocols.application.http', 'HTTP'),
+
+    # Submodules
+    'application': ('pcapkit.protocols.application', None),
+    'internet': ('pcapkit.protocols.internet', None),
+    'link': ('pcapkit.protocols.link', None),
+    'null': ('pcapkit.protocols.null', None),
+    'pcap': ('pcapkit.protocols.pcap', None),
+    'protocol': ('pcapkit.protocols.protocol', None),
+    'raw': ('pcapkit.protocols.raw', None),
+    'transport': ('pcapkit.protocols.transport', None),
+})
@@ -6,18 +6,24 @@ protocols in application layer, with detailed
 implementation and methods.
 
 """
-# TODO: Implements BGP, DHCP, DNS, IMAP, IDAP, MQTT, NNTP, NTP,
-#       ONC:RPC, POP, RIP, RTP, SIP, SMTP, SNMP, SSH, SSL, TELNET, TLS, XMPP.
+# TODO: Implements BGP, DHCP, IMAP, IDAP, MQTT, NNTP, NTP,
+#       ONC:RPC, POP, RIP, RTP, SIP, SMTP, SNMP, SSH, SSL, TELNET, XMPP.
 
-# Base Class for Internet Layer
-from pcapkit.protocols.application.application import Application
+from pcapkit.utilities.compat import lazy_import
 
-# Utility Classes for Protocols
-from pcapkit.protocols.application.ftp import FTP
-from pcapkit.protocols.application.httpv1 import HTTPv1
-from pcapkit.protocols.application.httpv2 import HTTPv2
+__all__ = ['DNS', 'FTP', 'HTTPv1', 'HTTPv2', 'TLS']
 
-# Deprecated / Base Classes
-from pcapkit.protocols.application.http import HTTP
+__getattr__, __dir__ = lazy_import(__name__, {
+    # Base Class for Application Layer
+    'Application': ('pcapkit.protocols.application.application', 'Application'),
 
-__all__ = ['FTP', 'HTTPv1', 'HTTPv2']
+    # Utility Classes for Protocols
+    'DNS': ('pcapkit.protocols.application.dns', 'DNS'),
+    'FTP': ('pcapkit.protocols.application.ftp', 'FTP'),
+    'HTTPv1': ('pcapkit.protocols.application.httpv1', 'HTTPv1'),
+    'HTTPv2': ('pcapkit.protocols.application.httpv2', 'HTTPv2'),
+    'TLS': ('pcapkit.protocols.application.tls', 'TLS'),
+
+    # Deprecated / Base Classes
+    'HTTP': ('pcapkit.protocols.application.http', 'HTTP'),
+})
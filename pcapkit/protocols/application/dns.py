@@ -0,0 +1,507 @@
+# -*- coding: utf-8 -*-
+"""domain name system
+
+:mod:`pcapkit.protocols.application.dns` contains
+:class:`~pcapkit.protocols.application.dns.DNS`
+only, which implements extractor for Domain Name
+System (DNS) [*]_ messages, whose header structure
+is described as below:
+
+======= ========= ===================== ==========================
+Octets      Bits        Name                    Description
+======= ========= ===================== ==========================
+  0           0   ``dns.id``                  Identifier
+  2          16   ``dns.flags.qr``            Query / Response Flag
+  2          17   ``dns.flags.opcode``        Operation Code
+  2          21   ``dns.flags.aa``            Authoritative Answer
+  2          22   ``dns.flags.tc``            Truncation Flag
+  2          23   ``dns.flags.rd``            Recursion Desired
+  3          24   ``dns.flags.ra``            Recursion Available
+  3          25   ``dns.flags.z``             Reserved
+  3          26   ``dns.flags.ad``            Authentic Data
+  3          27   ``dns.flags.cd``            Checking Disabled
+  3          28   ``dns.flags.rcode``         Response Code
+  4          32   ``dns.qdcount``             Question Count
+  6          48   ``dns.ancount``             Answer Count
+  8          64   ``dns.nscount``             Authority Count
+  10         80   ``dns.arcount``             Additional Count
+======= ========= ===================== ==========================
+
+Over TCP, each message is prefixed with a two-octet length field
+[:rfc:`1035#section-4.2.2`].
+
+Compressed domain names [:rfc:`1035#section-4.1.4`] are decoded
+through a per-message cache of names at label offsets, so that
+each compression pointer is resolved at most once; decoded names
+are further shared across messages through a least recently used
+cache of interned names (c.f. :data:`~pcapkit.protocols.application.dns.NAME_CACHE_SIZE`).
+
+.. [*] https://en.wikipedia.org/wiki/Domain_Name_System
+
+"""
+import collections
+import ipaddress
+import struct
+import sys
+import threading
+
+from pcapkit.const.dns.opcode import Opcode as _OPCODE
+from pcapkit.const.dns.rcode import RCode as _RCODE
+from pcapkit.const.dns.rr_class import RRClass as _RR_CLASS
+from pcapkit.const.dns.rr_type import RRType as _RR_TYPE
+from pcapkit.corekit.infoclass import Info
+from pcapkit.protocols.application.application import Application
+from pcapkit.utilities.exceptions import ProtocolError
+
+__all__ = ['DNS']
+
+#: int: Maximum number of names in the interned name cache.
+NAME_CACHE_SIZE = 4096
+
+#: OrderedDict[Tuple[bytes, str], Tuple[str]]: Interned name cache, as mapping
+#: from wire-format labels and decoded suffix (the name the labels are
+#: terminated by) to decoded names at each label (in least recently used order).
+_NAME_CACHE = collections.OrderedDict()
+#: threading.Lock: Lock of the interned name cache.
+_NAME_LOCK = threading.Lock()
+
+#: Precompiled structures of DNS fields.
+_HEADER = struct.Struct('!6H')
+_QUESTION = struct.Struct('!2H')
+_RECORD = struct.Struct('!2HIH')
+
+
+class DNS(Application):
+    """This class implements Domain Name System."""
+
+    ##########################################################################
+    # Properties.
+    ##########################################################################
+
+    @property
+    def name(self):
+        """Name of current protocol.
+
+        :rtype: Literal['Domain Name System']
+        """
+        return 'Domain Name System'
+
+    @property
+    def length(self):
+        """Header length of current protocol.
+
+        :rtype: int
+        """
+        return self._info.length  # pylint: disable=E1101
+
+    ##########################################################################
+    # Methods.
+    ##########################################################################
+
+    def read(self, length=None, **kwargs):  # pylint: disable=unused-argument
+        """Read Domain Name System (DNS).
+
+        Structure of DNS message [:rfc:`1035`]::
+
+            +---------------------+
+            |        Header       |
+            +---------------------+
+            |       Question      | the question for the name server
+            +---------------------+
+            |        Answer       | RRs answering the question
+            +---------------------+
+            |      Authority      | RRs pointing toward an authority
+            +---------------------+
+            |      Additional     | RRs holding additional information
+            +---------------------+
+
+        Args:
+            length (Optional[int]): Length of packet data.
+
+        Keyword Args:
+            **kwargs: Arbitrary keyword arguments.
+
+        Returns:
+            DataType_DNS: Parsed packet data.
+
+        Raises:
+            ProtocolError: If the packet is malformed.
+
+        """
+        if length is None:
+            length = len(self)
+        data = self._read_fileng(length)
+
+        # message length prefix over TCP
+        if self._exflow is None:
+            stream = len(data) >= 14 and int.from_bytes(data[:2], 'big') == len(data) - 2
+        else:
+            stream = self._exflow[0] == 'TCP'
+
+        if stream:
+            _mlen = int.from_bytes(data[:2], 'big')
+            if len(data) - 2 < _mlen:
+                raise ProtocolError('DNS: truncated message', quiet=True)
+            data = data[2:2+_mlen]
+        if len(data) < 12:
+            raise ProtocolError('DNS: invalid format', quiet=True)
+
+        _iden, _flag, _qdct, _anct, _nsct, _arct = _HEADER.unpack_from(data)
+        if _flag & 0x0040:
+            raise ProtocolError('DNS: [Z] invalid format', quiet=True)
+
+        cache = dict()
+        offset = 12
+        questions = list()
+        for _ in range(_qdct):
+            name, offset = self._read_dns_name(data, offset, cache)
+            if offset + 4 > len(data):
+                raise ProtocolError('DNS: truncated question', quiet=True)
+            _type, _clss = _QUESTION.unpack_from(data, offset)
+            offset += 4
+            questions.append(Info({
+                'name': name or '.',
+                'type': _RR_TYPE.get(_type),
+                'class': _RR_CLASS.get(_clss),
+            }))
+
+        answers, offset = self._read_dns_records(data, offset, _anct, cache)
+        authorities, offset = self._read_dns_records(data, offset, _nsct, cache)
+        additionals, offset = self._read_dns_records(data, offset, _arct, cache)
+
+        # no trailing data allowed after the last record
+        if offset != len(data):
+            raise ProtocolError('DNS: invalid format', quiet=True)
+
+        dns = dict(
+            length=14 if stream else 12,
+            id=_iden,
+            flags=dict(
+                qr=bool(_flag & 0x8000),
+                opcode=_OPCODE.get((_flag >> 11) & 0xF),
+                aa=bool(_flag & 0x0400),
+                tc=bool(_flag & 0x0200),
+                rd=bool(_flag & 0x0100),
+                ra=bool(_flag & 0x0080),
+                z=False,
+                ad=bool(_flag & 0x0020),
+                cd=bool(_flag & 0x0010),
+                rcode=_RCODE.get(_flag & 0xF),
+            ),
+            qdcount=_qdct,
+            ancount=_anct,
+            nscount=_nsct,
+            arcount=_arct,
+            questions=tuple(questions),
+            answers=tuple(answers),
+            authorities=tuple(authorities),
+            additionals=tuple(additionals),
+        )
+
+        return dns
+
+    def make(self, **kwargs):
+        """Make (construct) packet data.
+
+        Keyword Args:
+            **kwargs: Arbitrary keyword arguments.
+
+        Returns:
+            bytes: Constructed packet data.
+
+        """
+        raise NotImplementedError
+
+    ##########################################################################
+    # Data models.
+    ##########################################################################
+
+    def __length_hint__(self):
+        """Total length of corresponding protocol.
+
+        :rtype: Literal[12]
+        """
+        return 12
+
+    ##########################################################################
+    # Utilities.
+    ##########################################################################
+
+    @staticmethod
+    def _read_dns_name(data, offset, cache):
+        """Read a (compressed) domain name.
+
+        Args:
+            data (bytes): DNS message
+            offset (int): offset of the name
+            cache (Dict[int, str]): per-message cache of names at label offsets
+
+        Returns:
+            Tuple[str, int]: Decoded name (empty for the root) and offset next to the name.
+
+        Raises:
+            ProtocolError: If the name is truncated or malformed.
+
+        Notes:
+            Compression pointers must point strictly backwards to a prior occurrence
+            of the name suffix, which guarantees termination on malicious messages.
+
+        """
+        size = len(data)
+        starts = list()
+        chunks = list()
+        suffix = ''
+        end = None
+
+        limit = start = pos = offset
+        while True:
+            if pos >= size:
+                raise ProtocolError('DNS: truncated name', quiet=True)
+            _llen = data[pos]
+
+            if _llen == 0:                  # root
+                chunks.append(data[start:pos])
+                if end is None:
+                    end = pos + 1
+                break
+
+            if _llen >= 0xC0:               # pointer
+                if pos + 1 >= size:
+                    raise ProtocolError('DNS: truncated name', quiet=True)
+                _ptr = ((_llen & 0x3F) << 8) | data[pos+1]
+                if _ptr >= limit:
+                    raise ProtocolError('DNS: invalid compression pointer', quiet=True)
+
+                chunks.append(data[start:pos])
+                if end is None:
+                    end = pos + 2
+
+                name = cache.get(_ptr)
+                if name is not None:
+                    suffix = name
+                    break
+                limit = start = pos = _ptr
+                continue
+
+            if _llen > 63:
+                raise ProtocolError('DNS: invalid label type', quiet=True)
+            starts.append(pos)
+            pos += 1 + _llen
+
+        if not starts:
+            return suffix, end
+
+        key = (b''.join(chunks) if len(chunks) > 1 else chunks[0], suffix)
+        with _NAME_LOCK:
+            names = _NAME_CACHE.get(key)
+            if names is None:
+                temp = list()
+                name = suffix
+                for pos in reversed(starts):
+                    label = data[pos+1:pos+1+data[pos]].decode('ascii', 'backslashreplace')
+                    name = sys.intern(f'{label}.{name}' if name else label)
+                    temp.append(name)
+                names = _NAME_CACHE[key] = tuple(reversed(temp))
+                if len(_NAME_CACHE) > NAME_CACHE_SIZE:
+                    _NAME_CACHE.popitem(last=False)
+            else:
+                _NAME_CACHE.move_to_end(key)
+
+        cache.update(zip(starts, names))
+        return names[0], end
+
+    def _read_dns_records(self, data, offset, count, cache):
+        """Read DNS resource records.
+
+        Structure of DNS resource record [:rfc:`1035`]::
+
+                                            1  1  1  1  1  1
+              0  1  2  3  4  5  6  7  8  9  0  1  2  3  4  5
+            +--+--+--+--+--+--+--+--+--+--+--+--+--+--+--+--+
+            |                                               |
+            /                                               /
+            /                      NAME                     /
+            |                                               |
+            +--+--+--+--+--+--+--+--+--+--+--+--+--+--+--+--+
+            |                      TYPE                     |
+            +--+--+--+--+--+--+--+--+--+--+--+--+--+--+--+--+
+            |                     CLASS                     |
+            +--+--+--+--+--+--+--+--+--+--+--+--+--+--+--+--+
+            |                      TTL                      |
+            |                                               |
+            +--+--+--+--+--+--+--+--+--+--+--+--+--+--+--+--+
+            |                   RDLENGTH                    |
+            +--+--+--+--+--+--+--+--+--+--+--+--+--+--+--+--|
+            /                     RDATA                     /
+            /                                               /
+            +--+--+--+--+--+--+--+--+--+--+--+--+--+--+--+--+
+
+        Args:
+            data (bytes): DNS message
+            offset (int): offset of the first record
+            count (int): number of records
+            cache (Dict[int, str]): per-message cache of names at label offsets
+
+        Returns:
+            Tuple[List[DataType_DNS_RR], int]: Parsed resource records and offset
+            next to the last record.
+
+        Raises:
+            ProtocolError: If the records are truncated or malformed.
+
+        """
+        records = list()
+        for _ in range(count):
+            name, offset = self._read_dns_name(data, offset, cache)
+            if offset + 10 > len(data):
+                raise ProtocolError('DNS: truncated record', quiet=True)
+            _type, _clss, _ttl, _rlen = _RECORD.unpack_from(data, offset)
+            offset += 10
+
+            stop = offset + _rlen
+            if stop > len(data):
+                raise ProtocolError('DNS: truncated record', quiet=True)
+
+            if _type == 41:     # OPT, with CLASS as requestor's UDP payload size
+                rdata = self._read_dns_opt(data, offset, stop, _ttl)
+                _ttl = None
+            else:
+                rdata = self._read_dns_rdata(data, offset, stop, _type, cache)
+                _clss = _RR_CLASS.get(_clss)
+
+            records.append(Info({
+                'name': name or '.',
+                'type': _RR_TYPE.get(_type),
+                'class': _clss,
+                'ttl': _ttl,
+                'length': _rlen,
+                'rdata': rdata,
+            }))
+            offset = stop
+        return records, offset
+
+    def _read_dns_rdata(self, data, offset, stop, rtype, cache):
+        """Read DNS record data.
+
+        Args:
+            data (bytes): DNS message
+            offset (int): offset of record data
+            stop (int): offset next to record data
+            rtype (int): record type
+            cache (Dict[int, str]): per-message cache of names at label offsets
+
+        Returns:
+            Any: Parsed record data, c.f. :class:`DataType_DNS_RR`; or raw
+            :obj:`bytes` for record types not supported.
+
+        Raises:
+            ProtocolError: If the record data is malformed.
+
+        """
+        size = stop - offset
+        try:
+            if rtype == 1 and size == 4:            # A
+                return ipaddress.IPv4Address(data[offset:stop])
+            if rtype == 28 and size == 16:          # AAAA
+                return ipaddress.IPv6Address(data[offset:stop])
+            if rtype in (2, 5, 12, 39):             # NS, CNAME, PTR, DNAME
+                name, end = self._read_dns_name(data, offset, cache)
+                if end != stop:
+                    raise ProtocolError('DNS: invalid record data', quiet=True)
+                return name or '.'
+            if rtype == 15:                         # MX
+                name, end = self._read_dns_name(data, offset + 2, cache)
+                if end != stop:
+                    raise ProtocolError('DNS: invalid record data', quiet=True)
+                return Info(
+                    preference=int.from_bytes(data[offset:offset+2], 'big'),
+                    exchange=name or '.',
+                )
+            if rtype == 6:                          # SOA
+                mname, end = self._read_dns_name(data, offset, cache)
+                rname, end = self._read_dns_name(data, end, cache)
+                if end + 20 != stop:
+                    raise ProtocolError('DNS: invalid record data', quiet=True)
+                serial, refresh, retry, expire, minimum = struct.unpack_from('!5I', data, end)
+                return Info(
+                    mname=mname or '.',
+                    rname=rname or '.',
+                    serial=serial,
+                    refresh=refresh,
+                    retry=retry,
+                    expire=expire,
+                    minimum=minimum,
+                )
+            if rtype == 33:                         # SRV
+                name, end = self._read_dns_name(data, offset + 6, cache)
+                if end != stop:
+                    raise ProtocolError('DNS: invalid record data', quiet=True)
+                priority, weight, port = struct.unpack_from('!3H', data, offset)
+                return Info(
+                    priority=priority,
+                    weight=weight,
+                    port=port,
+                    target=name or '.',
+                )
+            if rtype == 16:                         # TXT
+                text = list()
+                while offset < stop:
+                    _tlen = data[offset]
+                    if offset + 1 + _tlen > stop:
+                        raise ProtocolError('DNS: invalid record data', quiet=True)
+                    text.append(data[offset+1:offset+1+_tlen])
+                    offset += 1 + _tlen
+                return tuple(text)
+        except struct.error:
+            raise ProtocolError('DNS: invalid record data', quiet=True) from None
+        return data[offset:stop]
+
+    @staticmethod
+    def _read_dns_opt(data, offset, stop, ttl):
+        """Read DNS ``OPT`` pseudo-record data.
+
+        Structure of ``OPT`` record data [:rfc:`6891`]::
+
+                        +0 (MSB)                            +1 (LSB)
+             +---+---+---+---+---+---+---+---+---+---+---+---+---+---+---+---+
+          0: |                          OPTION-CODE                          |
+             +---+---+---+---+---+---+---+---+---+---+---+---+---+---+---+---+
+          2: |                         OPTION-LENGTH                         |
+             +---+---+---+---+---+---+---+---+---+---+---+---+---+---+---+---+
+          4: |                                                               |
+             /                          OPTION-DATA                          /
+             /                                                               /
+             +---+---+---+---+---+---+---+---+---+---+---+---+---+---+---+---+
+
+        Args:
+            data (bytes): DNS message
+            offset (int): offset of record data
+            stop (int): offset next to record data
+            ttl (int): TTL field of the record, i.e. extended RCODE and flags
+
+        Returns:
+            DataType_DNS_OPT: Parsed record data.
+
+        Raises:
+            ProtocolError: If the record data is malformed.
+
+        """
+        options = list()
+        while offset < stop:
+            if offset + 4 > stop:
+                raise ProtocolError('DNS: invalid record data', quiet=True)
+            _code, _olen = struct.unpack_from('!2H', data, offset)
+            if offset + 4 + _olen > stop:
+                raise ProtocolError('DNS: invalid record data', quiet=True)
+            options.append(Info(
+                code=_code,
+                data=data[offset+4:offset+4+_olen],
+            ))
+            offset += 4 + _olen
+
+        return Info(
+            ext_rcode=ttl >> 24,
+            version=(ttl >> 16) & 0xFF,
+            do=bool(ttl & 0x8000),
+            options=tuple(options),
+        )
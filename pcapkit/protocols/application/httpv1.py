@@ -36,12 +36,12 @@ HTTP_METHODS = [
     'CONNECT', 'PATCH',
 ]
 
-#: Regular expression to match HTTP methods.
-_RE_METHOD = re.compile(r'|'.join(HTTP_METHODS).encode())
+#: Tuple[bytes]: Leading bytes of HTTP start line, i.e. HTTP methods and version string.
+_HTTP_START = tuple(method.encode() for method in HTTP_METHODS) + (b'HTTP/',)
 #: Regular expression to match HTTP version string.
 _RE_VERSION = re.compile(rb"HTTP/(?P<version>\d\.\d)")
-#: Regular expression to match HTTP status code.
-_RE_STATUS = re.compile(rb'\d{3}')
+#: Regular expression to split HTTP start line.
+_RE_SPACE = re.compile(rb'\s+')
 
 
 class HTTPv1(HTTP):
@@ -98,9 +98,11 @@ class HTTPv1(HTTP):
             length = len(self)
 
         packet = self._file.read(length)
-        try:
-            header, body = packet.split(b'\r\n\r\n', maxsplit=1)
-        except ValueError:
+        if not packet.startswith(_HTTP_START):
+            raise ProtocolError('HTTP: invalid format', quiet=True)
+
+        header, sep, body = packet.partition(b'\r\n\r\n')
+        if not sep:
             raise ProtocolError('HTTP: invalid format', quiet=True)
 
         header_unpacked, http_receipt = self._read_http_header(header)
@@ -166,52 +168,56 @@ class HTTPv1(HTTP):
             ProtocolError: If the packet is malformed.
 
         """
+        startline, sep, headerfield = header.partition(b'\r\n')
+        if not sep:
+            raise ProtocolError('HTTP: invalid format', quiet=True)
+
         try:
-            startline, headerfield = header.split(b'\r\n', 1)
-            para1, para2, para3 = re.split(rb'\s+', startline, 2)
-            fields = headerfield.split(b'\r\n')
-            lists = (re.split(rb'\s*:\s*', field, 1) for field in fields)
+            para1, para2, para3 = _RE_SPACE.split(startline, 2)
         except ValueError:
             raise ProtocolError('HTTP: invalid format', quiet=True)
 
-        match1 = re.match(_RE_METHOD, para1)
-        match2 = re.match(_RE_VERSION, para3)
-        match3 = re.match(_RE_VERSION, para1)
-        match4 = re.match(_RE_STATUS, para2)
-        if match1 and match2:
-            receipt = 'request'
-            header = dict(
-                request=dict(
-                    method=self.decode(para1),
-                    target=self.decode(para2),
-                    version=self.decode(match2.group('version')),
-                ),
-            )
-        elif match3 and match4:
+        if para1.startswith(b'HTTP/'):
+            match = _RE_VERSION.match(para1)
+            if match is None or not para2[:3].isdigit() or len(para2) < 3:
+                raise ProtocolError('HTTP: invalid format', quiet=True)
+
             receipt = 'response'
             header = dict(
                 response=dict(
-                    version=self.decode(match3.group('version')),
+                    version=self._decode_text(match.group('version')),
                     status=int(para2),
-                    phrase=self.decode(para3),
+                    phrase=self._decode_text(para3),
                 ),
             )
         else:
-            raise ProtocolError('HTTP: invalid format', quiet=True)
+            match = _RE_VERSION.match(para3)
+            if match is None:
+                raise ProtocolError('HTTP: invalid format', quiet=True)
 
-        try:
-            for item in lists:
-                key = self.decode(item[0].strip()).replace(receipt, f'{receipt}_field')
-                value = self.decode(item[1].strip())
-                if key in header:
-                    if isinstance(header[key], tuple):
-                        header[key] += (value,)
-                    else:
-                        header[key] = (header[key], value)
+            receipt = 'request'
+            header = dict(
+                request=dict(
+                    method=self._decode_text(para1),
+                    target=self._decode_text(para2),
+                    version=self._decode_text(match.group('version')),
+                ),
+            )
+
+        for field in headerfield.split(b'\r\n'):
+            name, sep, value = field.partition(b':')
+            if not sep:
+                raise ProtocolError('HTTP: invalid format', quiet=True)
+
+            key = self._decode_text(name.strip()).replace(receipt, f'{receipt}_field')
+            value = self._decode_text(value.strip())
+            if key in header:
+                if isinstance(header[key], tuple):
+                    header[key] += (value,)
                 else:
-                    header[key] = value
-        except IndexError:
-            raise ProtocolError('HTTP: invalid format', quiet=True)
+                    header[key] = (header[key], value)
+            else:
+                header[key] = value
 
         return header, receipt
 
@@ -105,19 +105,19 @@ class HTTPv2(HTTP):
 
         _tlen = self._read_unpack(3)
         _type = self._read_unpack(1)
-        _flag = self._read_binary(1)
-        _rsid = self._read_binary(4)
+        _flag = self._read_bits(1)
+        _rsid = self._read_bits(4)
 
         if _tlen != length:
             raise ProtocolError(f'HTTP/2: [Type {_type}] invalid format', quiet=True)
 
-        if int(_rsid[0], base=2):
+        if _rsid & 0x80000000:
             raise ProtocolError(f'HTTP/2: [Type {_type}] invalid format', quiet=True)
 
         http = dict(
             length=_tlen,
             type=_HTTP_TYPE.get(_type),
-            sid=int(_rsid[1:], base=2),
+            sid=_rsid & 0x7FFFFFFF,
             packet=self._read_packet(_tlen),
         )
 
@@ -175,7 +175,7 @@ class HTTPv2(HTTP):
         Args:
             size (int): length of packet data
             kind (int): packet type
-            flag (str): packet flags (8 bits)
+            flag (int): packet flags (8 bits)
 
         Returns:
             DataType_HTTPv2_Unassigned: Parsed packet data.
@@ -184,7 +184,7 @@ class HTTPv2(HTTP):
             ProtocolError: If the packet is malformed.
 
         """
-        if any((int(bit, base=2) for bit in flag)):
+        if flag:
             raise ProtocolError(f'HTTP/2: [Type {kind}] invalid format', quiet=True)
 
         data = dict(
@@ -216,7 +216,7 @@ class HTTPv2(HTTP):
         Args:
             size (int): length of packet data
             kind (int): packet type
-            flag (str): packet flags (8 bits)
+            flag (int): packet flags (8 bits)
 
         Returns:
             DataType_HTTPv2_DATA: Parsed packet data.
@@ -230,7 +230,8 @@ class HTTPv2(HTTP):
             END_STREAM=False,   # bit 0
             PADDED=False,       # bit 3
         )
-        for index, bit in enumerate(flag):
+        for index in range(8):
+            bit = flag >> index & 0x1
             if index == 0 and bit:
                 _flag['END_STREAM'] = True
             elif index == 3 and bit:
@@ -253,8 +254,8 @@ class HTTPv2(HTTP):
 
         _data = self._read_fileng(_dlen)
 
-        padding = self._read_binary(_plen)
-        if any((int(bit, base=2) for bit in padding)):
+        padding = self._read_bits(_plen)
+        if padding:
             raise ProtocolError(f'HTTP/2: [Type {kind}] invalid format', quiet=True)
 
         data = dict(
@@ -292,7 +293,7 @@ class HTTPv2(HTTP):
         Args:
             size (int): length of packet data
             kind (int): packet type
-            flag (str): packet flags (8 bits)
+            flag (int): packet flags (8 bits)
 
         Returns:
             DataType_HTTPv2_HEADERS: Parsed packet data.
@@ -309,7 +310,8 @@ class HTTPv2(HTTP):
             PADDED=False,           # bit 3
             PRIORITY=False,         # bit 5
         )
-        for index, bit in enumerate(flag):
+        for index in range(8):
+            bit = flag >> index & 0x1
             if index == 0 and bit:
                 _flag['END_STREAM'] = True
             elif index == 2 and bit:
@@ -319,7 +321,7 @@ class HTTPv2(HTTP):
                 _plen = self._read_unpack(1)
             elif index == 5 and bit:
                 _flag['PRIORITY'] = True
-                _edep = self._read_binary(4)
+                _edep = self._read_bits(4)
                 _wght = self._read_unpack(1)
                 _elen = 5
             elif bit:
@@ -336,8 +338,8 @@ class HTTPv2(HTTP):
 
         _frag = self._read_fileng(_dlen) or None
 
-        padding = self._read_binary(_plen)
-        if any((int(bit, base=2) for bit in padding)):
+        padding = self._read_bits(_plen)
+        if padding:
             raise ProtocolError(f'HTTP/2: [Type {kind}] invalid format', quiet=True)
 
         data = dict(
@@ -347,8 +349,8 @@ class HTTPv2(HTTP):
         if _flag['PADDED']:
             data['pad_len'] = _plen
         if _flag['PRIORITY']:
-            data['exclusive'] = bool(int(_edep[0], base=2))
-            data['deps'] = int(_edep[1:], base=2)
+            data['exclusive'] = bool(_edep & 0x80000000)
+            data['deps'] = _edep & 0x7FFFFFFF
             data['weight'] = _wght + 1
 
         return data
@@ -373,7 +375,7 @@ class HTTPv2(HTTP):
         Args:
             size (int): length of packet data
             kind (int): packet type
-            flag (str): packet flags (8 bits)
+            flag (int): packet flags (8 bits)
 
         Returns:
             DataType_HTTPv2_PRIORITY: Parsed packet data.
@@ -384,16 +386,16 @@ class HTTPv2(HTTP):
         """
         if size != 9:
             raise ProtocolError(f'HTTP/2: [Type {kind}] invalid format', quiet=True)
-        if any((int(bit, base=2) for bit in flag)):
+        if flag:
             raise ProtocolError(f'HTTP/2: [Type {kind}] invalid format', quiet=True)
 
-        _edep = self._read_binary(4)
+        _edep = self._read_bits(4)
         _wght = self._read_unpack(1)
 
         data = dict(
             flags=None,
-            exclusive=bool(int(_edep[0], base=2)),
-            deps=int(_edep[1:], base=2),
+            exclusive=bool(_edep & 0x80000000),
+            deps=_edep & 0x7FFFFFFF,
             weight=_wght + 1,
         )
 
@@ -417,7 +419,7 @@ class HTTPv2(HTTP):
         Args:
             size (int): length of packet data
             kind (int): packet type
-            flag (str): packet flags (8 bits)
+            flag (int): packet flags (8 bits)
 
         Returns:
             DataType_HTTPv2_RST_STREAM: Parsed packet data.
@@ -428,7 +430,7 @@ class HTTPv2(HTTP):
         """
         if size != 8:
             raise ProtocolError(f'HTTP/2: [Type {kind}] invalid format', quiet=True)
-        if any((int(bit, base=2) for bit in flag)):
+        if flag:
             raise ProtocolError(f'HTTP/2: [Type {kind}] invalid format', quiet=True)
 
         _code = self._read_unpack(4)
@@ -461,7 +463,7 @@ class HTTPv2(HTTP):
         Args:
             size (int): length of packet data
             kind (int): packet type
-            flag (str): packet flags (8 bits)
+            flag (int): packet flags (8 bits)
 
         Returns:
             DataType_HTTPv2_SETTINGS: Parsed packet data.
@@ -476,7 +478,8 @@ class HTTPv2(HTTP):
         _flag = dict(
             ACK=False,      # bit 0
         )
-        for index, bit in enumerate(flag):
+        for index in range(8):
+            bit = flag >> index & 0x1
             if index == 0 and bit:
                 _flag['ACK'] = True
             elif bit:
@@ -537,7 +540,7 @@ class HTTPv2(HTTP):
         Args:
             size (int): length of packet data
             kind (int): packet type
-            flag (str): packet flags (8 bits)
+            flag (int): packet flags (8 bits)
 
         Returns:
             DataType_HTTPv2_PUSH_PROMISE: Parsed packet data.
@@ -554,7 +557,8 @@ class HTTPv2(HTTP):
             END_HEADERS=False,      # bit 2
             PADDED=False,           # bit 3
         )
-        for index, bit in enumerate(flag):
+        for index in range(8):
+            bit = flag >> index & 0x1
             if index == 2 and bit:
                 _flag['END_HEADERS'] = True
             elif index == 3 and bit:
@@ -572,19 +576,19 @@ class HTTPv2(HTTP):
         if _dlen < 0:
             raise ProtocolError(f'HTTP/2: [Type {kind}] invalid format', quiet=True)
 
-        _rpid = self._read_binary(4)
+        _rpid = self._read_bits(4)
         _frag = self._read_fileng(_dlen) or None
 
-        if int(_rpid[0], base=2):
+        if _rpid & 0x80000000:
             raise ProtocolError(f'HTTP/2: [Type {kind}] invalid format', quiet=True)
 
-        padding = self._read_binary(_plen)
-        if any((int(bit, base=2) for bit in padding)):
+        padding = self._read_bits(_plen)
+        if padding:
             raise ProtocolError(f'HTTP/2: [Type {kind}] invalid format', quiet=True)
 
         data = dict(
             flags=_flag,
-            pid=int(_rpid[1:], base=2),
+            pid=_rpid & 0x7FFFFFFF,
             frag=_frag,
         )
         if _flag['PADDED']:
@@ -612,7 +616,7 @@ class HTTPv2(HTTP):
         Args:
             size (int): length of packet data
             kind (int): packet type
-            flag (str): packet flags (8 bits)
+            flag (int): packet flags (8 bits)
 
         Returns:
             DataType_HTTPv2_PING: Parsed packet data.
@@ -627,7 +631,8 @@ class HTTPv2(HTTP):
         _flag = dict(
             ACK=False,      # bit 0
         )
-        for index, bit in enumerate(flag):
+        for index in range(8):
+            bit = flag >> index & 0x1
             if index == 0 and bit:
                 _flag['ACK'] = True
             elif bit:
@@ -666,7 +671,7 @@ class HTTPv2(HTTP):
         Args:
             size (int): length of packet data
             kind (int): packet type
-            flag (str): packet flags (8 bits)
+            flag (int): packet flags (8 bits)
 
         Returns:
             DataType_HTTPv2_GOAWAY: Parsed packet data.
@@ -678,19 +683,19 @@ class HTTPv2(HTTP):
         _dlen = size - 8
         if _dlen < 0:
             raise ProtocolError(f'HTTP/2: [Type {kind}] invalid format', quiet=True)
-        if any((int(bit, base=2) for bit in flag)):
+        if flag:
             raise ProtocolError(f'HTTP/2: [Type {kind}] invalid format', quiet=True)
 
-        _rsid = self._read_binary(4)
+        _rsid = self._read_bits(4)
         _code = self._read_unpack(4)
         _data = self._read_fileng(_dlen) or None
 
-        if int(_rsid[0], base=2):
+        if _rsid & 0x80000000:
             raise ProtocolError(f'HTTP/2: [Type {kind}] invalid format', quiet=True)
 
         data = dict(
             flags=None,
-            last_sid=int(_rsid[1:], base=2),
+            last_sid=_rsid & 0x7FFFFFFF,
             error=_ERROR_CODE.get(_code, _code),
             data=_data,
         )
@@ -715,7 +720,7 @@ class HTTPv2(HTTP):
         Args:
             size (int): length of packet data
             kind (int): packet type
-            flag (str): packet flags (8 bits)
+            flag (int): packet flags (8 bits)
 
         Returns:
             DataType_HTTPv2_WINDOW_UPDATE: Parsed packet data.
@@ -726,17 +731,17 @@ class HTTPv2(HTTP):
         """
         if size != 4:
             raise ProtocolError(f'HTTP/2: [Type {kind}] invalid format', quiet=True)
-        if any((int(bit, base=2) for bit in flag)):
+        if flag:
             raise ProtocolError(f'HTTP/2: [Type {kind}] invalid format', quiet=True)
 
-        _size = self._read_binary(4)
+        _size = self._read_bits(4)
 
-        if int(_size[0], base=2):
+        if _size & 0x80000000:
             raise ProtocolError(f'HTTP/2: [Type {kind}] invalid format', quiet=True)
 
         data = dict(
             flags=None,
-            window=int(_size[1:], base=2),
+            window=_size & 0x7FFFFFFF,
         )
 
         return data
@@ -759,7 +764,7 @@ class HTTPv2(HTTP):
         Args:
             size (int): length of packet data
             kind (int): packet type
-            flag (str): packet flags (8 bits)
+            flag (int): packet flags (8 bits)
 
         Returns:
             DataType_HTTPv2_CONTINUATION: Parsed packet data.
@@ -771,7 +776,8 @@ class HTTPv2(HTTP):
         _flag = dict(
             END_HEADERS=False,      # bit 2
         )
-        for index, bit in enumerate(flag):
+        for index in range(8):
+            bit = flag >> index & 0x1
             if index == 2 and bit:
                 _flag['END_HEADERS'] = True
             elif bit:
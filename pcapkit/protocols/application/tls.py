@@ -0,0 +1,487 @@
+# -*- coding: utf-8 -*-
+"""transport layer security
+
+:mod:`pcapkit.protocols.application.tls` contains
+:class:`~pcapkit.protocols.application.tls.TLS`
+only, which implements a header-only extractor for
+Transport Layer Security (TLS) [*]_ records, whose
+structure is described as below:
+
+======= ========= ===================== ==========================
+Octets      Bits        Name                    Description
+======= ========= ===================== ==========================
+  0           0   ``tls.type``                Content Type
+  1           8   ``tls.version``             Protocol Version
+  3          24   ``tls.length``              Length
+  5          40   ``tls.fragment``            Fragment
+======= ========= ===================== ==========================
+
+Only plaintext handshake messages are decoded, i.e. metadata
+of ``ClientHello`` and ``ServerHello`` messages (server name,
+ALPN, cipher suites and JA3/JA3S fingerprints); fragments of
+other records are skipped without being read.
+
+.. [*] https://en.wikipedia.org/wiki/Transport_Layer_Security
+
+"""
+import hashlib
+import os
+
+from pcapkit.const.tls.content_type import ContentType as _CONTENT_TYPE
+from pcapkit.const.tls.handshake_type import HandshakeType as _HANDSHAKE_TYPE
+from pcapkit.corekit.infoclass import Info
+from pcapkit.protocols.application.application import Application
+from pcapkit.utilities.exceptions import ProtocolError
+
+__all__ = ['TLS']
+
+#: Dict[int, str]: TLS protocol versions.
+TLS_VERSION = {
+    0x0300: 'SSL 3.0',
+    0x0301: 'TLS 1.0',
+    0x0302: 'TLS 1.1',
+    0x0303: 'TLS 1.2',
+    0x0304: 'TLS 1.3',
+}
+
+#: int: Maximum length of a record fragment [:rfc:`5246#section-6.2.3`].
+TLS_MAX_LENGTH = 2 ** 14 + 2048
+
+
+class TLS(Application):
+    """This class implements Transport Layer Security."""
+
+    ##########################################################################
+    # Properties.
+    ##########################################################################
+
+    @property
+    def name(self):
+        """Name of current protocol.
+
+        :rtype: Literal['Transport Layer Security']
+        """
+        return 'Transport Layer Security'
+
+    @property
+    def length(self):
+        """Header length of current protocol.
+
+        :rtype: Literal[5]
+        """
+        return 5
+
+    ##########################################################################
+    # Methods.
+    ##########################################################################
+
+    def read(self, length=None, **kwargs):  # pylint: disable=unused-argument
+        """Read Transport Layer Security (TLS).
+
+        Structure of TLS record [:rfc:`8446`]::
+
+            struct {
+                ContentType type;
+                ProtocolVersion legacy_record_version;
+                uint16 length;
+                opaque fragment[TLSPlaintext.length];
+            } TLSPlaintext;
+
+        Args:
+            length (Optional[int]): Length of packet data.
+
+        Keyword Args:
+            **kwargs: Arbitrary keyword arguments.
+
+        Returns:
+            DataType_TLS: Parsed packet data.
+
+        Raises:
+            ProtocolError: If the packet is malformed.
+
+        """
+        if length is None:
+            length = len(self)
+
+        if length < 5:
+            raise ProtocolError('TLS: invalid format', quiet=True)
+
+        records = list()
+        handshake = list()
+        encrypted = False   # ChangeCipherSpec seen
+
+        offset = 0
+        while length - offset >= 5:
+            _type = self._read_unpack(1)
+            _vers = self._read_unpack(2)
+            _tlen = self._read_unpack(2)
+
+            if not (20 <= _type <= 24 and _vers >> 8 == 3 and _vers & 0xFF <= 4 and _tlen <= TLS_MAX_LENGTH):
+                if records:     # trailing data, e.g. TCP segment boundary
+                    break
+                raise ProtocolError(f'TLS: [Type {_type}] invalid format', quiet=True)
+
+            _size = min(_tlen, length - offset - 5)
+            records.append(Info(
+                type=_CONTENT_TYPE.get(_type),
+                version=self._read_tls_version(_vers),
+                length=_tlen,
+                truncated=_size < _tlen,
+            ))
+
+            if _type == 22 and not encrypted:   # handshake
+                handshake.extend(self._read_tls_handshake(_size, _tlen))
+            else:
+                self._file.seek(_size, os.SEEK_CUR)
+                if _type == 20:     # change_cipher_spec
+                    encrypted = True
+            offset += 5 + _size
+
+        tls = dict(
+            records=tuple(records),
+            handshake=tuple(handshake),
+        )
+
+        return tls
+
+    def make(self, **kwargs):
+        """Make (construct) packet data.
+
+        Keyword Args:
+            **kwargs: Arbitrary keyword arguments.
+
+        Returns:
+            bytes: Constructed packet data.
+
+        """
+        raise NotImplementedError
+
+    ##########################################################################
+    # Data models.
+    ##########################################################################
+
+    def __length_hint__(self):
+        """Total length of corresponding protocol.
+
+        :rtype: Literal[5]
+        """
+        return 5
+
+    ##########################################################################
+    # Utilities.
+    ##########################################################################
+
+    @staticmethod
+    def _read_tls_version(version):
+        """Name a TLS protocol version.
+
+        Args:
+            version (int): protocol version
+
+        Returns:
+            str: Name of the version, e.g. ``'TLS 1.2'``; unknown (e.g. GREASE [:rfc:`8701`])
+            versions are given as hexadecimal strings.
+
+        """
+        return TLS_VERSION.get(version, f'0x{version:04x}')
+
+    @staticmethod
+    def _check_grease(value):
+        """Check if a value is reserved for GREASE [:rfc:`8701`].
+
+        Args:
+            value (int): 16-bit code point
+
+        Returns:
+            bool: If the value is a GREASE value, i.e. ``0x?A?A``.
+
+        """
+        return value & 0x0F0F == 0x0A0A and value >> 8 == value & 0xFF
+
+    def _read_tls_handshake(self, size, length):
+        """Read TLS handshake messages.
+
+        Structure of TLS handshake message [:rfc:`8446`]::
+
+            struct {
+                HandshakeType msg_type;    /* handshake type */
+                uint24 length;             /* remaining bytes in message */
+                select (Handshake.msg_type) { ... };
+            } Handshake;
+
+        Args:
+            size (int): length of record fragment available
+            length (int): length of record fragment as declared in the record header
+
+        Returns:
+            List[Union[DataType_TLS_Handshake, DataType_TLS_ClientHello, DataType_TLS_ServerHello]]:
+            Parsed handshake messages. Should the fragment be encrypted, i.e. the message
+            type is unassigned or the message length exceeds the fragment, the rest of the
+            fragment is discarded.
+
+        """
+        data = self._read_fileng(size)
+
+        handshake = list()
+        offset = 0
+        while len(data) - offset >= 4:
+            _type = data[offset]
+            _mlen = int.from_bytes(data[offset+1:offset+4], 'big')
+            if 4 + _mlen > length - offset:
+                break
+
+            kind = _HANDSHAKE_TYPE.get(_type)
+            if kind.name.startswith('Unassigned'):
+                break
+
+            _body = data[offset+4:offset+4+_mlen]
+            offset += 4 + _mlen
+
+            if _type == 1:      # client_hello
+                message = self._read_tls_client_hello(_body, _mlen)
+            elif _type == 2:    # server_hello
+                message = self._read_tls_server_hello(_body, _mlen)
+            else:
+                message = dict()
+            handshake.append(Info(
+                type=kind,
+                length=_mlen,
+                truncated=len(_body) < _mlen,
+                **message,
+            ))
+        return handshake
+
+    def _read_tls_client_hello(self, data, length):
+        """Read TLS ``ClientHello`` message.
+
+        Structure of ``ClientHello`` message [:rfc:`8446`]::
+
+            struct {
+                ProtocolVersion legacy_version = 0x0303;    /* TLS v1.2 */
+                Random random;
+                opaque legacy_session_id<0..32>;
+                CipherSuite cipher_suites<2..2^16-2>;
+                opaque legacy_compression_methods<1..2^8-1>;
+                Extension extensions<8..2^16-1>;
+            } ClientHello;
+
+        Args:
+            data (bytes): message body
+            length (int): length of message body
+
+        Returns:
+            DataType_TLS_ClientHello: Parsed message body. Fields beyond a truncated
+            body are left as defaults, and the JA3 fingerprint is only available if
+            the message is complete.
+
+        """
+        hello = dict(
+            version=None,
+            random=None,
+            session_id=None,
+            cipher_suites=tuple(),
+            compression_methods=tuple(),
+            extensions=tuple(),
+            server_name=None,
+            alpn=tuple(),
+            supported_groups=tuple(),
+            ec_point_formats=tuple(),
+            supported_versions=tuple(),
+            ja3=None,
+            ja3_hash=None,
+        )
+
+        try:
+            _vers = int.from_bytes(self._read_tls_vector(data, 0, 2, 0), 'big')
+            hello['version'] = self._read_tls_version(_vers)
+            hello['random'] = self._read_tls_vector(data, 2, 32, 0)
+            hello['session_id'] = self._read_tls_vector(data, 34, 1)
+            offset = 35 + len(hello['session_id'])
+
+            _csui = self._read_tls_vector(data, offset, 2)
+            hello['cipher_suites'] = tuple(int.from_bytes(_csui[i:i+2], 'big') for i in range(0, len(_csui), 2))
+            offset += 2 + len(_csui)
+
+            _comp = self._read_tls_vector(data, offset, 1)
+            hello['compression_methods'] = tuple(_comp)
+            offset += 1 + len(_comp)
+
+            if offset < len(data):
+                hello.update(self._read_tls_extensions(self._read_tls_vector(data, offset, 2), client=True))
+        except ProtocolError:
+            return hello
+
+        if len(data) < length:  # truncated
+            return hello
+
+        # JA3: SSLVersion,Cipher,SSLExtension,EllipticCurve,EllipticCurvePointFormat
+        hello['ja3'] = ','.join((
+            str(_vers),
+            '-'.join(str(code) for code in hello['cipher_suites'] if not self._check_grease(code)),
+            '-'.join(str(code) for code in hello['extensions'] if not self._check_grease(code)),
+            '-'.join(str(code) for code in hello['supported_groups'] if not self._check_grease(code)),
+            '-'.join(str(code) for code in hello['ec_point_formats']),
+        ))
+        hello['ja3_hash'] = hashlib.md5(hello['ja3'].encode()).hexdigest()  # nosec
+        return hello
+
+    def _read_tls_server_hello(self, data, length):
+        """Read TLS ``ServerHello`` message.
+
+        Structure of ``ServerHello`` message [:rfc:`8446`]::
+
+            struct {
+                ProtocolVersion legacy_version = 0x0303;    /* TLS v1.2 */
+                Random random;
+                opaque legacy_session_id_echo<0..32>;
+                CipherSuite cipher_suite;
+                uint8 legacy_compression_method = 0;
+                Extension extensions<6..2^16-1>;
+            } ServerHello;
+
+        Args:
+            data (bytes): message body
+            length (int): length of message body
+
+        Returns:
+            DataType_TLS_ServerHello: Parsed message body. Fields beyond a truncated
+            body are left as defaults, and the JA3S fingerprint is only available if
+            the message is complete.
+
+        """
+        hello = dict(
+            version=None,
+            random=None,
+            session_id=None,
+            cipher_suite=None,
+            compression_method=None,
+            extensions=tuple(),
+            alpn=tuple(),
+            supported_versions=tuple(),
+            ja3s=None,
+            ja3s_hash=None,
+        )
+
+        try:
+            _vers = int.from_bytes(self._read_tls_vector(data, 0, 2, 0), 'big')
+            hello['version'] = self._read_tls_version(_vers)
+            hello['random'] = self._read_tls_vector(data, 2, 32, 0)
+            hello['session_id'] = self._read_tls_vector(data, 34, 1)
+            offset = 35 + len(hello['session_id'])
+
+            _csui = int.from_bytes(self._read_tls_vector(data, offset, 2, 0), 'big')
+            hello['cipher_suite'] = _csui
+            hello['compression_method'] = self._read_tls_vector(data, offset + 2, 1, 0)[0]
+            offset += 3
+
+            if offset < len(data):
+                hello.update(self._read_tls_extensions(self._read_tls_vector(data, offset, 2), client=False))
+        except ProtocolError:
+            return hello
+
+        if len(data) < length:  # truncated
+            return hello
+
+        # JA3S: SSLVersion,Cipher,SSLExtension
+        hello['ja3s'] = ','.join((
+            str(_vers),
+            str(_csui),
+            '-'.join(str(code) for code in hello['extensions'] if not self._check_grease(code)),
+        ))
+        hello['ja3s_hash'] = hashlib.md5(hello['ja3s'].encode()).hexdigest()  # nosec
+        return hello
+
+    def _read_tls_extensions(self, data, *, client):
+        """Read TLS extensions.
+
+        Structure of TLS extension [:rfc:`8446`]::
+
+            struct {
+                ExtensionType extension_type;
+                opaque extension_data<0..2^16-1>;
+            } Extension;
+
+        Args:
+            data (bytes): extensions data
+
+        Keyword Args:
+            client (bool): if the extensions are from ``ClientHello``
+
+        Returns:
+            Dict[str, Any]: Extension types and metadata from ``server_name`` (``0``),
+            ``supported_groups`` (``10``), ``ec_point_formats`` (``11``),
+            ``application_layer_protocol_negotiation`` (``16``) and
+            ``supported_versions`` (``43``) extensions.
+
+        Raises:
+            ProtocolError: If the extensions are truncated.
+
+        """
+        exts = list()
+        info = dict()
+
+        offset = 0
+        while offset < len(data):
+            _type = int.from_bytes(self._read_tls_vector(data, offset, 2, 0), 'big')
+            _data = self._read_tls_vector(data, offset + 2, 2)
+            offset += 4 + len(_data)
+            exts.append(_type)
+
+            if _type == 0 and client:       # server_name
+                _list = self._read_tls_vector(_data, 0, 2)
+                if _list and _list[0] == 0:     # host_name
+                    info['server_name'] = self._decode_text(self._read_tls_vector(_list, 1, 2))
+            elif _type == 10 and client:    # supported_groups
+                _list = self._read_tls_vector(_data, 0, 2)
+                info['supported_groups'] = tuple(int.from_bytes(_list[i:i+2], 'big') for i in range(0, len(_list), 2))
+            elif _type == 11 and client:    # ec_point_formats
+                info['ec_point_formats'] = tuple(self._read_tls_vector(_data, 0, 1))
+            elif _type == 16:               # application_layer_protocol_negotiation
+                _list = self._read_tls_vector(_data, 0, 2)
+                alpn = list()
+                index = 0
+                while index < len(_list):
+                    name = self._read_tls_vector(_list, index, 1)
+                    alpn.append(self._decode_text(name))
+                    index += 1 + len(name)
+                info['alpn'] = tuple(alpn)
+            elif _type == 43:               # supported_versions
+                if client:
+                    _list = self._read_tls_vector(_data, 0, 1)
+                else:
+                    _list = _data[:2]
+                info['supported_versions'] = tuple(self._read_tls_version(int.from_bytes(_list[i:i+2], 'big'))
+                                                   for i in range(0, len(_list), 2))
+
+        info['extensions'] = tuple(exts)
+        return info
+
+    @staticmethod
+    def _read_tls_vector(data, offset, size, prefix=None):
+        """Read a TLS vector.
+
+        Args:
+            data (bytes): source data
+            offset (int): offset of the vector
+            size (int): length of the length prefix, or of the fixed-length
+                field if ``prefix`` is ``0``
+            prefix (Optional[int]): ``0`` for a fixed-length field
+
+        Returns:
+            bytes: Vector content.
+
+        Raises:
+            ProtocolError: If the vector is truncated.
+
+        """
+        if prefix == 0:
+            stop = offset + size
+        else:
+            start = offset + size
+            if start > len(data):
+                raise ProtocolError('TLS: truncated vector', quiet=True)
+            stop = start + int.from_bytes(data[offset:start], 'big')
+            offset = start
+        if stop > len(data):
+            raise ProtocolError('TLS: truncated vector', quiet=True)
+        return data[offset:stop]
@@ -8,33 +8,37 @@ methods.
 """
 # TODO: Implements ECN, ESP, ICMP, ICMPv6, IGMP, Shim6.
 
-# Base Class for Internet Layer
-from pcapkit.protocols.internet.internet import Internet
-
-# Utility Classes for Protocols
-from pcapkit.protocols.internet.ah import AH
-from pcapkit.protocols.internet.ipv4 import IPv4
-from pcapkit.protocols.internet.ipv6 import IPv6
-from pcapkit.protocols.internet.ipx import IPX
-
-# IPv6 Extension Headers
-from pcapkit.protocols.internet.hip import HIP
-from pcapkit.protocols.internet.hopopt import HOPOPT
-from pcapkit.protocols.internet.ipv6_frag import IPv6_Frag
-from pcapkit.protocols.internet.ipv6_opts import IPv6_Opts
-from pcapkit.protocols.internet.ipv6_route import IPv6_Route
-from pcapkit.protocols.internet.mh import MH
-
-# Ethertype IEEE 802 Numbers
-from pcapkit.protocols.internet.internet import ETHERTYPE
-
-# Deprecated / Base Classes
-from pcapkit.protocols.internet.ip import IP
-from pcapkit.protocols.internet.ipsec import IPsec
+from pcapkit.utilities.compat import lazy_import
 
 __all__ = [
     'ETHERTYPE',                                        # Protocol Numbers
     'AH', 'IP', 'IPsec', 'IPv4', 'IPv6', 'IPX',         # Internet Layer
     'HIP', 'HOPOPT', 'IPv6_Frag',
-    'IPv6_Opts', 'IPv6_Route', 'MH',                    # IPv6 Extension Header
+    'IPv6_Opts', 'IPv6_Route', 'MH',                    # IPv6 Extension Headers
 ]
+
+__getattr__, __dir__ = lazy_import(__name__, {
+    # Base Class for Internet Layer
+    'Internet': ('pcapkit.protocols.internet.internet', 'Internet'),
+
+    # Utility Classes for Protocols
+    'AH': ('pcapkit.protocols.internet.ah', 'AH'),
+    'IPv4': ('pcapkit.protocols.internet.ipv4', 'IPv4'),
+    'IPv6': ('pcapkit.protocols.internet.ipv6', 'IPv6'),
+    'IPX': ('pcapkit.protocols.internet.ipx', 'IPX'),
+
+    # IPv6 Extension Headers
+    'HIP': ('pcapkit.protocols.internet.hip', 'HIP'),
+    'HOPOPT': ('pcapkit.protocols.internet.hopopt', 'HOPOPT'),
+    'IPv6_Frag': ('pcapkit.protocols.internet.ipv6_frag', 'IPv6_Frag'),
+    'IPv6_Opts': ('pcapkit.protocols.internet.ipv6_opts', 'IPv6_Opts'),
+    'IPv6_Route': ('pcapkit.protocols.internet.ipv6_route', 'IPv6_Route'),
+    'MH': ('pcapkit.protocols.internet.mh', 'MH'),
+
+    # Ethertype IEEE 802 Numbers
+    'ETHERTYPE': ('pcapkit.protocols.internet.internet', 'ETHERTYPE'),
+
+    # Deprecated / Base Classes
+    'IP': ('pcapkit.protocols.internet.ip', 'IP'),
+    'IPsec': ('pcapkit.protocols.internet.ipsec', 'IPsec'),
+})
@@ -137,8 +137,8 @@ class AH(IPsec):
             raise VersionError(f'Unknown IP version {version}')
 
         if _plen:   # explicit padding in need
-            padding = self._read_binary(_plen)
-            if any((int(bit, base=2) for bit in padding)):
+            padding = self._read_bits(_plen)
+            if padding:
                 raise ProtocolError(f'{self.alias}: invalid format')
 
         length -= ah['length']
@@ -28,6 +28,7 @@ Octets      Bits        Name                    Description
 
 """
 import collections
+import io
 import ipaddress
 
 from pcapkit.const.hip.certificate import Certificate as _CERT_TYPE
@@ -49,11 +50,16 @@ from pcapkit.const.hip.suite import Suite as _SUITE_ID
 from pcapkit.const.hip.transport import Transport as _TP_MODE_ID
 from pcapkit.const.reg.transtype import TransType as TP_PROTO
 from pcapkit.corekit.infoclass import Info
+from pcapkit.corekit.tlv import TLVEngine
 from pcapkit.protocols.internet.internet import Internet
 from pcapkit.utilities.exceptions import ProtocolError, UnsupportedCall
 
 __all__ = ['HIP']
 
+#: HIP parameter engine, where the type and length fields are two octets each,
+#: and parameters are padded to 8-octet boundaries.
+_HIP_TLV = TLVEngine(lambda code: f'_read_para_{_HIP_PARA.get(code).name.split(" [")[0].lower()}',
+                     '_read_para_unassigned', kind=2, length=2, size=lambda clen: 11 + clen - (clen + 3) % 8)
 
 class HIP(Internet):
     """This class implements Host Identity Protocol."""
@@ -162,35 +168,38 @@ class HIP(Internet):
 
         _next = self._read_protos(1)
         _hlen = self._read_unpack(1)
-        _type = self._read_binary(1)
-        if _type[0] != '0':
+        _type = self._read_bits(1)
+        if _type & 0x80:
             raise ProtocolError('HIP: invalid format')
-        _vers = self._read_binary(1)
-        if _vers[7] != '1':
+        _vers = self._read_bits(1)
+        if not _vers & 0x01:
             raise ProtocolError('HIP: invalid format')
         _csum = self._read_fileng(2)
-        _ctrl = self._read_binary(2)
+        _ctrl = self._read_bits(2)
         _shit = self._read_unpack(16)
         _rhit = self._read_unpack(16)
 
         hip = dict(
             next=_next,
             length=(_hlen + 1) * 8,
-            type=_HIP_TYPES.get(int(_type[1:], base=2)),
-            version=int(_vers[:4], base=2),
+            type=_HIP_TYPES.get(_type & 0x7F),
+            version=_vers >> 4,
             chksum=_csum,
             control=dict(
-                anonymous=bool(int(_ctrl[15], base=2)),
+                anonymous=bool(_ctrl & 0x0001),
             ),
             shit=_shit,
             rhit=_rhit,
         )
 
-        _prml = _hlen - 38
+        _prml = _hlen * 8 - 32
         if _prml:
-            parameters = self._read_hip_para(_prml, version=hip['version'])
-            hip['parameters'] = parameters[0]   # tuple of parameter acronyms
-            hip.update(parameters[1])           # merge parameters info to buffer
+            if self._skipopt:
+                hip['parameters'] = self._read_fileng(_prml)    # raw parameter bytes
+            else:
+                parameters = self._read_hip_para(_prml, version=hip['version'])
+                hip['parameters'] = parameters[0]   # tuple of parameter acronyms
+                hip.update(parameters[1])           # merge parameters info to buffer
 
         length -= hip['length']
         hip['packet'] = self._read_packet(header=hip['length'], payload=length)
@@ -200,6 +209,28 @@ class HIP(Internet):
             return hip
         return self._decode_next_layer(hip, _next, length)
 
+    def read_options(self):
+        """Decode HIP parameters on demand.
+
+        Parameters are kept as raw bytes in ``parameters`` when parsing with ``skip_options``
+        (c.f. :class:`~pcapkit.foundation.extraction.Extractor`), which can then
+        be decoded from the raw packet data through this method.
+
+        Returns:
+            Info: Parsed HIP parameters, with ``parameters`` as the tuple of parameter
+            acronyms and parameter data merged as in :meth:`read`.
+
+        """
+        hip = dict(parameters=tuple())
+
+        _prml = self._info.length - 40  # pylint: disable=E1101
+        if _prml:
+            parameters = self._read_options_at(40, self._read_hip_para, _prml,
+                                               version=self._info.version)  # pylint: disable=E1101
+            hip['parameters'] = parameters[0]   # tuple of parameter acronyms
+            hip.update(parameters[1])           # merge parameters info to buffer
+        return Info(hip)
+
     def make(self, **kwargs):
         """Make (construct) packet data.
 
@@ -278,46 +309,30 @@ class HIP(Internet):
             ProtocolError: if packet length threshold check failed
 
         """
-        counter = 0         # length of read parameters
-        optkind = list()    # parameter type list
-        options = dict()    # dict of parameter data
+        base = self._file.tell()
+        items, counter = _HIP_TLV.walk(self._read_fileng(length))
+        decoders = _HIP_TLV.compile(type(self))
 
-        while counter < length:
-            # break when eol triggered
-            kind = self._read_binary(2)
-            if not kind:
-                break
-
-            # get parameter type & C-bit
-            code = int(kind, base=2)
-            cbit = bool(int(kind[15], base=2))
-
-            # get parameter length
-            clen = self._read_unpack(2)
-            plen = 11 + clen - (clen + 3) % 8
+        records = list()    # decoded parameter records
+        for (code, start, stop, clen) in items:
+            # get C-bit & parameter length
+            cbit = bool(code & 1)
+            plen = stop - start
 
             # extract parameter
             dscp = _HIP_PARA.get(code)
-            meth_name = f'_read_para_{dscp.name.split(" [")[0].lower()}'
-            meth = getattr(self, meth_name, '_read_para_unassigned')
-            data = meth(self, code, cbit, clen, desc=dscp, length=plen, version=version)
+            self._file.seek(base + start + 4, io.SEEK_SET)
+            data = decoders[code](self, code, cbit, clen, desc=dscp, length=plen, version=version)
 
             # record parameter data
-            counter += plen
-            if dscp in optkind:
-                if isinstance(options[dscp], tuple):
-                    options[dscp] += (Info(data),)
-                else:
-                    options[dscp] = (Info(options[dscp]), Info(data))
-            else:
-                optkind.append(dscp)
-                options[dscp] = data
+            records.append((dscp, dscp, data))
+        self._file.seek(base + length, io.SEEK_SET)
 
         # check threshold
         if counter != length:
             raise ProtocolError(f'HIPv{version}: invalid format')
 
-        return tuple(optkind), options
+        return _HIP_TLV.collect(records)
 
     def _read_para_unassigned(self, code, cbit, clen, *, desc, length, version):  # pylint: disable=unused-argument
         """Read HIP unassigned parameters.
@@ -555,7 +570,7 @@ class HIP(Internet):
             _traf = self._read_unpack(1)
             _loct = self._read_unpack(1)
             _locl = self._read_unpack(1) * 4
-            _resp = self._read_binary(1)
+            _resp = self._read_bits(1)
             _life = self._read_unpack(4)
             _lobj = _read_locator(_loct, _locl)
 
@@ -563,7 +578,7 @@ class HIP(Internet):
                 traffic=_traf,
                 type=_loct,
                 length=_locl,
-                preferred=int(_resp[7], base=2),
+                preferred=_resp & 0x01,
                 lifetime=_life,
                 object=_lobj,
             ))
@@ -1231,20 +1246,20 @@ class HIP(Internet):
             """Read domain identifier.
 
             Args:
-                di_data (str): bit string of DI information byte
+                di_data (int): bit field of DI information
 
             Returns:
                 Tuple[pcapkit.const.hip.di_type.DIType, int, bytes]: A :data:`tuple` of
                 DI type enumeration, DI content length and DI data.
 
             """
-            di_type = _DI_TYPE.get(int(di_data[:4], base=2))
-            di_len = int(di_data[4:], base=2)
+            di_type = _DI_TYPE.get(di_data >> 12)
+            di_len = di_data & 0x0FFF
             domain_id = self._read_fileng(di_len)
             return di_type, di_len, domain_id
 
         _hlen = self._read_unpack(2)
-        _didt = self._read_binary(2)
+        _didt = self._read_bits(2)
         _algo = self._read_unpack(2)
         _hidf = _read_host_identifier(_hlen, _algo)
         _didf = _read_domain_identifier(_didt)
@@ -2251,7 +2266,7 @@ class HIP(Internet):
         if (clen - 4) % 16 != 0:
             raise ProtocolError(f'HIPv{version}: [ParamNo {code}] invalid format')
 
-        _flag = self._read_binary(2)
+        _flag = self._read_bits(2)
         _resv = self._read_fileng(2)
         _addr = list()
         for _ in range((clen - 4) // 16):
@@ -2262,8 +2277,8 @@ class HIP(Internet):
             critical=cbit,
             length=clen,
             flags=dict(
-                symmetric=bool(int(_flag[0], base=2)),
-                must_follow=bool(int(_flag[1], base=2)),
+                symmetric=bool(_flag & 0x8000),
+                must_follow=bool(_flag & 0x4000),
             ),
             ip=tuple(_addr),
         )
@@ -2814,7 +2829,7 @@ class HIP(Internet):
         if (clen - 4) % 16 != 0:
             raise ProtocolError(f'HIPv{version}: [ParamNo {code}] invalid format')
 
-        _flag = self._read_binary(2)
+        _flag = self._read_bits(2)
         _resv = self._read_fileng(2)
         _addr = list()
         for _ in range((clen - 4) // 16):
@@ -2825,8 +2840,8 @@ class HIP(Internet):
             critical=cbit,
             length=clen,
             flags=dict(
-                symmetric=bool(int(_flag[0], base=2)),
-                must_follow=bool(int(_flag[1], base=2)),
+                symmetric=bool(_flag & 0x8000),
+                must_follow=bool(_flag & 0x4000),
             ),
             ip=tuple(_addr),
         )
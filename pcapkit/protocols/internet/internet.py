@@ -182,10 +182,10 @@ class Internet(Protocol):  # pylint: disable=abstract-method
             pcapkit.protocols.protocol.Protocol: instance of next layer
 
         """
-        if length == 0:
+        if length == 0 or self._sigterm:
             from pcapkit.protocols.null import \
                 NoPayload as protocol  # pylint: disable=import-outside-toplevel
-        elif self._sigterm or proto == 59:  # No Next Header for IPv6
+        elif proto == 59:  # No Next Header for IPv6
             from pcapkit.protocols.raw import \
                 Raw as protocol  # pylint: disable=import-outside-toplevel
         else:
@@ -197,5 +197,6 @@ class Internet(Protocol):  # pylint: disable=abstract-method
                     Raw as protocol  # pylint: disable=import-outside-toplevel
 
         next_ = protocol(self._file, length, version=version, extension=extension,
-                         error=self._onerror, layer=self._exlayer, protocol=self._exproto)
+                         error=self._onerror, _threshold=self._exthrd, _skip_options=self._exopts,
+                         _decode_policy=self._exdec, _address=self._exaddr)
         return next_
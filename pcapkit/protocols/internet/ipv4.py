@@ -32,7 +32,7 @@ Octets      Bits        Name                    Description
 
 """
 import datetime
-import ipaddress
+import struct
 
 from pcapkit.const.ipv4.classification_level import ClassificationLevel as _CLASSIFICATION_LEVEL
 from pcapkit.const.ipv4.option_class import OptionClass as opt_class
@@ -46,7 +46,9 @@ from pcapkit.const.ipv4.tos_pre import ToSPrecedence as TOS_PRE
 from pcapkit.const.ipv4.tos_rel import ToSReliability as TOS_REL
 from pcapkit.const.ipv4.tos_thr import ToSThroughput as TOS_THR
 from pcapkit.const.reg.transtype import TransType
+from pcapkit.corekit.address import ADDRESS_CACHE
 from pcapkit.corekit.infoclass import Info
+from pcapkit.corekit.tlv import TLVEngine
 from pcapkit.protocols.internet.ip import IP
 from pcapkit.utilities.exceptions import ProtocolError
 
@@ -55,16 +57,15 @@ __all__ = ['IPv4']
 T = True
 F = False
 
-# pylint: disable=protected-access
 process_opt = {
-    0: lambda self, size, kind: self._read_mode_donone(size, kind),    # do nothing
-    1: lambda self, size, kind: self._read_mode_unpack(size, kind),    # unpack according to size
-    2: lambda self, size, kind: self._read_mode_route(size, kind),     # route data
-    3: lambda self, size, kind: self._read_mode_qs(size, kind),        # Quick-Start
-    4: lambda self, size, kind: self._read_mode_ts(size, kind),        # Time Stamp
-    5: lambda self, size, kind: self._read_mode_tr(size, kind),        # Traceroute
-    6: lambda self, size, kind: self._read_mode_sec(size, kind),       # (Extended) Security
-    7: lambda self, size, kind: self._read_mode_rsralt(size, kind),    # Router Alert
+    0: '_read_mode_donone',     # do nothing
+    1: '_read_mode_unpack',     # unpack according to size
+    2: '_read_mode_route',      # route data
+    3: '_read_mode_qs',         # Quick-Start
+    4: '_read_mode_ts',         # Time Stamp
+    5: '_read_mode_tr',         # Traceroute
+    6: '_read_mode_sec',        # (Extended) Security
+    7: '_read_mode_rsralt',     # Router Alert
 }
 
 IPv4_OPT = {                 # # copy  class  number  kind  length  process          name
@@ -108,6 +109,10 @@ IPv4_OPT
 
 """
 
+#: TLV engine for IPv4 options, where EOOL and NOP are one-octet options.
+IPv4_TLV = TLVEngine({kind: process_opt[opts[2]] for (kind, opts) in IPv4_OPT.items() if len(opts) > 2},
+                     singles=(0, 1), end=(0,))
+
 
 class IPv4(IP):
     """This class implements Internet Protocol version 4."""
@@ -178,11 +183,11 @@ class IPv4(IP):
         if length is None:
             length = len(self)
 
-        _vihl = self._read_fileng(1).hex()
-        _dscp = self._read_binary(1)
+        _vihl = self._read_bits(1)
+        _dscp = self._read_bits(1)
         _tlen = self._read_unpack(2)
         _iden = self._read_unpack(2)
-        _frag = self._read_binary(2)
+        _frag = self._read_bits(2)
         _ttol = self._read_unpack(1)
         _prot = self._read_protos(1)
         _csum = self._read_fileng(2)
@@ -190,24 +195,24 @@ class IPv4(IP):
         _dsta = self._read_ipv4_addr()
 
         ipv4 = dict(
-            version=int(_vihl[0]),
-            hdr_len=int(_vihl[1], base=16) * 4,
+            version=_vihl >> 4,
+            hdr_len=(_vihl & 0x0F) * 4,
             dsfield=dict(
                 dscp={
-                    'pre': TOS_PRE.get(int(_dscp[:3], base=2)),
-                    'del': TOS_DEL.get(int(_dscp[3], base=2)),
-                    'thr': TOS_THR.get(int(_dscp[4], base=2)),
-                    'rel': TOS_REL.get(int(_dscp[5], base=2)),
+                    'pre': TOS_PRE.get(_dscp >> 5),
+                    'del': TOS_DEL.get(_dscp >> 4 & 0x1),
+                    'thr': TOS_THR.get(_dscp >> 3 & 0x1),
+                    'rel': TOS_REL.get(_dscp >> 2 & 0x1),
                 },
-                ecn=TOS_ECN.get(int(_dscp[-2:], base=2)),
+                ecn=TOS_ECN.get(_dscp & 0x03),
             ),
             len=_tlen,
             id=_iden,
             flags=dict(
-                df=bool(int(_frag[1])),
-                mf=bool(int(_frag[2])),
+                df=bool(_frag & 0x4000),
+                mf=bool(_frag & 0x2000),
             ),
-            frag_offset=int(_frag[3:], base=2) * 8,
+            frag_offset=(_frag & 0x1FFF) * 8,
             ttl=_ttol,
             proto=_prot,
             checksum=_csum,
@@ -217,17 +222,41 @@ class IPv4(IP):
 
         _optl = ipv4['hdr_len'] - 20
         if _optl:
-            options = self._read_ipv4_options(_optl)
-            ipv4['opt'] = options[0]    # tuple of option acronyms
-            ipv4.update(options[1])     # merge option info to buffer
-            # ipv4['opt'] = self._read_fileng(_optl) or None
+            if self._skipopt:
+                ipv4['opt'] = self._read_fileng(_optl)  # raw option bytes
+            else:
+                options = self._read_ipv4_options(_optl)
+                ipv4['opt'] = options[0]    # tuple of option acronyms
+                ipv4.update(options[1])     # merge option info to buffer
 
         hdr_len = ipv4['hdr_len']
         raw_len = ipv4['len'] - hdr_len
         ipv4['packet'] = self._read_packet(header=hdr_len, payload=raw_len)
 
+        self._exaddr = (_srca, _dsta)
         return self._decode_next_layer(ipv4, _prot, raw_len)
 
+    def read_options(self):
+        """Decode IPv4 options on demand.
+
+        Options are kept as raw bytes in ``opt`` when parsing with ``skip_options``
+        (c.f. :class:`~pcapkit.foundation.extraction.Extractor`), which can then
+        be decoded from the raw packet data through this method.
+
+        Returns:
+            Info: Parsed IPv4 options, with ``opt`` as the tuple of option acronyms
+            and option data merged as in :meth:`read`.
+
+        """
+        ipv4 = dict(opt=tuple())
+
+        _optl = self._info.hdr_len - 20  # pylint: disable=E1101
+        if _optl:
+            options = self._read_options_at(20, self._read_ipv4_options, _optl)
+            ipv4['opt'] = options[0]    # tuple of option acronyms
+            ipv4.update(options[1])     # merge option info to buffer
+        return Info(ipv4)
+
     def make(self, **kwargs):
         """Make (construct) packet data.
 
@@ -288,7 +317,7 @@ class IPv4(IP):
         # _byte = self._read_fileng(4)
         # _addr = '.'.join([str(_) for _ in _byte])
         # return _addr
-        return ipaddress.ip_address(self._read_fileng(4))
+        return ADDRESS_CACHE.ip_address(self._read_fileng(4))
 
     def _read_opt_type(self, kind):  # pylint: disable=no-self-use
         """Read option type field.
@@ -300,12 +329,10 @@ class IPv4(IP):
             DataType_IPv4_Option_Type: extracted IPv4 option
 
         """
-        bin_ = bin(kind)[2:].zfill(8)
-
         type_ = {
-            'copy': bool(int(bin_[0], base=2)),
-            'class': opt_class.get(int(bin_[1:3], base=2)),
-            'number': int(bin_[3:], base=2),
+            'copy': bool(kind & 0x80),
+            'class': opt_class.get(kind >> 5 & 0x03),
+            'number': kind & 0x1F,
         }
 
         return type_
@@ -322,29 +349,27 @@ class IPv4(IP):
             option list and extracted IPv4 options
 
         """
-        counter = 0         # length of read option list
-        optkind = list()    # option kind list
-        options = dict()    # dict of option data
-
-        while counter < size:
-            # get option kind
-            kind = self._read_unpack(1)
+        view = memoryview(self._read_fileng(size))
+        items, _ = IPv4_TLV.walk(view)
+        decoders = IPv4_TLV.compile(type(self))
+
+        records = list()    # decoded option records
+        unknown = None      # unknown option data
+        for (kind, start, stop, byte) in items:
+            if stop > size:     # truncated option
+                break
 
             # fetch corresponding option tuple
             opts = IPv4_OPT.get(kind)
             if opts is None:
-                len_ = size - counter
-                counter = size
-                options['Unknown'] = self._read_fileng(len_)
+                unknown = bytes(view[start+1:])
                 break
 
             # extract option
             dscp = OPT_TYPE.get(kind)
-            desc = dscp.name
             if opts[0]:
-                byte = self._read_unpack(1)
-                if byte:    # check option process mode
-                    data = process_opt[opts[2]](self, byte, kind)
+                if byte:    # decode option data from the slice
+                    data = decoders[kind](self, kind, view[start+2:stop])
                 else:       # permission options (length is 2)
                     data = dict(
                         kind=kind,                          # option kind
@@ -353,42 +378,26 @@ class IPv4(IP):
                         flag=True,                          # permission flag
                     )
             else:           # 1-byte options
-                byte = 1
-
                 data = dict(
                     kind=kind,                          # option kind
                     type=self._read_opt_type(kind),     # option type info
                     length=1,                           # option length
                 )
+            records.append((dscp, dscp.name, data))
+        optkind, options = IPv4_TLV.collect(records)
 
-            # record option data
-            counter += byte
-            if dscp in optkind:
-                if isinstance(options[desc], tuple):
-                    options[desc] += (Info(data),)
-                else:
-                    options[desc] = (Info(options[desc]), Info(data))
-            else:
-                optkind.append(dscp)
-                options[desc] = data
-
-            # break when eol triggered
-            if not kind:
-                break
-
-        # get padding
-        if counter < size:
-            len_ = size - counter
-            self._read_binary(len_)
+        # unknown option and padding
+        if unknown is not None:
+            options['Unknown'] = unknown
 
-        return tuple(optkind), options
+        return optkind, options
 
-    def _read_mode_donone(self, size, kind):
+    def _read_mode_donone(self, kind, data):
         """Read options require no process.
 
         Arguments:
-            size (int): length of option
             kind (int): option kind value
+            data (memoryview): option data
 
         Returns:
             DataType_Opt_Do_None: extracted option
@@ -397,6 +406,7 @@ class IPv4(IP):
             ProtocolError: If ``size`` is **LESS THAN** ``3``.
 
         """
+        size = len(data) + 2
         if size < 3:
             raise ProtocolError(f'{self.alias}: [OptNo {kind}] invalid format')
 
@@ -404,17 +414,17 @@ class IPv4(IP):
             kind=kind,
             type=self._read_opt_type(kind),
             length=size,
-            data=self._read_fileng(size),
+            data=bytes(data),
         )
 
         return data
 
-    def _read_mode_unpack(self, size, kind):
+    def _read_mode_unpack(self, kind, data):
         """Read options require unpack process.
 
         Arguments:
-            size (int): length of option
             kind (int): option kind value
+            data (memoryview): option data
 
         Returns:
             DataType_Opt_Unpack: extracted option
@@ -423,6 +433,7 @@ class IPv4(IP):
             ProtocolError: If ``size`` is **LESS THAN** ``3``.
 
         """
+        size = len(data) + 2
         if size < 3:
             raise ProtocolError(f'{self.alias}: [OptNo {kind}] invalid format')
 
@@ -430,12 +441,12 @@ class IPv4(IP):
             kind=kind,
             type=self._read_opt_type(kind),
             length=size,
-            data=self._read_unpack(size),
+            data=int.from_bytes(data, 'big'),
         )
 
         return data
 
-    def _read_mode_route(self, size, kind):
+    def _read_mode_route(self, kind, data):
         """Read options with route data.
 
         Structure of these options [:rfc:`791`]:
@@ -465,8 +476,8 @@ class IPv4(IP):
              +--------+--------+--------+---------//--------+
 
         Arguments:
-            size (int): length of option
             kind (Literal[7, 131, 137]): option kind value (RR/LSR/SSR)
+            data (memoryview): option data
 
         Returns:
             DataType_Opt_Route_Data: extracted option with route data
@@ -475,31 +486,32 @@ class IPv4(IP):
             ProtocolError: If the option is malformed.
 
         """
+        size = len(data) + 2
         if size < 3 or (size - 3) % 4 != 0:
             raise ProtocolError(f'{self.alias}: [OptNo {kind}] invalid format')
 
-        _rptr = self._read_unpack(1)
+        _rptr = data[0]
         if _rptr < 4:
             raise ProtocolError(f'{self.alias}: [OptNo {kind}] invalid format')
 
+        counter = 4
+        address = list()
+        endpoint = min(_rptr, size)
+        while counter < endpoint:
+            address.append(ADDRESS_CACHE.ip_address(bytes(data[counter-3:counter+1])))
+            counter += 4
+
         data = dict(
             kind=kind,
             type=self._read_opt_type(kind),
             length=size,
             pointer=_rptr,
+            data=tuple(address) or None,
         )
 
-        counter = 4
-        address = list()
-        endpoint = min(_rptr, size)
-        while counter < endpoint:
-            counter += 4
-            address.append(self._read_ipv4_addr())
-        data['data'] = tuple(address) or None
-
         return data
 
-    def _read_mode_qs(self, size, kind):
+    def _read_mode_qs(self, kind, data):
         """Read Quick Start option.
 
         Structure of Quick-Start (QS) option [:rfc:`4782`]:
@@ -531,8 +543,8 @@ class IPv4(IP):
              +-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+
 
         Arguments:
-            size (int): length of option
             kind (Literal[25]): option kind value (QS)
+            data (memoryview): option data
 
         Returns:
             DataType_Opt_QuickStart: extracted Quick Start option
@@ -541,16 +553,15 @@ class IPv4(IP):
             ProtocolError: If the option is malformed.
 
         """
+        size = len(data) + 2
         if size != 8:
             raise ProtocolError(f'{self.alias}: [OptNo {kind}] invalid format')
 
         _type = self._read_opt_type(kind)
-        _fcrr = self._read_binary(1)
-        _func = int(_fcrr[:4], base=2)
-        _rate = int(_fcrr[4:], base=2)
-        _ttlv = self._read_unpack(1)
-        _nonr = self._read_binary(4)
-        _qsnn = int(_nonr[:30], base=2)
+        _fcrr, _ttlv, _nonr = struct.unpack('>BBI', data)
+        _func = _fcrr >> 4
+        _rate = _fcrr & 0x0F
+        _qsnn = _nonr >> 2
 
         if _func not in (0, 8):
             raise ProtocolError(f'{self.alias}: [OptNo {kind}] invalid format')
@@ -567,7 +578,7 @@ class IPv4(IP):
 
         return data
 
-    def _read_mode_ts(self, size, kind):
+    def _read_mode_ts(self, kind, data):
         """Read Time Stamp option.
 
         Structure of Timestamp (TS) option [:rfc:`791`]::
@@ -584,8 +595,8 @@ class IPv4(IP):
                               .
 
         Arguments:
-            size (int): length of option
             kind (Literal[68]): option kind value (TS)
+            data (memoryview): option data
 
         Returns:
             DataType_Opt_TimeStamp: extracted Time Stamp option
@@ -594,13 +605,15 @@ class IPv4(IP):
             ProtocolError: If the option is malformed.
 
         """
+        size = len(data) + 2
         if size > 40 or size < 4:
             raise ProtocolError(f'{self.alias}: [OptNo {kind}] invalid format')
 
-        _tptr = self._read_unpack(1)
-        _oflg = self._read_binary(1)
-        _oflw = int(_oflg[:4], base=2)
-        _flag = int(_oflg[4:], base=2)
+        view = data
+        _tptr = view[0]
+        _oflg = view[1]
+        _oflw = _oflg >> 4
+        _flag = _oflg & 0x0F
 
         if _tptr < 5:
             raise ProtocolError(f'{self.alias}: [OptNo {kind}] invalid format')
@@ -621,9 +634,9 @@ class IPv4(IP):
             counter = 5
             timestamp = list()
             while counter < endpoint:
-                counter += 4
-                time = self._read_unpack(4, lilendian=True)
+                time = int.from_bytes(view[counter-3:counter+1], 'little')
                 timestamp.append(datetime.datetime.fromtimestamp(time))
+                counter += 4
             data['timestamp'] = timestamp or None
         elif _flag in (1, 3):
             if (size - 4) % 8 != 0:
@@ -632,18 +645,18 @@ class IPv4(IP):
             ipaddress = list()  # pylint: disable=redefined-outer-name
             timestamp = list()
             while counter < endpoint:
-                counter += 8
-                ipaddress.append(self._read_ipv4_addr())
-                time = self._read_unpack(4, lilendian=True)
+                ipaddress.append(ADDRESS_CACHE.ip_address(bytes(view[counter-3:counter+1])))
+                time = int.from_bytes(view[counter+1:counter+5], 'little')
                 timestamp.append(datetime.datetime.fromtimestamp(time))
+                counter += 8
             data['ip'] = tuple(ipaddress) or None
             data['timestamp'] = tuple(timestamp) or None
         else:
-            data['data'] = self._read_fileng(size - 4) or None
+            data['data'] = bytes(view[2:]) or None
 
         return data
 
-    def _read_mode_tr(self, size, kind):
+    def _read_mode_tr(self, kind, data):
         """Read Traceroute option.
 
         Structure of Traceroute (TR) option [:rfc:`6814`]::
@@ -658,8 +671,8 @@ class IPv4(IP):
             +---------------+---------------+---------------+---------------+
 
         Arguments:
-            size (int): length of option
             kind (Literal[82]): option kind value (TR)
+            data (memoryview): option data
 
         Returns:
             DataType_Opt_Traceroute: extracted Traceroute option
@@ -668,13 +681,12 @@ class IPv4(IP):
             ProtocolError: If ``size`` is **NOT** ``12``.
 
         """
+        size = len(data) + 2
         if size != 12:
             raise ProtocolError(f'{self.alias}: [OptNo {kind}] invalid format')
 
-        _idnm = self._read_unpack(2)
-        _ohcn = self._read_unpack(2)
-        _rhcn = self._read_unpack(2)
-        _ipad = self._read_ipv4_addr()
+        _idnm, _ohcn, _rhcn = struct.unpack_from('>3H', data)
+        _ipad = ADDRESS_CACHE.ip_address(bytes(data[6:10]))
 
         data = dict(
             kind=kind,
@@ -688,7 +700,7 @@ class IPv4(IP):
 
         return data
 
-    def _read_mode_sec(self, size, kind):
+    def _read_mode_sec(self, kind, data):
         """Read options with security info.
 
         Structure of these options [:rfc:`1108`]:
@@ -718,10 +730,12 @@ class IPv4(IP):
         c
 
         """
+        size = len(data) + 2
         if size < 3:
             raise ProtocolError(f'{self.alias}: [OptNo {kind}] invalid format')
 
-        _clvl = self._read_unpack(1)
+        view = data
+        _clvl = view[0]
 
         data = dict(
             kind=kind,
@@ -733,21 +747,21 @@ class IPv4(IP):
         if size > 3:
             _list = list()
             for counter in range(3, size):
-                _flag = self._read_binary(1)
-                if (counter < size - 1 and not int(_flag[7], base=2)) \
-                        or (counter == size - 1 and int(_flag[7], base=2)):
+                _flag = view[counter-2]
+                if (counter < size - 1 and not _flag & 0x01) \
+                        or (counter == size - 1 and _flag & 0x01):
                     raise ProtocolError(f'{self.alias}: [OptNo {kind}] invalid format')
 
                 _dict = dict()
-                for (index, bit) in enumerate(_flag[:5]):
+                for index in range(5):
                     _auth = _PROTECTION_AUTHORITY.get(index)
-                    _dict[_auth] = bool(int(bit, base=2))
+                    _dict[_auth] = bool(_flag & (0x80 >> index))
                 _list.append(Info(_dict))
             data['flags'] = tuple(_list)
 
         return data
 
-    def _read_mode_rsralt(self, size, kind):
+    def _read_mode_rsralt(self, kind, data):
         """Read Router Alert option.
 
         Structure of Router Alert (RTRALT) option [:rfc:`2113`]::
@@ -757,8 +771,8 @@ class IPv4(IP):
             +--------+--------+--------+--------+
 
         Arguments:
-            size (int): length of option
             kind (Literal[140]): option kind value (RTRALT)
+            data (memoryview): option data
 
         Returns:
             DataType_Opt_RouterAlert: extracted option with security info
@@ -767,10 +781,11 @@ class IPv4(IP):
             ProtocolError: If ``size`` is **NOT** ``4``.
 
         """
+        size = len(data) + 2
         if size != 4:
             raise ProtocolError(f'{self.alias}: [OptNo {kind}] invalid format')
 
-        _code = self._read_unpack(2)
+        _code = int.from_bytes(data, 'big')
 
         data = dict(
             kind=kind,
@@ -23,10 +23,9 @@ Octets      Bits        Name                    Description
 .. [*] https://en.wikipedia.org/wiki/IPv6_packet
 
 """
-import ipaddress
-
 from pcapkit.const.ipv6.extension_header import ExtensionHeader as EXT_HDR
 from pcapkit.const.reg.transtype import TransType
+from pcapkit.corekit.address import ADDRESS_CACHE
 from pcapkit.protocols.internet.ip import IP
 
 __all__ = ['IPv6']
@@ -131,6 +130,7 @@ class IPv6(IP):
         raw_len = ipv6['payload']
         ipv6['packet'] = self._read_packet(header=hdr_len, payload=raw_len)
 
+        self._exaddr = (_srca, _dsta)
         return self._decode_next_layer(ipv6, _next, raw_len)
 
     def make(self, **kwargs):
@@ -191,10 +191,10 @@ class IPv6(IP):
             traffic class and flow label.
 
         """
-        _htet = self._read_fileng(4).hex()
-        _vers = int(_htet[0], base=16)      # version number (6)
-        _tcls = int(_htet[0:2], base=16)    # traffic class
-        _flow = int(_htet[2:], base=16)     # flow label
+        _htet = self._read_bits(4)
+        _vers = _htet >> 28                 # version number (6)
+        _tcls = _htet >> 20 & 0xFF          # traffic class
+        _flow = _htet & 0x000FFFFF          # flow label
 
         return (_vers, _tcls, _flow)
 
@@ -205,7 +205,7 @@ class IPv6(IP):
             ipaddress.IPv6Address: Parsed IP address.
 
         """
-        return ipaddress.ip_address(self._read_fileng(16))
+        return ADDRESS_CACHE.ip_address(self._read_fileng(16))
 
     def _decode_next_layer(self, ipv6, proto=None, length=None):  # pylint: disable=arguments-differ
         """Decode next layer extractor.
@@ -111,14 +111,14 @@ class IPv6_Frag(Internet):
 
         _next = self._read_protos(1)
         _temp = self._read_fileng(1)
-        _offm = self._read_binary(2)
+        _offm = self._read_bits(2)
         _ipid = self._read_unpack(4)
 
         ipv6_frag = dict(
             next=_next,
             length=8,
-            offset=int(_offm[:13], base=2),
-            mf=bool(int(_offm[15], base=2)),
+            offset=_offm >> 3,
+            mf=bool(_offm & 0x0001),
             id=_ipid,
         )
 
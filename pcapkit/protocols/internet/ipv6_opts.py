@@ -19,6 +19,7 @@ Octets      Bits        Name                    Description
 
 """
 import datetime
+import io
 import ipaddress
 
 from pcapkit.const.ipv6.option import Option as _OPT_TYPE
@@ -28,6 +29,7 @@ from pcapkit.const.ipv6.seed_id import SeedID as _IPv6_Opts_SEED
 from pcapkit.const.ipv6.tagger_id import TaggerID as _TID_TYPE
 from pcapkit.const.reg.transtype import TransType
 from pcapkit.corekit.infoclass import Info
+from pcapkit.corekit.tlv import TLVEngine
 from pcapkit.protocols.internet.internet import Internet
 from pcapkit.utilities.exceptions import ProtocolError, UnsupportedCall
 
@@ -35,13 +37,13 @@ __all__ = ['IPv6_Opts']
 
 #: IPv6_Opts Unknown Option Actions
 _IPv6_Opts_ACT = {
-    '00': 'skip over this option and continue processing the header',
-    '01': 'discard the packet',
-    '10': 'discard the packet and, regardless of whether or not the'
+    0b00: 'skip over this option and continue processing the header',
+    0b01: 'discard the packet',
+    0b10: 'discard the packet and, regardless of whether or not the'
           "packet's Destination Address was a multicast address, send an"
           "ICMP Parameter Problem, Code 2, message to the packet's"
           'Source Address, pointing to the unrecognized Option Type',
-    '11': "discard the packet and, only if the packet's Destination"
+    0b11: "discard the packet and, only if the packet's Destination"
           'Address was not a multicast address, send an ICMP Parameter'
           "Problem, Code 2, message to the packet's Source Address,"
           'pointing to the unrecognized Option Type',
@@ -80,6 +82,10 @@ _IPv6_Opts_NULL = {
     0xFE: 'RFC3692-style Experiment',                               # [RFC 4727]
 }
 
+#: IPv6-Opts option engine, where Pad1 is an one-octet option.
+_IPv6_Opts_TLV = TLVEngine({code: f'_read_opt_{abbr}' for (code, (abbr, _)) in _IPv6_Opts_OPT.items()},
+                           '_read_opt_none', singles=(0,), size=lambda value: value + 2)
+
 
 class IPv6_Opts(Internet):
     """This class implements Destination Options for IPv6."""
@@ -175,9 +181,12 @@ class IPv6_Opts(Internet):
             length=(_hlen + 1) * 8,
         )
 
-        options = self._read_ipv6_opts_options(_hlen * 8 + 6)
-        ipv6_opts['options'] = options[0]       # tuple of option acronyms
-        ipv6_opts.update(options[1])            # merge option info to buffer
+        if self._skipopt:
+            ipv6_opts['options'] = self._read_fileng(_hlen * 8 + 6)    # raw option bytes
+        else:
+            options = self._read_ipv6_opts_options(_hlen * 8 + 6)
+            ipv6_opts['options'] = options[0]       # tuple of option acronyms
+            ipv6_opts.update(options[1])            # merge option info to buffer
 
         length -= ipv6_opts['length']
         ipv6_opts['packet'] = self._read_packet(header=ipv6_opts['length'], payload=length)
@@ -187,6 +196,24 @@ class IPv6_Opts(Internet):
             return ipv6_opts
         return self._decode_next_layer(ipv6_opts, _next, length)
 
+    def read_options(self):
+        """Decode IPv6-Opts options on demand.
+
+        Options are kept as raw bytes in ``options`` when parsing with ``skip_options``
+        (c.f. :class:`~pcapkit.foundation.extraction.Extractor`), which can then
+        be decoded from the raw packet data through this method.
+
+        Returns:
+            Info: Parsed IPv6-Opts options, with ``options`` as the tuple of option
+            acronyms and option data merged as in :meth:`read`.
+
+        """
+        options = self._read_options_at(2, self._read_ipv6_opts_options, self._info.length - 2)  # pylint: disable=E1101
+
+        ipv6_opts = dict(options=options[0])   # tuple of option acronyms
+        ipv6_opts.update(options[1])           # merge option info to buffer
+        return Info(ipv6_opts)
+
     def make(self, **kwargs):
         """Make (construct) packet data.
 
@@ -258,12 +285,10 @@ class IPv6_Opts(Internet):
             DataType_IPv6_Opts_Option_Type: extracted IPv6-Opts option type field
 
         """
-        bin_ = bin(kind)[2:].zfill(8)
-
         type_ = dict(
             value=kind,
-            action=_IPv6_Opts_ACT.get(bin_[:2]),
-            change=bool(int(bin_[2], base=2)),
+            action=_IPv6_Opts_ACT.get(kind >> 6),
+            change=bool(kind & 0x20),
         )
 
         return type_
@@ -282,39 +307,29 @@ class IPv6_Opts(Internet):
             ProtocolError: If the threshold is **NOT** matching.
 
         """
-        counter = 0         # length of read options
-        optkind = list()    # option type list
-        options = dict()    # dict of option data
-
-        while counter < length:
-            # break when eol triggered
-            code = self._read_unpack(1)
-            if not code:
-                break
+        base = self._file.tell()
+        items, offset = _IPv6_Opts_TLV.walk(self._read_fileng(length))
+        decoders = _IPv6_Opts_TLV.compile(type(self))
 
+        counter = 0         # length of read options
+        records = list()    # decoded option records
+        for (code, start, _, _) in items:
             # extract parameter
             abbr, desc = _IPv6_Opts_OPT.get(code, ('None', 'Unassigned'))
-            meth_name = f'_read_opt_{abbr}'
-            meth = getattr(self, meth_name, '_read_opt_none')
-            data = meth(self, code, desc=desc)
+            self._file.seek(base + start + 1, io.SEEK_SET)
+            data = decoders[code](self, code, desc=desc)
             enum = _OPT_TYPE.get(code)
 
             # record parameter data
             counter += data['length']
-            if enum in optkind:
-                if isinstance(options[abbr], tuple):
-                    options[abbr] += (Info(data),)
-                else:
-                    options[abbr] = (Info(options[abbr]), Info(data))
-            else:
-                optkind.append(enum)
-                options[abbr] = data
+            records.append((enum, abbr, data))
+        self._file.seek(base + length, io.SEEK_SET)
 
         # check threshold
-        if counter != length:
+        if offset != length or counter != length:
             raise ProtocolError(f'{self.alias}: invalid format')
 
-        return tuple(optkind), options
+        return _IPv6_Opts_TLV.collect(records)
 
     def _read_opt_none(self, code, *, desc):
         """Read IPv6-Opts unassigned options.
@@ -543,7 +558,7 @@ class IPv6_Opts(Internet):
         if _clen:
             _bmap = list()
             for _ in range(_clen // 2):
-                _bmap.append(self._read_binary(8))
+                _bmap.append(format(self._read_bits(8), '064b'))
             opt['bitmap'] = tuple(_bmap)
 
         _plen = _size - _clen * 4 - 8
@@ -598,12 +613,12 @@ class IPv6_Opts(Internet):
         """
         _type = self._read_opt_type(code)
         _size = self._read_unpack(1)
-        _tidd = self._read_binary(1)
+        _tidd = self._read_bits(1)
 
-        if _tidd[0] == '0':
+        if not _tidd & 0x80:
             _mode = 'I-DPD'
-            _tidt = _TID_TYPE.get(_tidd[1:4], 'Unassigned')
-            _tidl = int(_tidd[4:], base=2)
+            _tidt = _TID_TYPE.get(_tidd >> 4 & 0x07)
+            _tidl = _tidd & 0x0F
 
             if _tidt == _TID_TYPE.NULL:
                 if _tidl != 0:
@@ -623,7 +638,7 @@ class IPv6_Opts(Internet):
                 if _tidl != 3:
                     raise ProtocolError(f'{self.alias}: [OptNo {code}] invalid format')
                 _tidf = self._read_fileng(4)
-                _iden = self._read_fileng(_size-4)
+                _iden = self._read_fileng(_size-5)
 
                 opt = dict(
                     desc=desc,
@@ -638,8 +653,8 @@ class IPv6_Opts(Internet):
             elif _tidt == _TID_TYPE.IPv6:
                 if _tidl != 15:
                     raise ProtocolError(f'{self.alias}: [OptNo {code}] invalid format')
-                _tidf = self._read_fileng(15)
-                _iden = self._read_fileng(_size-15)
+                _tidf = self._read_fileng(16)
+                _iden = self._read_fileng(_size-17)
 
                 opt = dict(
                     desc=desc,
@@ -665,10 +680,10 @@ class IPv6_Opts(Internet):
                     tid=_tidf,
                     id=_iden,
                 )
-        elif _tidd[0] == '1':
+        else:
             _mode = 'H-DPD'
-            _tidt = _TID_TYPE.get(_tidd[1:4])
-            _data = self._read_binary(_size-1)
+            _tidt = _TID_TYPE.get(_tidd >> 4 & 0x07)
+            _data = self._read_bits(_size-1)
 
             opt = dict(
                 desc=desc,
@@ -676,10 +691,8 @@ class IPv6_Opts(Internet):
                 length=_size + 2,
                 dpd_type=_mode,
                 tid_type=_tidt,
-                hav=_tidd[1:] + _data,
+                hav=format((_tidd & 0x7F) << ((_size-1) * 8) | _data, f'0{(_size-1) * 8 + 7}b'),
             )
-        else:
-            raise ProtocolError(f'{self.alias}: [OptNo {code}] invalid format')
 
         return opt
 
@@ -787,12 +800,12 @@ class IPv6_Opts(Internet):
         if _size != 6:
             raise ProtocolError(f'{self.alias}: [OptNo {code}] invalid format')
 
-        _fcrr = self._read_binary(1)
-        _func = int(_fcrr[:4], base=2)
-        _rate = int(_fcrr[4:], base=2)
+        _fcrr = self._read_bits(1)
+        _func = _fcrr >> 4
+        _rate = _fcrr & 0x0F
         _ttlv = self._read_unpack(1)
-        _nonr = self._read_binary(4)
-        _qsnn = int(_nonr[:30], base=2)
+        _nonr = self._read_bits(4)
+        _qsnn = _nonr >> 2
 
         if _func not in (0, 8):
             raise ProtocolError(f'{self.alias}: [OptNo {code}] invalid format')
@@ -842,7 +855,7 @@ class IPv6_Opts(Internet):
         _size = self._read_unpack(1)
         if _size < 4:
             raise ProtocolError(f'{self.alias}: [OptNo {code}] invalid format')
-        _flag = self._read_binary(1)
+        _flag = self._read_bits(1)
         _rpld = self._read_unpack(1)
         _rank = self._read_unpack(2)
 
@@ -851,9 +864,9 @@ class IPv6_Opts(Internet):
             type=_type,
             length=_size + 2,
             flags=dict(
-                down=bool(int(_flag[0], base=2)),
-                rank_error=bool(int(_flag[1], base=2)),
-                fwd_error=bool(int(_flag[2], base=2)),
+                down=bool(_flag & 0x80),
+                rank_error=bool(_flag & 0x40),
+                fwd_error=bool(_flag & 0x20),
             ),
             id=_rpld,
             rank=_rank,
@@ -896,34 +909,34 @@ class IPv6_Opts(Internet):
         _size = self._read_unpack(1)
         if _size < 2:
             raise ProtocolError(f'{self.alias}: [OptNo {code}] invalid format')
-        _smvr = self._read_binary(1)
+        _smvr = self._read_bits(1)
         _seqn = self._read_unpack(1)
 
         opt = dict(
             desc=desc,
             type=_type,
             length=_size + 2,
-            seed_len=_IPv6_Opts_SEED.get(int(_smvr[:2], base=2)),
+            seed_len=_IPv6_Opts_SEED.get(_smvr >> 6),
             flags=dict(
-                max=bool(int(_smvr[2], base=2)),
-                verification=bool(int(_smvr[3], base=2)),
+                max=bool(_smvr & 0x20),
+                verification=bool(_smvr & 0x10),
             ),
             seq=_seqn,
         )
 
-        _kind = _smvr[:2]
-        if _kind == '00':
+        _kind = _smvr >> 6
+        if _kind == 0b00:
             if _size != 2:
                 raise ProtocolError(f'{self.alias}: [OptNo {code}] invalid format')
-        elif _kind == '01':
+        elif _kind == 0b01:
             if _size != 4:
                 raise ProtocolError(f'{self.alias}: [OptNo {code}] invalid format')
             opt['seed_id'] = self._read_unpack(2)
-        elif _kind == '10':
+        elif _kind == 0b10:
             if _size != 10:
                 raise ProtocolError(f'{self.alias}: [OptNo {code}] invalid format')
             opt['seed_id'] = self._read_unpack(8)
-        elif _kind == '11':
+        elif _kind == 0b11:
             if _size != 18:
                 raise ProtocolError(f'{self.alias}: [OptNo {code}] invalid format')
             opt['seed_id'] = self._read_unpack(16)
@@ -1140,17 +1153,17 @@ class IPv6_Opts(Internet):
         _size = self._read_unpack(1)
         if _size != 2:
             raise ProtocolError(f'{self.alias}: [OptNo {code}] invalid format')
-        _verf = self._read_binary(1)
+        _verf = self._read_bits(1)
         _seqn = self._read_unpack(2)
 
         opt = dict(
             desc=desc,
             type=_type,
             length=_size + 2,
-            version=int(_verf[:2], base=2),
+            version=_verf >> 6,
             flags=dict(
-                dup=bool(int(_verf[2], base=2)),
-                ret=bool(int(_verf[3], base=2)),
+                dup=bool(_verf & 0x20),
+                ret=bool(_verf & 0x10),
             ),
             seq=_seqn,
         )
@@ -366,13 +366,13 @@ class IPv6_Route(Internet):
             ProtocolError: If ``length`` is **NOT** ``20``.
 
         """
-        _cmpr = self._read_binary(1)
-        _padr = self._read_binary(1)
+        _cmpr = self._read_bits(1)
+        _padr = self._read_bits(1)
         _resv = self._read_fileng(2)
 
-        _inti = int(_cmpr[:4], base=2)
-        _inte = int(_cmpr[4:], base=2)
-        _plen = int(_padr[:4], base=2)
+        _inti = _cmpr >> 4
+        _inte = _cmpr & 0x0F
+        _plen = _padr >> 4
 
         _ilen = 16 - _inti
         _elen = 16 - _inte
@@ -186,7 +186,7 @@ class IPX(Internet):
         addr = dict(
             network=_ntwk,
             node=_maca,
-            socket=SOCK.get(int(_sock.hex(), base=16)) or _sock,
+            socket=SOCK.get(int.from_bytes(_sock, 'big')) or _sock,
             addr=_addr,
         )
 
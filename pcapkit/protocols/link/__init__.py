@@ -8,22 +8,7 @@ link layer, with detailed implementation and methods.
 """
 # TODO: Implements DSL, EAPOL, FDDI, ISDN, NDP, PPP.
 
-# Base Class for Link Layer
-from pcapkit.protocols.link.link import Link
-
-# Utility Classes for Protocols
-from pcapkit.protocols.link.arp import ARP
-from pcapkit.protocols.link.ethernet import Ethernet
-from pcapkit.protocols.link.l2tp import L2TP
-from pcapkit.protocols.link.ospf import OSPF
-from pcapkit.protocols.link.rarp import RARP
-from pcapkit.protocols.link.vlan import VLAN
-
-# Link-Layer Header Type Values
-from pcapkit.protocols.link.link import LINKTYPE
-
-InARP = ARP
-DRARP = RARP
+from pcapkit.utilities.compat import lazy_import
 
 __all__ = [
     # Protocol Numbers
@@ -33,3 +18,23 @@ __all__ = [
     'ARP', 'DRARP', 'Ethernet', 'InARP', 'L2TP',
     'OSPF', 'RARP', 'VLAN',
 ]
+
+__getattr__, __dir__ = lazy_import(__name__, {
+    # Base Class for Link Layer
+    'Link': ('pcapkit.protocols.link.link', 'Link'),
+
+    # Utility Classes for Protocols
+    'ARP': ('pcapkit.protocols.link.arp', 'ARP'),
+    'Ethernet': ('pcapkit.protocols.link.ethernet', 'Ethernet'),
+    'L2TP': ('pcapkit.protocols.link.l2tp', 'L2TP'),
+    'OSPF': ('pcapkit.protocols.link.ospf', 'OSPF'),
+    'RARP': ('pcapkit.protocols.link.rarp', 'RARP'),
+    'VLAN': ('pcapkit.protocols.link.vlan', 'VLAN'),
+
+    # Link-Layer Header Type Values
+    'LINKTYPE': ('pcapkit.protocols.link.link', 'LINKTYPE'),
+
+    # Aliases
+    'InARP': ('pcapkit.protocols.link.arp', 'ARP'),
+    'DRARP': ('pcapkit.protocols.link.rarp', 'RARP'),
+})
@@ -32,13 +32,12 @@ below:
 .. [*] http://en.wikipedia.org/wiki/Address_Resolution_Protocol
 
 """
-import ipaddress
 import re
-import textwrap
 
 from pcapkit.const.arp.hardware import Hardware as HRD
 from pcapkit.const.arp.operation import Operation as OPER
 from pcapkit.const.reg.ethertype import EtherType as ETHERTYPE
+from pcapkit.corekit.address import ADDRESS_CACHE
 from pcapkit.protocols.link.link import Link
 
 __all__ = ['ARP']
@@ -239,8 +238,7 @@ class ARP(Link):
 
         """
         if htype == 1:  # Ethernet
-            _byte = self._read_fileng(6)
-            _addr = ':'.join(textwrap.wrap(_byte.hex(), 2))
+            _addr = ADDRESS_CACHE.mac_address(self._read_fileng(6))
         else:
             _addr = self._read_fileng(length)
         return _addr
@@ -260,7 +258,7 @@ class ARP(Link):
 
         """
         if ptype == 0x0800:  # IPv4
-            return ipaddress.ip_address(self._read_fileng(4))
+            return ADDRESS_CACHE.ip_address(self._read_fileng(4))
         if ptype == 0x86dd:  # IPv6
-            return ipaddress.ip_address(self._read_fileng(16))
+            return ADDRESS_CACHE.ip_address(self._read_fileng(16))
         return self._read_fileng(length)
@@ -20,8 +20,7 @@ below:
 .. [*] https://en.wikipedia.org/wiki/Ethernet
 
 """
-import textwrap
-
+from pcapkit.corekit.address import ADDRESS_CACHE
 from pcapkit.protocols.link.link import Link
 from pcapkit.utilities.exceptions import UnsupportedCall
 
@@ -156,6 +155,4 @@ class Ethernet(Link):
             str: Colon (``:``) seperated *hex* encoded MAC address.
 
         """
-        _byte = self._read_fileng(6)
-        _addr = ':'.join(textwrap.wrap(_byte.hex(), 2))
-        return _addr
+        return ADDRESS_CACHE.mac_address(self._read_fileng(6))
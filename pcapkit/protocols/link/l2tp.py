@@ -117,24 +117,24 @@ class L2TP(Link):
         if length is None:
             length = len(self)
 
-        _flag = self._read_binary(1)
-        _vers = self._read_fileng(1).hex()[1]
-        _hlen = self._read_unpack(2) if int(_flag[1]) else None
+        _flag = self._read_bits(1)
+        _vers = self._read_bits(1) & 0x0F
+        _hlen = self._read_unpack(2) if _flag & 0x40 else None
         _tnnl = self._read_unpack(2)
         _sssn = self._read_unpack(2)
-        _nseq = self._read_unpack(2) if int(_flag[4]) else None
-        _nrec = self._read_unpack(2) if int(_flag[4]) else None
-        _size = self._read_unpack(2) if int(_flag[6]) else 0
+        _nseq = self._read_unpack(2) if _flag & 0x08 else None
+        _nrec = self._read_unpack(2) if _flag & 0x08 else None
+        _size = self._read_unpack(2) if _flag & 0x02 else 0
 
         l2tp = dict(
             flags=dict(
-                type='Control' if int(_flag[0]) else 'Data',
-                len=bool(int(_flag[1])),
-                seq=bool(int(_flag[4])),
-                offset=bool(int(_flag[6])),
-                prio=bool(int(_flag[7])),
+                type='Control' if _flag & 0x80 else 'Data',
+                len=bool(_flag & 0x40),
+                seq=bool(_flag & 0x08),
+                offset=bool(_flag & 0x02),
+                prio=bool(_flag & 0x01),
             ),
-            ver=int(_vers, base=16),
+            ver=_vers,
             length=_hlen,
             tunnelid=_tnnl,
             sessionid=_sssn,
@@ -143,7 +143,7 @@ class L2TP(Link):
             offset=8*_size or None,
         )
 
-        hdr_len = _hlen or (6 + 2*(int(_flag[1]) + 2*int(_flag[4]) + int(_flag[6])))
+        hdr_len = _hlen or (6 + 2*(bool(_flag & 0x40) + 2*bool(_flag & 0x08) + bool(_flag & 0x02)))
         l2tp['hdr_len'] = hdr_len + _size * 8
         # if _size:
         #     l2tp['padding'] = self._read_fileng(_size * 8)
@@ -124,12 +124,9 @@ class Link(Protocol):  # pylint: disable=abstract-method
             pcapkit.protocols.protocol.Protocol: instance of next layer
 
         """
-        if length == 0:
+        if length == 0 or self._sigterm:
             from pcapkit.protocols.null import \
                 NoPayload as protocol  # pylint: disable=import-outside-toplevel
-        elif self._sigterm:
-            from pcapkit.protocols.raw import \
-                Raw as protocol  # pylint: disable=import-outside-toplevel
         else:
             module, name = self.__proto__[proto]
             try:
@@ -139,6 +136,7 @@ class Link(Protocol):  # pylint: disable=abstract-method
                     Raw as protocol  # pylint: disable=import-outside-toplevel
 
         next_ = protocol(self._file, length, error=self._onerror,
-                         layer=self._exlayer, protocol=self._exproto)
+                         _threshold=self._exthrd, _skip_options=self._exopts,
+                         _decode_policy=self._exdec)
 
         return next_
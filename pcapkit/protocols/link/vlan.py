@@ -86,14 +86,14 @@ class VLAN(Link):
         if length is None:
             length = len(self)
 
-        _tcif = self._read_binary(2)
+        _tcif = self._read_bits(2)
         _type = self._read_protos(2)
 
         vlan = dict(
             tci=dict(
-                pcp=_PCP.get(int(_tcif[:3], base=2)),
-                dei=bool(_tcif[3]),
-                vid=int(_tcif[4:], base=2),
+                pcp=_PCP.get(_tcif >> 13),
+                dei=bool(_tcif & 0x1000),
+                vid=_tcif & 0x0FFF,
             ),
             type=_type,
         )
@@ -434,5 +434,6 @@ class Frame(Protocol):
                 Raw as protocol  # pylint: disable=import-outside-toplevel
 
         next_ = protocol(self._file, length, error=error,
-                         layer=self._exlayer, protocol=self._exproto)
+                         _threshold=self._exthrd, _skip_options=self._exopts,
+                         _decode_policy=self._exdec)
         return next_
@@ -161,7 +161,7 @@ class Header(Protocol):
             self._nsec = True
             self._byte = 'big'
         else:
-            raise FileError(5, 'Unknown file format', self._file.name)  # pylint: disable=no-member
+            raise FileError(5, 'Unknown file format', getattr(self._file, 'name', None))
 
         _vmaj = self._read_unpack(2, lilendian=lilendian)
         _vmin = self._read_unpack(2, lilendian=lilendian)
@@ -16,18 +16,20 @@ import importlib
 import io
 import numbers
 import os
+import pkgutil
 import re
 import shutil
 import string
 import struct
 import textwrap
+import threading
 import urllib
 
 import aenum
-import chardet
 
 from pcapkit.corekit.infoclass import Info
 from pcapkit.corekit.protochain import ProtoChain
+from pcapkit.foundation import instrument
 from pcapkit.utilities.compat import cached_property
 from pcapkit.utilities.decorators import beholder, seekset
 from pcapkit.utilities.exceptions import (ProtocolNotFound, ProtocolNotImplemented, ProtocolUnbound,
@@ -39,6 +41,15 @@ __all__ = ['Protocol']
 # readable characters' order list
 readable = [ord(char) for char in filter(lambda char: not char.isspace(), string.printable)]
 
+#: int: Maximum number of flows in the per-flow charset cache.
+CHARSET_CACHE_SIZE = 65536
+
+#: OrderedDict[Hashable, str]: Per-flow cache of detected charsets, as mapping
+#: from flow key to charset name (in least recently used order).
+_CHARSET_CACHE = collections.OrderedDict()
+#: threading.Lock: Lock of the per-flow charset cache.
+_CHARSET_LOCK = threading.Lock()
+
 
 class Protocol(metaclass=abc.ABCMeta):
     """Abstract base class for all protocol family."""
@@ -166,7 +177,7 @@ class Protocol(metaclass=abc.ABCMeta):
         """
 
     @staticmethod
-    def decode(byte, *, encoding=None, errors='strict'):
+    def decode(byte, *, encoding=None, errors='strict', policy='detect'):
         """Decode :obj:`bytes` into :obj:`str`.
 
         Should decoding failed using ``encoding``, the method will try again decoding
@@ -184,6 +195,10 @@ class Protocol(metaclass=abc.ABCMeta):
                 :exc:`UnicodeDecodeError`. Other possible values are ``'ignore'`` and ``'replace'``
                 as well as any other name registered with :func:`codecs.register_error` that
                 can handle :exc:`UnicodeDecodeError`.
+            policy (Literal['fast', 'detect']): Decoding policy when ``encoding`` is not provided.
+                If ``'fast'``, the :obj:`bytes` will be decoded as strict **ASCII** and then **UTF-8**,
+                and only non-conforming :obj:`bytes` will be detected using |chardet|_; if ``'detect'``,
+                the encoding will always be detected.
 
         Returns:
             str: Decoede string.
@@ -195,6 +210,13 @@ class Protocol(metaclass=abc.ABCMeta):
         .. _chardet: https://chardet.readthedocs.io
 
         """
+        if encoding is None and policy == 'fast':
+            for charset in ('ascii', 'utf-8'):
+                with contextlib.suppress(UnicodeDecodeError):
+                    return byte.decode(charset)
+
+        if encoding is None:
+            import chardet  # pylint: disable=import-outside-toplevel
         charset = encoding or chardet.detect(byte)['encoding']
         try:
             return byte.decode(charset or 'utf-8', errors=errors)
@@ -264,6 +286,18 @@ class Protocol(metaclass=abc.ABCMeta):
                 (:attr:`self._onerror <pcapkit.protocols.protocol.Protocol._exlayer>`).
             _protocol (str): Parse packet until ``_protocol``
                 (:attr:`self._onerror <pcapkit.protocols.protocol.Protocol._exproto>`).
+            _threshold (FrozenSet[Type[Protocol]]): Termination threshold as compiled from
+                ``_layer`` and ``_protocol`` by :meth:`_compile_threshold`
+                (:attr:`self._exthrd <pcapkit.protocols.protocol.Protocol._exthrd>`).
+            _skip_options (Union[bool, str, Tuple[str], FrozenSet[Type[Protocol]]]): Keep options of
+                such protocols as raw bytes, as compiled by :meth:`_compile_skip_options`
+                (:attr:`self._exopts <pcapkit.protocols.protocol.Protocol._exopts>`).
+            _decode_policy (Literal['fast', 'detect']): Decoding policy of text fields
+                (:attr:`self._exdec <pcapkit.protocols.protocol.Protocol._exdec>`).
+            _flow (Optional[Hashable]): Key of the flow which the packet belongs to
+                (:attr:`self._exflow <pcapkit.protocols.protocol.Protocol._exflow>`).
+            _address (Optional[Tuple[Any, Any]]): Source and destination addresses from the
+                Internet layer (:attr:`self._exaddr <pcapkit.protocols.protocol.Protocol._exaddr>`).
             **kwargs: Arbitrary keyword arguments.
 
         """
@@ -275,14 +309,34 @@ class Protocol(metaclass=abc.ABCMeta):
         self._exlayer = kwargs.pop('_layer', str())
         #: str: Parse packet until such protocol.
         self._exproto = kwargs.pop('_protocol', str())
+        #: FrozenSet[Type[Protocol]]: Parse packet until such protocol classes.
+        self._exthrd = kwargs.pop('_threshold', None)
+        if self._exthrd is None:
+            self._exthrd = self._compile_threshold(self._exlayer, self._exproto)
+        #: Union[bool, FrozenSet[Type[Protocol]]]: Keep options of such protocols as raw bytes.
+        self._exopts = kwargs.pop('_skip_options', False)
+        if not isinstance(self._exopts, (bool, frozenset)):
+            self._exopts = self._compile_skip_options(self._exopts)
+        #: Literal['fast', 'detect']: Decoding policy of text fields.
+        self._exdec = kwargs.pop('_decode_policy', 'fast')
+        #: Optional[Hashable]: Key of the flow which the packet belongs to.
+        self._exflow = kwargs.pop('_flow', None)
+        #: Optional[Tuple[Any, Any]]: Source and destination addresses from the Internet layer.
+        self._exaddr = kwargs.pop('_address', None)
 
         #: int: Initial offset of :attr:`self._file <pcapkit.protocols.protocol.Protocol._file>`
         self._seekset = (file or io.BytesIO()).tell()
         #: bool: If terminate parsing next layer of protocol.
         self._sigterm = self._check_term_threshold()
+        #: bool: If keep options as raw bytes instead of decoding them.
+        self._skipopt = self._check_skip_options()
 
         # post-init customisations
-        self.__post_init__(file, length, **kwargs)
+        recorder = instrument.RECORDER.get()
+        if recorder is None:
+            self.__post_init__(file, length, **kwargs)
+        else:
+            recorder.decode(self, file, length, **kwargs)
 
     def __post_init__(self, file=None, length=None, **kwargs):
         """Post initialisation hook.
@@ -547,6 +601,28 @@ class Protocol(metaclass=abc.ABCMeta):
                 raise StructError(f'{self.__class__.__name__}: unpack failed')
         return buf
 
+    def _read_bits(self, size=1):
+        """Read bytes and convert into bit field.
+
+        Bits of the field are extracted with shifts and masks on the
+        returned integer, where the first bit on wire is the most
+        significant bit, i.e. ``1 << (size * 8 - 1)``.
+
+        Arguments:
+            size (int): buffer size
+
+        Returns:
+            int: bit field as a big-endian unsigned integer
+
+        Raises:
+            StructError: If the buffer is shorter than ``size``.
+
+        """
+        mem = self._file.read(size)
+        if len(mem) != size:
+            raise StructError(f'{self.__class__.__name__}: unpack failed')
+        return int.from_bytes(mem, 'big')
+
     def _read_binary(self, size=1):
         """Read bytes and convert into binaries.
 
@@ -556,12 +632,12 @@ class Protocol(metaclass=abc.ABCMeta):
         Returns:
             str: binary bits (``0``/``1``)
 
+        Note:
+            Bit strings are kept for backward compatibility only, please
+            use :meth:`~pcapkit.protocols.protocol.Protocol._read_bits` instead.
+
         """
-        bin_ = ''
-        for _ in range(size):
-            byte = self._file.read(1)
-            bin_ += bin(ord(byte))[2:].zfill(8)
-        return bin_
+        return format(self._read_bits(size), f'0{size * 8}b')
 
     @seekset
     def _read_packet(self, length=None, *, header=None, payload=None, discard=False):
@@ -728,18 +804,16 @@ class Protocol(metaclass=abc.ABCMeta):
             pcapkit.protocols.protocol.Protocol: instance of next layer
 
         """
-        if length is not None and length == 0:
+        if (length is not None and length == 0) or self._sigterm:
             from pcapkit.protocols.null import \
-                NoPayload as protocol  # pylint: disable=import-outside-toplevel
-        elif self._sigterm:
-            from pcapkit.protocols.raw import \
-                Raw as protocol  # pylint: disable=import-outside-toplevel
-        else:
-            module, name = self.__proto__[proto]
-            protocol = getattr(importlib.import_module(module), name)
+                NoPayload  # pylint: disable=import-outside-toplevel
+            return NoPayload()
+
+        module, name = self.__proto__[proto]
+        protocol = getattr(importlib.import_module(module), name)
 
         next_ = protocol(io.BytesIO(self._read_fileng(length)), length,
-                         layer=self._exlayer, protocol=self._exproto)
+                         _threshold=self._exthrd, _skip_options=self._exopts, _decode_policy=self._exdec)
 
         return next_
 
@@ -747,16 +821,152 @@ class Protocol(metaclass=abc.ABCMeta):
         """Check if reached termination threshold.
 
         Returns:
-            bool: if reached termination threshold
+            bool: if reached termination threshold, i.e. current protocol class is in
+            :attr:`self._exthrd <pcapkit.protocols.protocol.Protocol._exthrd>`
+
+        """
+        return type(self) in self._exthrd
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _compile_threshold(layer=None, protocol=None):
+        """Compile termination threshold.
+
+        Arguments:
+            layer (Optional[str]): parse packet until such layer, e.g. ``'Internet'``
+            protocol (Optional[Union[str, Tuple[str]]]): parse packet until such protocol(s)
+
+        Returns:
+            FrozenSet[Type[Protocol]]: all protocol classes whose :attr:`__layer__` matches
+            ``layer``, or whose :meth:`id` matches any of ``protocol`` (case insensitive);
+            the result is cached and shall be shared among all frames of an extraction
+
+        """
+        # ``'None'`` layer and ``'null'`` protocol are the defaults for no threshold
+        layer = (layer or '').lower()
+        if layer == 'none':
+            layer = ''
+        iterable = protocol if isinstance(protocol, tuple) else (protocol,)
+        names = {name.lower() for name in iterable if name} - {'null', 'none'}
+        if not (layer or names):
+            return frozenset()
+
+        # protocol modules are imported lazily, load only those of the layer and
+        # protocols through the lazy name tables to collect subclasses
+        import pcapkit.protocols as protocols  # pylint: disable=import-outside-toplevel
+        table = {attr.lower(): attr for attr in dir(protocols)}
+        if layer in ('link', 'internet', 'transport', 'application'):
+            package = getattr(protocols, layer)
+            for attr in dir(package):
+                getattr(package, attr)
+        if names.issubset(table):
+            for name in names:
+                getattr(protocols, table[name])
+        else:
+            # aliases not in the name tables, load all protocol modules instead
+            for module in pkgutil.walk_packages(protocols.__path__, 'pcapkit.protocols.'):
+                importlib.import_module(module.name)
+
+        threshold = set()
+        pending = [Protocol]
+        while pending:
+            cls = pending.pop()
+            pending.extend(cls.__subclasses__())
+
+            index = cls.id()
+            aliases = index if isinstance(index, tuple) else (index,)
+            if (layer and (cls.__layer__ or '').lower() == layer) or names.intersection(map(str.lower, aliases)):
+                threshold.add(cls)
+        return frozenset(threshold)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _compile_skip_options(skip_options=False):
+        """Compile protocols whose options are kept as raw bytes.
+
+        Arguments:
+            skip_options (Union[bool, str, Tuple[str]]): keep options of all (:data:`True`),
+                none (:data:`False`) or such protocol(s)
+
+        Returns:
+            Union[bool, FrozenSet[Type[Protocol]]]: the flag as is, or all protocol classes
+            whose :meth:`id` matches any of ``skip_options`` (case insensitive, c.f.
+            :meth:`_compile_threshold`); the result is cached and shall be shared among all
+            frames of an extraction
 
         """
-        index = self.id()
-        layer = self.__layer__ or ''
+        if isinstance(skip_options, bool):
+            return skip_options
+        return Protocol._compile_threshold(None, skip_options)
+
+    def _check_skip_options(self):
+        """Check if keep options as raw bytes.
 
-        pattern = r'|'.join(index) if isinstance(index, tuple) else index
-        iterable = self._exproto if isinstance(self._exproto, tuple) else (self._exproto,)
+        Returns:
+            bool: if options of current protocol should be kept as raw bytes,
+            i.e. :attr:`self._exopts <pcapkit.protocols.protocol.Protocol._exopts>`
+            is :data:`True` or contains current protocol class
 
-        layer_match = re.fullmatch(layer, self._exlayer, re.IGNORECASE)
-        protocol_match = filter(lambda string: re.fullmatch(pattern, string, re.IGNORECASE), iterable)  # pylint: disable=filter-builtin-not-iterating
+        """
+        if isinstance(self._exopts, bool):
+            return self._exopts
+        return type(self) in self._exopts
 
-        return bool(list(protocol_match) or layer_match)
+    def _decode_text(self, byte):
+        """Decode text fields of current protocol.
+
+        The text is decoded as per :attr:`self._exdec <pcapkit.protocols.protocol.Protocol._exdec>`
+        (c.f. :meth:`decode`). Charsets detected by |chardet|_ are cached for the flow which the packet
+        belongs to (c.f. :attr:`self._exflow <pcapkit.protocols.protocol.Protocol._exflow>`), and will be
+        tried first for further non-conforming text of the same flow.
+
+        Args:
+            byte (bytes): Source bytestring.
+
+        Returns:
+            str: Decoded string.
+
+        """
+        if self._exdec != 'fast':
+            return self.decode(byte, policy=self._exdec)
+
+        with _CHARSET_LOCK:
+            cached = _CHARSET_CACHE.get(self._exflow)
+        for charset in ('ascii', 'utf-8', cached):
+            if charset is None:
+                break
+            with contextlib.suppress(UnicodeDecodeError, LookupError):
+                return byte.decode(charset)
+
+        import chardet  # pylint: disable=import-outside-toplevel
+        charset = chardet.detect(byte)['encoding']
+        if charset is not None and self._exflow is not None:
+            with _CHARSET_LOCK:
+                _CHARSET_CACHE[self._exflow] = charset
+                _CHARSET_CACHE.move_to_end(self._exflow)
+                if len(_CHARSET_CACHE) > CHARSET_CACHE_SIZE:
+                    _CHARSET_CACHE.popitem(last=False)
+        return self.decode(byte, encoding=charset or 'utf-8')
+
+    def _read_options_at(self, offset, reader, *args, **kwargs):
+        """Decode options from the raw packet data on demand.
+
+        Arguments:
+            offset (int): offset of the options from the start of current protocol
+            reader (Callable[..., Tuple[tuple, dict]]): option list reader, e.g.
+                :meth:`TCP._read_tcp_options <pcapkit.protocols.transport.tcp.TCP._read_tcp_options>`
+            *args: arbitrary positional arguments for ``reader``
+
+        Keyword Arguments:
+            **kwargs: arbitrary keyword arguments for ``reader``
+
+        Returns:
+            Tuple[tuple, dict]: option acronyms and option data as returned by ``reader``
+
+        """
+        seek_cur = self._file.tell()
+        try:
+            self._file.seek(offset, io.SEEK_SET)
+            return reader(*args, **kwargs)
+        finally:
+            self._file.seek(seek_cur, io.SEEK_SET)
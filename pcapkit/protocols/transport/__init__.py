@@ -8,18 +8,21 @@ methods.
 """
 # TODO: Implements DCCP, RSVP, STCP.
 
-# Base Class for Transport Layer
-from pcapkit.protocols.transport.transport import Transport
-
-# Utility Classes for Protocols
-from pcapkit.protocols.transport.tcp import TCP
-from pcapkit.protocols.transport.udp import UDP
-
-# Transport Layer Protocol Numbers
-from pcapkit.protocols.transport.transport import TP_PROTO
-
+from pcapkit.utilities.compat import lazy_import
 
 __all__ = [
     'TP_PROTO',     # Protocol Numbers
     'TCP', 'UDP',   # Transport Layer Protocols
 ]
+
+__getattr__, __dir__ = lazy_import(__name__, {
+    # Base Class for Transport Layer
+    'Transport': ('pcapkit.protocols.transport.transport', 'Transport'),
+
+    # Utility Classes for Protocols
+    'TCP': ('pcapkit.protocols.transport.tcp', 'TCP'),
+    'UDP': ('pcapkit.protocols.transport.udp', 'UDP'),
+
+    # Transport Layer Protocol Numbers
+    'TP_PROTO': ('pcapkit.protocols.transport.transport', 'TP_PROTO'),
+})
@@ -43,6 +43,7 @@ from pcapkit.const.tcp.checksum import Checksum as chksum_opt
 from pcapkit.const.tcp.mp_tcp_option import MPTCPOption
 from pcapkit.const.tcp.option import Option as OPT_TYPE
 from pcapkit.corekit.infoclass import Info
+from pcapkit.corekit.tlv import TLVEngine
 from pcapkit.protocols.transport.transport import Transport
 from pcapkit.utilities.exceptions import ProtocolError
 
@@ -56,27 +57,26 @@ op_len = lambda n: n * 8
 
 # pylint: disable=protected-access
 mptcp_opt = {   # [RFC 6824]
-    0: lambda self, bits, size, kind: self._read_mptcp_capable(bits, size, kind),      # MP_CAPABLE
-    1: lambda self, bits, size, kind: self._read_mptcp_join(bits, size, kind),         # MP_JOIN
-    2: lambda self, bits, size, kind: self._read_mptcp_dss(bits, size, kind),          # DSS
-    3: lambda self, bits, size, kind: self._read_mptcp_add(bits, size, kind),          # ADD_ADDR
-    4: lambda self, bits, size, kind: self._read_mptcp_remove(bits, size, kind),       # REMOVE_ADDR
-    5: lambda self, bits, size, kind: self._read_mptcp_prio(bits, size, kind),         # MP_PRIO
-    6: lambda self, bits, size, kind: self._read_mptcp_fail(bits, size, kind),         # MP_FAIL
-    7: lambda self, bits, size, kind: self._read_mptcp_fastclose(bits, size, kind),    # MP_FASTCLOSE
+    0: lambda self, bits, data, kind: self._read_mptcp_capable(bits, data, kind),      # MP_CAPABLE
+    1: lambda self, bits, data, kind: self._read_mptcp_join(bits, data, kind),         # MP_JOIN
+    2: lambda self, bits, data, kind: self._read_mptcp_dss(bits, data, kind),          # DSS
+    3: lambda self, bits, data, kind: self._read_mptcp_add(bits, data, kind),          # ADD_ADDR
+    4: lambda self, bits, data, kind: self._read_mptcp_remove(bits, data, kind),       # REMOVE_ADDR
+    5: lambda self, bits, data, kind: self._read_mptcp_prio(bits, data, kind),         # MP_PRIO
+    6: lambda self, bits, data, kind: self._read_mptcp_fail(bits, data, kind),         # MP_FAIL
+    7: lambda self, bits, data, kind: self._read_mptcp_fastclose(bits, data, kind),    # MP_FASTCLOSE
 }
 
-# pylint: disable=protected-access
 process_opt = {
-    0: lambda self, size, kind: self._read_mode_donone(size, kind),    # do nothing
-    1: lambda self, size, kind: self._read_mode_unpack(size, kind),    # unpack according to size
-    2: lambda self, size, kind: self._read_mode_tsopt(size, kind),     # Timestamps
-    3: lambda self, size, kind: self._read_mode_pocsp(size, kind),     # POC Service Profile
-    4: lambda self, size, kind: self._read_mode_acopt(size, kind),     # Alternate Checksum Request
-    5: lambda self, size, kind: self._read_mode_qsopt(size, kind),     # Quick-Start Response
-    6: lambda self, size, kind: self._read_mode_utopt(size, kind),     # User Timeout Option
-    7: lambda self, size, kind: self._read_mode_tcpao(size, kind),     # TCP Authentication Option
-    8: lambda self, size, kind: self._read_mode_mptcp(size, kind),     # Multipath TCP
+    0: '_read_mode_donone',     # do nothing
+    1: '_read_mode_unpack',     # unpack according to size
+    2: '_read_mode_tsopt',      # Timestamps
+    3: '_read_mode_pocsp',      # POC Service Profile
+    4: '_read_mode_acopt',      # Alternate Checksum Request
+    5: '_read_mode_qsopt',      # Quick-Start Response
+    6: '_read_mode_utopt',      # User Timeout Option
+    7: '_read_mode_tcpao',      # TCP Authentication Option
+    8: '_read_mode_mptcp',      # Multipath TCP
 }
 
 TCP_OPT = {                          # # kind  length  type  process  comment            name
@@ -152,6 +152,11 @@ TCP_OPT
 
 """
 
+#: TLV engine for TCP options, where EOOL and NOP are one-octet options, and
+#: permission options (without process) have no decoder.
+TCP_TLV = TLVEngine({kind: process_opt[opts[3]] for (kind, opts) in TCP_OPT.items() if len(opts) > 3},
+                    singles=(0, 1), end=(0,))
+
 
 class TCP(Transport):
     """This class implements Transmission Control Protocol."""
@@ -238,8 +243,8 @@ class TCP(Transport):
         _dstp = self._read_unpack(2)
         _seqn = self._read_unpack(4)
         _ackn = self._read_unpack(4)
-        _lenf = self._read_binary(1)
-        _flag = self._read_binary(1)
+        _lenf = self._read_bits(1)
+        _flag = self._read_bits(1)
         _wins = self._read_unpack(2)
         _csum = self._read_fileng(2)
         _urgp = self._read_unpack(2)
@@ -249,17 +254,17 @@ class TCP(Transport):
             dstport=_dstp,
             seq=_seqn,
             ack=_ackn,
-            hdr_len=int(_lenf[:4], base=2) * 4,
+            hdr_len=(_lenf >> 4) * 4,
             flags=dict(
-                ns=bool(int(_lenf[7])),
-                cwr=bool(int(_flag[0])),
-                ece=bool(int(_flag[1])),
-                urg=bool(int(_flag[2])),
-                ack=bool(int(_flag[3])),
-                psh=bool(int(_flag[4])),
-                rst=bool(int(_flag[5])),
-                syn=bool(int(_flag[6])),
-                fin=bool(int(_flag[7])),
+                ns=bool(_lenf & 0x01),
+                cwr=bool(_flag & 0x80),
+                ece=bool(_flag & 0x40),
+                urg=bool(_flag & 0x20),
+                ack=bool(_flag & 0x10),
+                psh=bool(_flag & 0x08),
+                rst=bool(_flag & 0x04),
+                syn=bool(_flag & 0x02),
+                fin=bool(_flag & 0x01),
             ),
             window_size=_wins,
             checksum=_csum,
@@ -267,20 +272,44 @@ class TCP(Transport):
         )
 
         # packet type flags
-        self._syn = bool(int(_flag[6]))
-        self._ack = bool(int(_flag[3]))
+        self._syn = bool(_flag & 0x02)
+        self._ack = bool(_flag & 0x10)
 
         _hlen = tcp['hdr_len']
         _optl = _hlen - 20
         if _optl:
-            options = self._read_tcp_options(_optl)
-            tcp['opt'] = options[0]     # tuple of option acronyms
-            tcp.update(options[1])      # merge option info to buffer
+            if self._skipopt:
+                tcp['opt'] = self._read_fileng(_optl)   # raw option bytes
+            else:
+                options = self._read_tcp_options(_optl)
+                tcp['opt'] = options[0]     # tuple of option acronyms
+                tcp.update(options[1])      # merge option info to buffer
 
         length -= _hlen
         tcp['packet'] = self._read_packet(header=_hlen, payload=length)
 
-        return self._decode_next_layer(tcp, None, length)
+        return self._decode_next_layer(tcp, (_srcp, _dstp), length)
+
+    def read_options(self):
+        """Decode TCP options on demand.
+
+        Options are kept as raw bytes in ``opt`` when parsing with ``skip_options``
+        (c.f. :class:`~pcapkit.foundation.extraction.Extractor`), which can then
+        be decoded from the raw packet data through this method.
+
+        Returns:
+            Info: Parsed TCP options, with ``opt`` as the tuple of option acronyms
+            and option data merged as in :meth:`read`.
+
+        """
+        tcp = dict(opt=tuple())
+
+        _optl = self._info.hdr_len - 20  # pylint: disable=E1101
+        if _optl:
+            options = self._read_options_at(20, self._read_tcp_options, _optl)
+            tcp['opt'] = options[0]     # tuple of option acronyms
+            tcp.update(options[1])      # merge option info to buffer
+        return Info(tcp)
 
     def make(self, **kwargs):
         """Make (construct) packet data.
@@ -333,72 +362,55 @@ class TCP(Transport):
             Tuple of TCP option list and extracted TCP options.
 
         """
-        counter = 0         # length of read option list
-        optkind = list()    # option kind list
-        options = dict()    # dict of option data
-
-        while counter < size:
-            # get option kind
-            kind = self._read_unpack(1)
+        view = memoryview(self._read_fileng(size))
+        items, counter = TCP_TLV.walk(view)
+        decoders = TCP_TLV.compile(type(self))
+
+        records = list()    # decoded option records
+        for (kind, start, stop, len_) in items:
+            if stop > size:     # truncated option
+                counter = start
+                break
 
             # fetch corresponding option tuple
             opts = TCP_OPT.get(kind)
             enum = OPT_TYPE.get(kind)
             if opts is None:
-                len_ = size - counter
+                records.append((enum, enum.name, bytes(view[start+1:])))
                 counter = size
-                optkind.append(enum)
-                options[enum.name] = self._read_fileng(len_)
                 break
 
             # extract option
-            dscp = opts[1]
             if opts[0]:
-                len_ = self._read_unpack(1)
-                byte = opts[2](len_)
-                if byte:    # check option process mode
-                    data = process_opt[opts[3]](self, byte, kind)
-                else:       # permission options (length is 2)
+                func = decoders[kind]
+                if func is None:    # permission options (length is 2)
                     data = dict(
                         kind=kind,      # option kind
                         length=2,       # option length
                         flag=True,      # permission flag
                     )
+                else:               # decode option data from the slice
+                    data = func(self, kind, view[start+2:stop])
             else:           # 1-bytes options
-                len_ = 1
                 data = dict(
                     kind=kind,      # option kind
                     length=1,       # option length
                 )
-
-            # record option data
-            counter += len_
-            if enum in optkind:
-                if isinstance(options[dscp], tuple):
-                    options[dscp] += (Info(data),)
-                else:
-                    options[dscp] = (Info(options[dscp]), Info(data))
-            else:
-                optkind.append(enum)
-                options[dscp] = data
-
-            # break when eol triggered
-            if not kind:
-                break
+            records.append((enum, opts[1], data))
+        optkind, options = TCP_TLV.collect(records)
 
         # get padding
         if counter < size:
-            len_ = size - counter
-            options['padding'] = self._read_fileng(len_)
+            options['padding'] = bytes(view[counter:])
 
-        return tuple(optkind), options
+        return optkind, options
 
-    def _read_mode_donone(self, size, kind):
+    def _read_mode_donone(self, kind, data):
         """Read options request no process.
 
         Arguments:
-            size (int): length of option
             kind (int): option kind value
+            data (memoryview): option data
 
         Returns:
             DataType_TCP_Opt_DONONE: Extracted option with no operation.
@@ -406,17 +418,17 @@ class TCP(Transport):
         """
         data = dict(
             kind=kind,
-            length=size,
-            data=self._read_fileng(size),
+            length=len(data),
+            data=bytes(data),
         )
         return data
 
-    def _read_mode_unpack(self, size, kind):
+    def _read_mode_unpack(self, kind, data):
         """Read options request unpack process.
 
         Arguments:
-            size (int): length of option
             kind (int): option kind value
+            data (memoryview): option data
 
         Returns:
             DataType_TCP_Opt_UNPACK: Extracted option which unpacked.
@@ -424,12 +436,12 @@ class TCP(Transport):
         """
         data = dict(
             kind=kind,
-            length=size,
-            data=self._read_unpack(size),
+            length=len(data),
+            data=int.from_bytes(data, 'big'),
         )
         return data
 
-    def _read_mode_tsopt(self, size, kind):
+    def _read_mode_tsopt(self, kind, data):
         """Read Timestamps option.
 
         Structure of TCP ``TSopt`` [:rfc:`7323`]::
@@ -440,23 +452,23 @@ class TCP(Transport):
                 1       1              4                     4
 
         Arguments:
-            size (int): length of option
             kind (Literal[8]): option kind value (Timestamps)
+            data (memoryview): option data
 
         Returns:
             DataType_TCP_Opt_TS: extracted Timestamps (``TS``) option
 
         """
-        temp = struct.unpack('>II', self._read_fileng(size))
+        temp = struct.unpack('>II', data)
         data = dict(
             kind=kind,
-            length=size,
+            length=len(data),
             val=temp[0],
             ecr=temp[1],
         )
         return data
 
-    def _read_mode_pocsp(self, size, kind):
+    def _read_mode_pocsp(self, kind, data):
         """Read Partial Order Connection Service Profile option.
 
         Structure of TCP ``POC-SP`` Option [:rfc:`1693`][:rfc:`6247`]::
@@ -467,26 +479,28 @@ class TCP(Transport):
             +----------+----------+------------+----------+--------+
 
         Arguments:
-            size (int): length of option
             kind (Literal[10]): option kind value (POC-Serv Profile)
+            data (memoryview): option data
 
         Returns:
             DataType_TCP_Opt_POCSP: extracted Partial Order Connection Service Profile (``POC-SP``) option
 
         """
-        temp = self._read_binary(size)
+        size = len(data)
+        bits = size * 8
+        temp = int.from_bytes(data, 'big')
 
         data = dict(
             kind=kind,
             length=size,
-            start=bool(int(temp[0])),
-            end=bool(int(temp[1])),
-            filler=bytes(chr(int(temp[2:], base=2)), encoding='utf-8'),
+            start=bool(temp >> (bits - 1) & 0x1),
+            end=bool(temp >> (bits - 2) & 0x1),
+            filler=bytes(chr(temp & ((1 << (bits - 2)) - 1)), encoding='utf-8'),
         )
 
         return data
 
-    def _read_mode_acopt(self, size, kind):
+    def _read_mode_acopt(self, kind, data):
         """Read Alternate Checksum Request option.
 
         Structure of TCP ``CHKSUM-REQ`` [:rfc:`1146`][:rfc:`6247`]::
@@ -496,25 +510,25 @@ class TCP(Transport):
             +----------+----------+----------+
 
         Arguments:
-            size (int): length of option
             kind (Literal[14]): option kind value (Alt-Chksum Request)
+            data (memoryview): option data
 
         Returns:
             DataType_TCP_Opt_ACOPT: extracted Alternate Checksum Request (``CHKSUM-REQ``) option
 
         """
-        temp = self._read_unpack(size)
+        temp = int.from_bytes(data, 'big')
         algo = chksum_opt.get(temp)
 
         data = dict(
             kind=kind,
-            length=size,
+            length=len(data),
             ac=algo,
         )
 
         return data
 
-    def _read_mode_qsopt(self, size, kind):
+    def _read_mode_qsopt(self, kind, data):
         """Read Quick-Start Response option.
 
         Structure of TCP ``QSopt`` [:rfc:`4782`]::
@@ -529,28 +543,26 @@ class TCP(Transport):
             +-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+
 
         Arguments:
-            size (int): length of option
             kind (Literal[27]): option kind value (Quick-Start Response)
+            data (memoryview): option data
 
         Returns:
             DataType_TCP_Opt_QSOPT: extracted Quick-Start Response (``QS``) option
 
         """
-        rvrr = self._read_binary(1)
-        ttld = self._read_unpack(1)
-        noun = self._read_binary(4)
+        rvrr, ttld, noun = struct.unpack_from('>BBI', data)
 
         data = dict(
             kind=kind,
-            length=size,
-            req_rate=int(rvrr[4:], base=2),
+            length=len(data),
+            req_rate=rvrr & 0x0F,
             ttl_diff=ttld,
-            nounce=int(noun[:-2], base=2),
+            nounce=noun >> 2,
         )
 
         return data
 
-    def _read_mode_utopt(self, size, kind):
+    def _read_mode_utopt(self, kind, data):
         """Read User Timeout option.
 
         Structure of TCP ``TIMEOUT`` [:rfc:`5482`]::
@@ -562,29 +574,32 @@ class TCP(Transport):
             +-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+
 
         Arguments:
-            size (int): length of option
             kind (Literal[28]): option kind value (User Timeout Option)
+            data (memoryview): option data
 
         Returns:
             DataType_TCP_Opt_UTOPT: extracted User Timeout (``TIMEOUT``) option
 
         """
-        temp = self._read_fileng(size)
-        if int(temp[0]):
-            time = datetime.timedelta(minutes=int(temp[0:], base=2))
+        size = len(data)
+        bits = size * 8
+        temp = int.from_bytes(data, 'big')
+        gran = temp >> (bits - 1) & 0x1
+        if gran:
+            time = datetime.timedelta(minutes=temp & ((1 << (bits - 1)) - 1))
         else:
-            time = datetime.timedelta(seconds=int(temp[0:], base=2))
+            time = datetime.timedelta(seconds=temp & ((1 << (bits - 1)) - 1))
 
         data = dict(
             kind=kind,
             length=size,
-            granularity='minutes' if int(temp[0]) else 'seconds',
+            granularity='minutes' if gran else 'seconds',
             timeout=time,
         )
 
         return data
 
-    def _read_mode_tcpao(self, size, kind):
+    def _read_mode_tcpao(self, kind, data):
         """Read Authentication option.
 
         Structure of TCP ``AOopt`` [:rfc:`5925`]::
@@ -600,20 +615,20 @@ class TCP(Transport):
             ...-----------------+
 
         Arguments:
-            size (int): length of option
             kind (Literal[29]): option kind value (TCP Authentication Option)
+            data (memoryview): option data
 
         Returns:
             DataType_TCP_Opt_TCPAO: extracted Authentication (``AO``) option
 
         """
-        key_ = self._read_unpack(1)
-        rkey = self._read_unpack(1)
-        mac_ = self._read_fileng(size - 2)
+        key_ = data[0]
+        rkey = data[1]
+        mac_ = bytes(data[2:])
 
         data = dict(
             kind=kind,
-            length=size,
+            length=len(data),
             key_id=key_,
             r_next_key_id=rkey,
             mac=mac_,
@@ -621,7 +636,7 @@ class TCP(Transport):
 
         return data
 
-    def _read_mode_mptcp(self, size, kind):
+    def _read_mode_mptcp(self, kind, data):
         """Read Multipath TCP option.
 
         Structure of ``MP-TCP`` [:rfc:`6824`]::
@@ -636,33 +651,33 @@ class TCP(Transport):
             +---------------------------------------------------------------+
 
         Arguments:
-            size (int): length of option
             kind (Literal[30]): option kind value (Multipath TCP)
+            data (memoryview): option data
 
         Returns:
             DataType_TCP_Opt_MPTCP: extracted Multipath TCP (``MP-TCP``) option
 
         """
-        bins = self._read_binary(1)
-        subt = int(bins[:4], base=2)    # subtype number
-        bits = bins[4:]                 # 4-bit data
-        dlen = size - 1                 # length of remaining data
+        size = len(data)
+        bins = data[0]
+        subt = bins >> 4                # subtype number
+        bits = bins & 0x0F              # 4-bit data
 
         # fetch subtype-specific data
         func = mptcp_opt.get(subt)
         if func is None:    # if subtype not exist, directly read all data
-            temp = self._read_fileng(dlen)
+            temp = bytes(data[1:])
             data = dict(
                 kind=kind,
                 length=size,
                 subtype=MPTCPOption.get(subt),
-                data=bytes(chr(int(bits[:4], base=2)), encoding='utf-8') + temp,
+                data=bytes(chr(bits), encoding='utf-8') + temp,
             )
         else:               # fetch corresponding subtype data dict
-            data = func(self, bits, dlen, kind)
+            data = func(self, bits, data[1:], kind)
         return data
 
-    def _read_mptcp_capable(self, bits, size, kind):
+    def _read_mptcp_capable(self, bits, data, kind):
         """Read Multipath Capable option.
 
         Structure of ``MP_CAPABLE`` [:rfc:`6824`]::
@@ -682,18 +697,19 @@ class TCP(Transport):
             +---------------------------------------------------------------+
 
         Arguments:
-            bits (str): 4-bit data (after subtype)
-            size (int): length of option
+            bits (int): 4-bit data (after subtype)
+            data (memoryview): option data (after subtype)
             kind (Literal[30]): option kind value (Multipath TCP)
 
         Returns:
             DataType_TCP_Opt_MP_CAPABLE: extracted Multipath Capable (``MP_CAPABLE``) option
 
         """
-        vers = int(bits, base=2)
-        bins = self._read_binary(1)
-        skey = self._read_unpack(8)
-        rkey = self._read_unpack(8) if size == 17 else None
+        size = len(data)
+        vers = bits
+        bins = data[0]
+        skey = int.from_bytes(data[1:9], 'big')
+        rkey = int.from_bytes(data[9:17], 'big') if size == 17 else None
 
         data = dict(
             kind=kind,
@@ -702,10 +718,10 @@ class TCP(Transport):
             capable=dict(
                 version=vers,
                 flags=dict(
-                    req=bool(int(bins[0])),
-                    ext=bool(int(bins[1])),
-                    res=tuple(bool(int(bit)) for bit in bits[2:7]),
-                    hsa=bool(int(bins[7])),
+                    req=bool(bins & 0x80),
+                    ext=bool(bins & 0x40),
+                    res=tuple(bool(bins & mask) for mask in (0x20, 0x10, 0x08, 0x04, 0x02)),
+                    hsa=bool(bins & 0x01),
                 ),
                 skey=skey,
                 rkey=rkey,
@@ -714,12 +730,12 @@ class TCP(Transport):
 
         return data
 
-    def _read_mptcp_join(self, bits, size, kind):
+    def _read_mptcp_join(self, bits, data, kind):
         """Read Join Connection option.
 
         Arguments:
-            bits (str): 4-bit data (after subtype)
-            size (int): length of option
+            bits (int): 4-bit data (after subtype)
+            data (memoryview): option data (after subtype)
             kind (Literal[30]): option kind value (Multipath TCP)
 
         Returns:
@@ -727,25 +743,25 @@ class TCP(Transport):
 
         """
         if self._syn and self._ack:      # MP_JOIN-SYN/ACK
-            return self._read_join_synack(bits, size, kind)
+            return self._read_join_synack(bits, data, kind)
         if self._syn and not self._ack:  # MP_JOIN-SYN
-            return self._read_join_syn(bits, size, kind)
+            return self._read_join_syn(bits, data, kind)
         if not self._syn and self._ack:  # MP_JOIN-ACK
-            return self._read_join_ack(bits, size, kind)
+            return self._read_join_ack(bits, data, kind)
 
-        temp = self._read_fileng(size)   # illegal MP_JOIN occurred
+        temp = bytes(data)               # illegal MP_JOIN occurred
         data = dict(
             kind=kind,
-            length=size + 1,
+            length=len(data) + 1,
             subtype=MPTCPOption(1),
             connection=None,
             join=dict(
-                data=bytes(chr(int(bits[:4], base=2)), encoding='utf-8') + temp,
+                data=bytes(chr(bits), encoding='utf-8') + temp,
             ),
         )
         return data
 
-    def _read_join_syn(self, bits, size, kind):
+    def _read_join_syn(self, bits, data, kind):
         """Read Join Connection option for Initial SYN.
 
         Structure of ``MP_JOIN-SYN`` [:rfc:`6824`]::
@@ -761,26 +777,24 @@ class TCP(Transport):
             +---------------------------------------------------------------+
 
         Arguments:
-            bits (str): 4-bit data (after subtype)
-            size (int): length of option
+            bits (int): 4-bit data (after subtype)
+            data (memoryview): option data (after subtype)
             kind (Literal[30]): option kind value (Multipath TCP)
 
         Returns:
             DataType_TCP_Opt_MP_JOIN_SYN: extracted Join Connection (``MP_JOIN-SYN``) option for Initial SYN
 
         """
-        adid = self._read_unpack(1)
-        rtkn = self._read_unpack(4)
-        srno = self._read_unpack(4)
+        adid, rtkn, srno = struct.unpack_from('>BII', data)
 
         data = dict(
             kind=kind,
-            length=size + 1,
+            length=len(data) + 1,
             subtype=MPTCPOption(1),
             connection='SYN',
             join=dict(
                 syn=dict(
-                    backup=bool(int(bits[3])),
+                    backup=bool(bits & 0x1),
                     addr_id=adid,
                     token=rtkn,
                     rand_num=srno,
@@ -790,7 +804,7 @@ class TCP(Transport):
 
         return data
 
-    def _read_join_synack(self, bits, size, kind):
+    def _read_join_synack(self, bits, data, kind):
         """Read Join Connection option for Responding SYN/ACK.
 
         Structure of ``MP_JOIN-SYN/ACK`` [:rfc:`6824`]::
@@ -808,8 +822,8 @@ class TCP(Transport):
             +---------------------------------------------------------------+
 
         Arguments:
-            bits (str): 4-bit data (after subtype)
-            size (int): length of option
+            bits (int): 4-bit data (after subtype)
+            data (memoryview): option data (after subtype)
             kind (Literal[30]): option kind value (Multipath TCP)
 
         Returns:
@@ -817,18 +831,16 @@ class TCP(Transport):
             option for Responding SYN/ACK
 
         """
-        adid = self._read_unpack(1)
-        hmac = self._read_fileng(8)
-        srno = self._read_unpack(4)
+        adid, hmac, srno = struct.unpack_from('>B8sI', data)
 
         data = dict(
             kind=kind,
-            length=size + 1,
+            length=len(data) + 1,
             subtype=MPTCPOption(1),
             connection='SYN/ACK',
             join=dict(
                 synack=dict(
-                    backup=bool(int(bits[3])),
+                    backup=bool(bits & 0x1),
                     addr_id=adid,
                     hmac=hmac,
                     rand_num=srno,
@@ -838,7 +850,7 @@ class TCP(Transport):
 
         return data
 
-    def _read_join_ack(self, bits, size, kind):  # pylint: disable=unused-argument
+    def _read_join_ack(self, bits, data, kind):  # pylint: disable=unused-argument
         """Read Join Connection option for Third ACK.
 
         Structure of ``MP_JOIN-ACK`` [:rfc:`6824`]::
@@ -856,8 +868,8 @@ class TCP(Transport):
             +---------------------------------------------------------------+
 
         Arguments:
-            bits (str): 4-bit data (after subtype)
-            size (int): length of option
+            bits (int): 4-bit data (after subtype)
+            data (memoryview): option data (after subtype)
             kind (Literal[30]): option kind value (Multipath TCP)
 
         Returns:
@@ -865,11 +877,11 @@ class TCP(Transport):
             option for Third ACK
 
         """
-        temp = self._read_fileng(20)
+        temp = bytes(data[1:21])
 
         data = dict(
             kind=kind,
-            length=size + 1,
+            length=len(data) + 1,
             subtype=MPTCPOption(1),
             connection='ACK',
             join=dict(
@@ -881,7 +893,7 @@ class TCP(Transport):
 
         return data
 
-    def _read_mptcp_dss(self, bits, size, kind):
+    def _read_mptcp_dss(self, bits, data, kind):
         """Read Data Sequence Signal (Data ACK and Data Sequence Mapping) option.
 
         Structure of ``DSS`` [:rfc:`6824`]::
@@ -905,24 +917,33 @@ class TCP(Transport):
             +-------------------------------+------------------------------+
 
         Arguments:
-            bits (str): 4-bit data (after subtype)
-            size (int): length of option
+            bits (int): 4-bit data (after subtype)
+            data (memoryview): option data (after subtype)
             kind (Literal[30]): option kind value (Multipath TCP)
 
         Returns:
             DataType_TCP_Opt_DSS: extracted Data Sequence Signal (``DSS``) option
 
         """
-        bits = self._read_binary(1)
-        mflg = 8 if int(bits[4]) else 4
-        Mflg = bool(int(bits[5]))
-        aflg = 8 if int(bits[6]) else 4
-        Aflg = bool(int(bits[7]))
-        ack_ = self._read_unpack(aflg) if Aflg else None
-        dsn_ = self._read_unpack(mflg) if Mflg else None
-        ssn_ = self._read_unpack(4) if Mflg else None
-        dll_ = self._read_unpack(2) if Mflg else None
-        chk_ = self._read_fileng(2) if Mflg else None
+        size = len(data)
+        bits = data[0]
+        mflg = 8 if bits & 0x08 else 4
+        Mflg = bool(bits & 0x04)
+        aflg = 8 if bits & 0x02 else 4
+        Aflg = bool(bits & 0x01)
+
+        offset = 1
+        if Aflg:
+            ack_ = int.from_bytes(data[offset:offset+aflg], 'big')
+            offset += aflg
+        else:
+            ack_ = None
+        if Mflg:
+            dsn_ = int.from_bytes(data[offset:offset+mflg], 'big')
+            ssn_, dll_ = struct.unpack_from('>IH', data, offset + mflg)
+            chk_ = bytes(data[offset+mflg+6:offset+mflg+8])
+        else:
+            dsn_ = ssn_ = dll_ = chk_ = None
 
         data = dict(
             kind=kind,
@@ -930,7 +951,7 @@ class TCP(Transport):
             subtype=MPTCPOption(2),
             dss=dict(
                 flags=dict(
-                    fin=bool(int(bits[3])),
+                    fin=bool(bits & 0x10),
                     dsn_len=mflg,
                     data_pre=Mflg,
                     ack_len=aflg,
@@ -946,7 +967,7 @@ class TCP(Transport):
 
         return data
 
-    def _read_mptcp_add(self, bits, size, kind):
+    def _read_mptcp_add(self, bits, data, kind):
         """Read Add Address option.
 
         Structure of ``ADD_ADDR`` [:rfc:`6824`]::
@@ -962,8 +983,8 @@ class TCP(Transport):
             +-------------------------------+
 
         Arguments:
-            bits (str): 4-bit data (after subtype)
-            size (int): length of option
+            bits (int): 4-bit data (after subtype)
+            data (memoryview): option data (after subtype)
             kind (Literal[30]): option kind value (Multipath TCP)
 
         Returns:
@@ -973,7 +994,7 @@ class TCP(Transport):
             ProtocolError: If the option is malformed.
 
         """
-        vers = int(bits, base=2)
+        vers = bits
         if vers == 4:
             ip_l = 4
         elif vers == 6:
@@ -981,10 +1002,11 @@ class TCP(Transport):
         else:
             raise ProtocolError('[MP_TCP ADD_ADDR] malformed option')
 
-        adid = self._read_unpack(1)
-        ipad = self._read_fileng(ip_l)
+        size = len(data)
+        adid = data[0]
+        ipad = bytes(data[1:1+ip_l])
         pt_l = size - 1 - ip_l
-        port = self._read_unpack(2) if pt_l else None
+        port = int.from_bytes(data[1+ip_l:3+ip_l], 'big') if pt_l else None
 
         data = dict(
             kind=kind,
@@ -1000,7 +1022,7 @@ class TCP(Transport):
 
         return data
 
-    def _read_mptcp_remove(self, bits, size, kind):  # pylint: disable=unused-argument
+    def _read_mptcp_remove(self, bits, data, kind):  # pylint: disable=unused-argument
         """Read Remove Address option.
 
         Structure of ``REMOVE_ADDR`` [:rfc:`6824`]::
@@ -1013,30 +1035,28 @@ class TCP(Transport):
                                        (followed by n-1 Address IDs, if required)
 
         Arguments:
-            bits (str): 4-bit data (after subtype)
-            size (int): length of option
+            bits (int): 4-bit data (after subtype)
+            data (memoryview): option data (after subtype)
             kind (Literal[30]): option kind value (Multipath TCP)
 
         Returns:
             DataType_TCP_Opt_REMOVE_ADDR: extracted Remove Address (``REMOVE_ADDR``) option
 
         """
-        adid = []
-        for _ in size:
-            adid.append(self._read_unpack(1))
+        adid = tuple(data)
 
         data = dict(
             kind=kind,
-            length=size + 1,
+            length=len(data) + 1,
             subtype=MPTCPOption(4),
             removeaddr=dict(
-                addr_id=tuple(adid),
+                addr_id=adid,
             ),
         )
 
         return data
 
-    def _read_mptcp_prio(self, bits, size, kind):
+    def _read_mptcp_prio(self, bits, data, kind):
         """Read Change Subflow Priority option.
 
         Structure of ``MP_PRIO`` [RFC 6824]::
@@ -1048,29 +1068,29 @@ class TCP(Transport):
             +---------------+---------------+-------+-----+-+--------------+
 
         Arguments:
-            bits (str): 4-bit data (after subtype)
-            size (int): length of option
+            bits (int): 4-bit data (after subtype)
+            data (memoryview): option data (after subtype)
             kind (Literal[30]): option kind value (Multipath TCP)
 
         Returns:
             DataType_TCP_Opt_REMOVE_ADDR: extracted Change Subflow Priority (``MP_PRIO``) option
 
         """
-        temp = self._read_unpack(1) if size else None
+        temp = data[0] if data else None
 
         data = dict(
             kind=kind,
-            length=size + 1,
+            length=len(data) + 1,
             subtype=MPTCPOption(4),
             prio=dict(
-                backup=bool(int(bits[3])),
+                backup=bool(bits & 0x1),
                 addr_id=temp,
             ),
         )
 
         return data
 
-    def _read_mptcp_fail(self, bits, size, kind):  # pylint: disable=unused-argument
+    def _read_mptcp_fail(self, bits, data, kind):  # pylint: disable=unused-argument
         """Read Fallback option.
 
         Structure of ``MP_FAIL`` [:rfc:`6824`]::
@@ -1086,20 +1106,19 @@ class TCP(Transport):
             +--------------------------------------------------------------+
 
         Arguments:
-            bits (str): 4-bit data (after subtype)
-            size (int): length of option
+            bits (int): 4-bit data (after subtype)
+            data (memoryview): option data (after subtype)
             kind (Literal[30]): option kind value (Multipath TCP)
 
         Returns:
             DataType_TCP_Opt_MP_FAIL: extracted Fallback (``MP_FAIL``) option
 
         """
-        resv = self._read_fileng(1)  # pylint: disable=unused-variable
-        dsn_ = self._read_unpack(8)
+        dsn_ = int.from_bytes(data[1:9], 'big')
 
         data = dict(
             kind=kind,
-            length=size + 1,
+            length=len(data) + 1,
             subtype=MPTCPOption(6),
             fail=dict(
                 dsn=dsn_,
@@ -1108,7 +1127,7 @@ class TCP(Transport):
 
         return data
 
-    def _read_mptcp_fastclose(self, bits, size, kind):  # pylint: disable=unused-argument
+    def _read_mptcp_fastclose(self, bits, data, kind):  # pylint: disable=unused-argument
         """Read Fast Close option.
 
         Structure of ``MP_FASTCLOSE`` [RFC 6824]::
@@ -1124,20 +1143,19 @@ class TCP(Transport):
             +---------------------------------------------------------------+
 
         Arguments:
-            bits (str): 4-bit data (after subtype)
-            size (int): length of option
+            bits (int): 4-bit data (after subtype)
+            data (memoryview): option data (after subtype)
             kind (Literal[30]): option kind value (Multipath TCP)
 
         Returns:
             DataType_TCP_Opt_MP_FAIL: extracted Fast Close (``MP_FASTCLOSE``) option
 
         """
-        resv = self._read_fileng(1)  # pylint: disable=unused-variable
-        rkey = self._read_fileng(8)
+        rkey = bytes(data[1:9])
 
         data = dict(
             kind=kind,
-            length=size + 1,
+            length=len(data) + 1,
             subtype=MPTCPOption(7),
             fastclose=dict(
                 rkey=rkey,
@@ -52,24 +52,33 @@ class Transport(Protocol):  # pylint: disable=abstract-method
         """Import next layer extractor.
 
         Arguments:
-            proto (str): next layer protocol name
+            proto (Optional[Tuple[int, int]]): source and destination ports, as hints for
+                the application layer protocol and, together with the source and destination
+                addresses from the Internet layer, key of the per-flow protocol cache
             length (int): valid (*non-padding*) length
 
         Returns:
             pcapkit.protocols.protocol.Protocol: instance of next layer
 
+        See Also:
+            :func:`pcapkit.foundation.analysis.analyse`
+
         """
-        if self._exproto == 'null' and self._exlayer == 'None':
-            from pcapkit.protocols.raw import \
-                Raw as protocol  # pylint: disable=import-outside-toplevel
+        from pcapkit.foundation.analysis import \
+            analyse as protocol  # pylint: disable=import-outside-toplevel
+
+        if proto is None:
+            flow = None
+        elif self._exaddr is None:
+            flow = (self.__class__.__name__, *sorted(proto))
         else:
-            from pcapkit.foundation.analysis import \
-                analyse as protocol  # pylint: disable=import-outside-toplevel
+            flow = (self.__class__.__name__, *sorted(zip(self._exaddr, proto)))
 
-        if length == 0:
+        if length == 0 or self._sigterm:
             next_ = NoPayload()
         elif self._onerror:
-            next_ = beholder_ng(protocol)(self._file, length, termination=self._sigterm)
+            next_ = beholder_ng(protocol)(self._file, length, ports=proto, flow=flow,
+                                          decode_policy=self._exdec)
         else:
-            next_ = protocol(self._file, length, termination=self._sigterm)
+            next_ = protocol(self._file, length, ports=proto, flow=flow, decode_policy=self._exdec)
         return next_
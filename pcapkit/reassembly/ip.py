@@ -124,11 +124,12 @@ class IP_Reassembly(Reassembly):  # pylint: disable=abstract-method
         # set RCVBT bits (in 8 octets)
         start = FO // 8
         stop = FO // 8 + (TL - IHL + 7) // 8
-        self._buffer[BUFID]['RCVBT'][start:stop] = b'\x01' * (stop - start + 1)
+        self._buffer[BUFID]['RCVBT'][start:stop] = b'\x01' * (stop - start)
 
         # get total data length (header excludes)
         if not MF:
-            TDL = TL - IHL + FO
+            self._buffer[BUFID]['TDL'] = TL - IHL + FO
+        TDL = self._buffer[BUFID]['TDL']
 
         # put header into header buffer
         if not FO:
@@ -42,6 +42,15 @@ class Reassembly(metaclass=abc.ABCMeta):
         """
         return len(self.fetch())
 
+    # number of buffered datagrams
+    @property
+    def buffered(self):
+        """Number of datagrams pending reassembly in buffer.
+
+        :rtype: int
+        """
+        return len(self._buffer)
+
     # reassembled datagram
     @property
     def datagram(self):
@@ -6,9 +6,29 @@
 flag to indicate if usable for its caller.
 
 """
+from pcapkit.corekit.address import LazyAddress
+
 __all__ = ['ipv4_reassembly', 'ipv6_reassembly', 'tcp_reassembly', 'tcp_traceflow']
 
 
+def _ip_address(addr):
+    """Resolve IP address.
+
+    Args:
+        addr (Union[ipaddress.IPv4Address, ipaddress.IPv6Address, LazyAddress]): IP address
+            as stored in the protocol info
+
+    Returns:
+        Union[ipaddress.IPv4Address, ipaddress.IPv6Address]: Decoded IP address, i.e.
+        :attr:`LazyAddress.value <pcapkit.corekit.address.LazyAddress.value>` if ``addr``
+        is kept lazy.
+
+    """
+    if isinstance(addr, LazyAddress):
+        return addr.value
+    return addr
+
+
 def ipv4_reassembly(frame):
     """Make data for IPv4 reassembly.
 
@@ -35,8 +55,8 @@ def ipv4_reassembly(frame):
             return False, None
         data = dict(
             bufid=(
-                ipv4.src,                                   # source IP address
-                ipv4.dst,                                   # destination IP address
+                _ip_address(ipv4.src),                      # source IP address
+                _ip_address(ipv4.dst),                      # destination IP address
                 ipv4.id,                                    # identification
                 ipv4.proto.name,                            # payload protocol type
             ),
@@ -78,8 +98,8 @@ def ipv6_reassembly(frame):
             return False, None
         data = dict(
             bufid=(
-                ipv6.src,                                       # source IP address
-                ipv6.dst,                                       # destination IP address
+                _ip_address(ipv6.src),                          # source IP address
+                _ip_address(ipv6.dst),                          # destination IP address
                 ipv6.label,                                     # label
                 ipv6.ipv6_frag.next.name,                       # next header field in IPv6 Fragment Header
             ),
@@ -118,8 +138,8 @@ def tcp_reassembly(frame):
         tcp = frame['TCP'].info
         data = dict(
             bufid=(
-                ip.src,                                     # source IP address
-                ip.dst,                                     # destination IP address
+                _ip_address(ip.src),                        # source IP address
+                _ip_address(ip.dst),                        # destination IP address
                 tcp.srcport,                                # source port
                 tcp.dstport,                                # destination port
             ),
@@ -169,8 +189,8 @@ def tcp_traceflow(frame, *, data_link):
             frame=frame.info,                       # extracted frame info
             syn=tcp.flags.syn,                      # TCP synchronise (SYN) flag
             fin=tcp.flags.fin,                      # TCP finish (FIN) flag
-            src=ip.src,                             # source IP
-            dst=ip.dst,                             # destination IP
+            src=_ip_address(ip.src),                # source IP
+            dst=_ip_address(ip.dst),                # destination IP
             srcport=tcp.srcport,                    # TCP source port
             dstport=tcp.dstport,                    # TCP destination port
             timestamp=frame.info.time_epoch,        # frame timestamp
@@ -208,7 +208,6 @@ def tcp_reassembly(packet, *, count=NotImplemented):
         return False, None
     tcp = getattr(ip, 'tcp', None)
     if tcp is not None:
-        flags = bin(tcp.flags)[2:].zfill(8)
         data = dict(
             bufid=(
                 ipaddress.ip_address(ip.src),                   # source IP address
@@ -219,9 +218,9 @@ def tcp_reassembly(packet, *, count=NotImplemented):
             num=count,                                          # original packet range number
             ack=tcp.ack,                                        # acknowledgement
             dsn=tcp.seq,                                        # data sequence number
-            rst=bool(int(flags[5])),                            # reset connection flag
-            syn=bool(int(flags[6])),                            # synchronise flag
-            fin=bool(int(flags[7])),                            # finish flag
+            rst=bool(tcp.flags & 0x04),                         # reset connection flag
+            syn=bool(tcp.flags & 0x02),                         # synchronise flag
+            fin=bool(tcp.flags & 0x01),                         # finish flag
             payload=bytearray(tcp.pack()[tcp.__hdr_len__:]),    # raw bytearray type payload
         )
         raw_len = len(tcp.data)                                 # payload length, header excludes
@@ -263,13 +262,12 @@ def tcp_traceflow(packet, timestamp, *, data_link, count=NotImplemented):
         return False, None
     tcp = getattr(ip, 'tcp', None)
     if tcp is not None:
-        flags = bin(tcp.flags)[2:].zfill(8)
         data = dict(
             protocol=data_link,                                         # data link type from global header
             index=count,                                                # frame number
             frame=packet2dict(packet, timestamp, data_link=data_link),  # extracted packet
-            syn=bool(int(flags[6])),                                    # TCP synchronise (SYN) flag
-            fin=bool(int(flags[7])),                                    # TCP finish (FIN) flag
+            syn=bool(tcp.flags & 0x02),                                 # TCP synchronise (SYN) flag
+            fin=bool(tcp.flags & 0x01),                                 # TCP finish (FIN) flag
             src=ipaddress.ip_address(ip.src),                           # source IP
             dst=ipaddress.ip_address(ip.dst),                           # destination IP
             srcport=tcp.sport,                                          # TCP source port
@@ -2,6 +2,7 @@
 
 import builtins
 import collections.abc
+import importlib
 import sys
 
 __all__ = [
@@ -11,6 +12,9 @@ __all__ = [
     # classes
     'Collection', 'cached_property',
 
+    # functions
+    'lazy_import',
+
     # modules
     'pathlib',
 ]
@@ -104,3 +108,44 @@ except ImportError:
                             )
                             raise TypeError(msg) from None
             return val
+
+
+def lazy_import(name, attributes):
+    """Import attributes of a module on first access (:pep:`562`).
+
+    Args:
+        name (str): name of the module, i.e. ``__name__``
+        attributes (Dict[str, Tuple[str, Optional[str]]]): mapping from attribute names
+            to the module defining the attribute and the name of the attribute in that
+            module (:data:`None` for the module itself)
+
+    Returns:
+        Tuple[Callable[[str], Any], Callable[[], List[str]]]: Module level ``__getattr__``
+        and ``__dir__`` functions.
+
+    Note:
+        Module level ``__getattr__`` is not supported before Python 3.7, where all
+        attributes are imported eagerly instead.
+
+    """
+    module = sys.modules[name]
+
+    def __getattr__(attr):
+        try:
+            source, target = attributes[attr]
+        except KeyError:
+            raise AttributeError(f'module {name!r} has no attribute {attr!r}') from None
+
+        value = importlib.import_module(source)
+        if target is not None:
+            value = getattr(value, target)
+        setattr(module, attr, value)
+        return value
+
+    def __dir__():
+        return sorted(set(vars(module)) | set(attributes))
+
+    if sys.version_info[:2] < (3, 7):
+        for attr in attributes:
+            __getattr__(attr)
+    return __getattr__, __dir__
@@ -112,12 +112,16 @@ def beholder(func):
         try:
             return func(proto, length, *args, **kwargs)
         except Exception as exc:
+            from pcapkit.foundation import instrument  # pylint: disable=import-outside-toplevel
             from pcapkit.protocols.raw import Raw  # pylint: disable=import-outside-toplevel
             error = traceback.format_exc(limit=1).strip().split(os.linesep)[-1]
             # error = traceback.format_exc()
 
             # log error
             logger.error(error, exc_info=exc)
+            recorder = instrument.RECORDER.get()
+            if recorder is not None:
+                recorder.fallback(type(self).__name__)
 
             self._file.seek(seek_cur, os.SEEK_SET)
             next_ = Raw(io.BytesIO(self._read_fileng(length)), length, error=error)
@@ -152,12 +156,16 @@ def beholder_ng(func):
             return func(file, length, *args, **kwargs)
         except Exception as exc:
             # from pcapkit.foundation.analysis import analyse
+            from pcapkit.foundation import instrument  # pylint: disable=import-outside-toplevel
             from pcapkit.protocols.raw import Raw  # pylint: disable=import-outside-toplevel
             error = traceback.format_exc(limit=1).strip().split(os.linesep)[-1]
             # error = traceback.format_exc()
 
             # log error
             logger.error(error, exc_info=exc)
+            recorder = instrument.RECORDER.get()
+            if recorder is not None:
+                recorder.fallback(getattr(func, '__name__', type(func).__name__))
 
             file.seek(seek_cur, os.SEEK_SET)
 
@@ -146,7 +146,7 @@ attrs = dict(
     extras_require={
         'all': [
             'emoji',
-            'dpkt', 'scapy', 'pyshark',
+            'dpkt', 'scapy', 'pyshark', 'zstandard',
             'requests[socks]', 'beautifulsoup4[html5lib]',
         ],
         # for CLI display
@@ -155,6 +155,8 @@ attrs = dict(
         'DPKT': ['dpkt'],
         'Scapy': ['scapy'],
         'PyShark': ['pyshark'],
+        # for Zstandard compressed input
+        'zstd': ['zstandard'],
         # for developers
         'vendor': ['requests[socks]', 'beautifulsoup4[html5lib]'],
     },
@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+
+import statistics
+import time
+
+import pcapkit
+from pcapkit.corekit.address import ADDRESS_CACHE
+
+# extract with cache disabled, eager cache and lazy cache
+for (maxsize, lazy) in ((0, False), (65536, False), (65536, True)):
+    ADDRESS_CACHE.maxsize = maxsize
+    ADDRESS_CACHE.lazy = lazy
+
+    lid = list()
+    for index in range(1, 6):
+        ADDRESS_CACHE.clear()
+        now = time.time()
+        extraction = pcapkit.extract(fin='../sample/in.pcap', store=True, nofile=True, verbose=False)
+        delta = time.time() - now
+        lid.append(float(delta))
+
+    # touch addresses so that lazy ones get decoded
+    addresses = set()
+    for frame in extraction.frame:
+        if pcapkit.IP in frame:
+            ip = frame[pcapkit.IP]
+            addresses.update((str(ip.src), str(ip.dst)))
+
+    average = statistics.mean(lid) / len(extraction.frame)
+    print(f'Report: [cache size {maxsize}, lazy {lazy}] {average} seconds per frame, '
+          f'{len(addresses)} addresses, {ADDRESS_CACHE.hits} hits, {ADDRESS_CACHE.misses} misses, '
+          f'hit rate {ADDRESS_CACHE.hit_rate:.2%}.')
+
+# reassembly and flow tracing with lazy addresses
+ADDRESS_CACHE.maxsize = 65536
+ADDRESS_CACHE.lazy = True
+ADDRESS_CACHE.clear()
+extraction = pcapkit.extract(fin='../sample/in.pcap', store=False, nofile=True, verbose=False,
+                             ip=True, tcp=True, strict=False, trace=True)
+print(f'Report: [lazy reassembly] {len(extraction.reassembly.ipv4)} IPv4 datagrams, '
+      f'{len(extraction.reassembly.tcp)} TCP datagrams, {len(extraction.trace)} flows.')
+ADDRESS_CACHE.lazy = False
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import os
+import time
+
+import pcapkit
+from test_benchmark import Generator
+
+path = '../sample/async.pcap'
+Generator('mixed').write(path, 256 * 1024)
+
+
+async def ticker(lags, interval=0.01):
+    """Measure event loop lags whilst extracting."""
+    while True:
+        now = time.perf_counter()
+        await asyncio.sleep(interval)
+        lags.append(time.perf_counter() - now - interval)
+
+
+async def consume(batch):
+    count = 0
+    async for frame in pcapkit.aextract(path, nofile=True, store=False, batch=batch):  # pylint: disable=unused-variable
+        count += 1
+    return count
+
+
+async def main():
+    # extract captures concurrently in one event loop
+    for batch in (1, 64):
+        lags = list()
+        task = asyncio.ensure_future(ticker(lags))
+        now = time.time()
+        counts = await asyncio.gather(*(consume(batch) for _ in range(4)))
+        delta = time.time() - now
+        task.cancel()
+
+        print(f'Report: [aextract batch={batch}] {delta / sum(counts)} seconds per frame, '
+              f'{max(lags)} seconds maximum event loop lag, {len(counts)} captures.')
+
+now = time.time()
+for _ in range(4):
+    extraction = pcapkit.extract(fin=path, nofile=True, store=False)
+delta = time.time() - now
+print(f'Report: [extract] {delta / extraction.length / 4} seconds per frame.')
+
+asyncio.run(main())
+os.remove(path)
@@ -0,0 +1,310 @@
+# -*- coding: utf-8 -*-
+
+import argparse
+import importlib.util
+import io
+import json
+import multiprocessing
+import os
+import platform
+import random
+import statistics
+import struct
+import sys
+import time
+import tracemalloc
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+import pcapkit
+
+#: Extraction engines, with modules they depend on.
+ENGINES = dict(default=None, dpkt='dpkt', scapy='scapy', pyshark='pyshark',
+               pipeline='multiprocessing', server='multiprocessing')
+
+#: Extraction settings of benchmark cases besides engines.
+CASES = dict(reassembly=dict(ip=True, tcp=True), trace=dict(trace=True))
+
+#: Traffic mixes, as relative weights of packet kinds.
+MIXES = dict(
+    tcp=dict(tcp=1),
+    udp=dict(udp=1),
+    fragment=dict(fragment=1),
+    http=dict(http=1),
+    options=dict(options=1),
+    mixed=dict(tcp=4, udp=2, fragment=1, http=2, options=1),
+)
+
+#: Size suffixes.
+UNITS = dict(K=1 << 10, M=1 << 20, G=1 << 30)
+
+#: Ethernet header of generated frames.
+MAC = bytes.fromhex('00005e005301') + bytes.fromhex('00005e005302') + b'\x08\x00'
+
+HTTP_REQUEST = (b'GET /index.html HTTP/1.1\r\nHost: www.example.com\r\nUser-Agent: pcapkit\r\n'
+                b'Accept: */*\r\nConnection: keep-alive\r\n\r\n')
+HTTP_RESPONSE = (b'HTTP/1.1 200 OK\r\nContent-Type: text/html; charset=utf-8\r\nContent-Length: %d\r\n'
+                 b'Connection: keep-alive\r\n\r\n')
+
+# TCP: MSS, NOP, WS, SACK permitted, timestamps, NOPs, EOOL, padding to 28 bytes
+TCP_OPTIONS = (b'\x02\x04\x05\xb4' + b'\x01' + b'\x03\x03\x07' + b'\x04\x02' + b'\x08\x0a' + bytes(8)
+               + b'\x01\x01' + b'\x00' + bytes(5))
+# IPv4: NOP, record route, router alert (nesting level 0), EOOL, padding to 20 bytes
+IP_OPTIONS = b'\x01' + b'\x07\x0b\x0c' + bytes(8) + b'\x94\x04\x00\x01' + b'\x00' + bytes(3)
+
+#: Leading protocol chains which frames of each packet kind should decode to,
+#: i.e. random payloads are left out.
+CHAINS = dict(
+    tcp='Ethernet:IPv4:TCP',
+    udp='Ethernet:IPv4:UDP',
+    fragment='Ethernet:IPv4:UDP',
+    http='Ethernet:IPv4:TCP:HTTP/1.1',
+    options='Ethernet:IPv4:TCP',
+)
+
+
+def parse_size(size):
+    """Parse size such as ``10K`` or ``1G`` into bytes."""
+    unit = UNITS.get(size[-1:].upper())
+    if unit is None:
+        return int(size)
+    return int(float(size[:-1]) * unit)
+
+
+def checksum(header):
+    """Compute IPv4 header checksum."""
+    total = sum(struct.unpack(f'!{len(header) // 2}H', header))
+    while total >> 16:
+        total = (total & 0xFFFF) + (total >> 16)
+    return ~total & 0xFFFF
+
+
+def ipv4(src, dst, proto, payload, *, ident=0, flags=0, offset=0, options=b''):
+    """Build IPv4 header with payload."""
+    ihl = 5 + len(options) // 4
+    header = struct.pack('!2B3H2BH4s4s', 0x40 | ihl, 0, ihl * 4 + len(payload), ident,
+                         flags << 13 | offset, 64, proto, 0, src, dst) + options
+    return header[:10] + struct.pack('!H', checksum(header)) + header[12:] + payload
+
+
+def tcp(sport, dport, seq, ack, payload, *, flags=0x18, options=b''):
+    """Build TCP header with payload."""
+    offset = 5 + len(options) // 4
+    return struct.pack('!2H2I2B3H', sport, dport, seq, ack, offset << 4, flags, 65535, 0, 0) + options + payload
+
+
+def udp(sport, dport, payload):
+    """Build UDP header with payload."""
+    return struct.pack('!4H', sport, dport, 8 + len(payload), 0) + payload
+
+
+class Generator:
+    """Deterministic generator of synthetic captures."""
+
+    def __init__(self, mix, seed=0):
+        self.rand = random.Random(seed)
+        self.kinds = list(MIXES[mix])
+        self.weights = list(MIXES[mix].values())
+        self.ident = 0
+        # flows: (client, server, client port, server port) -> [client seq, server seq]
+        self.flows = dict()
+        self.hosts = [bytes([10, 0, index >> 8, index & 0xFF]) for index in range(1, 257)]
+
+    def endpoints(self, port):
+        flow = (self.rand.choice(self.hosts[:64]), self.rand.choice(self.hosts[64:]),
+                self.rand.randrange(1024, 1024 + 64), port)
+        return flow, self.flows.setdefault(flow, [self.rand.getrandbits(32), self.rand.getrandbits(32)])
+
+    def payload(self, low, high):
+        return self.rand.getrandbits(8 * high).to_bytes(high, 'big')[:self.rand.randint(low, high)]
+
+    def segment(self, flow, state, payload, *, reply=False, options=b'', ip_options=b''):
+        (client, server, cport, sport) = flow
+        (src, dst, sp, dp, index) = (server, client, sport, cport, 1) if reply else (client, server, cport, sport, 0)
+        packet = tcp(sp, dp, state[index], state[1 - index], payload, options=options)
+        state[index] = (state[index] + len(payload)) & 0xFFFFFFFF
+        return [ipv4(src, dst, 6, packet, options=ip_options)]
+
+    def packets(self, kind=None):
+        """Generate IPv4 packets of next kind, or of ``kind`` if given."""
+        if kind is None:
+            kind = self.rand.choices(self.kinds, self.weights)[0]
+        if kind == 'tcp':
+            flow, state = self.endpoints(self.rand.choice((22, 443, 8080)))
+            return self.segment(flow, state, self.payload(0, 1400), reply=self.rand.random() < 0.5)
+        if kind == 'http':
+            flow, state = self.endpoints(80)
+            body = self.payload(0, 1200)
+            return (self.segment(flow, state, HTTP_REQUEST)
+                    + self.segment(flow, state, HTTP_RESPONSE % len(body) + body, reply=True))
+        if kind == 'options':
+            flow, state = self.endpoints(443)
+            return self.segment(flow, state, self.payload(0, 512), options=TCP_OPTIONS, ip_options=IP_OPTIONS)
+        (client, server, cport, sport), _ = self.endpoints(53)
+        if kind == 'udp':
+            return [ipv4(client, server, 17, udp(cport, sport, self.payload(16, 512)))]
+
+        # fragment: UDP datagram split into 8-byte aligned fragments
+        self.ident = (self.ident + 1) & 0xFFFF
+        datagram = udp(cport, sport, self.payload(2000, 4000))
+        step = 1480
+        return [ipv4(client, server, 17, datagram[offset:offset + step], ident=self.ident,
+                     flags=int(offset + step < len(datagram)), offset=offset // 8)
+                for offset in range(0, len(datagram), step)]
+
+    def check(self):
+        """Check that a sample frame of each packet kind decodes to its protocol chain."""
+        from pcapkit.protocols.link.ethernet import Ethernet
+
+        for kind in self.kinds:
+            frame = MAC + self.packets(kind)[0]
+            ethernet = Ethernet(io.BytesIO(frame), len(frame))
+            chain = str(ethernet.protochain)
+            if chain.split(':')[:CHAINS[kind].count(':') + 1] != CHAINS[kind].split(':'):
+                raise ValueError(f'{kind} frame decoded as {chain!r}; expected {CHAINS[kind]!r}')
+            if kind == 'options':
+                info = ethernet.info.ipv4
+                if (info.hdr_len, info.tcp.hdr_len) != (20 + len(IP_OPTIONS), 20 + len(TCP_OPTIONS)):
+                    raise ValueError(f'options frame decoded with header lengths {info.hdr_len} (IPv4) '
+                                     f'and {info.tcp.hdr_len} (TCP)')
+
+    def write(self, path, size):
+        """Write capture of about ``size`` bytes to ``path``."""
+        self.check()
+        mac = MAC
+        with open(path, 'wb') as file:
+            file.write(struct.pack('=IHHiIII', 0xA1B2C3D4, 2, 4, 0, 0, 65535, 1))
+            length = 24
+            (sec, usec) = (1500000000, 0)
+            while length < size:
+                for packet in self.packets():
+                    frame = mac + packet
+                    usec += self.rand.randrange(1, 2000)
+                    (sec, usec) = (sec + usec // 1000000, usec % 1000000)
+                    file.write(struct.pack('=4I', sec, usec, len(frame), len(frame)) + frame)
+                    length += 16 + len(frame)
+
+
+def peak_rss():
+    """Peak resident set size of current process in bytes."""
+    if resource is None:
+        return None
+    scale = 1 if sys.platform == 'darwin' else 1024
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+
+
+def measure(queue, path, engine, kwargs, repeat, trace_malloc):
+    """Benchmark one case in a fresh process."""
+    try:
+        queue.put(_measure(path, engine, kwargs, repeat, trace_malloc))
+    except Exception as error:  # pylint: disable=broad-except
+        queue.put(dict(error=f'{type(error).__name__}: {error}'))
+
+
+def _measure(path, engine, kwargs, repeat, trace_malloc):
+    # protocols are imported lazily, load them before timing
+    import pcapkit.all  # pylint: disable=unused-import
+
+    lid = list()
+    for _ in range(repeat):
+        now = time.perf_counter()
+        extraction = pcapkit.extract(fin=path, store=False, nofile=True, engine=engine, **kwargs)
+        lid.append(time.perf_counter() - now)
+    result = dict(frames=extraction.length, seconds=min(lid), seconds_mean=statistics.mean(lid),
+                  peak_rss=peak_rss())
+
+    # memory allocated by pcapkit in current process, i.e. excluding worker processes
+    if trace_malloc:
+        tracemalloc.start()
+        pcapkit.extract(fin=path, store=False, nofile=True, engine=engine, **kwargs)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        result['alloc_peak'] = peak
+        result['alloc_per_frame'] = peak / max(extraction.length, 1)
+    return result
+
+
+def run(path, name, engine, kwargs, args):
+    if ENGINES.get(engine) and importlib.util.find_spec(ENGINES[engine]) is None:
+        return dict(case=name, skipped=f'{ENGINES[engine]} not installed')
+
+    context = multiprocessing.get_context('spawn')
+    queue = context.Queue()
+    process = context.Process(target=measure, args=(queue, path, engine, kwargs, args.repeat, not args.no_malloc))
+    process.start()
+    result = queue.get()
+    process.join()
+    if 'error' in result:
+        return dict(case=name, **result)
+
+    size = os.path.getsize(path)
+    result.update(case=name, packets_per_sec=result['frames'] / result['seconds'],
+                  mb_per_sec=size / result['seconds'] / (1 << 20))
+    return result
+
+
+def compare(results, baseline):
+    """Print throughput change against baseline results."""
+    with open(baseline) as file:
+        previous = {(item['size'], item['mix'], item['case']): item for item in json.load(file)['results']}
+    for item in results:
+        old = previous.get((item['size'], item['mix'], item['case']))
+        if old is None or 'packets_per_sec' not in item or 'packets_per_sec' not in old:
+            continue
+        change = item['packets_per_sec'] / old['packets_per_sec'] - 1
+        print(f"Compare: [{item['case']}, {item['mix']}, {item['size']}] {change:+.1%} packets per second.")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='benchmark pcapkit over synthetic captures')
+    parser.add_argument('-s', '--size', action='append', help='capture size, e.g. 10K, 1M, 1G (default: 10K, 1M)')
+    parser.add_argument('-m', '--mix', action='append', choices=sorted(MIXES), help='traffic mix (default: mixed)')
+    parser.add_argument('-c', '--case', action='append', choices=list(ENGINES) + list(CASES),
+                        help='engine or case to benchmark (default: all)')
+    parser.add_argument('-r', '--repeat', type=int, default=3, help='runs per case (default: 3)')
+    parser.add_argument('--seed', type=int, default=0, help='seed of generator (default: 0)')
+    parser.add_argument('--no-malloc', action='store_true', help='skip measuring allocations')
+    parser.add_argument('-d', '--directory', default='../sample/benchmark', help='directory of generated captures')
+    parser.add_argument('-o', '--output', default='../sample/benchmark.json', help='JSON results file')
+    parser.add_argument('-b', '--baseline', help='JSON results file to compare with')
+    parser.add_argument('-l', '--label', help='label of results, e.g. version under test')
+    args = parser.parse_args()
+
+    os.makedirs(args.directory, exist_ok=True)
+    results = list()
+    for size in args.size or ['10K', '1M']:
+        for mix in args.mix or ['mixed']:
+            path = os.path.join(args.directory, f'{mix}-{size}-{args.seed}.pcap')
+            if not os.path.isfile(path):
+                Generator(mix, args.seed).write(path, parse_size(size))
+
+            for name in args.case or list(ENGINES) + list(CASES):
+                engine, kwargs = (name, dict()) if name in ENGINES else ('default', CASES[name])
+                result = run(path, name, engine, kwargs, args)
+                result.update(size=size, mix=mix)
+                results.append(result)
+
+                if 'skipped' in result:
+                    print(f'Report: [{name}, {mix}, {size}] skipped, {result["skipped"]}.')
+                    continue
+                if 'error' in result:
+                    print(f'Report: [{name}, {mix}, {size}] failed, {result["error"]}.')
+                    continue
+                alloc = f'{result["alloc_per_frame"]:.1f}' if 'alloc_per_frame' in result else 'n/a'
+                print(f'Report: [{name}, {mix}, {size}] {result["packets_per_sec"]:.1f} packets per second, '
+                      f'{result["mb_per_sec"]:.3f} MB per second, peak RSS {result["peak_rss"]} bytes, '
+                      f'{alloc} bytes allocated per frame.')
+
+    with open(args.output, 'w') as file:
+        json.dump(dict(label=args.label, python=platform.python_version(), platform=platform.platform(),
+                       time=time.strftime('%Y-%m-%dT%H:%M:%S'), results=results), file, indent=2)
+    if args.baseline:
+        compare(results, args.baseline)
+
+
+if __name__ == '__main__':
+    multiprocessing.freeze_support()
+    main()
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+
+import bz2
+import gzip
+import lzma
+import os
+import shutil
+import statistics
+import tempfile
+import time
+import warnings
+
+import pcapkit
+from pcapkit.utilities.warnings import FileWarning
+from test_benchmark import Generator
+
+root = tempfile.mkdtemp(prefix='pcapkit-')
+path = os.path.join(root, 'compress.pcap')
+Generator('mixed').write(path, 256 * 1024)
+with open(path, 'rb') as file:
+    data = file.read()
+
+# compress capture in each format of the standard library
+for (ext, module) in (('gz', gzip), ('bz2', bz2), ('xz', lzma)):
+    with open(f'{path}.{ext}', 'wb') as file:
+        file.write(module.compress(data))
+
+# extract plain and compressed captures
+for ext in (None, 'gz', 'bz2', 'xz'):
+    fin = path if ext is None else f'{path}.{ext}'
+    lid = list()
+    for index in range(1, 6):
+        now = time.time()
+        extraction = pcapkit.extract(fin=fin, nofile=True, store=False)
+        delta = time.time() - now
+        lid.append(float(delta))
+
+    average = statistics.mean(lid) / extraction.length
+    print(f'Report: [{ext or "pcap"}] {average} seconds per frame, {os.path.getsize(fin)} bytes on disk.')
+
+# extract truncated compressed capture, keeping the frames decoded so far
+with open(f'{path}.gz', 'rb') as file:
+    compressed = file.read()
+with open(f'{path}.gz', 'wb') as file:
+    file.write(compressed[:len(compressed) // 2])
+with warnings.catch_warnings(record=True) as record:
+    warnings.simplefilter('always', FileWarning)
+    extraction = pcapkit.extract(fin=f'{path}.gz', nofile=True, store=False)
+print(f'Report: [truncated gz] {extraction.length} frames, {len(record)} warnings.')
+assert extraction.length and any(issubclass(item.category, FileWarning) for item in record)
+
+shutil.rmtree(root)
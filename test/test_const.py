@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+
+import random
+import statistics
+import time
+import tracemalloc
+
+from pcapkit.const.reg.ethertype import EtherType
+from pcapkit.const.reg.linktype import LinkType
+from pcapkit.const.reg.transtype import TransType
+
+random.seed(0)
+
+# (enumeration, upper bound of values), with noisy values mostly unknown
+samples = ((EtherType, 0xFFFF), (LinkType, 0xFFFFFFFF), (TransType, 0xFF))
+
+for (enum, bound) in samples:
+    values = [random.randint(0, bound) for _ in range(10000)]
+    size = len(enum.__members__)
+
+    lid = list()
+    tracemalloc.start()
+    for index in range(1, 6):
+        now = time.time()
+        for value in values:
+            try:
+                enum(value)
+            except ValueError:
+                continue
+        delta = time.time() - now
+        lid.append(float(delta))
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    average = statistics.mean(lid) / len(values)
+    print(f'Report: [{enum.__name__}] {average} seconds per lookup, {len(enum.__members__) - size} members added, '
+          f'{memory} bytes retained.')
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+
+import io
+import random
+import statistics
+import struct
+import time
+import tracemalloc
+
+import pcapkit.protocols.application.dns as dns
+from pcapkit.protocols.application.dns import DNS
+from pcapkit.utilities.exceptions import ProtocolError
+
+random.seed(0)
+
+
+def name(domain):
+    return b''.join(len(label).to_bytes(1, 'big') + label.encode() for label in domain.split('.')) + b'\x00'
+
+
+def message(domain, response):
+    flag = 0x8180 if response else 0x0100
+    data = struct.pack('!6H', random.randrange(65536), flag, 1, 3 if response else 0, 0, 0)
+    data += name(domain) + struct.pack('!2H', 1, 1)
+    if response:
+        # CNAME to a sibling, then two A records, all compressed
+        data += b'\xc0\x0c' + struct.pack('!2HIH', 5, 1, 300, 6) + b'\x03cdn\xc0' + bytes([12 + len(domain.split('.')[0]) + 1])
+        cname = len(data) - 6
+        for _ in range(2):
+            data += struct.pack('!H', 0xC000 | cname) + struct.pack('!2HIH', 1, 1, 60, 4) + bytes(random.randrange(256) for _ in range(4))
+    return data
+
+
+# DNS-heavy corpus with popular owner names
+domains = [f'{host}.{site}.com' for host in ('www', 'api', 'img', 'mail') for site in ('example', 'google', 'github', 'python')]
+corpus = [message(random.choice(domains), random.random() < 0.5) for _ in range(10000)]
+
+# parse with protocol construction
+lid = list()
+for index in range(1, 6):
+    now = time.time()
+
+    parsed = 0
+    for payload in corpus:
+        try:
+            DNS(io.BytesIO(payload), len(payload))
+        except ProtocolError:
+            continue
+        parsed += 1
+
+    delta = time.time() - now
+    lid.append(float(delta))
+
+average = statistics.mean(lid) / len(corpus)
+print(f'Report: [DNS] {parsed} of {len(corpus)} messages parsed, {average} seconds per message.')
+
+# parse with DNS.read only, with and without the interned name cache
+packet = DNS(io.BytesIO(corpus[0]), len(corpus[0]))
+
+for size in (0, dns.NAME_CACHE_SIZE):
+    dns.NAME_CACHE_SIZE = size
+    dns._NAME_CACHE.clear()
+
+    lid = list()
+    for index in range(1, 6):
+        now = time.time()
+        for payload in corpus:
+            packet._file = io.BytesIO(payload)
+            packet.read(len(payload))
+        delta = time.time() - now
+        lid.append(float(delta))
+
+    # memory retained by parsed messages
+    tracemalloc.start()
+    result = list()
+    for payload in corpus:
+        packet._file = io.BytesIO(payload)
+        result.append(packet.read(len(payload)))
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    average = statistics.mean(lid) / len(corpus)
+    print(f'Report: [DNS.read] name cache size {size}, {average} seconds and '
+          f'{memory / len(corpus)} bytes retained per message.')
@@ -0,0 +1,8 @@
+# -*- coding: utf-8 -*-
+
+import pcapkit
+
+extraction = pcapkit.extract(fin='../sample/in.pcap', nofile=True, verbose=True,
+                             filter='tcp port 80 and not dst net 123.129.0.0/16')
+for frame in extraction.frame:
+    print(frame.info.number, frame['IPv4'].info.src, frame['TCP'].info.srcport)
@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+
+import os
+import shutil
+import tempfile
+import threading
+import time
+
+import pcapkit
+from test_benchmark import Generator
+
+root = tempfile.mkdtemp(prefix='pcapkit-')
+source = os.path.join(root, 'source.pcap')
+Generator('mixed').write(source, 64 * 1024)
+with open(source, 'rb') as file:
+    header, records = file.read(24), file.read()
+
+written = dict()
+
+
+def writer(files=3, chunk=512, delay=0.005):
+    """Write the capture into rotated files in small chunks, as a sensor does."""
+    for index in range(files):
+        with open(os.path.join(root, f'capture-{index}.pcap'), 'wb', buffering=0) as file:
+            file.write(header)
+            for offset in range(0, len(records), chunk):
+                time.sleep(delay)
+                file.write(records[offset:offset + chunk])
+    written['time'] = time.time()
+
+
+# follow rotated capture files whilst they are being written
+thread = threading.Thread(target=writer)
+with open(os.path.join(root, 'capture-0.pcap'), 'wb') as file:
+    file.write(header)
+thread.start()
+
+extraction = pcapkit.extract(fin=os.path.join(root, 'capture-0.pcap'), nofile=True, store=False, auto=False,
+                             follow=True, follow_interval=0.1, follow_timeout=1.0,
+                             follow_rotate=os.path.join(root, 'capture-*.pcap'))
+for frame in extraction:  # pylint: disable=unused-variable
+    last = time.time()
+thread.join()
+
+print(f'Report: [follow] {extraction.length} frames from {os.path.basename(extraction.input)!r}, '
+      f'last frame {last - written["time"]} seconds after the writer finished.')
+shutil.rmtree(root)
@@ -0,0 +1,13 @@
+# -*- coding: utf-8 -*-
+
+import pcapkit
+
+extraction = pcapkit.extract(fin='../sample/in.pcap', store=False, nofile=True, hierarchy=True)
+hierarchy = extraction.hierarchy
+
+# merge statistics from another file (or worker)
+hierarchy += pcapkit.extract(fin='../sample/in.pcap', store=False, nofile=True, hierarchy=True).hierarchy
+
+for record in hierarchy.index:
+    print(f"{'  ' * (record.level - 1)}{record.chain.split(':')[-1]:<{30 - 2 * record.level}}"
+          f'frames:{record.frames:>8d} bytes:{record.bytes:>10d}')
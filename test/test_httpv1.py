@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+
+import io
+import os
+import random
+import statistics
+import time
+
+from pcapkit.protocols.application.httpv1 import HTTPv1
+from pcapkit.utilities.exceptions import ProtocolError
+
+random.seed(0)
+
+requests = [
+    b'GET /index.html HTTP/1.1\r\nHost: www.example.com\r\nUser-Agent: curl/7.64.1\r\nAccept: */*\r\n\r\n',
+    b'POST /api/v1/items HTTP/1.1\r\nHost: api.example.com\r\nContent-Type: application/json\r\n'
+    b'Content-Length: 17\r\nCookie: a=1\r\nCookie: b=2\r\n\r\n{"name": "value"}',
+    b'HEAD /favicon.ico HTTP/1.0\r\nHost: example.com\r\nConnection: close\r\n\r\n',
+]
+responses = [
+    b'HTTP/1.1 200 OK\r\nServer: nginx\r\nDate: Mon, 01 Jun 2020 00:00:00 GMT\r\nContent-Type: text/html\r\n'
+    b'Content-Length: 13\r\nConnection: keep-alive\r\n\r\n<html></html>',
+    b'HTTP/1.1 404 Not Found\r\nContent-Length: 0\r\n\r\n',
+    b'HTTP/1.0 301 Moved Permanently\r\nLocation: https://example.com/\r\n\r\n',
+]
+others = [
+    b'\x16\x03\x01\x02\x00\x01\x00\x01\xfc\x03\x03' + os.urandom(128),      # TLS ClientHello
+    b'220 FTP server ready\r\n',                                            # FTP reply
+    b'\x00\x00\x12\x04\x00\x00\x00\x00\x00' + os.urandom(18),               # HTTP/2 SETTINGS
+    os.urandom(512),                                                        # binary payload
+    b'SSH-2.0-OpenSSH_8.2p1 Ubuntu-4ubuntu0.1\r\n',                         # SSH banner
+]
+
+# mixed corpus of 50% HTTP and 50% non-HTTP payloads
+corpus = random.choices(requests + responses, k=5000) + random.choices(others, k=5000)
+random.shuffle(corpus)
+
+# parse with protocol construction
+lid = list()
+for index in range(1, 6):
+    now = time.time()
+
+    parsed = 0
+    for payload in corpus:
+        try:
+            HTTPv1(io.BytesIO(payload), len(payload))
+        except ProtocolError:
+            continue
+        parsed += 1
+
+    delta = time.time() - now
+    lid.append(float(delta))
+
+average = statistics.mean(lid) / len(corpus)
+print(f'Report: [HTTPv1] {parsed} of {len(corpus)} payloads parsed, {average} seconds per payload.')
+
+# parse with HTTPv1.read only
+http = HTTPv1(io.BytesIO(requests[0]), len(requests[0]))
+
+lid = list()
+for index in range(1, 6):
+    now = time.time()
+
+    parsed = 0
+    for payload in corpus:
+        http._file = io.BytesIO(payload)
+        try:
+            http.read(len(payload))
+        except ProtocolError:
+            continue
+        parsed += 1
+
+    delta = time.time() - now
+    lid.append(float(delta))
+
+average = statistics.mean(lid) / len(corpus)
+print(f'Report: [HTTPv1.read] {parsed} of {len(corpus)} payloads parsed, {average} seconds per payload.')
@@ -0,0 +1,18 @@
+# -*- coding: utf-8 -*-
+
+import pprint
+
+import pcapkit
+from pcapkit.foundation.httpv2 import HTTPv2_Flow
+
+extraction = pcapkit.extract(
+    fin='../sample/http2.pcap', store=False, tcp=True, nofile=True, strict=True,
+)
+
+http2 = HTTPv2_Flow()
+http2.run(extraction.reassembly.tcp)
+
+for record in http2.index:
+    print(f'[{record.id.src} -> {record.id.dst}] stream {record.sid} ({record.type})')
+    pprint.pprint(record.headers)
+    print()
@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+
+import re
+import statistics
+import subprocess  # nosec
+import sys
+
+# modules which shall only be loaded on first use
+lazy = ('pcapkit.all', 'pcapkit.const.', 'pcapkit.protocols.', 'pcapkit.foundation.', 'pcapkit.dumpkit', 'chardet')
+
+for (statement, gated) in (('import pcapkit', True),
+                           ('from pcapkit.foundation.extraction import Extractor', False)):
+    lid = list()
+    for index in range(1, 6):
+        proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', statement],  # nosec
+                              stderr=subprocess.PIPE, check=True, universal_newlines=True)
+
+        # import time: self [us] | cumulative [us] | imported package
+        modules = dict()
+        for line in proc.stderr.splitlines():
+            match = re.match(r'import time:\s+\d+ \|\s+(\d+) \| *(\S+)', line)
+            if match is not None:
+                modules[match.group(2)] = int(match.group(1))
+        lid.append(modules['pcapkit'] / 1e6)
+
+    loaded = sorted(name for name in modules if name.startswith(lazy))
+    average = statistics.mean(lid)
+    print(f'Report: [{statement}] {average} seconds to import pcapkit, {len(loaded)} lazy modules loaded.')
+    if gated:
+        assert not loaded, f'modules loaded eagerly: {loaded}'
+
+# protocol modules not in the capture shall not be loaded by a default extraction
+STATEMENT = '''
+import sys
+from pcapkit.foundation.extraction import Extractor
+Extractor(fin='../sample/in.pcap', nofile=True)
+print(sum(1 for name in sys.modules if name.startswith('pcapkit.protocols.')))
+assert 'pcapkit.protocols.internet.hip' not in sys.modules
+'''
+proc = subprocess.run([sys.executable, '-c', STATEMENT],  # nosec
+                      stdout=subprocess.PIPE, check=True, universal_newlines=True)
+print(f'Report: [Extractor(fin=...)] {proc.stdout.strip()} protocol modules loaded.')
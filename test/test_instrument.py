@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+
+import statistics
+import time
+
+import pcapkit
+
+# extract with instrumentation disabled and enabled
+for instrument in (False, True):
+    lid = list()
+    for index in range(1, 11):
+        now = time.time()
+        extraction = pcapkit.extract(fin='../sample/in.pcap', store=False, nofile=True, instrument=instrument)
+        delta = time.time() - now
+        lid.append(float(delta))
+
+    average = statistics.mean(lid) / extraction.length
+    print(f'Report: [instrument {instrument}] {average} seconds per frame.')
+
+# per protocol report of the last extraction
+for record in extraction.instrument.index:
+    print(f'Report: [{record.protocol}] {record.count} decodings, {record.bytes} bytes, '
+          f'{record.self} seconds excluding upper layers, p99 {record.p99} seconds.')
+print(extraction.instrument.prometheus())
+
+# concurrent extractions record into their own instrumentation
+import concurrent.futures
+
+with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+    futures = [executor.submit(pcapkit.extract, fin='../sample/in.pcap', store=False, nofile=True,
+                               instrument=bool(index % 2)) for index in range(8)]
+    counts = [sum(record.count for record in future.result().instrument.index)
+              for future in futures[1::2]]
+print(f'Report: [concurrent] {counts} decodings per extraction.')
+assert len(set(counts)) == 1, counts
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+
+import io
+import statistics
+import struct
+import time
+
+from pcapkit.protocols.internet.hip import HIP
+from pcapkit.protocols.internet.hopopt import HOPOPT
+from pcapkit.protocols.internet.ipv4 import IPv4
+from pcapkit.protocols.internet.ipv6_opts import IPv6_Opts
+from pcapkit.protocols.transport.tcp import TCP
+
+# TCP: MSS, NOP, WS, SACK permitted, timestamps, NOPs, TFO cookie, EOOL, padding
+tcp_opts = (b'\x02\x04\x05\xb4' + b'\x01' + b'\x03\x03\x07' + b'\x04\x02' + b'\x08\x0a' + struct.pack('!2I', 1, 2)
+            + b'\x01\x01' + b'\x22\x0a' + bytes(range(8)) + b'\x00' + bytes(3))
+tcp = struct.pack('!2H2I2B3H', 12345, 80, 1, 2, (20 + len(tcp_opts)) // 4 << 4, 0x12, 65535, 0, 0) + tcp_opts
+
+# IPv4: NOP, record route, router alert, stream ID, timestamps, EOOL, padding
+ip_opts = (b'\x01' + b'\x07\x0b\x0c' + bytes(8) + b'\x94\x04\x00\x01' + b'\x88\x04\x12\x34'
+           + b'\x44\x0c\x05\x00' + struct.pack('!2I', 1000, 2000) + b'\x00' + bytes(3))
+ihl = (20 + len(ip_opts)) // 4
+ipv4 = struct.pack('!2B3H2BH4s4s', 0x40 | ihl, 0, ihl * 4, 1, 0, 64, 253, 0, bytes([10, 0, 0, 1]), bytes([10, 0, 0, 2])) + ip_opts
+
+# HOPOPT & IPv6-Opts: Pad1, router alert, tunnel limit, jumbo payload, home address, PadN
+v6_opts = (b'\x00' + b'\x05\x02\x00\x00' + b'\x04\x01\x04' + b'\xc2\x04\x00\x01\x00\x00' + b'\xc9\x10' + bytes(range(16))
+           + b'\x01\x04' + bytes(4))
+ipv6 = bytes([59, (len(v6_opts) + 2) // 8 - 1]) + v6_opts
+
+
+def para(code, body):
+    size = 11 + len(body) - (len(body) + 3) % 8
+    return struct.pack('!2H', code, len(body)) + body + bytes(size - 4 - len(body))
+
+
+# HIP: SEQ, DH_GROUP_LIST, ACK, SEQ, unassigned
+hip_para = (para(385, struct.pack('!I', 7)) + para(511, b'\x03\x04\x07') + para(449, struct.pack('!2I', 1, 2))
+            + para(385, struct.pack('!I', 8)) + para(0xFFFE, b'abc'))
+hip = struct.pack('!4B2H16s16s', 59, (40 + len(hip_para)) // 8 - 1, 0x01, 0x21, 0, 0, bytes(16), bytes(16)) + hip_para
+
+# (protocol, packet, keyword arguments, offset of option list, option reader)
+samples = ((TCP, tcp, dict(), 20, lambda self, size: self._read_tcp_options(size)),
+           (IPv4, ipv4, dict(), 20, lambda self, size: self._read_ipv4_options(size)),
+           (HOPOPT, ipv6, dict(extension=True), 2, lambda self, size: self._read_hopopt_options(size)),
+           (IPv6_Opts, ipv6, dict(extension=True), 2, lambda self, size: self._read_ipv6_opts_options(size)),
+           (HIP, hip, dict(extension=True), 40, lambda self, size: self._read_hip_para(size, version=2)))
+
+for (protocol, packet, kwargs, offset, reader) in samples:
+    # parse with protocol construction
+    lid = list()
+    for index in range(1, 6):
+        now = time.time()
+        for _ in range(1000):
+            info = protocol(io.BytesIO(packet), len(packet), **kwargs)
+        delta = time.time() - now
+        lid.append(float(delta))
+
+    average = statistics.mean(lid) / 1000
+    print(f'Report: [{protocol.__name__}] {average} seconds per packet.')
+
+    # parse option list only
+    options = packet[offset:]
+    lid = list()
+    for index in range(1, 6):
+        now = time.time()
+        for _ in range(10000):
+            info._file = io.BytesIO(options)
+            optkind, _ = reader(info, len(options))
+        delta = time.time() - now
+        lid.append(float(delta))
+
+    average = statistics.mean(lid) / 10000
+    print(f'Report: [{protocol.__name__} options] {len(optkind)} option kinds, {average} seconds per option list.')
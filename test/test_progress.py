@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+
+import statistics
+import time
+
+import pcapkit
+
+reports = list()
+
+
+def progress(extraction, stats):  # pylint: disable=unused-argument
+    reports.append(stats)
+
+
+# extract without and with a progress callback on every frame
+for (callback, interval) in ((None, 1.0), (progress, 0)):
+    lid = list()
+    for index in range(1, 11):
+        now = time.time()
+        extraction = pcapkit.extract(fin='../sample/in.pcap', store=False, nofile=True, tcp=True, trace=True,
+                                     progress=callback, progress_interval=interval)
+        delta = time.time() - now
+        lid.append(float(delta))
+
+    average = statistics.mean(lid) / extraction.length
+    print(f'Report: [progress {callback is not None}] {average} seconds per frame, {len(reports)} reports.')
+
+print(extraction.stats)
@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+
+import os
+import random
+import time
+import tracemalloc
+
+import pcapkit
+from test_benchmark import Generator
+
+path = '../sample/spill.pcap'
+Generator('mixed').write(path, 1024 * 1024)
+
+# extract with all frames in memory and spilled to disk over a memory budget
+for budget in (None, 256 * 1024):
+    tracemalloc.start()
+    now = time.time()
+    extraction = pcapkit.extract(fin=path, store=True, store_budget=budget, nofile=True)
+    delta = time.time() - now
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    frames = extraction.frame
+    indexes = random.Random(0).choices(range(len(frames)), k=1000)
+    now = time.time()
+    for index in indexes:
+        assert frames[index].info.number == index + 1
+    access = (time.time() - now) / len(indexes)
+
+    print(f'Report: [store_budget={budget}] {delta / extraction.length} seconds per frame, '
+          f'{retained / extraction.length} bytes retained per frame, {access} seconds per random access, '
+          f'spilled {getattr(frames, "spilled", False)}.')
+
+os.remove(path)
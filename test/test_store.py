@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+
+import statistics
+import time
+import tracemalloc
+
+import pcapkit
+
+# extract with different frame retention policies
+for store in (True, 2, 'index', False):
+    lid = list()
+    tracemalloc.start()
+    for index in range(1, 11):
+        now = time.time()
+        extraction = pcapkit.extract(fin='../sample/in.pcap', store=store, nofile=True)
+        delta = time.time() - now
+        lid.append(float(delta))
+
+        # retained frames are held until the extractor is discarded
+        size, _ = tracemalloc.get_traced_memory()
+        del extraction
+        freed, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    extraction = pcapkit.extract(fin='../sample/in.pcap', store=store, nofile=True)
+    average = statistics.mean(lid) / extraction.length
+    retained = (size - freed) / extraction.length
+    frames = len(extraction.frame) if store else 0
+    print(f'Report: [store={store!r}] {average} seconds per frame, {retained} bytes retained per frame, '
+          f'{frames} frames retained.')
+
+    # retained frames shall be the last ones as extracted
+    if store:
+        assert extraction.frame[-1].info.number == extraction.length
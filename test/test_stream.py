@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+
+import os
+import subprocess  # nosec
+import sys
+import time
+
+import pcapkit
+from test_benchmark import Generator
+
+path = '../sample/stream.pcap'
+Generator('mixed').write(path, 256 * 1024)
+
+# writer process dumping the capture to a pipe in small chunks, as ``tcpdump -w -`` does
+WRITER = '''
+import sys, time
+with open(sys.argv[1], 'rb') as file:
+    for chunk in iter(lambda: file.read(4096), b''):
+        sys.stdout.buffer.write(chunk)
+        sys.stdout.buffer.flush()
+        time.sleep(0.001)
+'''
+
+now = time.time()
+extraction = pcapkit.extract(fin=path, nofile=True, store=False, tcp=True)
+delta = time.time() - now
+print(f'Report: [file] {delta / extraction.length} seconds per frame, {extraction.length} frames.')
+
+now = time.time()
+with subprocess.Popen([sys.executable, '-c', WRITER, path], stdout=subprocess.PIPE) as proc:  # nosec
+    streaming = pcapkit.extract(fin=proc.stdout, nofile=True, store=False, tcp=True)
+delta = time.time() - now
+print(f'Report: [pipe] {delta / streaming.length} seconds per frame, {streaming.length} frames, '
+      f'{streaming.stats.offset} bytes read.')
+
+assert streaming.length == extraction.length
+assert streaming.stats.offset == os.path.getsize(path)
+os.remove(path)
@@ -8,7 +8,7 @@ import pcapkit
 
 multiprocessing.freeze_support()
 
-for engine in ['default', 'dpkt', 'scapy', 'pyshark', 'pipline', 'server']:
+for engine in ['default', 'dpkt', 'scapy', 'pyshark', 'pipeline', 'server']:
     lid = list()
     for index in range(1, 101):
         now = time.time()
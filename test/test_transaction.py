@@ -0,0 +1,22 @@
+# -*- coding: utf-8 -*-
+
+import pcapkit
+from pcapkit.foundation.httpv1 import HTTPv1_Flow
+
+http = HTTPv1_Flow(store=False)
+
+# feed TCP segments in order of capture
+for frame in pcapkit.extract(fin='../sample/http.pcap', nofile=True, auto=False):
+    if pcapkit.TCP in frame:
+        ip = (frame['IPv4'] if pcapkit.IPv4 in frame else frame['IPv6']).info
+        tcp = frame['TCP'].info
+        payload = tcp.packet.payload
+        if not payload:
+            continue
+        for record in http.feed((ip.src, tcp.srcport), (ip.dst, tcp.dstport), payload,
+                                index=(frame.info.number,), timestamp=frame.info.time_epoch):
+            print(f'{record.method} {record.target} -> {record.status} '
+                  f'({record.response_body} bytes in {record.response_end - record.request_time:.6f}s)')
+
+for record in http.flush():
+    print(f'{record.method} {record.target} -> {record.status} (incomplete)')